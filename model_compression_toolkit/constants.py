@@ -91,6 +91,10 @@ UPPER_FACTOR = 1.2
 DEC_RANGE_BOTTOM = 0.97
 DEC_RANGE_UPPER = 1.03
 
+# Maximal number of bytes the batched quantization parameters search may allocate at once.
+# Chunks that fit in the CPU cache are evaluated faster than larger chunks.
+THRESHOLD_SEARCH_MEMORY_BUDGET = 2 ** 20
+
 # KPI computation parameters
 BITS_TO_BYTES = 8.0
 
@@ -116,7 +120,15 @@ WEIGHTS_CHANNELS_AXIS = 'weights_channels_axis'
 # Memory graph constants
 DUMMY_NODE = 'dummy_node'
 DUMMY_TENSOR = 'dummy_tensor'
+# Default limit on the number of expansion steps of a max cut AStar search, per operation in the memory graph
+# (and a minimal limit for small graphs).
+ASTAR_ITER_PER_OPERATION = 10
+MIN_ASTAR_ITER = 500
 
 # Jacobian-weights constants
 MIN_JACOBIANS_ITER = 10
 JACOBIANS_COMP_TOLERANCE = 1e-3
+# Maximal number of random vectors to compute their Jacobian products in a single (batched) backward pass, and
+# maximal number of bytes the Jacobian products of a single backward pass may take.
+JACOBIANS_PROBES_PER_BACKWARD = 10
+JACOBIANS_MEMORY_BUDGET = 2 ** 28
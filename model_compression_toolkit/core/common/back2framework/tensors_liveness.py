@@ -0,0 +1,48 @@
+# Copyright 2023 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+from typing import List
+
+from model_compression_toolkit.core.common import BaseNode, Graph
+
+
+def get_release_schedule(graph: Graph,
+                         node_sort: List[BaseNode],
+                         output_nodes_names: List[str]) -> List[List[int]]:
+    """
+    Compute, for each node in a topological order of a graph, the nodes whose output tensors are not needed once
+    the node has run: nodes that the node is their last consumer, or nodes that have no consumers, and are not
+    requested as outputs. Releasing these tensors as soon as possible bounds the memory of the intermediate tensors
+    by the largest set of tensors that are alive together, instead of by the sum of all tensors.
+
+    Args:
+        graph: Graph the nodes are in.
+        node_sort: Topological order of the graph's nodes, by which the nodes are run.
+        output_nodes_names: Names of the nodes whose outputs are requested, so they are never released.
+
+    Returns:
+        For each node (by its index in node_sort), the indices (in node_sort) of the nodes whose output tensors can
+        be released after it runs.
+    """
+    node_to_index = {node: i for i, node in enumerate(node_sort)}
+    output_nodes_names = set(output_nodes_names)
+
+    release_schedule = [[] for _ in node_sort]
+    for i, node in enumerate(node_sort):
+        if node.name in output_nodes_names:
+            continue
+        # A node's outputs are alive until its last consumer runs (or until it runs, if it has no consumers).
+        last_use = max([node_to_index[oe.sink_node] for oe in graph.out_edges(node)], default=i)
+        release_schedule[last_use].append(i)
+    return release_schedule
@@ -158,3 +158,262 @@ class HistogramCollector(BaseCollector):
         """
         count, bins = np.histogram(x, bins=self.__n_bins)
         self.__histogram_per_iteration.append((count, bins))
+
+    def update_histogram(self, counts: np.ndarray, bins: np.ndarray):
+        """
+        Update the current state of the histogram using a histogram of a tensor that goes through
+        the collector (instead of the tensor itself).
+
+        Args:
+            counts: Counts of the tensor's histogram.
+            bins: Bins edges of the tensor's histogram.
+        """
+        self.__histogram_per_iteration.append((counts, bins))
+
+    @property
+    def n_bins(self) -> int:
+        """
+        Returns: Number of bins to use for each collected histogram.
+        """
+        return self.__n_bins
+
+
+class StreamingHistogramCollector(BaseCollector):
+    """
+    Collector for holding histogram of tensors going through it, using a fixed number of bins.
+    Instead of keeping a histogram per iteration and merging them lazily, every new tensor is merged
+    into a single histogram as it is collected. When a tensor falls outside the current histogram's range,
+    the range grows by multiplying the bin width by a power of two, so existing bins are merged into the new
+    bins exactly (no interpolation is needed). This way, the memory of the collector is constant and does not
+    depend on the number of iterations, and getting the histogram requires no merge.
+    """
+
+    def __init__(self, n_bins: int = 2048):
+        """
+        Args:
+            n_bins: Number of bins in the histogram.
+        """
+
+        super().__init__()
+        self.__n_bins = n_bins
+        self.__counts = None  # Counts of the merged histogram
+        self.__range_min = None  # Left edge of the histogram's first bin
+        self.__bin_width = None
+        # As long as all collected values are identical, the histogram range can not be inferred.
+        # In this case, we only track the value and the number of times it was seen.
+        self.__point_value = None
+        self.__point_count = 0
+
+    def __get_bins(self) -> np.ndarray:
+        """
+        Returns: Bins edges of the merged histogram.
+        """
+        return self.__range_min + self.__bin_width * np.arange(self.__n_bins + 1)
+
+    def __bin_index(self, x: np.ndarray) -> np.ndarray:
+        """
+        Compute the index of the bin each value falls in (without clipping it to the histogram's range).
+
+        Args:
+            x: Values to compute their bins indices.
+
+        Returns:
+            Bins indices of the values.
+        """
+        return np.floor((x - self.__range_min) / self.__bin_width)
+
+    def __init_range(self, range_min: float, range_max: float):
+        """
+        Initialize the histogram between two values.
+
+        Args:
+            range_min: Left edge of the histogram.
+            range_max: Right edge of the histogram.
+        """
+        self.__range_min = range_min
+        self.__bin_width = (range_max - range_min) / self.__n_bins
+        self.__counts = np.zeros(self.__n_bins)
+
+    def __expand_range(self, range_min: float, range_max: float):
+        """
+        Expand the histogram's range so it contains [range_min, range_max]. The bin width is multiplied
+        by the smallest power of two that is enough to cover the new range, and the new left edge is aligned
+        to the current bins, so every existing bin falls into exactly one new bin. The spare bins are split
+        between both sides of the new range, so a slowly growing range does not require an expansion per update.
+
+        Args:
+            range_min: Minimal value the histogram should contain.
+            range_max: Maximal value the histogram should contain.
+        """
+        current_range_max = self.__range_min + self.__n_bins * self.__bin_width
+        if range_min >= self.__range_min and range_max <= current_range_max:
+            return
+
+        range_min = min(range_min, self.__range_min)
+        range_max = max(range_max, current_range_max)
+
+        factor = 1
+        while True:
+            factor *= 2
+            new_bin_width = self.__bin_width * factor
+            # Minimal and maximal number of new bins to the left of the current range,
+            # such that the expanded histogram contains both range_min and range_max.
+            min_left_bins = int(np.ceil((self.__range_min - range_min) / new_bin_width))
+            max_left_bins = int(np.floor(self.__n_bins - (range_max - self.__range_min) / new_bin_width))
+            if min_left_bins <= max_left_bins:
+                break
+        n_left_bins = (min_left_bins + max_left_bins) // 2
+        new_range_min = self.__range_min - n_left_bins * new_bin_width
+
+        # Bin i of the current histogram falls into bin (i // factor + n_left_bins) of the expanded histogram.
+        new_bins_indices = np.arange(self.__n_bins) // factor + n_left_bins
+        self.__counts = np.bincount(new_bins_indices, weights=self.__counts, minlength=self.__n_bins)
+        self.__range_min = new_range_min
+        self.__bin_width = new_bin_width
+
+    def __add_counts(self, x: np.ndarray, weight: float = 1.0):
+        """
+        Add values to the histogram counts. Values are assumed to be inside the histogram's range
+        (up to numerical errors, which are clipped to the edge bins).
+
+        Args:
+            x: Values to add.
+            weight: Count to add for each value.
+        """
+        bins_indices = np.clip(self.__bin_index(x), 0, self.__n_bins - 1).astype(int)
+        self.__counts += weight * np.bincount(bins_indices.flatten(), minlength=self.__n_bins)
+
+    def scale(self, scale_factor: np.ndarray):
+        """
+        Scale all statistics in collector by some factor.
+        If the scale is per-channel, the data's validity status change to invalid since histogram was collected
+        per-tensor and not per-channel.
+
+        Args:
+            scale_factor: Factor to scale all collector's statistics by.
+
+        """
+
+        scale_per_channel = scale_factor.flatten().shape[0] > 1  # current scaling is per channel or not
+        if scale_per_channel or not self.is_legal:
+            self.update_legal_status(is_illegal=True)
+        else:
+            self.__materialize_point_histogram()
+            self.__range_min = self.__range_min * scale_factor
+            self.__bin_width = self.__bin_width * scale_factor
+
+    def shift(self, shift_value: np.ndarray):
+        """
+        Shift all statistics in collector by some value.
+        If the shifting is per-channel, the data's validity status change to invalid since histogram was collected
+        per-tensor and not per-channel.
+
+        Args:
+            shift_value: Value to shift all collector's statistics by.
+
+        """
+
+        shift_per_channel = shift_value.flatten().shape[0] > 1  # current shifting is per channel or not
+        if shift_per_channel or not self.is_legal:
+            self.update_legal_status(is_illegal=True)
+        else:
+            self.__materialize_point_histogram()
+            self.__range_min = self.__range_min + shift_value
+
+    def __materialize_point_histogram(self):
+        """
+        If all collected values were identical, create a histogram that holds them the same way
+        numpy.histogram does for a constant tensor (bins between value-0.5 and value+0.5).
+        """
+        if self.__counts is None and self.__point_value is not None:
+            self.__init_range(self.__point_value - 0.5, self.__point_value + 0.5)
+            self.__add_counts(np.asarray([self.__point_value]), weight=self.__point_count)
+            self.__point_value = None
+            self.__point_count = 0
+
+    def get_histogram(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Returns: The histogram (bins and counts) the collector holds.
+        """
+
+        self.validate_data_correctness()
+        self.__materialize_point_histogram()
+        return self.__get_bins(), self.__counts
+
+    def max(self):
+        """
+        Returns: Maximum value in the histogram.
+        """
+        bins, counts = self.get_histogram()
+        return max(bins[:-1][counts > 0])
+
+    def min(self):
+        """
+        Returns: Minimum value in the histogram.
+        """
+        bins, counts = self.get_histogram()
+        return min(bins[:-1][counts > 0])
+
+    def update(self, x: np.ndarray):
+        """
+        Update the current state of the histogram bins and count according to a new
+        tensor that goes through the collector.
+
+        Args:
+            x: Tensor going through the collector to update the histogram according to.
+        """
+        x_min, x_max = np.min(x), np.max(x)
+        if self.__prepare_range(x_min, x_max):
+            self.__add_counts(x)
+        else:
+            self.__point_count += x.size
+
+    def update_histogram(self, counts: np.ndarray, bins: np.ndarray):
+        """
+        Update the current state of the histogram using a histogram of a tensor that goes through
+        the collector (instead of the tensor itself). The histogram is interpolated to the collector's bins.
+
+        Args:
+            counts: Counts of the tensor's histogram.
+            bins: Bins edges of the tensor's histogram.
+        """
+        non_empty_bins = np.nonzero(counts)[0]
+        if len(non_empty_bins) == 0:
+            return
+        if self.__prepare_range(bins[non_empty_bins[0]], bins[non_empty_bins[-1] + 1]):
+            self.__counts += interpolate_histogram(self.__get_bins(), bins, counts)
+
+    @property
+    def n_bins(self) -> int:
+        """
+        Returns: Number of bins in the histogram.
+        """
+        return self.__n_bins
+
+    def __prepare_range(self, x_min: float, x_max: float) -> bool:
+        """
+        Make sure the histogram's range contains [x_min, x_max] before adding new values to it.
+        As long as all values are identical, the histogram is not created and only the value is tracked.
+
+        Args:
+            x_min: Minimal value to add.
+            x_max: Maximal value to add.
+
+        Returns:
+            Whether the values should be added to the histogram's counts (False if all values that were seen
+            so far are identical, so the caller should only count them).
+        """
+        if self.__counts is None:
+            if self.__point_value is not None:
+                x_min, x_max = min(x_min, self.__point_value), max(x_max, self.__point_value)
+            if x_min == x_max:
+                self.__point_value = x_min
+                return False
+            self.__init_range(x_min, x_max)
+            if self.__point_value is not None:
+                self.__add_counts(np.asarray([self.__point_value]), weight=self.__point_count)
+                self.__point_value = None
+                self.__point_count = 0
+        else:
+            self.__expand_range(x_min, x_max)
+        return True
@@ -23,25 +23,30 @@ from model_compression_toolkit.constants import LAST_AXIS
 class MeanCollector(BaseCollector):
     """
         Class to collect observed per channel mean values of tensors that goes through it (passed to update).
-        The mean is calculated using a exponential moving average with bias correction.
+        The mean is calculated either exactly (using a running sum and count per channel), or using an
+        exponential moving average with bias correction.
     """
 
     def __init__(self,
                  axis: int,
-                 beta: float = 0.99):
+                 beta: float = 0.99,
+                 use_ema: bool = True):
         """
-        Instantiate a per channel mean collector using a exponential moving average with bias correction.
+        Instantiate a per channel mean collector.
 
         Args:
             axis: Compute the mean with regard to this axis.
             beta: Parameter for mean smoothing by EMA.
+            use_ema: Whether to compute the mean using an EMA with bias correction (True) or to compute the exact mean of all observed values (False).
         """
         super().__init__()
         self.axis = axis
-        self.__state_internal = np.array([0.0])  # mean per-channel
+        self.__state_internal = np.array([0.0])  # mean per-channel (EMA) or sum per-channel (exact mean)
         self.__state_internal_correction = None
         self.beta = beta
+        self.use_ema = use_ema
         self.i = 0.0
+        self.__count = 0  # Number of values that were summed per-channel (exact mean)
 
     def scale(self, scale_factor: np.ndarray):
         """
@@ -85,16 +90,38 @@ class MeanCollector(BaseCollector):
                x: np.ndarray):
         """
         Update the mean using a new tensor x to consider.
+        The tensor is reduced over all axes except the channel axis (without transposing or
+        copying it), and accumulated in float64.
 
         Args:
             x: Tensor that goes through the mean collector and needs to be considered in the mean computation.
         """
 
-        self.i += 1  # Update the iteration index
         axis = (len(x.shape) - 1) if self.axis == LAST_AXIS else self.axis
-        n = x.shape[axis]
-        transpose_index = [axis, *[i for i in range(len(x.shape)) if i != axis]]
-        mu = np.mean(np.reshape(np.transpose(x, transpose_index), [n, -1]), axis=-1)  # compute mean per channel
+        reduce_axes = tuple(i for i in range(len(x.shape)) if i != axis)
+        self.update_sum(np.sum(x, axis=reduce_axes, dtype=np.float64), x.size // x.shape[axis])
+
+    def update_sum(self,
+                   sum_per_channel: np.ndarray,
+                   count_per_channel: int):
+        """
+        Update the mean using the per-channel sum of a new tensor to consider (for example, when
+        the tensor was already reduced by the framework).
+
+        Args:
+            sum_per_channel: Sum of the tensor's values per-channel.
+            count_per_channel: Number of values in each channel of the tensor.
+        """
+
+        self.i += 1  # Update the iteration index
+
+        if not self.use_ema:
+            self.__state_internal = self.__state_internal + sum_per_channel
+            self.__count += count_per_channel
+            self.__state_internal_correction = self.__state_internal / self.__count
+            return
+
+        mu = sum_per_channel / count_per_channel  # compute mean per channel
         update_state = self.beta * self.__state_internal + (1 - self.beta) * mu
         self.__state_internal = update_state
 
@@ -131,13 +131,25 @@ class MinMaxPerChannelCollector(BaseCollector):
         """
 
         axis = (len(x.shape) - 1) if self.axis == LAST_AXIS else self.axis
-        n = x.shape[axis]
-        transpose_index = [axis, *[i for i in range(len(x.shape)) if i != axis]]
-        x_reshape = np.reshape(np.transpose(x, transpose_index), [n, -1])
+        reduce_axes = tuple(i for i in range(len(x.shape)) if i != axis)
+        self.update_min_max(np.min(x, axis=reduce_axes), np.max(x, axis=reduce_axes))
+
+    def update_min_max(self,
+                       min_per_channel: np.ndarray,
+                       max_per_channel: np.ndarray):
+        """
+        Update the min/max values the collector holds using the per-channel min/max values of a new
+        tensor to consider (for example, when the tensor was already reduced by the framework).
+
+        Args:
+            min_per_channel: Minimal value of the tensor per-channel.
+            max_per_channel: Maximal value of the tensor per-channel.
+        """
+
         if self.state is None:
-            x_max = np.max(x_reshape, axis=-1)
-            x_min = np.min(x_reshape, axis=-1)
+            x_max = max_per_channel
+            x_min = min_per_channel
         else:
-            x_max = np.maximum(np.max(x_reshape, axis=-1), self.state[:, 0])
-            x_min = np.minimum(np.min(x_reshape, axis=-1), self.state[:, 1])
+            x_max = np.maximum(max_per_channel, self.state[:, 0])
+            x_min = np.minimum(min_per_channel, self.state[:, 1])
         self.state = np.stack([x_max, x_min], axis=-1)
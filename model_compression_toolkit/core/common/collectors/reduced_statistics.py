@@ -0,0 +1,66 @@
+# Copyright 2023 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+
+from typing import Tuple
+
+import numpy as np
+
+
+class ReducedStatistics:
+    """
+    Statistics of a single tensor that were reduced by the framework: per-channel min/max/sum and
+    a histogram of the whole tensor. They can be passed to a StatsCollector instead of the tensor itself,
+    so only these small arrays are transferred from the framework to Numpy.
+    """
+
+    def __init__(self,
+                 min_per_channel: np.ndarray,
+                 max_per_channel: np.ndarray,
+                 sum_per_channel: np.ndarray,
+                 count_per_channel: int,
+                 hist_counts: np.ndarray,
+                 hist_bins: np.ndarray):
+        """
+        Args:
+            min_per_channel: Minimal value of the tensor per-channel.
+            max_per_channel: Maximal value of the tensor per-channel.
+            sum_per_channel: Sum of the tensor's values per-channel.
+            count_per_channel: Number of values in each channel.
+            hist_counts: Counts of the tensor's histogram.
+            hist_bins: Bins edges of the tensor's histogram.
+        """
+        self.min_per_channel = min_per_channel
+        self.max_per_channel = max_per_channel
+        self.sum_per_channel = sum_per_channel
+        self.count_per_channel = count_per_channel
+        self.hist_counts = hist_counts
+        self.hist_bins = hist_bins
+
+
+def get_histogram_range(min_value: float, max_value: float) -> Tuple[float, float]:
+    """
+    Get the range of a histogram of a tensor with the given min/max values, the same way numpy.histogram
+    computes it (a tensor with a single value gets a histogram between value-0.5 and value+0.5).
+
+    Args:
+        min_value: Minimal value of the tensor.
+        max_value: Maximal value of the tensor.
+
+    Returns:
+        Left and right edges of the histogram.
+    """
+    if min_value == max_value:
+        return min_value - 0.5, max_value + 0.5
+    return min_value, max_value
@@ -21,9 +21,11 @@ from typing import Any, Tuple
 import numpy as np
 
 from model_compression_toolkit.core.common.framework_info import FrameworkInfo, ChannelAxis
-from model_compression_toolkit.core.common.collectors.histogram_collector import HistogramCollector
+from model_compression_toolkit.core.common.collectors.histogram_collector import HistogramCollector, \
+    StreamingHistogramCollector
 from model_compression_toolkit.core.common.collectors.mean_collector import MeanCollector
 from model_compression_toolkit.core.common.collectors.min_max_per_channel_collector import MinMaxPerChannelCollector
+from model_compression_toolkit.core.common.collectors.reduced_statistics import ReducedStatistics
 
 
 class BaseStatsCollector(object):
@@ -58,7 +60,9 @@ class StatsCollector(BaseStatsCollector):
     def __init__(self,
                  out_channel_axis: int,
                  init_min_value: float = None,
-                 init_max_value: float = None):
+                 init_max_value: float = None,
+                 streaming_histogram: bool = False,
+                 exact_mean: bool = False):
         """
         Instantiate three statistics collectors: histogram, mean and min/max per channel.
         Set initial min/max values if are known.
@@ -67,11 +71,13 @@ class StatsCollector(BaseStatsCollector):
             out_channel_axis: Index of output channels.
             init_min_value: Initial min value for min/max stored values.
             init_max_value: Initial max value for min/max stored values.
+            streaming_histogram: Whether to merge the histogram on the fly using a fixed number of bins, instead of keeping a histogram per iteration.
+            exact_mean: Whether to compute the exact per-channel mean instead of an exponential moving average.
         """
 
         super().__init__()
-        self.hc = HistogramCollector()
-        self.mc = MeanCollector(axis=out_channel_axis)
+        self.hc = StreamingHistogramCollector() if streaming_histogram else HistogramCollector()
+        self.mc = MeanCollector(axis=out_channel_axis, use_ema=not exact_mean)
         self.mpcc = MinMaxPerChannelCollector(init_min_value=init_min_value,
                                               init_max_value=init_max_value,
                                               axis=out_channel_axis)
@@ -89,6 +95,35 @@ class StatsCollector(BaseStatsCollector):
         self.mc.update(x)
         self.mpcc.update(x)
 
+    def update_reduced_statistics(self, reduced_statistics: ReducedStatistics):
+        """
+        Update statistics in all collectors with statistics of a new tensor to consider,
+        that were already reduced by the framework.
+
+        Args:
+            reduced_statistics: Reduced statistics of the tensor to consider.
+        """
+
+        self.hc.update_histogram(reduced_statistics.hist_counts, reduced_statistics.hist_bins)
+        self.mc.update_sum(reduced_statistics.sum_per_channel, reduced_statistics.count_per_channel)
+        self.mpcc.update_min_max(reduced_statistics.min_per_channel, reduced_statistics.max_per_channel)
+
+    @property
+    def out_channel_axis(self) -> int:
+        """
+        Returns: Index of the channels axis the statistics are collected per.
+        """
+
+        return self.mpcc.axis
+
+    @property
+    def n_bins(self) -> int:
+        """
+        Returns: Number of bins to use for the histogram of each collected tensor.
+        """
+
+        return self.hc.n_bins
+
     def get_mean(self) -> np.ndarray:
         """
         Get mean per-channel from mean collector. When its accessed from outside the tensor,
@@ -200,7 +235,7 @@ def standardize_tensor(x: Any) -> np.ndarray:
     Returns:
         Same tensor as numpy ndarray of float data type.
     """
-    x = x.astype(np.float64)
+    x = x.astype(np.float64, copy=False)
     if not isinstance(x, np.ndarray) and len(x.shape) == 0:
         x = np.asarray(x)
         x = x.reshape([1])
@@ -0,0 +1,295 @@
+# Copyright 2023 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import hashlib
+import json
+import os
+import re
+from typing import Any, Callable, Dict, List
+
+import numpy as np
+
+from model_compression_toolkit.logger import Logger
+from model_compression_toolkit.core.common.collectors.base_collector import BaseCollector
+from model_compression_toolkit.core.common.collectors.statistics_collector import BaseStatsCollector
+from model_compression_toolkit.core.common.framework_implementation import FrameworkImplementation
+from model_compression_toolkit.core.common.graph.base_graph import Graph
+
+# Nodes' attributes that are set according to the quantization configuration (and not according to the
+# prepared model), so they do not affect the collected statistics and are not part of the statistics key.
+QUANTIZATION_NODE_ATTRIBUTES = ['quantization_attr',
+                                'candidates_quantization_cfg',
+                                'final_weights_quantization_cfg',
+                                'final_activation_quantization_cfg',
+                                'prior_info']
+
+# Keys to mark non-JSON values in the serialized state of a collector.
+ARRAY_KEY = '__array__'
+COLLECTOR_KEY = '__collector__'
+STATE_KEY = '__state__'
+TUPLE_KEY = '__tuple__'
+
+# Offset alignment (in bytes) of the arrays in the statistics file.
+ARRAY_ALIGNMENT = 64
+
+
+class StatisticsStore:
+    """
+    An on-disk store of the statistics collected for a graph, such that runs that quantize the same prepared
+    graph with the same representative dataset (for example, with a different quantization error method or
+    KPI target) can load the statistics instead of inferring the dataset.
+    The statistics of a graph are saved in a pair of files, named after a hash of the graph and the dataset: a JSON
+    index with the collectors' states, and a binary file with the collectors' arrays that is memory-mapped on load.
+    """
+
+    def __init__(self, cache_dir: str):
+        """
+        Args:
+            cache_dir: Directory to save the statistics files in.
+        """
+        self.cache_dir = cache_dir
+
+    def get_key(self,
+                graph: Graph,
+                representative_data_gen: Callable,
+                fw_impl: FrameworkImplementation,
+                framework_statistics_reduction: bool = False) -> str:
+        """
+        Compute the key of the statistics of a graph. The key is a hash of the graph's structure, its nodes' attributes
+        and weights, the (initial) statistics collectors attached to it and the representative dataset's samples.
+        Note that computing the key iterates over the representative dataset (without inferring it).
+
+        Args:
+            graph: Graph with statistics collectors attached to its nodes.
+            representative_data_gen: Dataset to collect the statistics with.
+            fw_impl: FrameworkImplementation object with a specific framework methods implementation.
+            framework_statistics_reduction: Whether the statistics are reduced by the framework.
+
+        Returns:
+            The key of the graph's statistics.
+        """
+        hasher = hashlib.sha256()
+
+        def _hash(value: Any):
+            _hash_value(hasher, value, fw_impl.to_numpy)
+
+        _hash([fw_impl.__class__.__name__, framework_statistics_reduction])
+
+        for n in graph.get_topo_sorted_nodes():
+            _hash({k: v for k, v in vars(n).items() if k not in QUANTIZATION_NODE_ATTRIBUTES})
+            _hash([(e.source_node.name, e.source_index, e.sink_index) for e in graph.incoming_edges(n)])
+            arrays = []
+            _hash(_serialize_state(graph.get_out_stats_collector(n), arrays))
+            _hash(arrays)
+        _hash([(o.node.name, o.node_out_index) for o in graph.get_outputs()])
+
+        for inputs in representative_data_gen():
+            _hash(inputs)
+
+        return hasher.hexdigest()
+
+    def load(self, graph: Graph, key: str) -> bool:
+        """
+        Load the statistics that were saved with a key into the statistics collectors of a graph.
+
+        Args:
+            graph: Graph with statistics collectors attached to its nodes.
+            key: Key of the statistics to load.
+
+        Returns:
+            Whether the statistics were found and loaded.
+        """
+        index_path, data_path = self._get_paths(key)
+        if not os.path.isfile(index_path) or not os.path.isfile(data_path):
+            return False
+
+        with open(index_path, 'r') as f:
+            index = json.load(f)
+
+        collectors = _get_graph_collectors(graph)
+        if index.get('key') != key or \
+                set(index['collectors'].keys()) != set(collectors.keys()) or \
+                any(index['collectors'][name][COLLECTOR_KEY] != type(sc).__name__ for name, sc in collectors.items()):
+            Logger.warning(f'Statistics file {index_path} does not match the graph, statistics are collected again')
+            return False
+
+        # The file is mapped in copy-on-write mode, so collectors can update the arrays without changing the file.
+        data = np.memmap(data_path, dtype=np.uint8, mode='c') if os.path.getsize(data_path) > 0 else b''
+        arrays = [np.ndarray(a['shape'], dtype=np.dtype(a['dtype']), buffer=data, offset=a['offset'])
+                  for a in index['arrays']]
+
+        for name, sc in collectors.items():
+            _restore_state(sc, index['collectors'][name], arrays)
+
+        Logger.info(f'Loaded statistics from {index_path}')
+        return True
+
+    def save(self, graph: Graph, key: str):
+        """
+        Save the statistics that were collected for a graph.
+
+        Args:
+            graph: Graph with statistics collectors that collected statistics.
+            key: Key to save the statistics with.
+        """
+        os.makedirs(self.cache_dir, exist_ok=True)
+        index_path, data_path = self._get_paths(key)
+
+        arrays = []
+        collectors = {name: _serialize_state(sc, arrays) for name, sc in _get_graph_collectors(graph).items()}
+
+        arrays_index, offset = [], 0
+        with open(data_path + '.tmp', 'wb') as f:
+            for a in arrays:
+                a = np.ascontiguousarray(a)
+                f.write(b'\0' * (offset - f.tell()))
+                f.write(a.tobytes())
+                arrays_index.append({'shape': list(a.shape), 'dtype': a.dtype.str, 'offset': offset})
+                offset += -(-a.nbytes // ARRAY_ALIGNMENT) * ARRAY_ALIGNMENT
+        with open(index_path + '.tmp', 'w') as f:
+            json.dump({'key': key, 'arrays': arrays_index, 'collectors': collectors}, f)
+
+        # The index is replaced last, so an index file always points to a complete data file.
+        os.replace(data_path + '.tmp', data_path)
+        os.replace(index_path + '.tmp', index_path)
+        Logger.info(f'Saved statistics to {index_path}')
+
+    def _get_paths(self, key: str):
+        """
+        Args:
+            key: Key of statistics.
+
+        Returns:
+            The paths of the index file and the data file of the statistics.
+        """
+        return os.path.join(self.cache_dir, f'{key}.json'), os.path.join(self.cache_dir, f'{key}.bin')
+
+
+def _get_graph_collectors(graph: Graph) -> Dict[str, BaseStatsCollector]:
+    """
+    Get the output statistics collectors of a graph's nodes that collect statistics.
+    Input statistics collectors are the output statistics collectors of the previous nodes, so restoring the output
+    collectors restores them as well.
+
+    Args:
+        graph: Graph with statistics collectors attached to its nodes.
+
+    Returns:
+        A mapping from a unique name of each statistics collector to the collector.
+    """
+    collectors = {}
+    for n in graph.get_topo_sorted_nodes():
+        out_stats_collector = graph.get_out_stats_collector(n)
+        if not isinstance(out_stats_collector, list):
+            out_stats_collector = [out_stats_collector]
+        for i, sc in enumerate(out_stats_collector):
+            if sc is not None and sc.require_collection():
+                collectors[f'{n.name}:{i}'] = sc
+    return collectors
+
+
+def _serialize_state(value: Any, arrays: List[np.ndarray]) -> Any:
+    """
+    Serialize the state of a statistics collector (or a value in its state) to a JSON compatible value.
+    The arrays in the state are appended to a list and replaced by their index in it.
+
+    Args:
+        value: Value to serialize.
+        arrays: List to append the arrays in the value to.
+
+    Returns:
+        The serialized value.
+    """
+    if isinstance(value, np.ndarray):
+        arrays.append(value)
+        return {ARRAY_KEY: len(arrays) - 1}
+    if isinstance(value, (BaseCollector, BaseStatsCollector)):
+        return {COLLECTOR_KEY: type(value).__name__,
+                STATE_KEY: {k: _serialize_state(v, arrays) for k, v in vars(value).items()}}
+    if isinstance(value, tuple):
+        return {TUPLE_KEY: [_serialize_state(v, arrays) for v in value]}
+    if isinstance(value, list):
+        return [_serialize_state(v, arrays) for v in value]
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
+
+
+def _deserialize_value(value: Any, arrays: List[np.ndarray]) -> Any:
+    """
+    Deserialize a value of a statistics collector's state that was serialized by _serialize_state.
+
+    Args:
+        value: Serialized value.
+        arrays: Arrays the serialized value refers to.
+
+    Returns:
+        The deserialized value.
+    """
+    if isinstance(value, dict):
+        if ARRAY_KEY in value:
+            return arrays[value[ARRAY_KEY]]
+        if TUPLE_KEY in value:
+            return tuple(_deserialize_value(v, arrays) for v in value[TUPLE_KEY])
+    if isinstance(value, list):
+        return [_deserialize_value(v, arrays) for v in value]
+    return value
+
+
+def _restore_state(collector: Any, state: Dict[str, Any], arrays: List[np.ndarray]):
+    """
+    Restore a serialized state into an existing statistics collector (and its inner collectors), so objects
+    that refer to the collector see the restored statistics.
+
+    Args:
+        collector: Collector to restore its state.
+        state: Serialized state of the collector.
+        arrays: Arrays the serialized state refers to.
+    """
+    for k, v in state[STATE_KEY].items():
+        if isinstance(v, dict) and COLLECTOR_KEY in v:
+            _restore_state(getattr(collector, k), v, arrays)
+        else:
+            setattr(collector, k, _deserialize_value(v, arrays))
+
+
+def _hash_value(hasher: Any, value: Any, to_numpy: Callable):
+    """
+    Update a hash with a value.
+
+    Args:
+        hasher: Hash object to update.
+        value: Value to hash.
+        to_numpy: Function to convert a framework's tensor to a Numpy array.
+    """
+    if isinstance(value, np.ndarray) and value.dtype != object:
+        hasher.update(f'array{value.dtype.str}{value.shape}'.encode())
+        hasher.update(np.ascontiguousarray(value))
+    elif isinstance(value, dict):
+        hasher.update(f'dict{len(value)}'.encode())
+        for k in sorted(value.keys(), key=str):
+            _hash_value(hasher, k, to_numpy)
+            _hash_value(hasher, value[k], to_numpy)
+    elif isinstance(value, (list, tuple)):
+        hasher.update(f'{type(value).__name__}{len(value)}'.encode())
+        for v in value:
+            _hash_value(hasher, v, to_numpy)
+    elif callable(value) and hasattr(value, '__qualname__'):
+        hasher.update(f'{getattr(value, "__module__", None)}.{value.__qualname__}'.encode())
+    elif hasattr(value, 'shape') and hasattr(value, 'dtype') and not isinstance(value, np.generic):
+        # A framework's tensor
+        _hash_value(hasher, np.asarray(to_numpy(value)), to_numpy)
+    else:
+        # Objects' addresses are removed from their representation, so it is the same in different runs.
+        hasher.update(re.sub(r' at 0x[0-9a-fA-F]+', '', repr(value)).encode())
@@ -20,6 +20,7 @@ import numpy as np
 from model_compression_toolkit.core import MixedPrecisionQuantizationConfigV2
 from model_compression_toolkit.core import common
 from model_compression_toolkit.core.common import BaseNode
+from model_compression_toolkit.core.common.collectors.reduced_statistics import ReducedStatistics
 from model_compression_toolkit.core.common.collectors.statistics_collector import BaseStatsCollector
 from model_compression_toolkit.core.common.framework_info import FrameworkInfo
 from model_compression_toolkit.core.common.graph.base_graph import Graph
@@ -116,13 +117,15 @@ class FrameworkImplementation(ABC):
     @abstractmethod
     def run_model_inference(self,
                             model: Any,
-                            input_list: List[Any]) -> Tuple[Any]:
+                            input_list: List[Any],
+                            requires_grad: bool = False) -> Tuple[Any]:
         """
         Run the model logic on the given the inputs.
 
         Args:
             model: Framework's model.
             input_list: List of inputs for the model.
+            requires_grad: Whether the inference should record the autograd graph (for computing gradients).
 
         Returns:
             The frameworks model's output.
@@ -130,6 +133,43 @@ class FrameworkImplementation(ABC):
         raise NotImplemented(f'{self.__class__.__name__} have to implement the '
                              f'framework\'s run_model_inference method.')  # pragma: no cover
 
+    def compile_inference_model(self,
+                                model: Any,
+                                jit_compile: bool = False) -> Any:
+        """
+        Compile a model into a graph function that runs inference with the same call signature as the model,
+        to be used by run_model_inference and sensitivity_eval_inference instead of the model.
+        By default, the model is returned as is (frameworks that support graph compilation override it).
+
+        Args:
+            model: Framework's model.
+            jit_compile: Whether to compile the graph function with a JIT compiler (XLA).
+
+        Returns:
+            A callable to run inference with instead of the model.
+        """
+        return model
+
+    @abstractmethod
+    def reduce_tensor_statistics(self,
+                                 tensor: Any,
+                                 channel_axis: int,
+                                 n_bins: int) -> ReducedStatistics:
+        """
+        Compute the statistics that are needed for statistics collection (per-channel min/max/sum
+        and a histogram) from a framework's tensor, inside the framework.
+
+        Args:
+            tensor: Framework's tensor.
+            channel_axis: Index of the channels axis to compute the per-channel statistics by.
+            n_bins: Number of bins in the histogram.
+
+        Returns:
+            ReducedStatistics of the tensor.
+        """
+        raise NotImplemented(f'{self.__class__.__name__} have to implement the '
+                             f'framework\'s reduce_tensor_statistics method.')  # pragma: no cover
+
     @abstractmethod
     def shift_negative_correction(self,
                                   graph: Graph,
@@ -150,7 +190,10 @@ class FrameworkImplementation(ABC):
                              f'framework\'s apply_shift_negative_correction method.')  # pragma: no cover
 
     @abstractmethod
-    def attach_sc_to_node(self, node: BaseNode, fw_info: FrameworkInfo) -> BaseStatsCollector:
+    def attach_sc_to_node(self,
+                          node: BaseNode,
+                          fw_info: FrameworkInfo,
+                          qc: QuantizationConfig = None) -> BaseStatsCollector:
         """
         Return a statistics collector that should be attached to a node's output
         during statistics collection.
@@ -158,6 +201,7 @@ class FrameworkImplementation(ABC):
         Args:
             node: Node to return its collector.
             fw_info: Information relevant to a specific framework about what is out channel axis (for statistics per-channel).
+            qc: Quantization configuration that determines how the statistics should be collected.
 
         Returns:
             Statistics collector for the node.
@@ -395,6 +439,49 @@ class FrameworkImplementation(ABC):
         raise NotImplemented(f'{self.__class__.__name__} have to implement the '
                              f'framework\'s model_grad method.')  # pragma: no cover
 
+    def model_grad_per_image(self,
+                             graph_float: common.Graph,
+                             model_input_tensors: Dict[BaseNode, Any],
+                             interest_points: List[BaseNode],
+                             output_list: List[BaseNode],
+                             all_outputs_indices: List[int],
+                             alpha: float = 0.3,
+                             n_iter: int = 50,
+                             norm_weights: bool = True) -> np.ndarray:
+        """
+        Computes the jacobian-based weights of the model's outputs with respect to the feature maps of the set of
+        given interest points (as model_grad computes them for a single image) for each image of a batch of images.
+        By default, model_grad is called for each image. Frameworks may override it to compute the weights of all
+        the images together.
+
+        Args:
+            graph_float: Graph to build its corresponding framework model.
+            model_input_tensors: A mapping between model input nodes to an input batch.
+            interest_points: List of nodes which we want to get their feature map as output, to calculate distance metric.
+            output_list: List of nodes that considered as model's output for the purpose of gradients computation.
+            all_outputs_indices: Indices of the model outputs and outputs replacements (if exists),
+                in a topological sorted interest points list.
+            alpha: A tuning parameter to allow calibration between the contribution of the output feature maps returned
+                weights and the other feature maps weights (since the gradient of the output layers does not provide a
+                compatible weight for the distance metric computation).
+            n_iter: The number of random iterations to calculate the approximated jacobian-based weights for each interest point.
+            norm_weights: Whether to normalize the returned weights (to get values between 0 and 1).
+
+        Returns: An array of the (possibly normalized) jacobian-based weights of each image, with the images on the
+        first axis and the interest points on the second axis.
+        """
+
+        n_images = next(iter(model_input_tensors.values())).shape[0]
+        return np.asarray([self.model_grad(graph_float,
+                                           {n: t[i:i + 1] for n, t in model_input_tensors.items()},
+                                           interest_points,
+                                           output_list,
+                                           all_outputs_indices,
+                                           alpha,
+                                           n_iter,
+                                           norm_weights=norm_weights)
+                           for i in range(n_images)])
+
     @abstractmethod
     def is_node_compatible_for_metric_outputs(self,
                                                  node: BaseNode) -> bool:
@@ -453,16 +540,60 @@ class FrameworkImplementation(ABC):
     @abstractmethod
     def sensitivity_eval_inference(self,
                                    model: Any,
-                                   inputs: Any):
+                                   inputs: Any,
+                                   requires_grad: bool = False):
         """
         Calls for a model inference for a specific framework during mixed precision sensitivity evaluation.
 
         Args:
             model: A model to run inference for.
             inputs: Input tensors to run inference on.
+            requires_grad: Whether the inference should record the autograd graph (for computing gradients).
 
         Returns:
             The output of the model inference on the given input.
         """
         raise NotImplemented(f'{self.__class__.__name__} have to implement the '
                              f'framework\'s sensitivity_eval_inference method.')  # pragma: no cover
+
+    @abstractmethod
+    def sensitivity_eval_inference_with_cache(self,
+                                              model: Any,
+                                              inputs: Any) -> Tuple[Any, Any]:
+        """
+        Calls for a model inference for a specific framework during mixed precision sensitivity evaluation,
+        and returns a cache of the model's intermediate activations, to be reused by
+        sensitivity_eval_inference_from_cache.
+
+        Args:
+            model: A model to run inference for.
+            inputs: Input tensors to run inference on.
+
+        Returns:
+            The output of the model inference on the given input, and the activations cache.
+        """
+        raise NotImplemented(f'{self.__class__.__name__} have to implement the '
+                             f'framework\'s sensitivity_eval_inference_with_cache method.')  # pragma: no cover
+
+    @abstractmethod
+    def sensitivity_eval_inference_from_cache(self,
+                                              model: Any,
+                                              inputs: Any,
+                                              cache: Any,
+                                              changed_nodes_names: List[str]) -> Any:
+        """
+        Calls for a model inference for a specific framework during mixed precision sensitivity evaluation,
+        reusing the activations cache of a previous inference on the same inputs, such that only the part of the
+        model that is affected by the changed nodes is computed.
+
+        Args:
+            model: A model to run inference for.
+            inputs: Input tensors to run inference on.
+            cache: Activations cache from sensitivity_eval_inference_with_cache on the same inputs.
+            changed_nodes_names: Names of the nodes whose configuration changed since the cache was created.
+
+        Returns:
+            The output of the model inference on the given input.
+        """
+        raise NotImplemented(f'{self.__class__.__name__} have to implement the '
+                             f'framework\'s sensitivity_eval_inference_from_cache method.')  # pragma: no cover
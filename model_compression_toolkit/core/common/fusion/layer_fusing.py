@@ -97,7 +97,7 @@ def fusion(graph: Graph, tpc: TargetPlatformCapabilities) -> Graph:
     # -------------------------------- #
     # Fusion algorithm
     # -------------------------------- #
-    fused_graph = copy.deepcopy(graph)
+    fused_graph = graph.snapshot()
 
     # Travel along the graph to find layers for fusing
     nodes = fused_graph.get_topo_sorted_nodes()
@@ -15,13 +15,11 @@
 from collections import namedtuple
 
 from copy import copy, deepcopy
-from typing import List, Tuple, Any
+from typing import List, Tuple, Any, Dict
 
 import networkx as nx
 import numpy as np
 
-from networkx.algorithms.dag import topological_sort
-
 from model_compression_toolkit.core.common.framework_info import FrameworkInfo
 from model_compression_toolkit.core.common.graph.edge import EDGE_SINK_INDEX, EDGE_SOURCE_INDEX
 from model_compression_toolkit.core.common.graph.edge import Edge, convert_to_edge
@@ -59,6 +57,15 @@ class Graph(nx.MultiDiGraph, GraphSearches):
             **attr: Attributes to add to graph as key=value pairs.
         """
 
+        # The graph's topological order and the nodes' indices in it are computed on demand, and reset whenever
+        # a node or an edge is added to or removed from the graph.
+        self._topo_sorted_nodes = None
+        self._nodes_topo_index = None
+        # The graph's memory schedule, which is set when it is computed and reset with the topological order.
+        self._memory_schedule = None
+        # Nodes whose edges changed (or that were added or removed) while changes are recorded, as an ordered set.
+        self._changed_nodes = None
+
         super().__init__(**attr)
         self.name = name
         self.input_nodes = input_nodes
@@ -93,12 +100,157 @@ class Graph(nx.MultiDiGraph, GraphSearches):
         """
         self.tpc = tpc
 
+    def snapshot(self) -> 'Graph':
+        """
+        Create a copy-on-write copy of the graph: the graph's structure and its nodes (including their quantization
+        configurations) are copied, while the nodes' weights arrays and the statistics collectors are shared with
+        the graph, instead of copying them as a deepcopy of the graph does.
+        Weights are never modified in-place, but replaced using set_weights_by_keys, so replacing a weight in
+        one graph does not change the other graph. Statistics collectors are not modified after the statistics
+        are collected (shifting or scaling a collector creates a new collector).
+
+        Returns:
+            A copy of the graph that shares its weights and statistics collectors with the graph.
+        """
+
+        # Objects in the deepcopy's memo are not copied.
+        shared_objects = [w for n in self.nodes for w in n.weights.values()]
+        for sc in list(self.node_to_out_stats_collector.values()) + list(self.node_to_in_stats_collector.values()):
+            shared_objects.extend(sc if isinstance(sc, list) else [sc])
+        memo = {id(obj): obj for obj in shared_objects if obj is not None}
+        return deepcopy(self, memo)
+
     def get_topo_sorted_nodes(self):
         """
         Returns: a list of toposorted nodes.
         """
 
-        return list(nx.algorithms.dag.topological_sort(self))
+        if self._topo_sorted_nodes is None:
+            self._topo_sorted_nodes = list(nx.algorithms.dag.topological_sort(self))
+        return list(self._topo_sorted_nodes)
+
+    def get_nodes_topo_index(self) -> Dict[BaseNode, int]:
+        """
+        Returns: A mapping from each node of the graph to its index in the graph's topological order
+        (the order of get_topo_sorted_nodes). The mapping is cached, and should not be modified.
+        """
+
+        if self._nodes_topo_index is None:
+            self._nodes_topo_index = {n: i for i, n in enumerate(self.get_topo_sorted_nodes())}
+        return self._nodes_topo_index
+
+    def get_memory_schedule(self) -> Tuple[List[BaseNode], float, List[Any]]:
+        """
+        Returns: The memory schedule of the graph that was set by set_memory_schedule (the schedule, the cost of its
+        max cut and its cuts), or None if no schedule was set since the graph's structure last changed.
+        """
+
+        return self._memory_schedule
+
+    def set_memory_schedule(self, memory_schedule: Tuple[List[BaseNode], float, List[Any]]):
+        """
+        Set the memory schedule of the graph. The schedule is kept until the graph's structure changes.
+
+        Args:
+            memory_schedule: A schedule for computation of the graph's nodes, the cost of its max cut and its cuts.
+        """
+
+        self._memory_schedule = memory_schedule
+
+    def start_recording_changed_nodes(self):
+        """
+        Start recording the nodes that are added to or removed from the graph, or that have edges added or removed.
+        """
+
+        self._changed_nodes = {}
+
+    def stop_recording_changed_nodes(self) -> List[BaseNode]:
+        """
+        Stop recording the graph's changed nodes.
+
+        Returns: The nodes that changed since the recording started, ordered by their first change (some of them may
+        no longer be in the graph).
+        """
+
+        changed_nodes = list(self._changed_nodes)
+        self._changed_nodes = None
+        return changed_nodes
+
+    def _structure_changed(self, nodes: List[BaseNode]):
+        """
+        Reset the cached topological order and memory schedule of the graph after the graph's structure changes, and
+        record the changed nodes if recording is on.
+
+        Args:
+            nodes: Nodes that are added or removed, or that have edges added or removed.
+        """
+
+        self._topo_sorted_nodes = None
+        self._nodes_topo_index = None
+        self._memory_schedule = None
+        if self._changed_nodes is not None:
+            self._changed_nodes.update(dict.fromkeys(nodes))
+
+    def add_node(self, node_for_adding, **attr):
+        self._structure_changed([node_for_adding])
+        super().add_node(node_for_adding, **attr)
+
+    def add_nodes_from(self, nodes_for_adding, **attr):
+        nodes_for_adding = list(nodes_for_adding)
+        self._structure_changed([n[0] if isinstance(n, tuple) else n for n in nodes_for_adding])
+        super().add_nodes_from(nodes_for_adding, **attr)
+
+    def remove_nodes_from(self, nodes):
+        nodes = list(nodes)
+        self._structure_changed(nodes)
+        super().remove_nodes_from(nodes)
+
+    def add_edge(self, u_for_edge, v_for_edge, *args, **attr):
+        self._structure_changed([u_for_edge, v_for_edge])
+        return super().add_edge(u_for_edge, v_for_edge, *args, **attr)
+
+    def add_edges_from(self, ebunch_to_add, **attr):
+        ebunch_to_add = list(ebunch_to_add)
+        self._structure_changed([n for e in ebunch_to_add for n in e[:2]])
+        return super().add_edges_from(ebunch_to_add, **attr)
+
+    def remove_edge(self, u, v, *args):
+        self._structure_changed([u, v])
+        super().remove_edge(u, v, *args)
+
+    def remove_edges_from(self, ebunch):
+        ebunch = list(ebunch)
+        self._structure_changed([n for e in ebunch for n in e[:2]])
+        super().remove_edges_from(ebunch)
+
+    def clear(self):
+        self._structure_changed(list(self.nodes))
+        super().clear()
+
+    def clear_edges(self):
+        self._structure_changed(list(self.nodes))
+        super().clear_edges()
+
+    def get_scheduled_nodes(self) -> List[BaseNode]:
+        """
+        Returns: A list of the graph's nodes, ordered by the graph's memory schedule (see
+        UserInformation.memory_schedule), if one was set and it's a valid schedule of the graph's nodes.
+        Otherwise, the nodes are toposorted.
+        The Pytorch model builder runs the nodes in this order, so the schedule sets the execution order (and the
+        peak activation memory) of Pytorch models only.
+        """
+        schedule = self.user_info.memory_schedule
+        if schedule is not None:
+            name_to_node = {n.name: n for n in self.nodes}
+            if len(schedule) == len(name_to_node) and set(schedule) == set(name_to_node.keys()):
+                scheduled_nodes = [name_to_node[name] for name in schedule]
+                node_position = {n: i for i, n in enumerate(scheduled_nodes)}
+                if all(node_position[u] < node_position[v] for u, v in self.edges()):
+                    return scheduled_nodes
+            Logger.warning(f'The memory schedule of graph {self.name} does not match its nodes, '
+                           f'the nodes are toposorted instead')
+
+        return self.get_topo_sorted_nodes()
 
     def get_op_list(self) -> np.ndarray:
         """
@@ -158,7 +310,6 @@ class Graph(nx.MultiDiGraph, GraphSearches):
         if n_outputs != 1:  # Node has multiple outputs
             stats_collectors = [deepcopy(stats_collector) for i in
                                 range(n_outputs)]  # Create multiple tensors to attach to each next
-            # node
             out_edges = self.out_edges(n, sort_by_attr=EDGE_SOURCE_INDEX)
             for sc, oe in zip(stats_collectors, out_edges):  # Attach to each next node an input tensor
                 in_nodes = [e.source_node for e in self.incoming_edges(oe.sink_node,
@@ -442,6 +593,7 @@ class Graph(nx.MultiDiGraph, GraphSearches):
                                                          f'' \
                                                          f'before deleting the node from the graph.'
         #  Remove node
+        self._structure_changed([node_to_remove])
         super().remove_node(node_to_remove)
 
     def incoming_edges(self,
@@ -609,12 +761,8 @@ class Graph(nx.MultiDiGraph, GraphSearches):
         Returns: nodes_list sorted topologically.
 
         """
-        sorted_configurable_nodes = []
-        sorted_nodes = list(topological_sort(self))
-        for n in sorted_nodes:
-            if n in nodes_list:
-                sorted_configurable_nodes.append(n)
-        return sorted_configurable_nodes
+        nodes_topo_index = self.get_nodes_topo_index()
+        return sorted({n for n in nodes_list if n in nodes_topo_index}, key=nodes_topo_index.get)
 
     def get_min_candidates_config(self) -> List[int]:
         """
@@ -50,6 +50,16 @@ class NodeOperationMatcher(node_matcher.BaseNodeMatcher):
         if input_node_object.type == self.operation:
             return True
 
+    def get_node_types(self):
+        """
+        Returns: A set with the layer the NodeOperationMatcher holds (or None if the layer can't be hashed).
+        """
+
+        try:
+            return {self.operation}
+        except TypeError:  # pragma: no cover
+            return None
+
 
 class NodeFrameworkAttrMatcher(node_matcher.BaseNodeMatcher):
     """
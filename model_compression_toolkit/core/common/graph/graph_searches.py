@@ -27,39 +27,66 @@ class GraphSearches(base_graph_filter.BaseGraphFilter, ABC):
     The graph needs to have 'nodes' and 'edges' attributes, and a 'get_next_nodes' method.
     """
 
-    def _node_filter(self, node_matcher: node_matcher.BaseNodeMatcher) -> list:
+    def _get_candidate_nodes(self, node_matcher: node_matcher.BaseNodeMatcher, nodes: list = None) -> list:
+        """
+        Get the nodes that a node matcher can match, by the node types the matcher can match.
+
+        Args:
+            node_matcher: Matcher object to apply on nodes in the graph.
+            nodes: Nodes to select the candidates from. If None, the candidates are selected from all the
+                graph's nodes.
+
+        Returns:
+            List of nodes to apply the node_matcher on (ordered as the given nodes, or as the graph's nodes).
+        """
+
+        nodes = self.nodes if nodes is None else nodes
+        node_types = node_matcher.get_node_types() if hasattr(node_matcher, 'get_node_types') else None
+        if node_types is None:
+            return list(nodes)
+        return [n for n in nodes if n.type in node_types]
+
+    def _node_filter(self, node_matcher: node_matcher.BaseNodeMatcher, nodes: list = None) -> list:
         """
         Iterate over nodes and returns the nodes in the graph that matches the matcher object.
 
         Args:
             node_matcher: Matcher object to apply on nodes in the graph.
+            nodes: Nodes to apply the matcher on. If None, it's applied on all the graph's nodes.
 
         Returns:
             List of nodes that match the node_matcher.
         """
 
-        return [n for n in self.nodes if node_matcher.apply(n)]
+        return [n for n in self._get_candidate_nodes(node_matcher, nodes) if node_matcher.apply(n)]
 
-    def _edge_filter(self, edge_matcher: edge_matcher.BaseEdgeMatcher) -> list:
+    def _edge_filter(self, edge_matcher: edge_matcher.BaseEdgeMatcher, nodes: list = None) -> list:
         """
         Iterate over edges and returns the edges in the graph that matches
         the edge_matcher object.
 
         Args:
             edge_matcher: Matcher object to apply on edge.
+            nodes: Source nodes of the edges to apply the matcher on. If None, it's applied on all the graph's edges.
 
         Returns:
             List of edges that match.
         """
 
+        # Only out edges of nodes the source matcher can match are checked (combined edge matchers have no
+        # source matcher, and are checked on all the given nodes).
+        source_matcher = getattr(edge_matcher, 'source_matcher', None)
+        if source_matcher is not None:
+            nodes = self._get_candidate_nodes(source_matcher, nodes)
+
         edge_list = []
-        for e in self.edges:
+        for e in self.edges(nodes, keys=True):
             if edge_matcher.apply(e) and len(self.edges(e[0])):
                 edge_list.append(e)
 
         return edge_list
 
-    def _walk_filter(self, walk_matcher: WalkMatcherList) -> List[BaseNode]:
+    def _walk_filter(self, walk_matcher: WalkMatcherList, nodes: List[BaseNode] = None) -> List[BaseNode]:
         """
         Search for a list of nodes which match the list in walk_matcher.
         If one the nodes in the list (that was found in the graph) has more than one output,
@@ -67,6 +94,7 @@ class GraphSearches(base_graph_filter.BaseGraphFilter, ABC):
 
         Args:
             walk_matcher: WalkMatcherList with a list of nodes to match.
+            nodes: Nodes to start the search from. If None, it's started from all the graph's nodes.
 
         Returns:
             A list of nodes which match the list in walk_matcher.
@@ -115,8 +143,9 @@ class GraphSearches(base_graph_filter.BaseGraphFilter, ABC):
             walk_matcher]
         result = []
 
-        # Walk the entire graph, node by node
-        result_match_list = [walk_match(n, [], 0, matcher_list) for n in self.nodes if len(self.get_next_nodes(n)) == 1]
+        # Walk the entire graph, node by node (only nodes the first matcher can match can start a walk)
+        result_match_list = [walk_match(n, [], 0, matcher_list) for n in self._get_candidate_nodes(matcher_list[0], nodes)
+                             if len(self.get_next_nodes(n)) == 1]
         # Flatten lists
         result.extend([r for r_list in result_match_list if r_list is not None for r in r_list])
         return result
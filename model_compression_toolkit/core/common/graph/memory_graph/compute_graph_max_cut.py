@@ -14,15 +14,17 @@
 # ==============================================================================
 from typing import Tuple, List
 
-from model_compression_toolkit.core.common import BaseNode
+from model_compression_toolkit.constants import ASTAR_ITER_PER_OPERATION, MIN_ASTAR_ITER
+from model_compression_toolkit.core.common import BaseNode, Graph
 from model_compression_toolkit.core.common.graph.memory_graph.cut import Cut
 from model_compression_toolkit.core.common.graph.memory_graph.max_cut_astar import MaxCutAstar
+from model_compression_toolkit.core.common.graph.memory_graph.memory_element import MemoryElements
 from model_compression_toolkit.core.common.graph.memory_graph.memory_graph import MemoryGraph
-
+from model_compression_toolkit.logger import Logger
 
 def compute_graph_max_cut(memory_graph: MemoryGraph,
                           n_iter: int = 50,
-                          astar_n_iter: int = 500,
+                          astar_n_iter: int = None,
                           eps: float = 1e-2) -> Tuple[List[BaseNode], float, List[Cut]]:
     """
     A wrapper function to compute max cut and schedule for a given model.
@@ -31,19 +33,29 @@ def compute_graph_max_cut(memory_graph: MemoryGraph,
     Args:
         memory_graph: A MemoryGraph object to run the search on.
         n_iter: Limit on the number of AStar searches.
-        astar_n_iter: Limit on the number of expansion iterations in a single AStar search.
+        astar_n_iter: Limit on the number of expansion iterations in a single AStar search. If None, the limit is set
+            according to the number of operations in the memory graph.
         eps: Small value for defining a sufficient gap around an optimal solution in which the search would finish.
 
     Returns: A solution of the AStar search (schedule, max cut cost, cuts route).
 
     """
+    if astar_n_iter is None:
+        astar_n_iter = max(MIN_ASTAR_ITER, ASTAR_ITER_PER_OPERATION * len(memory_graph.a_nodes))
+
     max_cut_astar = MaxCutAstar(memory_graph=memory_graph)
     last_result = (None, 0, None)
+    last_estimate = None
     l_bound = memory_graph.memory_lbound_single_op
     u_bound = 2 * sum([t.total_size for t in memory_graph.b_nodes]) - l_bound
     it = 0
     while it < n_iter:
         estimate = (u_bound + l_bound) / 2
+        if estimate == last_estimate:
+            # The search is deterministic, so searching again with the same estimate yields the same solution.
+            return last_result
+        last_estimate = estimate
+
         schedule, max_cut_size, cuts = max_cut_astar.solve(estimate_factor=estimate, iter_limit=astar_n_iter)
         if schedule is None:
             return last_result
@@ -57,3 +69,60 @@ def compute_graph_max_cut(memory_graph: MemoryGraph,
         it += 1
 
     return last_result
+
+
+def compute_schedule_cuts(memory_graph: MemoryGraph, schedule: List[BaseNode]) -> Tuple[float, List[Cut]]:
+    """
+    Compute the cuts that are developed during the computation of a model according to a given schedule.
+    The cut of an operation contains its input and output tensors, and the tensors of previous operations that are
+    needed by later operations (or are the model's outputs).
+
+    Args:
+        memory_graph: A MemoryGraph object of the model.
+        schedule: A schedule for computation of the model (a topologically sorted list of nodes).
+
+    Returns: The cost of a max cut of the schedule, and the cuts of the schedule's operations (in the schedule's order).
+
+    """
+    executed_ops = set()
+    alive_tensors = set()
+    cuts = []
+    for i, op in enumerate(schedule):
+        executed_ops.add(op)
+        alive_tensors.update(memory_graph.operation_node_children(op))
+        cuts.append(Cut(schedule[:i + 1], set(executed_ops),
+                        MemoryElements(set(alive_tensors), sum([t.total_size for t in alive_tensors]))))
+
+        # Tensors are alive until all the operations that depend on them are executed.
+        alive_tensors = {t for t in alive_tensors
+                         if not all([child in executed_ops for child in memory_graph.activation_tensor_children(t)])
+                         or len(memory_graph.activation_tensor_children(t)) == 0}
+
+    return max([c.memory_size() for c in cuts], default=0), cuts
+
+
+def get_graph_memory_schedule(graph: Graph) -> Tuple[List[BaseNode], float, List[Cut]]:
+    """
+    Get a schedule for computation of a model that minimizes its max cut (the maximal memory of the activation tensors
+    that are alive together), using an AStar search on the model's memory graph. If the search doesn't find a schedule
+    within its limits, the graph's topological order is used instead.
+    The schedule is stored on the graph, and is computed again only if the graph's structure changed since.
+
+    Args:
+        graph: A graph representation of a model.
+
+    Returns: The schedule (list of nodes), the cost of its max cut and the cuts of the schedule (ordered by the
+    schedule).
+
+    """
+    if graph.get_memory_schedule() is None:
+        memory_graph = MemoryGraph(graph)
+        schedule, max_cut_size, _ = compute_graph_max_cut(memory_graph)
+        if schedule is None:
+            Logger.warning(f'Max cut search did not find a memory schedule for graph {graph.name}, '
+                           f'using a topological order')
+            schedule = graph.get_topo_sorted_nodes()
+        max_cut_size, cuts = compute_schedule_cuts(memory_graph, schedule)
+        graph.set_memory_schedule((schedule, max_cut_size, cuts))
+
+    return graph.get_memory_schedule()
@@ -13,7 +13,9 @@
 # limitations under the License.
 # ==============================================================================
 import copy
-from typing import List, Tuple, Dict
+import heapq
+from itertools import count
+from typing import List, Tuple, NamedTuple, Optional
 
 from model_compression_toolkit.core.common import BaseNode
 from model_compression_toolkit.constants import DUMMY_TENSOR, DUMMY_NODE
@@ -72,6 +74,25 @@ class DummyActivationMemoryTensorGenerator:
             self.counter += 1
 
 
+class CutRoute(NamedTuple):
+    """
+    A route of cuts in the search, stored as a linked list from the last cut to the source cut, so extending a
+    route doesn't copy it.
+    """
+    cut: 'Cut'
+    parent: Optional['CutRoute']
+    length: int
+
+
+class OpenCut(NamedTuple):
+    """
+    A cut in the search's open set, with its cost, its route and the order in which it was added to the open set.
+    """
+    cost: float
+    route: CutRoute
+    order: int
+
+
 class MaxCutAstar:
     """
     Implements the AStar solver and all the relevant utility methods to run a search for schedule and max cut
@@ -122,6 +143,16 @@ class MaxCutAstar:
         self.target_cut = Cut([], set(), MemoryElements(elements={target_dummy_b, target_dummy_b2},
                                                         total_size=0))
 
+        # The memory graph's adjacency is cached, since the search queries it for every cut it visits.
+        self.tensors_children = {t: self.memory_graph.activation_tensor_children(t) for t in self.memory_graph.b_nodes}
+        self.tensors_parents = {t: self.memory_graph.activation_tensor_parents(t) for t in self.memory_graph.b_nodes}
+        self.ops_children = {op: self.memory_graph.operation_node_children(op) for op in self.memory_graph.a_nodes}
+        self.ops_parents = {op: self.memory_graph.operation_node_parents(op) for op in self.memory_graph.a_nodes}
+
+        # Each memory tensor is assigned a bit, and a cut's key is the bitmask of its memory elements, so cuts
+        # that are equal (have the same memory elements) are found in the search's open and closed sets by hash.
+        self.tensors_bits = {t: 1 << i for i, t in enumerate(self.memory_graph.b_nodes)}
+
     def solve(self, estimate_factor: float, iter_limit: int = 500) -> Tuple[List[BaseNode], float, List[Cut]]:
         """
         The AStar solver function. This method runs an AStar-like search on the memory graph,
@@ -135,99 +166,114 @@ class MaxCutAstar:
         Returns: A solution (if found within the steps limit) which contains:
         - A schedule for computation of the model (List of nodes).
         - The cost of a max cut of the found schedule.
-        - All the cuts that are developed during the computation on the model according to the found schedule (List of Cuts).
+        - All the cuts that are developed during the computation on the model according to the found schedule (List of Cuts,
+          ordered by the schedule).
 
         """
 
-        open_list = [self.src_cut]
-        closed_list = []
-        costs = {self.src_cut: self.src_cut.memory_size()}
-        routes = {self.src_cut: [self.src_cut]}
+        order = count()
+        src_key = self.get_cut_key(self.src_cut)
+        src_route = CutRoute(self.src_cut, None, 1)
+        open_cuts = {src_key: OpenCut(self.src_cut.memory_size(), src_route, next(order))}
+        open_heap = [self._get_heap_entry(src_key, open_cuts[src_key], estimate_factor)]
+        closed_keys = set()
 
         expansion_count = 0
 
-        while expansion_count < iter_limit and len(open_list) > 0:
-            # Choose next node to expand
-            next_cut = self._get_cut_to_expand(open_list, costs, routes, estimate_factor)
+        while expansion_count < iter_limit and len(open_cuts) > 0:
+            # Choose next node to expand. Entries of cuts that were removed from the open set, or were added to it
+            # again with a lower cost, are outdated and skipped.
+            _, _, entry_order, next_key = heapq.heappop(open_heap)
+            if next_key not in open_cuts or open_cuts[next_key].order != entry_order:
+                continue
 
-            cut_cost = costs[next_cut]
-            cut_route = routes[next_cut]
+            cut_cost, cut_route, _ = open_cuts.pop(next_key)
+            next_cut = cut_route.cut
 
             if next_cut == self.target_cut:
-                return self._remove_dummys_from_path(cut_route[0].op_order), cut_cost,\
-                       list(set([self._remove_dummys_from_cut(self.clean_memory_for_next_step(c)) for c in cut_route]))
+                return self._remove_dummys_from_path(next_cut.op_order), cut_cost, \
+                       [self._remove_dummys_from_cut(self.clean_memory_for_next_step(c))
+                        for c in reversed(self._get_route_cuts(cut_route))]
 
-            if self.is_pivot(next_cut):
+            clean_cut = self.clean_memory_for_next_step(next_cut)
+            if self._is_clean_cut_pivot(clean_cut):
                 # Can clear all search history
-                open_list = []
-                closed_list = []
-                routes = {}
+                open_cuts = {}
+                open_heap = []
+                closed_keys = set()
             else:
-                # Can remove only next_cut and put it in closed_list
-                open_list.remove(next_cut)
-                del routes[next_cut]
-                closed_list.append(next_cut)
+                # Can remove only next_cut and put it in closed set
+                closed_keys.add(next_key)
 
             # Expand the chosen cut
-            expanded_cuts = self.expand(next_cut)
+            expanded_cuts = self._expand_clean_cut(clean_cut)
             expansion_count += 1
 
-            # Only consider nodes that where not already visited
-            expanded_cuts = list(filter(lambda _c: _c not in closed_list, expanded_cuts))
             for c in expanded_cuts:
+                # Only consider nodes that where not already visited
+                c_key = self.get_cut_key(c)
+                if c_key in closed_keys:
+                    continue
+
                 cost = self.accumulate(cut_cost, c.memory_size())
-                if c not in open_list:
-                    self._update_expanded_node(c, cost, cut_route, open_list, costs, routes)
-                elif self.ordering(cost, costs[c]):
-                    # If we already saw this cut during the search with a larger cost, then we want to update the order
-                    # of the schedule in the cut
-                    # Remove call - removes the cut with the same memory elements but different ordering from open
-                    # Then - adds the cut with the improved ordering from open
-                    open_list.remove(c)
-                    self._update_expanded_node(c, cost, cut_route, open_list, costs, routes)
+                # If we already saw this cut during the search with a larger cost, then we want to update the order
+                # of the schedule in the cut, by adding the cut with the improved ordering to the open set instead.
+                if c_key not in open_cuts or self.ordering(cost, open_cuts[c_key].cost):
+                    open_cuts[c_key] = OpenCut(cost, CutRoute(c, cut_route, cut_route.length + 1), next(order))
+                    heapq.heappush(open_heap, self._get_heap_entry(c_key, open_cuts[c_key], estimate_factor))
 
         # Halt or No Solution
         return None, 0, None
 
-    @staticmethod
-    def _update_expanded_node(cut: Cut, cost: float, route: List[Cut], open_list: List[Cut],
-                              costs: Dict[Cut, float], routes: Dict[Cut, List[Cut]]):
+    def get_cut_key(self, cut: Cut) -> int:
         """
-        An auxiliary method for updating search data structures according to an expanded node.
+        Computes a compact key of a cut, which identifies the cut by its memory elements (as the cuts equality does).
 
         Args:
-            cut: A cut to expand the search to.
-            cost: The cost of the cut.
-            route: The rout to the cut.
-            open_list: The search open list.
-            costs: The search utility mapping between cuts and their cost.
-            routes: The search utility mapping between cuts and their routes.
+            cut: A cut to compute its key.
+
+        Returns: A bitmask of the cut's memory elements.
 
         """
-        open_list.append(cut)
-        costs.update({cut: cost})
-        routes.update({cut: [cut] + route})
+        key = 0
+        for t in cut.mem_elements.elements:
+            key |= self.tensors_bits[t]
+        return key
 
-    def _get_cut_to_expand(self, open_list: List[Cut], costs: Dict[Cut, float], routes: Dict[Cut, List[Cut]],
-                           estimate_factor: float) -> Cut:
+    def _get_heap_entry(self, key: int, open_cut: OpenCut, estimate_factor: float) -> Tuple[float, int, int, int]:
         """
-        An auxiliary method for finding a cut for expanding the search out of a set of potential cuts for expansion.
+        An auxiliary method for creating the entry of a cut in the search's heap. Cuts are expanded by the lowest
+        estimated cost first, then by the shortest route, and then by the order they were added to the open set.
 
         Args:
-            open_list: The search open list.
-            costs: The search utility mapping between cuts and their cost.
-            routes: The search utility mapping between cuts and their routes.
-            estimate_factor: A multiplication factor to set extended boundaries on the potential cuts to exapand.
+            key: The cut's key.
+            open_cut: The cut's record in the open set.
+            estimate_factor: A multiplication factor to set extended boundaries on the potential cuts to expand.
 
-        Returns: A sorted list of potential cuts for expansion (ordered by lowest cost first).
+        Returns: A heap entry of the cut.
 
         """
-        ordered_cuts_list = sorted(open_list,
-                                   key=lambda c: (self.accumulate(costs[c], self.estimate(c, estimate_factor)), len(routes[c])),
-                                   reverse=False)
+        return (self.accumulate(open_cut.cost, self.estimate(open_cut.route.cut, estimate_factor)),
+                open_cut.route.length,
+                open_cut.order,
+                key)
 
-        assert len(ordered_cuts_list) > 0
-        return ordered_cuts_list[0]
+    @staticmethod
+    def _get_route_cuts(route: CutRoute) -> List[Cut]:
+        """
+        An auxiliary method for listing the cuts of a route.
+
+        Args:
+            route: A route in the search.
+
+        Returns: The route's cuts, from its last cut to the source cut.
+
+        """
+        cuts = []
+        while route is not None:
+            cuts.append(route.cut)
+            route = route.parent
+        return cuts
 
     def clean_memory_for_next_step(self, cut: Cut) -> Cut:
         """
@@ -241,10 +287,8 @@ class MaxCutAstar:
 
         """
 
-        cut_records_names = cut.get_record_names()
-        filtered_memory_elements = set(filter(lambda elm: not all(child.name in cut_records_names for child in
-                                                                  self.memory_graph.activation_tensor_children(elm)),
-                                              cut.mem_elements.elements))
+        filtered_memory_elements = {elm for elm in cut.mem_elements.elements
+                                    if not all(child in cut.op_record for child in self.tensors_children[elm])}
 
         return Cut(cut.op_order, cut.op_record,
                    mem_elements=MemoryElements(filtered_memory_elements,
@@ -262,9 +306,22 @@ class MaxCutAstar:
         Returns: Whether the cut can be expanded by expanding the op_node.
         """
 
-        clean_cut = self.clean_memory_for_next_step(cut)
-        return op_node not in cut.op_record and len(cut.mem_elements.elements) > 0 and \
-               all([parent_mem_element in clean_cut.mem_elements.elements for parent_mem_element in self.memory_graph.operation_node_parents(op_node)])
+        return len(cut.mem_elements.elements) > 0 and \
+               self._can_expand_clean_cut(op_node, self.clean_memory_for_next_step(cut))
+
+    def _can_expand_clean_cut(self, op_node: BaseNode, clean_cut: Cut) -> bool:
+        """
+        Checks whether a cut can be expanded by adding an operation node to it, given the cut after removing
+        its irrelevant memory elements.
+
+        Args:
+            op_node: An operation node to check if it can expand the cut.
+            clean_cut: A cut without irrelevant memory elements.
+
+        Returns: Whether the cut can be expanded by expanding the op_node.
+        """
+        return op_node not in clean_cut.op_record and \
+               all([parent_mem_element in clean_cut.mem_elements.elements for parent_mem_element in self.ops_parents[op_node]])
 
     def expand(self, cut: Cut) -> List[Cut]:
         """
@@ -276,14 +333,29 @@ class MaxCutAstar:
         Returns: A list of successors of the expanded cut.
 
         """
-        clean_cut = self.clean_memory_for_next_step(cut)
+        return self._expand_clean_cut(self.clean_memory_for_next_step(cut))
+
+    def _expand_clean_cut(self, clean_cut: Cut) -> List[Cut]:
+        """
+        Expends the search with the given cut, after removing its irrelevant memory elements.
+
+        Args:
+            clean_cut: A cut without irrelevant memory elements to expand the search to.
+
+        Returns: A list of successors of the expanded cut.
+
+        """
+        if len(clean_cut.mem_elements.elements) == 0:
+            return []
 
         # candidates for expansion are children of the memory elements from the cleaned cut that can be expanded
         candidates = []
+        candidates_set = set()
         for mem_element in clean_cut.mem_elements.elements:
-            child_ops = self.memory_graph.activation_tensor_children(mem_element)
-            ops_to_expand = list(filter(lambda op: self.can_expand(op, clean_cut) and op not in candidates, child_ops))
-            candidates.extend(ops_to_expand)
+            for op in self.tensors_children[mem_element]:
+                if op not in candidates_set and self._can_expand_clean_cut(op, clean_cut):
+                    candidates.append(op)
+                    candidates_set.add(op)
 
         # for each candidate a cut is returned with the candidate expanded
         # (operation is added to record / order and resulting memory elements added to memory elements)
@@ -295,7 +367,7 @@ class MaxCutAstar:
             op_record.add(candidate)
 
             mem_elements = copy.copy(clean_cut.mem_elements)
-            mem_elements.add_elements_set(set(self.memory_graph.operation_node_children(candidate)))
+            mem_elements.add_elements_set(set(self.ops_children[candidate]))
 
             expanded_cut = Cut(op_order, op_record, mem_elements)
             next_cuts.append(expanded_cut)
@@ -314,10 +386,20 @@ class MaxCutAstar:
 
         """
 
-        clean_cut = self.clean_memory_for_next_step(cut)
+        return self._is_clean_cut_pivot(self.clean_memory_for_next_step(cut))
+
+    def _is_clean_cut_pivot(self, clean_cut: Cut) -> bool:
+        """
+        returns true if Cut is a pivot, given the cut after removing its irrelevant memory elements.
 
-        mem_elements_parents = list(map(lambda mem_elm: self.memory_graph.activation_tensor_parents(mem_elm), clean_cut.mem_elements.elements))
-        unique_parents = set(sum(mem_elements_parents, []))
+        Args:
+            clean_cut: A Cut without irrelevant memory elements to check whether it is a pivot.
+
+        Returns: True if the given cut is a pivot.
+
+        """
+        unique_parents = {parent for mem_elm in clean_cut.mem_elements.elements
+                          for parent in self.tensors_parents[mem_elm]}
 
         return len(unique_parents) == 1
 
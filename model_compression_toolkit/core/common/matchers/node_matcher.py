@@ -41,6 +41,13 @@ class BaseNodeMatcher(base_matcher.BaseMatcher):
         """
         return NodeNotMatcher(self)
 
+    def get_node_types(self):
+        """
+        Returns: A set of the node types (layer classes) that the matcher can match, so nodes of other types can
+        be skipped without applying the matcher on them, or None if the matcher can match nodes of any type.
+        """
+        return None
+
 
 class NodeAndMatcher(BaseNodeMatcher):
     """
@@ -54,6 +61,12 @@ class NodeAndMatcher(BaseNodeMatcher):
     def apply(self, input_object) -> bool:
         return self.matcher_a.apply(input_object) and self.matcher_b.apply(input_object)
 
+    def get_node_types(self):
+        types_a, types_b = self.matcher_a.get_node_types(), self.matcher_b.get_node_types()
+        if types_a is None or types_b is None:
+            return types_b if types_a is None else types_a
+        return types_a & types_b
+
 
 class NodeOrMatcher(BaseNodeMatcher):
     """
@@ -67,6 +80,12 @@ class NodeOrMatcher(BaseNodeMatcher):
     def apply(self, input_object) -> bool:
         return self.matcher_a.apply(input_object) or self.matcher_b.apply(input_object)
 
+    def get_node_types(self):
+        types_a, types_b = self.matcher_a.get_node_types(), self.matcher_b.get_node_types()
+        if types_a is None or types_b is None:
+            return None
+        return types_a | types_b
+
 
 class NodeAnyMatcher(BaseNodeMatcher):
     """
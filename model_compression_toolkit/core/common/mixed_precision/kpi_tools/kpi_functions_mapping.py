@@ -12,7 +12,11 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 # ==============================================================================
-from model_compression_toolkit.core.common.mixed_precision.kpi_tools.kpi import KPITarget
+from typing import Dict, Tuple
+
+import numpy as np
+
+from model_compression_toolkit.core.common.mixed_precision.kpi_tools.kpi import KPITarget, KPI
 from model_compression_toolkit.core.common.mixed_precision.kpi_tools.kpi_aggregation_methods import MpKpiAggregation
 from model_compression_toolkit.core.common.mixed_precision.kpi_tools.kpi_methods import MpKpiMetric
 
@@ -23,4 +27,23 @@ from model_compression_toolkit.core.common.mixed_precision.kpi_tools.kpi_methods
 kpi_functions_mapping = {KPITarget.WEIGHTS: (MpKpiMetric.WEIGHTS_SIZE, MpKpiAggregation.SUM),
                          KPITarget.ACTIVATION: (MpKpiMetric.ACTIVATION_OUTPUT_SIZE, MpKpiAggregation.MAX),
                          KPITarget.TOTAL: (MpKpiMetric.TOTAL_WEIGHTS_ACTIVATION_SIZE, MpKpiAggregation.TOTAL),
-                         KPITarget.BOPS: (MpKpiMetric.BOPS_COUNT, MpKpiAggregation.SUM)}
+                         KPITarget.BOPS: (MpKpiMetric.BOPS_COUNT, MpKpiAggregation.SUM),
+                         KPITarget.PEAK_ACTIVATION: (MpKpiMetric.PEAK_ACTIVATION_MEMORY, MpKpiAggregation.MAX)}
+
+
+def get_kpi_functions(target_kpi: KPI = None) -> Dict[KPITarget, Tuple[MpKpiMetric, MpKpiAggregation]]:
+    """
+    Get the pairs of kpi computation function and kpi aggregation function of the KPI targets to compute
+    for a target KPI.
+    Computing the peak activation memory KPI requires a search for the model's memory schedule, so it's computed
+    only if the target KPI constrains it.
+
+    Args:
+        target_kpi: Target KPI of a mixed-precision search (if None, the peak activation memory KPI is not computed).
+
+    Returns: A mapping from a KPITarget to its pair of kpi computation function and kpi aggregation function.
+
+    """
+    compute_peak_activation = target_kpi is not None and target_kpi.peak_activation_memory < np.inf
+    return {target: kpi_fns for target, kpi_fns in kpi_functions_mapping.items()
+            if target != KPITarget.PEAK_ACTIVATION or compute_peak_activation}
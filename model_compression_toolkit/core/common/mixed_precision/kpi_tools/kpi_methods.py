@@ -14,7 +14,7 @@
 # ==============================================================================
 from enum import Enum
 from functools import partial
-from typing import List
+from typing import List, Tuple
 
 import numpy as np
 
@@ -23,6 +23,7 @@ from model_compression_toolkit.core.common import Graph, BaseNode
 from model_compression_toolkit.constants import BITS_TO_BYTES, FLOAT_BITWIDTH
 from model_compression_toolkit.core.common.framework_implementation import FrameworkImplementation
 from model_compression_toolkit.core.common.graph.edge import EDGE_SINK_INDEX
+from model_compression_toolkit.core.common.graph.memory_graph.compute_graph_max_cut import get_graph_memory_schedule
 from model_compression_toolkit.core.common.graph.virtual_activation_weights_node import VirtualActivationWeightsNode, \
     VirtualSplitWeightsNode, VirtualSplitActivationNode
 from model_compression_toolkit.logger import Logger
@@ -204,6 +205,43 @@ def total_weights_activation_kpi(mp_cfg: List[int],
     return np.array(weights_activation_memory)
 
 
+def peak_activation_memory_kpi(mp_cfg: List[int],
+                               graph: Graph,
+                               fw_info: FrameworkInfo,
+                               fw_impl: FrameworkImplementation) -> np.ndarray:
+    """
+    Computes a KPIs vector with the activation memory of each cut of the graph's memory schedule (the activation
+    tensors that are alive together while a node is computed, when the nodes are computed according to a schedule
+    that minimizes the max cut), according to the given mixed-precision configuration.
+    As in the activation output size KPI, only quantized activation tensors are considered.
+    Since a cut contains tensors of both configurable and non-configurable nodes, the non-configurable nodes are
+    considered in the KPI vector of the configurable nodes, and if an empty configuration is given, an empty vector
+    is returned (unless the graph has no configurable nodes).
+
+    Args:
+        mp_cfg: A mixed-precision configuration (list of candidates index for each configurable node)
+        graph: Graph object.
+        fw_info: FrameworkInfo object about the specific framework (not used in this method).
+        fw_impl: FrameworkImplementation object with specific framework methods implementation (not used in this method).
+
+    Returns: A vector of the schedule's cuts activation memory sizes.
+
+    """
+    mp_nodes = graph.get_configurable_sorted_nodes_names()
+    if len(mp_cfg) == 0 and len(mp_nodes) > 0:
+        return np.array([])
+
+    nodes_bytes_per_element = {}
+    for n in graph.nodes:
+        node_qc = n.candidates_quantization_cfg[_get_node_cfg_idx(n, mp_cfg, mp_nodes)]
+        nodes_bytes_per_element[n.name] = node_qc.activation_quantization_cfg.activation_n_bits / BITS_TO_BYTES \
+            if node_qc.activation_quantization_cfg.enable_activation_quantization else 0
+
+    _, _, cuts = get_graph_memory_schedule(graph)
+    return np.array([sum([t.total_size * nodes_bytes_per_element[t.node_name] for t in cut.mem_elements.elements])
+                     for cut in cuts])
+
+
 def bops_kpi(mp_cfg: List[int],
              graph: Graph,
              fw_info: FrameworkInfo,
@@ -294,6 +332,125 @@ def _bops_kpi(mp_cfg: List[int],
     return np.array(bops)
 
 
+def weights_size_kpi_table(graph: Graph,
+                           fw_info: FrameworkInfo,
+                           fw_impl: FrameworkImplementation) -> Tuple[List[int], List[np.ndarray]]:
+    """
+    Computes the entries of the weights_size_kpi vector per configurable node's candidate.
+
+    Args:
+        graph: Graph object.
+        fw_info: FrameworkInfo object about the specific framework (e.g., attributes of different layers' weights to quantize).
+        fw_impl: FrameworkImplementation object with specific framework methods implementation (not used in this method).
+
+    Returns: For each entry of the KPI vector, the index of the configurable node it depends on, and its values
+        per candidate of the node.
+
+    """
+    mp_nodes_indices = {name: i for i, name in enumerate(graph.get_configurable_sorted_nodes_names())}
+    entries_nodes, entries_values = [], []
+    for n in graph.get_sorted_weights_configurable_nodes():
+        entries_nodes.append(mp_nodes_indices[n.name])
+        entries_values.append(np.array([_compute_node_weights_memory(n, c.weights_quantization_cfg.weights_n_bits,
+                                                                     fw_info)
+                                        for c in n.candidates_quantization_cfg]))
+
+    return entries_nodes, entries_values
+
+
+def activation_output_size_kpi_table(graph: Graph,
+                                     fw_info: FrameworkInfo,
+                                     fw_impl: FrameworkImplementation) -> Tuple[List[int], List[np.ndarray]]:
+    """
+    Computes the entries of the activation_output_size_kpi vector per configurable node's candidate.
+
+    Args:
+        graph: Graph object.
+        fw_info: FrameworkInfo object about the specific framework (not used in this method).
+        fw_impl: FrameworkImplementation object with specific framework methods implementation (not used in this method).
+
+    Returns: For each entry of the KPI vector, the index of the configurable node it depends on, and its values
+        per candidate of the node.
+
+    """
+    mp_nodes_indices = {name: i for i, name in enumerate(graph.get_configurable_sorted_nodes_names())}
+    entries_nodes, entries_values = [], []
+    for n in graph.get_sorted_activation_configurable_nodes():
+        entries_nodes.append(mp_nodes_indices[n.name])
+        entries_values.append(np.array([_compute_node_activation_memory(n, c.activation_quantization_cfg.activation_n_bits)
+                                        for c in n.candidates_quantization_cfg]))
+
+    return entries_nodes, entries_values
+
+
+def total_weights_activation_kpi_table(graph: Graph,
+                                       fw_info: FrameworkInfo,
+                                       fw_impl: FrameworkImplementation) -> Tuple[List[int], List[np.ndarray]]:
+    """
+    Computes the entries of the total_weights_activation_kpi tensor per configurable node's candidate.
+
+    Args:
+        graph: Graph object.
+        fw_info: FrameworkInfo object about the specific framework (e.g., attributes of different layers' weights to quantize).
+        fw_impl: FrameworkImplementation object with specific framework methods implementation (not used in this method).
+
+    Returns: For each entry of the KPI tensor, the index of the configurable node it depends on, and its values
+        (weights memory and activation memory) per candidate of the node.
+
+    """
+    entries_nodes, entries_values = [], []
+    for node_idx, n in enumerate(graph.get_configurable_sorted_nodes()):
+        is_weights_configurable = n.is_weights_quantization_enabled() and not n.is_all_weights_candidates_equal()
+        is_activation_configurable = n.is_activation_quantization_enabled() and \
+                                     not n.is_all_activation_candidates_equal()
+
+        node_values = []
+        for c in n.candidates_quantization_cfg:
+            node_weights_memory_in_bytes = _compute_node_weights_memory(
+                n, c.weights_quantization_cfg.weights_n_bits, fw_info) if is_weights_configurable else 0
+            node_activation_memory_in_bytes = _compute_node_activation_memory(
+                n, c.activation_quantization_cfg.activation_n_bits) if is_activation_configurable else 0
+            node_values.append([node_weights_memory_in_bytes, node_activation_memory_in_bytes])
+
+        entries_nodes.append(node_idx)
+        entries_values.append(np.array(node_values))
+
+    return entries_nodes, entries_values
+
+
+def bops_kpi_table(graph: Graph,
+                   fw_info: FrameworkInfo,
+                   fw_impl: FrameworkImplementation) -> Tuple[List[int], List[np.ndarray]]:
+    """
+    Computes the entries of the bops_kpi vector (for setting constraints on a virtual graph) per configurable
+    node's candidate.
+
+    Args:
+        graph: Graph object.
+        fw_info: FrameworkInfo object about the specific framework (e.g., attributes of different layers' weights to quantize).
+        fw_impl: FrameworkImplementation object with specific framework methods implementation.
+
+    Returns: For each entry of the KPI vector, the index of the configurable node it depends on (None for
+        non-configurable nodes), and its values per candidate of the node.
+
+    """
+    mp_nodes_indices = {name: i for i, name in enumerate(graph.get_configurable_sorted_nodes_names())}
+    entries_nodes, entries_values = [], []
+    for n in graph.get_topo_sorted_nodes():
+        if isinstance(n, VirtualActivationWeightsNode):
+            if n.name in mp_nodes_indices:
+                entries_nodes.append(mp_nodes_indices[n.name])
+                candidates_indices = range(len(n.candidates_quantization_cfg))
+            else:
+                # A non-configurable node has a single candidate
+                entries_nodes.append(None)
+                candidates_indices = [0]
+            entries_values.append(np.array([n.get_bops_count(fw_impl, fw_info, candidate_idx=i)
+                                            for i in candidates_indices]))
+
+    return entries_nodes, entries_values
+
+
 def _get_node_cfg_idx(node: BaseNode, mp_cfg: List[int], sorted_configurable_nodes_names: List[str]) -> int:
     """
     Returns the index of a node's quantization configuration candidate according to the given
@@ -411,12 +568,23 @@ class MpKpiMetric(Enum):
 
      BOPS_COUNT - applies the bops_kpi function
 
+     PEAK_ACTIVATION_MEMORY - applies the peak_activation_memory_kpi function
+
     """
 
     WEIGHTS_SIZE = partial(weights_size_kpi)
     ACTIVATION_OUTPUT_SIZE = partial(activation_output_size_kpi)
     TOTAL_WEIGHTS_ACTIVATION_SIZE = partial(total_weights_activation_kpi)
     BOPS_COUNT = partial(bops_kpi)
+    PEAK_ACTIVATION_MEMORY = partial(peak_activation_memory_kpi)
 
     def __call__(self, *args):
         return self.value(*args)
+
+
+# A mapping from a KPI metric to a function that computes its KPI vector's entries per configurable node's candidate
+# (used to build a KPITable of the metric). Metrics that are not in the mapping are computed per configuration.
+kpi_table_methods_mapping = {MpKpiMetric.WEIGHTS_SIZE: weights_size_kpi_table,
+                             MpKpiMetric.ACTIVATION_OUTPUT_SIZE: activation_output_size_kpi_table,
+                             MpKpiMetric.TOTAL_WEIGHTS_ACTIVATION_SIZE: total_weights_activation_kpi_table,
+                             MpKpiMetric.BOPS_COUNT: bops_kpi_table}
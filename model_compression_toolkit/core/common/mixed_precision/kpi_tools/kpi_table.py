@@ -0,0 +1,111 @@
+# Copyright 2023 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+from typing import List
+
+import numpy as np
+
+
+class KPITable:
+    """
+    A table of the KPI values of a KPI metric per configurable node's candidate.
+    Each entry of the metric's KPI vector depends on the candidate of at most one configurable node, so the KPI
+    vector of a configuration is gathered from the table without going over the graph, and the KPI vector of a
+    configuration that differs from a base configuration is updated in the changed nodes' entries only.
+    """
+
+    def __init__(self,
+                 entries_nodes: List[int],
+                 entries_values: List[np.ndarray],
+                 n_candidates: List[int]):
+        """
+        Args:
+            entries_nodes: For each entry of the KPI vector, the index of the configurable node it depends on
+                (or None if it does not depend on the configuration).
+            entries_values: For each entry of the KPI vector, its values per candidate of the node it depends on
+                (or a single value if it does not depend on the configuration).
+            n_candidates: Number of candidates of each configurable node.
+        """
+        self.n_candidates = list(n_candidates)
+        n_conf_nodes = len(self.n_candidates)
+
+        # Entries that don't depend on the configuration gather their value by the extra "node" at the end of the
+        # configuration, which is always configured to 0.
+        self.entries_nodes = np.array([n_conf_nodes if n is None else n for n in entries_nodes], dtype=int)
+
+        entries_values = [np.asarray(v, dtype=float) for v in entries_values]
+        value_shape = entries_values[0].shape[1:] if len(entries_values) > 0 else ()
+        max_candidates = max([len(v) for v in entries_values], default=1)
+        self.values = np.zeros((len(entries_values), max_candidates) + value_shape)
+        for i, v in enumerate(entries_values):
+            self.values[i, :len(v)] = v
+
+        self.node_to_entries = [[] for _ in range(n_conf_nodes + 1)]
+        for i, n in enumerate(self.entries_nodes):
+            self.node_to_entries[n].append(i)
+
+    def get_kpi_vector(self, config: List[int]) -> np.ndarray:
+        """
+        Gather the KPI vector of a configuration.
+
+        Args:
+            config: A mixed-precision configuration (list of candidates index for each configurable node).
+
+        Returns: The KPI vector of the configuration.
+        """
+        config = np.append(np.asarray(config, dtype=int), 0)
+        return self.values[np.arange(len(self.entries_nodes)), config[self.entries_nodes]]
+
+    def update_kpi_vector(self,
+                          base_kpi_vector: np.ndarray,
+                          config: List[int],
+                          changed_nodes_idx: List[int]) -> np.ndarray:
+        """
+        Compute the KPI vector of a configuration from the KPI vector of a base configuration it differs from in
+        a few nodes.
+
+        Args:
+            base_kpi_vector: The KPI vector of the base configuration.
+            config: A mixed-precision configuration (list of candidates index for each configurable node).
+            changed_nodes_idx: Indices of the configurable nodes in which the configuration differs from the base.
+
+        Returns: The KPI vector of the configuration.
+        """
+        kpi_vector = base_kpi_vector.copy()
+        for node_idx in changed_nodes_idx:
+            entries = self.node_to_entries[node_idx]
+            kpi_vector[entries] = self.values[entries, config[node_idx]]
+        return kpi_vector
+
+    def get_kpi_matrix(self, base_config: List[int]) -> np.ndarray:
+        """
+        Build a KPI matrix, in which each column is the difference between the KPI vector of a configuration that
+        changes a single node's candidate in the base configuration and the KPI vector of the base configuration.
+        The columns are ordered by the configurable nodes, and by the candidates of each node.
+
+        Args:
+            base_config: A mixed-precision configuration to compute the KPI differences from.
+
+        Returns: A KPI matrix with the configurations on its last axis.
+        """
+        base_kpi_vector = self.get_kpi_vector(base_config)
+        columns_offsets = np.cumsum([0] + self.n_candidates)
+
+        kpi_matrix = np.zeros((columns_offsets[-1],) + base_kpi_vector.shape)
+        for node_idx, n_candidates in enumerate(self.n_candidates):
+            entries = self.node_to_entries[node_idx]
+            kpi_matrix[columns_offsets[node_idx]:columns_offsets[node_idx + 1], entries] = \
+                np.swapaxes(self.values[entries, :n_candidates], 0, 1) - base_kpi_vector[entries]
+
+        return np.moveaxis(kpi_matrix, source=0, destination=len(kpi_matrix.shape) - 1)
@@ -33,7 +33,11 @@ class MixedPrecisionQuantizationConfigV2:
                  use_grad_based_weights: bool = True,
                  output_grad_factor: float = 0.1,
                  norm_weights: bool = True,
-                 refine_mp_solution: bool = True):
+                 refine_mp_solution: bool = True,
+                 cache_prefix_activations: bool = False,
+                 sensitivity_eval_n_workers: int = 1,
+                 compile_inference_models: bool = False,
+                 jit_compile_inference: bool = False):
         """
         Class with mixed precision parameters to quantize the input model.
         Unlike QuantizationConfig, number of bits for quantization is a list of possible bit widths to
@@ -49,6 +53,10 @@ class MixedPrecisionQuantizationConfigV2:
             output_grad_factor (float): A tuning parameter to be used for gradient-based weights.
             norm_weights (bool): Whether to normalize the returned weights (to get values between 0 and 1).
             refine_mp_solution (bool): Whether to try to improve the final mixed-precision configuration using a greedy algorithm that searches layers to increase their bit-width, or not.
+            cache_prefix_activations (bool): Whether to cache the MP model's activations in the baseline configuration, such that evaluating a change in a few layers only infers the part of the model from the first changed layer.
+            sensitivity_eval_n_workers (int): Number of MP model replicas to evaluate the sensitivity of multiple configurations with in parallel threads.
+            compile_inference_models (bool): Whether to trace the baseline and MP models of the sensitivity evaluation into graph functions, so each evaluation is inferred without the per-layer Python dispatch of eager execution (supported in Keras, where the models are traced into tf.functions).
+            jit_compile_inference (bool): Whether to compile the traced sensitivity evaluation models with XLA (used only if compile_inference_models is enabled).
 
         """
 
@@ -57,6 +65,10 @@ class MixedPrecisionQuantizationConfigV2:
         self.num_of_images = num_of_images
         self.configuration_overwrite = configuration_overwrite
         self.refine_mp_solution = refine_mp_solution
+        self.cache_prefix_activations = cache_prefix_activations
+        self.sensitivity_eval_n_workers = sensitivity_eval_n_workers
+        self.compile_inference_models = compile_inference_models
+        self.jit_compile_inference = jit_compile_inference
 
         assert 0.0 < num_interest_points_factor <= 1.0, "num_interest_points_factor should represent a percentage of " \
                                                         "the base set of interest points that are required to be " \
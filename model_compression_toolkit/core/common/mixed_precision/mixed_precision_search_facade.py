@@ -13,15 +13,15 @@
 # limitations under the License.
 # ==============================================================================
 
-import copy
 from enum import Enum
 import numpy as np
 from typing import List, Callable, Dict
 
 from model_compression_toolkit.core import MixedPrecisionQuantizationConfigV2
 from model_compression_toolkit.core.common import Graph
+from model_compression_toolkit.core.common.graph.memory_graph.compute_graph_max_cut import get_graph_memory_schedule
 from model_compression_toolkit.core.common.mixed_precision.kpi_tools.kpi import KPI, KPITarget
-from model_compression_toolkit.core.common.mixed_precision.kpi_tools.kpi_functions_mapping import kpi_functions_mapping
+from model_compression_toolkit.core.common.mixed_precision.kpi_tools.kpi_functions_mapping import get_kpi_functions
 from model_compression_toolkit.core.common.framework_implementation import FrameworkImplementation
 from model_compression_toolkit.core.common.mixed_precision.mixed_precision_search_manager import MixedPrecisionSearchManager
 from model_compression_toolkit.core.common.mixed_precision.search_methods.linear_programming import \
@@ -78,8 +78,13 @@ def search_bit_width(graph_to_search_cfg: Graph,
     if target_kpi is None:
         Logger.critical('Target KPI have to be passed for search_methods bit-width configuration')  # pragma: no cover
 
+    if target_kpi.peak_activation_memory < np.inf:
+        # Compute the memory schedule on the graph before copying it, so the schedule is kept on the graph
+        # (and used to build the quantized model) as well as on its copy that is searched.
+        get_graph_memory_schedule(graph_to_search_cfg)
+
     # Set graph for MP search
-    graph = copy.deepcopy(graph_to_search_cfg)  # Copy graph before searching
+    graph = graph_to_search_cfg.snapshot()  # Copy graph before searching
     if target_kpi.bops < np.inf:
         # Since Bit-operations count target KPI is set, we need to reconstruct the graph for the MP search
         graph = substitute(graph, fw_impl.get_substitutions_virtual_weights_activation_coupling())
@@ -89,7 +94,8 @@ def search_bit_width(graph_to_search_cfg: Graph,
     disable_activation_for_metric = (target_kpi.weights_memory < np.inf and
                                     (target_kpi.activation_memory == np.inf and
                                      target_kpi.total_memory == np.inf and
-                                     target_kpi.bops == np.inf)) or graph_to_search_cfg.is_single_activation_cfg()
+                                     target_kpi.bops == np.inf and
+                                     target_kpi.peak_activation_memory == np.inf)) or graph_to_search_cfg.is_single_activation_cfg()
 
     # Set Sensitivity Evaluator for MP search. It should always work with the original MP graph,
     # even if a virtual graph was created (and is used only for BOPS KPI computation purposes)
@@ -101,7 +107,7 @@ def search_bit_width(graph_to_search_cfg: Graph,
         disable_activation_for_metric=disable_activation_for_metric)
 
     # Each pair of (KPI method, KPI aggregation) should match to a specific provided kpi target
-    kpi_functions = kpi_functions_mapping
+    kpi_functions = get_kpi_functions(target_kpi)
 
     # Instantiate a manager object
     search_manager = MixedPrecisionSearchManager(graph,
@@ -25,7 +25,9 @@ from model_compression_toolkit.core.common.graph.virtual_activation_weights_node
     VirtualSplitWeightsNode, VirtualSplitActivationNode
 from model_compression_toolkit.core.common.mixed_precision.kpi_tools.kpi import KPITarget, KPI
 from model_compression_toolkit.core.common.mixed_precision.kpi_tools.kpi_aggregation_methods import MpKpiAggregation
-from model_compression_toolkit.core.common.mixed_precision.kpi_tools.kpi_methods import MpKpiMetric
+from model_compression_toolkit.core.common.mixed_precision.kpi_tools.kpi_methods import MpKpiMetric, \
+    kpi_table_methods_mapping
+from model_compression_toolkit.core.common.mixed_precision.kpi_tools.kpi_table import KPITable
 from model_compression_toolkit.core.common.framework_info import FrameworkInfo
 from model_compression_toolkit.core.common.mixed_precision.sensitivity_evaluation import SensitivityEvaluation
 
@@ -64,12 +66,15 @@ class MixedPrecisionSearchManager:
         self.fw_impl = fw_impl
         self.sensitivity_evaluator = sensitivity_evaluator
         self.layer_to_bitwidth_mapping = self.get_search_space()
-        self.compute_metric_fn = self.get_sensitivity_metric()
+        self.compute_metrics_fn = self.get_sensitivity_metric()
+        self.compute_metric_fn = self._compute_metric
 
         self.compute_kpi_functions = kpi_functions
         self.target_kpi = target_kpi
         self.min_kpi_config = self.graph.get_min_candidates_config()
         self.max_kpi_config = self.graph.get_max_candidates_config()
+        self.kpi_tables = self._build_kpi_tables()
+        self.base_config_kpi_vectors = None  # The last base configuration of compute_kpi_for_config and its KPI vectors
         self.min_kpi = self.compute_min_kpis()
         self.non_conf_kpi_dict = self._non_configurable_nodes_kpi()
 
@@ -97,14 +102,34 @@ class MixedPrecisionSearchManager:
         """
 
         Returns: Return a function (from the framework implementation) to compute a metric that
-        indicates the similarity of the mixed-precision model (to the float model) for a given
-        mixed-precision configuration.
+        indicates the similarity of the mixed-precision model (to the float model) for each mixed-precision
+        configuration in a list of configurations.
 
         """
         # Get from the framework an evaluation function on how a MP configuration,
         # affects the expected loss.
 
-        return self.sensitivity_evaluator.compute_metric
+        return self.sensitivity_evaluator.get_sensitivity_metric()
+
+    def _compute_metric(self,
+                        mp_model_configuration: List[int],
+                        node_idx: List[int] = None,
+                        baseline_mp_configuration: List[int] = None) -> float:
+        """
+        Compute the sensitivity metric of a single mixed-precision configuration, using the sensitivity metric
+        function of the search manager.
+
+        Args:
+            mp_model_configuration: Bitwidth configuration to compute its sensitivity metric.
+            node_idx: A list of nodes' indices to configure (instead of using the entire mp_model_configuration).
+            baseline_mp_configuration: A mixed-precision configuration to set the model back to after modifying it to
+                compute the metric for the given configuration.
+
+        Returns:
+            The sensitivity metric of the given configuration.
+        """
+
+        return self.compute_metrics_fn([mp_model_configuration], [node_idx], baseline_mp_configuration)[0]
 
     def compute_min_kpis(self) -> Dict[KPITarget, np.ndarray]:
         """
@@ -118,12 +143,34 @@ class MixedPrecisionSearchManager:
         """
         min_kpis = {}
         for kpi_target, kpi_fns in self.compute_kpi_functions.items():
-            # kpi_fns is a pair of kpi computation method and kpi aggregation method (in this method we only need
-            # the first one)
-            min_kpis[kpi_target] = kpi_fns[0](self.min_kpi_config, self.graph, self.fw_info, self.fw_impl)
+            if kpi_target in self.kpi_tables:
+                min_kpis[kpi_target] = self.kpi_tables[kpi_target].get_kpi_vector(self.min_kpi_config)
+            else:
+                # kpi_fns is a pair of kpi computation method and kpi aggregation method (in this method we only need
+                # the first one)
+                min_kpis[kpi_target] = kpi_fns[0](self.min_kpi_config, self.graph, self.fw_info, self.fw_impl)
 
         return min_kpis
 
+    def _build_kpi_tables(self) -> Dict[KPITarget, KPITable]:
+        """
+        Builds a KPI table (the KPI vector's entries per configurable node's candidate) for each kpi target
+        whose kpi method supports it, so the KPI vectors of configurations are computed without going over the graph.
+
+        Returns: A dictionary mapping kpi targets to their KPI tables.
+
+        """
+        n_candidates = [len(n.candidates_quantization_cfg) for n in self.graph.get_configurable_sorted_nodes()]
+
+        kpi_tables = {}
+        for kpi_target, kpi_fns in self.compute_kpi_functions.items():
+            kpi_table_fn = kpi_table_methods_mapping.get(kpi_fns[0]) if isinstance(kpi_fns[0], MpKpiMetric) else None
+            if kpi_table_fn is not None:
+                entries_nodes, entries_values = kpi_table_fn(self.graph, self.fw_info, self.fw_impl)
+                kpi_tables[kpi_target] = KPITable(entries_nodes, entries_values, n_candidates)
+
+        return kpi_tables
+
     def compute_kpi_matrix(self, target: KPITarget) -> np.ndarray:
         """
         Computes and builds a KPIs matrix, to be used for the mixed-precision search problem formalization.
@@ -142,6 +189,9 @@ class MixedPrecisionSearchManager:
         """
         assert isinstance(target, KPITarget), f"{target} is not a valid KPI target"
 
+        if target in self.kpi_tables:
+            return self.kpi_tables[target].get_kpi_matrix(self.min_kpi_config)
+
         configurable_sorted_nodes = self.graph.get_configurable_sorted_nodes()
 
         kpi_matrix = []
@@ -247,6 +297,9 @@ class MixedPrecisionSearchManager:
         for target, kpi_value in self.target_kpi.get_kpi_dict().items():
             # Call for the KPI method of the given target - empty quantization configuration list is passed since we
             # compute for non-configurable nodes
+            if target not in self.compute_kpi_functions:
+                # The KPI target is not computed in the search (it is not restricted by the target KPI)
+                continue
             if target == KPITarget.BOPS:
                 kpi_vector = None
             else:
@@ -256,12 +309,16 @@ class MixedPrecisionSearchManager:
 
         return non_conf_kpi_dict
 
-    def compute_kpi_for_config(self, config: List[int]) -> KPI:
+    def compute_kpi_for_config(self, config: List[int], base_config: List[int] = None) -> KPI:
         """
         Computes the KPI values for a given mixed-precision configuration.
+        If a base configuration is given, the KPI vectors (of kpi targets with a KPI table) are updated from the KPI
+        vectors of the base configuration in the nodes that differ from it only (the KPI vectors of the last base
+        configuration are kept, so computing multiple configurations that differ from the same base is cheap).
 
         Args:
             config: A mixed-precision configuration (list of candidates indices)
+            base_config: A mixed-precision configuration that the given configuration differs from in a few nodes.
 
         Returns: A KPI object with the model's KPI values when quantized with the given config.
 
@@ -269,10 +326,26 @@ class MixedPrecisionSearchManager:
 
         kpis_dict = {}
 
+        changed_nodes_idx = None
+        if base_config is not None:
+            if self.base_config_kpi_vectors is None or self.base_config_kpi_vectors[0] != tuple(base_config):
+                self.base_config_kpi_vectors = (tuple(base_config),
+                                                {kpi_target: kpi_table.get_kpi_vector(base_config)
+                                                 for kpi_target, kpi_table in self.kpi_tables.items()})
+            changed_nodes_idx = np.flatnonzero(np.asarray(config) != np.asarray(base_config))
+
         for kpi_target, kpi_fns in self.compute_kpi_functions.items():
             # Passing False to kpi methods and aggregations to indicates that the computations
             # are not for constraints setting
-            if kpi_target == KPITarget.BOPS:
+            if kpi_target in self.kpi_tables and kpi_target != KPITarget.BOPS and self.original_graph is self.graph:
+                # The BOPS KPI of a configuration is computed on the original graph, while the table is of the
+                # virtual graph.
+                if changed_nodes_idx is None:
+                    configurable_nodes_kpi_vector = self.kpi_tables[kpi_target].get_kpi_vector(config)
+                else:
+                    configurable_nodes_kpi_vector = self.kpi_tables[kpi_target].update_kpi_vector(
+                        self.base_config_kpi_vectors[1][kpi_target], config, changed_nodes_idx)
+            elif kpi_target == KPITarget.BOPS:
                 configurable_nodes_kpi_vector = kpi_fns[0](config, self.original_graph, self.fw_info, self.fw_impl, False)
             else:
                 configurable_nodes_kpi_vector = kpi_fns[0](config, self.original_graph, self.fw_info, self.fw_impl)
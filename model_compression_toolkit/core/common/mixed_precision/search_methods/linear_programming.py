@@ -15,7 +15,7 @@
 
 import numpy as np
 from pulp import *
-from tqdm import tqdm
+from scipy.sparse import csr_matrix
 from typing import Dict, List, Tuple, Callable
 
 from model_compression_toolkit.logger import Logger
@@ -126,6 +126,8 @@ def _formalize_problem(layer_to_indicator_vars_mapping: Dict[int, Dict[int, LpVa
                        search_manager: MixedPrecisionSearchManager) -> LpProblem:
     """
     Formalize the LP problem by defining all inequalities that define the solution space.
+    The expressions are built directly from lists of (variable, coefficient) pairs, instead of summing a
+    product per term.
 
     Args:
         layer_to_indicator_vars_mapping: Dictionary that maps each node's index to a dictionary of bitwidth to
@@ -142,18 +144,17 @@ def _formalize_problem(layer_to_indicator_vars_mapping: Dict[int, Dict[int, LpVa
     """
 
     lp_problem = LpProblem()  # minimization problem by default
-    lp_problem += lpSum([layer_to_objective_vars_mapping[layer] for layer in
-                         layer_to_metrics_mapping.keys()])  # Objective (minimize acc loss)
+    lp_problem += LpAffineExpression([(layer_to_objective_vars_mapping[layer], 1) for layer in
+                                      layer_to_metrics_mapping.keys()])  # Objective (minimize acc loss)
 
     for layer in layer_to_metrics_mapping.keys():
         # Use every bitwidth for every layer with its indicator.
-        lp_problem += lpSum([indicator * layer_to_metrics_mapping[layer][nbits]
-                             for nbits, indicator in layer_to_indicator_vars_mapping[layer].items()]) == \
-                      layer_to_objective_vars_mapping[layer]
+        lp_problem += LpAffineExpression([(indicator, layer_to_metrics_mapping[layer][nbits])
+                                          for nbits, indicator in layer_to_indicator_vars_mapping[layer].items()] +
+                                         [(layer_to_objective_vars_mapping[layer], -1)]) == 0
 
         # Constraint of only one indicator==1
-        lp_problem += lpSum(
-            [v for v in layer_to_indicator_vars_mapping[layer].values()]) == 1
+        lp_problem += LpAffineExpression([(v, 1) for v in layer_to_indicator_vars_mapping[layer].values()]) == 1
 
     # Bound the feasible solution space with the desired KPI.
     # Creates separate constraints for weights KPI and activation KPI.
@@ -163,9 +164,6 @@ def _formalize_problem(layer_to_indicator_vars_mapping: Dict[int, Dict[int, LpVa
             for _, indicator in layer_to_indicator_vars_mapping[layer].items():
                 indicators.append(indicator)
 
-        indicators_arr = np.array(indicators)
-        indicators_matrix = np.diag(indicators_arr)
-
         for target, kpi_value in target_kpi.get_kpi_dict().items():
             if not np.isinf(kpi_value):
                 non_conf_kpi_vector = None if search_manager.non_conf_kpi_dict is None \
@@ -173,7 +171,7 @@ def _formalize_problem(layer_to_indicator_vars_mapping: Dict[int, Dict[int, LpVa
                 _add_set_of_kpi_constraints(search_manager=search_manager,
                                             target=target,
                                             target_kpi_value=kpi_value,
-                                            indicators_matrix=indicators_matrix,
+                                            indicators=indicators,
                                             lp_problem=lp_problem,
                                             non_conf_kpi_vector=non_conf_kpi_vector)
     else:  # pragma: no cover
@@ -185,7 +183,7 @@ def _formalize_problem(layer_to_indicator_vars_mapping: Dict[int, Dict[int, LpVa
 def _add_set_of_kpi_constraints(search_manager: MixedPrecisionSearchManager,
                                 target: KPITarget,
                                 target_kpi_value: float,
-                                indicators_matrix: np.ndarray,
+                                indicators: List[LpVariable],
                                 lp_problem: LpProblem,
                                 non_conf_kpi_vector: np.ndarray):
     """
@@ -196,25 +194,14 @@ def _add_set_of_kpi_constraints(search_manager: MixedPrecisionSearchManager,
         search_manager:  MixedPrecisionSearchManager object to be used for kpi constraints formalization.
         target: A KPITarget.
         target_kpi_value: Target KPI value of the given KPI target for which the constraint is added.
-        indicators_matrix: A diagonal matrix of the Lp problem's indicators.
+        indicators: The Lp problem's indicators, ordered as the configurations in the KPI matrix.
         lp_problem: An Lp problem object to add constraint to.
         non_conf_kpi_vector: A non-configurable nodes' KPI vector.
 
     """
 
     kpi_matrix = search_manager.compute_kpi_matrix(target)
-    indicated_kpi_matrix = np.matmul(kpi_matrix, indicators_matrix)
-    # Need to re-organize the tensor such that the configurations' axis will be second,
-    # and all metric values' axis will come afterword
-    indicated_kpi_matrix = np.moveaxis(indicated_kpi_matrix, source=len(indicated_kpi_matrix.shape) - 1, destination=1)
-
-    # In order to get the result KPI according to a chosen set of indicators, we sum each row in the result matrix.
-    # Each row represents the KPI values for a specific KPI metric, such that only elements corresponding
-    # to a configuration which implied by the set of indicators will have some positive value different than 0
-    # (and will contribute to the total KPI).
-    kpi_sum_vector = np.array([
-        np.sum(indicated_kpi_matrix[i], axis=0) +  # sum of metric values over all configurations in a row
-        search_manager.min_kpi[target][i] for i in range(indicated_kpi_matrix.shape[0])])
+    kpi_sum_vector = _build_kpi_sum_vector(kpi_matrix, search_manager.min_kpi[target], indicators)
 
     # search_manager.compute_kpi_functions contains a pair of kpi_metric and kpi_aggregation for each kpi target
     # get aggregated KPI, considering both configurable and non-configurable nodes
@@ -231,15 +218,53 @@ def _add_set_of_kpi_constraints(search_manager: MixedPrecisionSearchManager,
             lp_problem += v <= target_kpi_value
 
 
+def _build_kpi_sum_vector(kpi_matrix: np.ndarray,
+                          min_kpi: np.ndarray,
+                          indicators: List[LpVariable]) -> np.ndarray:
+    """
+    Build the KPI values of the model as linear expressions of the Lp problem's indicators.
+    Each KPI value is the KPI value of the minimal configuration plus the KPI values of the chosen configurations
+    (the KPI matrix's entries whose indicator is one). Since a configuration mostly affects a few KPI values, the
+    KPI matrix is converted to a sparse matrix, and each expression is built from its row's non-zero entries only.
+
+    Args:
+        kpi_matrix: A KPI matrix, with the configurations on its last axis.
+        min_kpi: KPI values of the minimal configuration, of the same shape as the KPI matrix without its last axis.
+        indicators: The Lp problem's indicators, ordered as the configurations in the KPI matrix.
+
+    Returns:
+        An array (of the same shape as min_kpi) of the KPI values expressions.
+    """
+
+    # Each KPI value (including the values of non-scalar KPI metrics) is a row of the sparse matrix.
+    sparse_kpi_matrix = csr_matrix(kpi_matrix.reshape(-1, kpi_matrix.shape[-1]))
+    min_kpi = np.asarray(min_kpi, dtype=float).reshape(-1)
+
+    kpi_sum_vector = np.empty(sparse_kpi_matrix.shape[0], dtype=object)
+    for i in range(sparse_kpi_matrix.shape[0]):
+        row = slice(sparse_kpi_matrix.indptr[i], sparse_kpi_matrix.indptr[i + 1])
+        if row.start == row.stop:
+            # A KPI value that no configuration affects is a constant.
+            kpi_sum_vector[i] = float(min_kpi[i])
+        else:
+            kpi_sum_vector[i] = LpAffineExpression([(indicators[j], c) for j, c in
+                                                    zip(sparse_kpi_matrix.indices[row],
+                                                        sparse_kpi_matrix.data[row])],
+                                                   constant=min_kpi[i])
+
+    return kpi_sum_vector.reshape(kpi_matrix.shape[:-1])
+
+
 def _build_layer_to_metrics_mapping(search_manager: MixedPrecisionSearchManager,
                                     target_kpi: KPI) -> Dict[int, Dict[int, float]]:
     """
     This function measures the sensitivity of a change in a bitwidth of a layer on the entire model.
     It builds a mapping from a node's index, to its bitwidht's effect on the model sensitivity.
     For each node and some possible node's bitwidth (according to the given search space), we use
-    the framework function compute_metric_fn in order to infer
+    the framework function compute_metrics_fn in order to infer
     a batch of images, and compute (using the inference results) the sensitivity metric of
-    the configured mixed-precision model.
+    the configured mixed-precision model. All configurations are evaluated in a single call, such that
+    the sensitivity evaluator can distribute them between parallel workers.
 
     Args:
         search_manager: MixedPrecisionSearchManager object to be used for problem formalization.
@@ -263,8 +288,10 @@ def _build_layer_to_metrics_mapping(search_manager: MixedPrecisionSearchManager,
     else:
         max_config_value = search_manager.compute_metric_fn(search_manager.max_kpi_config)
 
-    for node_idx, layer_possible_bitwidths_indices in tqdm(search_manager.layer_to_bitwidth_mapping.items(),
-                                                           total=len(search_manager.layer_to_bitwidth_mapping)):
+    # Configurations to evaluate, the nodes to configure for each of them, and their (node, bitwidth) entry in the
+    # mapping.
+    mp_model_configurations, changed_nodes_indices, entries = [], [], []
+    for node_idx, layer_possible_bitwidths_indices in search_manager.layer_to_bitwidth_mapping.items():
         layer_to_metrics_mapping[node_idx] = {}
 
         for bitwidth_idx in layer_possible_bitwidths_indices:
@@ -277,7 +304,6 @@ def _build_layer_to_metrics_mapping(search_manager: MixedPrecisionSearchManager,
             mp_model_configuration = search_manager.max_kpi_config.copy()
             mp_model_configuration[node_idx] = bitwidth_idx
 
-            # Build a distance matrix using the function we got from the framework implementation.
             if is_bops_target_kpi:
                 # Reconstructing original graph's configuration from virtual graph's configuration
                 origin_mp_model_configuration = \
@@ -287,14 +313,18 @@ def _build_layer_to_metrics_mapping(search_manager: MixedPrecisionSearchManager,
                         original_base_config=origin_max_config)
                 origin_changed_nodes_indices = [i for i, c in enumerate(origin_max_config) if
                                                 c != origin_mp_model_configuration[i]]
-                layer_to_metrics_mapping[node_idx][bitwidth_idx] = search_manager.compute_metric_fn(
-                    origin_mp_model_configuration,
-                    origin_changed_nodes_indices,
-                    origin_max_config)
+                mp_model_configurations.append(origin_mp_model_configuration)
+                changed_nodes_indices.append(origin_changed_nodes_indices)
             else:
-                layer_to_metrics_mapping[node_idx][bitwidth_idx] = search_manager.compute_metric_fn(
-                    mp_model_configuration,
-                    [node_idx],
-                    search_manager.max_kpi_config)
+                mp_model_configurations.append(mp_model_configuration)
+                changed_nodes_indices.append([node_idx])
+            entries.append((node_idx, bitwidth_idx))
+
+    # Build the distance matrices using the function we got from the framework implementation.
+    Logger.info(f'Evaluating the sensitivity of {len(mp_model_configurations)} configurations')
+    baseline_config = origin_max_config if is_bops_target_kpi else search_manager.max_kpi_config
+    metrics = search_manager.compute_metrics_fn(mp_model_configurations, changed_nodes_indices, baseline_config)
+    for (node_idx, bitwidth_idx), metric in zip(entries, metrics):
+        layer_to_metrics_mapping[node_idx][bitwidth_idx] = metric
 
     return layer_to_metrics_mapping
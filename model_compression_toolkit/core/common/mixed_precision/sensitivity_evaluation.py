@@ -13,9 +13,12 @@
 # limitations under the License.
 # ==============================================================================
 import copy
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
 import numpy as np
-from typing import Callable, Any, List
+from tqdm import tqdm
+from typing import Callable, Any, List, Tuple, Dict
 
 from model_compression_toolkit.constants import AXIS
 from model_compression_toolkit.core import FrameworkInfo, MixedPrecisionQuantizationConfigV2
@@ -92,6 +95,10 @@ class SensitivityEvaluation:
         # in the new built MP model.
         self.baseline_model, self.model_mp, self.conf_node2layers = self._build_models()
 
+        # Callables to infer the models with (the models themselves, unless they're compiled into graph functions).
+        self.baseline_model_inference = self._compile_inference_model(self.baseline_model)
+        self.model_mp_inference = self._compile_inference_model(self.model_mp)
+
         # Build images batches for inference comparison
         self.images_batches = self._get_images_batches(quant_config.num_of_images)
 
@@ -104,6 +111,15 @@ class SensitivityEvaluation:
         # Initiating baseline_tensors_list since it is not initiated in SensitivityEvaluationManager init.
         self._init_baseline_tensors_list()
 
+        # Activations of the MP model (per images batch) when it is configured with the configuration
+        # in prefix_cache_configuration (used only if cache_prefix_activations is enabled).
+        self.prefix_cache = None
+        self.prefix_cache_configuration = None
+
+        # Evaluators with their own replica of the MP model, for evaluating multiple configurations in parallel
+        # (built on the first use of compute_metrics).
+        self.replicas = None
+
         # Computing gradient-based weights for weighted average distance metric computation (only if requested),
         # and assigning distance_weighting method accordingly.
         self.interest_points_gradients = None
@@ -134,6 +150,12 @@ class SensitivityEvaluation:
             The sensitivity metric of the MP model for a given configuration.
         """
 
+        if self.quant_config.cache_prefix_activations and node_idx is not None \
+                and baseline_mp_configuration is not None:
+            return self._compute_metric_from_prefix_cache(mp_model_configuration,
+                                                          node_idx,
+                                                          baseline_mp_configuration)
+
         # Configure MP model with the given configuration.
         self._configure_bitwidths_model(mp_model_configuration,
                                         node_idx)
@@ -146,6 +168,148 @@ class SensitivityEvaluation:
             self._configure_bitwidths_model(baseline_mp_configuration,
                                             node_idx)
 
+        # The cached activations are valid only while the MP model is configured as when they were cached.
+        if baseline_mp_configuration is None or list(baseline_mp_configuration) != self.prefix_cache_configuration:
+            self.prefix_cache = None
+            self.prefix_cache_configuration = None
+
+        return self._compute_mp_distance_measure(distance_matrix, self.quant_config.distance_weighting_method)
+
+    def get_sensitivity_metric(self) -> Callable:
+        """
+        Returns: A function to compute the sensitivity metric of the MP model for each configuration in a list of
+        configurations (see compute_metrics). The metrics are computed using the prefix activations cache and the
+        parallel evaluation workers, if they are enabled in the mixed-precision configuration.
+        """
+
+        return self.compute_metrics
+
+    def compute_metrics(self,
+                        mp_model_configurations: List[List[int]],
+                        nodes_idx: List[List[int]] = None,
+                        baseline_mp_configuration: List[int] = None) -> np.ndarray:
+        """
+        Compute the sensitivity metric of the MP model for each of the given configurations.
+        The configurations are distributed between sensitivity_eval_n_workers replicas of the MP model, which
+        are evaluated in parallel threads. The progress is reported by a progress bar over the configurations.
+
+        Args:
+            mp_model_configurations: Bitwidth configurations to compute their sensitivity metric.
+            nodes_idx: For each configuration, a list of nodes' indices to configure (instead of using the entire
+                configuration), or None to configure all nodes.
+            baseline_mp_configuration: A mixed-precision configuration to set the model back to after modifying it to
+                compute the metric for each of the given configurations.
+
+        Returns:
+            A vector with the sensitivity metric of the MP model for each of the given configurations.
+        """
+        if nodes_idx is None:
+            nodes_idx = [None] * len(mp_model_configurations)
+
+        n_workers = min(self.quant_config.sensitivity_eval_n_workers, len(mp_model_configurations))
+        if n_workers <= 1:
+            return np.asarray([self.compute_metric(c, idx, baseline_mp_configuration)
+                               for c, idx in tqdm(zip(mp_model_configurations, nodes_idx),
+                                                  total=len(mp_model_configurations),
+                                                  disable=len(mp_model_configurations) <= 1)])
+
+        replicas = self._get_replicas(n_workers, baseline_mp_configuration)
+
+        # The workers update a shared progress bar, so it counts the configurations evaluated by all of them.
+        progress_bar, progress_lock = tqdm(total=len(mp_model_configurations)), threading.Lock()
+
+        def _evaluate_replica(replica_idx: int) -> List[float]:
+            replica_metrics = []
+            for c, idx in zip(mp_model_configurations[replica_idx::n_workers], nodes_idx[replica_idx::n_workers]):
+                replica_metrics.append(replicas[replica_idx].compute_metric(c, idx, baseline_mp_configuration))
+                with progress_lock:
+                    progress_bar.update(1)
+            return replica_metrics
+
+        metrics = np.zeros(len(mp_model_configurations))
+        with progress_bar, ThreadPoolExecutor(max_workers=n_workers) as executor:
+            for replica_idx, replica_metrics in enumerate(executor.map(_evaluate_replica, range(n_workers))):
+                metrics[replica_idx::n_workers] = replica_metrics
+
+        return metrics
+
+    def _get_replicas(self,
+                      n_replicas: int,
+                      baseline_mp_configuration: List[int] = None) -> List['SensitivityEvaluation']:
+        """
+        Gets evaluators that share everything but the MP model with this evaluator (which is the first of them),
+        such that they can compute metrics in parallel.
+        If prefix activations caching is used, the cache is created once and shared between the evaluators.
+
+        Args:
+            n_replicas: Number of evaluators to get.
+            baseline_mp_configuration: The mixed-precision configuration the evaluators are set back to after
+                computing a metric.
+
+        Returns:
+            A list of evaluators.
+        """
+        if self.replicas is None:
+            self.replicas = [self]
+        for _ in range(len(self.replicas), n_replicas):
+            replica = copy.copy(self)
+            replica.model_mp, replica.conf_node2layers = self._build_mp_model(self._get_evaluation_graph())
+            replica.model_mp_inference = self._compile_inference_model(replica.model_mp)
+            replica.replicas = None
+            replica.prefix_cache = None
+            replica.prefix_cache_configuration = None
+            self.replicas.append(replica)
+
+        if self.quant_config.cache_prefix_activations and baseline_mp_configuration is not None:
+            self._init_prefix_cache(baseline_mp_configuration)
+            for replica in self.replicas[1:n_replicas]:
+                if replica.prefix_cache_configuration != self.prefix_cache_configuration:
+                    replica._configure_bitwidths_model(self.prefix_cache_configuration, None)
+                    replica.prefix_cache = self.prefix_cache
+                    replica.prefix_cache_configuration = self.prefix_cache_configuration
+
+        return self.replicas[:n_replicas]
+
+    def _init_prefix_cache(self, baseline_mp_configuration: List[int]):
+        """
+        Configures the MP model with the given configuration and caches its activations for all images batches
+        (if they are not cached already).
+
+        Args:
+            baseline_mp_configuration: The mixed-precision configuration to cache the MP model's activations for.
+        """
+        if self.prefix_cache_configuration != list(baseline_mp_configuration):
+            self._configure_bitwidths_model(baseline_mp_configuration, None)
+            self.prefix_cache = [self.fw_impl.sensitivity_eval_inference_with_cache(self.model_mp, images)[1]
+                                 for images in self.images_batches]
+            self.prefix_cache_configuration = list(baseline_mp_configuration)
+
+    def _compute_metric_from_prefix_cache(self,
+                                          mp_model_configuration: List[int],
+                                          node_idx: List[int],
+                                          baseline_mp_configuration: List[int]) -> float:
+        """
+        Compute the sensitivity metric of the MP model for a configuration that differs from the baseline
+        configuration only in the given nodes. The MP model's activations in the baseline configuration are cached
+        (once per baseline configuration), and only the part of the model from the first changed node is inferred.
+
+        Args:
+            mp_model_configuration: Bitwidth configuration to use to configure the MP model.
+            node_idx: A list of nodes' indices to configure (the rest are configured as in the baseline).
+            baseline_mp_configuration: The mixed-precision configuration the cached activations are computed with.
+
+        Returns:
+            The sensitivity metric of the MP model for a given configuration.
+        """
+        self._init_prefix_cache(baseline_mp_configuration)
+
+        self._configure_bitwidths_model(mp_model_configuration, node_idx)
+
+        distance_matrix = self._build_distance_matrix(
+            changed_nodes_names=[self.sorted_configurable_nodes_names[i] for i in node_idx])
+
+        self._configure_bitwidths_model(baseline_mp_configuration, node_idx)
+
         return self._compute_mp_distance_measure(distance_matrix, self.quant_config.distance_weighting_method)
 
     def _init_baseline_tensors_list(self):
@@ -153,30 +317,64 @@ class SensitivityEvaluation:
         Evaluates the baseline model on all images and saves the obtained lists of tensors in a list for later use.
         Initiates a class variable self.baseline_tensors_list
         """
-        self.baseline_tensors_list = [self.fw_impl.to_numpy(self.fw_impl.sensitivity_eval_inference(self.baseline_model,
-                                                                                                    images))
-                                      for images in self.images_batches]
+        self.baseline_tensors_list = [self.fw_impl.to_numpy(self.fw_impl.sensitivity_eval_inference(
+            self.baseline_model_inference, images)) for images in self.images_batches]
 
-    def _build_models(self) -> Any:
+    def _get_evaluation_graph(self) -> Graph:
         """
-        Builds two models - an MP model with configurable layers and a baseline, float model.
-
-        Returns: A tuple with two models built from the given graph: a baseline model (with baseline configuration) and
-            an MP model (which can be configured for a specific bitwidth configuration).
-            Note that the type of the returned models is dependent on the used framework (TF/Pytorch).
+        Returns: A copy of the graph to build the models for the sensitivity evaluation from.
         """
-
-        evaluation_graph = copy.deepcopy(self.graph)
+        evaluation_graph = self.graph.snapshot()
 
         if self.disable_activation_for_metric:
             for n in evaluation_graph.get_topo_sorted_nodes():
                 for c in n.candidates_quantization_cfg:
                     c.activation_quantization_cfg.enable_activation_quantization = False
 
+        return evaluation_graph
+
+    def _build_mp_model(self, evaluation_graph: Graph) -> Tuple[Any, Dict[str, List[Any]]]:
+        """
+        Builds an MP model with configurable layers.
+
+        Args:
+            evaluation_graph: Graph to build the model from.
+
+        Returns: The MP model and a mapping between a configurable graph's node and its matching layer(s) in the model.
+        """
         model_mp, _, conf_node2layers = self.fw_impl.model_builder(evaluation_graph,
                                                                    mode=ModelBuilderMode.MIXEDPRECISION,
                                                                    append2output=self.interest_points,
                                                                    fw_info=self.fw_info)
+        return model_mp, conf_node2layers
+
+    def _compile_inference_model(self, model: Any) -> Any:
+        """
+        Compiles a model into a graph function to infer it with, if compile_inference_models is enabled.
+        The MP model's configurable quantizers select their active candidate when the graph runs, so configuring
+        the MP model doesn't require compiling it again.
+
+        Args:
+            model: Model to compile.
+
+        Returns: A callable to infer the model with.
+        """
+        if self.quant_config.compile_inference_models:
+            return self.fw_impl.compile_inference_model(model, self.quant_config.jit_compile_inference)
+        return model
+
+    def _build_models(self) -> Any:
+        """
+        Builds two models - an MP model with configurable layers and a baseline, float model.
+
+        Returns: A tuple with two models built from the given graph: a baseline model (with baseline configuration) and
+            an MP model (which can be configured for a specific bitwidth configuration).
+            Note that the type of the returned models is dependent on the used framework (TF/Pytorch).
+        """
+
+        evaluation_graph = self._get_evaluation_graph()
+
+        model_mp, conf_node2layers = self._build_mp_model(evaluation_graph)
 
         # Build a baseline model.
         baseline_model, _ = self.fw_impl.model_builder(evaluation_graph,
@@ -187,7 +385,7 @@ class SensitivityEvaluation:
 
     def _compute_gradient_based_weights(self) -> np.ndarray:
         """
-        Computes the gradient-based weights using the framework's model_grad method per batch of images.
+        Computes the gradient-based weights using the framework's model_grad_per_image method per batch of images.
 
         Returns: A vector of weights, one for each interest point,
         to be used for the distance metric weighted average computation.
@@ -195,18 +393,15 @@ class SensitivityEvaluation:
 
         grad_per_batch = []
         for images in self.images_batches:
-            batch_ip_gradients = []
-            for i in range(1, images[0].shape[0] + 1):
-                Logger.info(f"Computing Jacobian-based weights approximation for image sample {i} out of {images[0].shape[0]}...")
-                image_ip_gradients = self.fw_impl.model_grad(self.graph,
-                                                             {inode: images[0][i - 1:i] for inode in
-                                                              self.graph.get_inputs()},
-                                                             self.interest_points,
-                                                             self.outputs_replacement_nodes,
-                                                             self.output_nodes_indices,
-                                                             self.quant_config.output_grad_factor,
-                                                             norm_weights=self.quant_config.norm_weights)
-                batch_ip_gradients.append(image_ip_gradients)
+            Logger.info(f"Computing Jacobian-based weights approximation for {images[0].shape[0]} image samples...")
+            batch_ip_gradients = self.fw_impl.model_grad_per_image(self.graph,
+                                                                   {inode: images[0] for inode in
+                                                                    self.graph.get_inputs()},
+                                                                   self.interest_points,
+                                                                   self.outputs_replacement_nodes,
+                                                                   self.output_nodes_indices,
+                                                                   self.quant_config.output_grad_factor,
+                                                                   norm_weights=self.quant_config.norm_weights)
             grad_per_batch.append(np.mean(batch_ip_gradients, axis=0))
         return np.mean(grad_per_batch, axis=0)
 
@@ -293,9 +488,14 @@ class SensitivityEvaluation:
 
         return distance_matrix
 
-    def _build_distance_matrix(self):
+    def _build_distance_matrix(self, changed_nodes_names: List[str] = None):
         """
         Builds a matrix that contains the distances between the baseline and MP models for each interest point.
+
+        Args:
+            changed_nodes_names: Names of the nodes that changed since the prefix cache was created. If passed,
+                the MP model is inferred from the cached activations.
+
         Returns: A distance matrix.
         """
         # List of distance matrices. We create a distance matrix for each sample from the representative_data_gen
@@ -303,9 +503,14 @@ class SensitivityEvaluation:
         distance_matrices = []
 
         # Compute the distance matrix for num_of_images images.
-        for images, baseline_tensors in zip(self.images_batches, self.baseline_tensors_list):
+        for i, (images, baseline_tensors) in enumerate(zip(self.images_batches, self.baseline_tensors_list)):
             # when using model.predict(), it does not use the QuantizeWrapper functionality
-            mp_tensors = self.fw_impl.sensitivity_eval_inference(self.model_mp, images)
+            if changed_nodes_names is None:
+                mp_tensors = self.fw_impl.sensitivity_eval_inference(self.model_mp_inference, images)
+            else:
+                mp_tensors = self.fw_impl.sensitivity_eval_inference_from_cache(self.model_mp, images,
+                                                                                self.prefix_cache[i],
+                                                                                changed_nodes_names)
             mp_tensors = self.fw_impl.to_numpy(mp_tensors)
 
             # Build distance matrix: similarity between the baseline model to the float model
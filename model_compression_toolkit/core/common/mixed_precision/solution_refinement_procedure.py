@@ -71,7 +71,8 @@ def greedy_solution_refinement_procedure(mp_solution: List[int],
             updated_kpis = []
             for valid_idx in valid_candidates:
                 node_updated_kpis = search_manager.compute_kpi_for_config(
-                    config=search_manager.replace_config_in_index(new_solution, node_idx, valid_idx))
+                    config=search_manager.replace_config_in_index(new_solution, node_idx, valid_idx),
+                    base_config=new_solution)
                 updated_kpis.append(node_updated_kpis)
 
             # filter out new configs that don't hold the KPI restrictions
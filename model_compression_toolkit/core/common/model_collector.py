@@ -15,12 +15,14 @@
 
 
 import numpy as np
-from typing import List
+from typing import List, Any
 
 from model_compression_toolkit.core import FrameworkInfo
 from model_compression_toolkit.core import common
+from model_compression_toolkit.core.common.collectors.statistics_collector import BaseStatsCollector
 from model_compression_toolkit.core.common.framework_implementation import FrameworkImplementation
 from model_compression_toolkit.core.common.graph.base_graph import Graph
+from model_compression_toolkit.core.common.quantization.quantization_config import QuantizationConfig, DEFAULTCONFIG
 from model_compression_toolkit.logger import Logger
 from model_compression_toolkit.core.common.model_builder_mode import ModelBuilderMode
 
@@ -33,7 +35,11 @@ class ModelCollector:
     for thresholds calculations.
     """
 
-    def __init__(self, graph: Graph, fw_impl: FrameworkImplementation, fw_info: FrameworkInfo):
+    def __init__(self,
+                 graph: Graph,
+                 fw_impl: FrameworkImplementation,
+                 fw_info: FrameworkInfo,
+                 qc: QuantizationConfig = DEFAULTCONFIG):
         """
         Build a Keras model from the passed graph, and set the model's
         outputs to be all layers' outputs.
@@ -41,12 +47,15 @@ class ModelCollector:
         Args:
             graph: Graph to build a model from it.
             fw_impl: FrameworkImplementation object with a specific framework methods implementation.
+            fw_info: FrameworkInfo object with information about the specific framework's model.
+            qc: Quantization configuration that determines how the statistics should be collected.
 
         """
 
         self.graph = graph
         self.fw_impl = fw_impl
         self.fw_info = fw_info
+        self.framework_statistics_reduction = qc.framework_statistics_reduction
 
         node2fetch = []  # List of graph nodes, the model should output their outputs.
         stats_containers_list = []  # List of output statistics containers of nodes ordered
@@ -79,6 +88,8 @@ class ModelCollector:
                                                    mode=ModelBuilderMode.FLOAT,
                                                    append2output=node2fetch,
                                                    fw_info=self.fw_info)
+        if qc.compile_inference_models:
+            self.model = self.fw_impl.compile_inference_model(self.model, qc.jit_compile_inference)
 
     def infer(self, inputs_list: List[np.ndarray]):
         """
@@ -90,7 +101,6 @@ class ModelCollector:
 
         """
 
-        # TODO: Thinking about delegating collections to framework
         # TODO: migrate datasets to framework datasets
         tensor_data = self.fw_impl.run_model_inference(self.model, inputs_list)
         for td, sc in zip(tensor_data, self.stats_containers_list):
@@ -101,6 +111,27 @@ class ModelCollector:
                 if len(sc) != len(td):
                     Logger.exception('"tensor_data" and the model tensor_list must be of the same length')
                 for tdi, sci in zip(td, sc):
-                    sci.update_statistics(self.fw_impl.to_numpy(tdi))
+                    self._update_statistics(sci, tdi)
             else:
-                sc.update_statistics(self.fw_impl.to_numpy(td))
+                self._update_statistics(sc, td)
+
+    def _update_statistics(self, stats_container: BaseStatsCollector, tensor: Any):
+        """
+        Update a statistics container with a tensor the model outputs. When statistics reduction in the
+        framework is enabled, the statistics are reduced by the framework and only the reduced
+        statistics are converted to Numpy. Otherwise, the whole tensor is converted to Numpy.
+
+        Args:
+            stats_container: Statistics container to update.
+            tensor: Framework's tensor to update the statistics container with.
+
+        """
+
+        if self.framework_statistics_reduction:
+            if stats_container.require_collection():
+                stats_container.update_reduced_statistics(
+                    self.fw_impl.reduce_tensor_statistics(tensor,
+                                                          stats_container.out_channel_axis,
+                                                          stats_container.n_bins))
+        else:
+            stats_container.update_statistics(self.fw_impl.to_numpy(tensor))
@@ -43,6 +43,15 @@ class NodeTypeFilter(BaseNodeMatcher):
         if input_object.type == self.node_type:
             return True
 
+    def get_node_types(self):
+        """
+        Returns: A set with the node type that NodeTypeFilter contains (or None if the type can't be hashed).
+        """
+        try:
+            return {self.node_type}
+        except TypeError:  # pragma: no cover
+            return None
+
 
 class NodeNameFilter(BaseNodeMatcher):
     """
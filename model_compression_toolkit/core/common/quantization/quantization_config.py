@@ -63,7 +63,16 @@ class QuantizationConfig:
                  residual_collapsing: bool = True,
                  shift_negative_ratio: float = 0.05,
                  shift_negative_threshold_recalculation: bool = False,
-                 shift_negative_params_search: bool = False):
+                 shift_negative_params_search: bool = False,
+                 streaming_histogram: bool = False,
+                 exact_activation_mean: bool = False,
+                 framework_statistics_reduction: bool = False,
+                 qparams_computation_n_workers: int = 1,
+                 statistics_cache_dir: str = None,
+                 compile_inference_models: bool = False,
+                 jit_compile_inference: bool = False,
+                 store_representative_dataset: bool = False,
+                 representative_dataset_store_dir: str = None):
         """
         Class to wrap all different parameters the library quantize the input model according to.
 
@@ -85,6 +94,15 @@ class QuantizationConfig:
             shift_negative_ratio (float): Value for the ratio between the minimal negative value of a non-linearity output to its activation threshold, which above it - shifting negative activation should occur if enabled.
             shift_negative_threshold_recalculation (bool): Whether or not to recompute the threshold after shifting negative activation.
             shift_negative_params_search (bool): Whether to search for optimal shift and threshold in shift negative activation (experimental)
+            streaming_histogram (bool): Whether to merge activations histograms on the fly into a single fixed-size histogram during statistics collection, instead of keeping a histogram per batch (reduces memory when using many calibration batches).
+            exact_activation_mean (bool): Whether to compute the activations per-channel mean exactly (using a running sum and count) during statistics collection, instead of using an exponential moving average.
+            framework_statistics_reduction (bool): Whether to compute the activations statistics (per-channel min/max and mean, and histogram) inside the framework during statistics collection, so only the reduced statistics are converted to Numpy (instead of every collected tensor).
+            qparams_computation_n_workers (int): Number of processes to use for computing the weights quantization parameters (1 computes them in the main process).
+            statistics_cache_dir (str): Directory to save the collected statistics in, keyed by a hash of the prepared graph and the representative dataset, so later runs with the same graph and dataset load them instead of inferring the dataset (None disables the cache).
+            compile_inference_models (bool): Whether to trace the statistics collection model into a graph function, so each batch is inferred without the per-layer Python dispatch of eager execution (supported in Keras, where the model is traced into a tf.function).
+            jit_compile_inference (bool): Whether to compile the traced statistics collection model with XLA (used only if compile_inference_models is enabled).
+            store_representative_dataset (bool): Whether to iterate the representative dataset only once, storing its batches in a memory-mapped buffer file (filled by a background thread) that all the quantization stages replay, instead of iterating the dataset in each stage. The dataset must yield the same batches each time it is iterated.
+            representative_dataset_store_dir (str): Directory to create the representative dataset's buffer file in (None uses the default temporary directory).
 
         Examples:
             One may create a quantization configuration to quantize a model according to.
@@ -120,6 +138,15 @@ class QuantizationConfig:
         self.shift_negative_ratio = shift_negative_ratio
         self.shift_negative_threshold_recalculation = shift_negative_threshold_recalculation
         self.shift_negative_params_search = shift_negative_params_search
+        self.streaming_histogram = streaming_histogram
+        self.exact_activation_mean = exact_activation_mean
+        self.framework_statistics_reduction = framework_statistics_reduction
+        self.qparams_computation_n_workers = qparams_computation_n_workers
+        self.statistics_cache_dir = statistics_cache_dir
+        self.compile_inference_models = compile_inference_models
+        self.jit_compile_inference = jit_compile_inference
+        self.store_representative_dataset = store_representative_dataset
+        self.representative_dataset_store_dir = representative_dataset_store_dir
 
     def __repr__(self):
         return str(self.__dict__)
@@ -0,0 +1,169 @@
+# Copyright 2023 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+from collections.abc import Callable
+from typing import Tuple
+
+import numpy as np
+
+from model_compression_toolkit.constants import THRESHOLD_SEARCH_MEMORY_BUDGET
+from model_compression_toolkit.core.common.quantization.quantizers.quantizers_helpers import calculate_delta, \
+    fix_range_to_include_zero
+
+# Number of candidate-sized float arrays that are alive at the same time while a chunk of candidates is evaluated
+# (the quantized tensor and its difference from the float tensor).
+N_CHUNK_TEMPORARIES = 2
+
+
+def _uniform_quantize_candidates(x: np.ndarray,
+                                 range_min: np.ndarray,
+                                 range_max: np.ndarray,
+                                 n_bits: int,
+                                 dtype: np.dtype) -> np.ndarray:
+    """
+    Quantize a tensor by a batch of quantization ranges. This is the broadcasted version of uniform_quantize_tensor,
+    and it follows the same sequence of operations, so each candidate yields the same values as quantizing the
+    tensor by the candidate alone.
+
+    Args:
+        x: Tensor values to quantize.
+        range_min: Minimum bounds of the candidate ranges, with the candidates stacked on the leading axis.
+        range_max: Maximum bounds of the candidate ranges, with the candidates stacked on the leading axis.
+        n_bits: Number of bits to quantize the tensor.
+        dtype: Data type to quantize the tensor in.
+
+    Returns:
+        The quantized tensors, with the candidates stacked on the leading axis.
+    """
+    a, b = fix_range_to_include_zero(range_min, range_max, n_bits)
+    delta = (b - a) / (2 ** n_bits - 1)
+    a, b, delta = a.astype(dtype, copy=False), b.astype(dtype, copy=False), delta.astype(dtype, copy=False)
+
+    # The quantization is done in-place on the clipped tensor to avoid allocating a new array per operation.
+    q = np.clip(x, a_min=a, a_max=b)
+    q -= a
+    q /= delta
+    np.round(q, out=q)
+    q *= delta
+    q += a
+    return q
+
+
+def _batched_search(x: np.ndarray,
+                    range_min: np.ndarray,
+                    range_max: np.ndarray,
+                    n_bits: int,
+                    batched_error_function: Callable,
+                    per_channel: bool,
+                    memory_budget: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Evaluate a set of quantization ranges candidates, and select the one with the minimal error.
+    The candidates are evaluated in chunks, such that the memory the evaluation allocates stays within the
+    given memory budget.
+
+    Args:
+        x: Tensor values to quantize (already reshaped to (channels, elements) if per-channel).
+        range_min: Minimum bounds of the candidates, of shape (candidates, channels) if per-channel, or (candidates,).
+        range_max: Maximum bounds of the candidates, of shape (candidates, channels) if per-channel, or (candidates,).
+        n_bits: Number of bits to quantize the tensor.
+        batched_error_function: Function to compute the errors between the tensor and a batch of quantized tensors.
+        per_channel: Whether the search is done per-channel or per-tensor.
+        memory_budget: Maximal number of bytes to allocate at once.
+
+    Returns:
+        The index of the best candidate (per-channel, if per_channel is True) and its matching loss.
+    """
+    # The errors are reduced over the last axis, so the tensor is made contiguous to reduce each channel in the
+    # same order as when it is reduced alone.
+    x = np.ascontiguousarray(x)
+    if per_channel:
+        dtype = np.result_type(x, range_min)
+    else:
+        # In the per-tensor search each candidate is a scalar, which is cast to the tensor's data type
+        # according to NumPy's scalars casting rules.
+        x = x.flatten()
+        dtype = np.result_type(x, range_min.flat[0])
+
+    # Candidates are broadcasted against the tensor on a new leading axis.
+    range_min = np.expand_dims(range_min, -1)
+    range_max = np.expand_dims(range_max, -1)
+
+    n_candidates = range_min.shape[0]
+    candidate_bytes = N_CHUNK_TEMPORARIES * x.size * np.dtype(dtype).itemsize
+    chunk_size = int(max(1, min(n_candidates, memory_budget // max(candidate_bytes, 1))))
+
+    errors = np.concatenate([batched_error_function(x, _uniform_quantize_candidates(x,
+                                                                                    range_min[i:i + chunk_size],
+                                                                                    range_max[i:i + chunk_size],
+                                                                                    n_bits,
+                                                                                    dtype))
+                             for i in range(0, n_candidates, chunk_size)], axis=0)
+
+    best_idx = np.argmin(errors, axis=0)
+    best_loss = np.take_along_axis(errors, np.expand_dims(best_idx, 0), axis=0)[0]
+    return best_idx, best_loss
+
+
+def symmetric_batched_search(x: np.ndarray,
+                             thresholds: np.ndarray,
+                             n_bits: int,
+                             signed: bool,
+                             batched_error_function: Callable,
+                             per_channel: bool = False,
+                             memory_budget: int = THRESHOLD_SEARCH_MEMORY_BUDGET) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Search for the threshold with the minimal quantization error among a set of threshold candidates,
+    by evaluating all candidates (and all channels) at once.
+
+    Args:
+        x: Tensor values to quantize (already reshaped to (channels, elements) if per-channel).
+        thresholds: Threshold candidates, of shape (candidates, channels) if per-channel, or (candidates,).
+        n_bits: Number of bits to quantize the tensor.
+        signed: Whether quantization range is signed or not.
+        batched_error_function: Function to compute the errors between the tensor and a batch of quantized tensors.
+        per_channel: Whether the search is done per-channel or per-tensor.
+        memory_budget: Maximal number of bytes to allocate at once.
+
+    Returns:
+        The index of the best threshold candidate (per-channel, if per_channel is True) and its matching loss.
+    """
+    delta = calculate_delta(thresholds, n_bits, signed=signed)
+    range_min = -thresholds * int(signed)
+    range_max = thresholds - delta
+    return _batched_search(x, range_min, range_max, n_bits, batched_error_function, per_channel, memory_budget)
+
+
+def uniform_batched_search(x: np.ndarray,
+                           ranges: np.ndarray,
+                           n_bits: int,
+                           batched_error_function: Callable,
+                           per_channel: bool = False,
+                           memory_budget: int = THRESHOLD_SEARCH_MEMORY_BUDGET) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Search for the quantization range with the minimal quantization error among a set of range candidates,
+    by evaluating all candidates (and all channels) at once.
+
+    Args:
+        x: Tensor values to quantize (already reshaped to (channels, elements) if per-channel).
+        ranges: Range candidates, of shape (candidates, channels, 2) if per-channel, or (candidates, 2).
+        n_bits: Number of bits to quantize the tensor.
+        batched_error_function: Function to compute the errors between the tensor and a batch of quantized tensors.
+        per_channel: Whether the search is done per-channel or per-tensor.
+        memory_budget: Maximal number of bytes to allocate at once.
+
+    Returns:
+        The index of the best range candidate (per-channel, if per_channel is True) and its matching loss.
+    """
+    return _batched_search(x, ranges[..., 0], ranges[..., 1], n_bits, batched_error_function, per_channel,
+                           memory_budget)
@@ -369,6 +369,60 @@ def get_threshold_selection_tensor_error_function(quantization_method: Quantizat
     return quant_method_error_function_mapping[quant_error_method]
 
 
+def _batched_lp_error(float_tensor: np.ndarray,
+                      q_tensor: np.ndarray,
+                      p: int,
+                      norm: bool = False,
+                      norm_eps: float = 1e-8) -> np.ndarray:
+    """
+    Compute the Lp-norm distance between a float tensor and a batch of its quantized versions, reduced over the
+    last axis only, so all candidates (and all channels) are evaluated in a single computation.
+
+    Args:
+        float_tensor: Float tensor, broadcastable to q_tensor's shape.
+        q_tensor: Quantized tensors, with the candidates stacked on the leading axis.
+        p: p-norm to use for the Lp-norm distance.
+        norm: whether to normalize the error function result.
+        norm_eps: epsilon value for error normalization stability.
+
+    Returns:
+        The Lp-norm distance of each quantized tensor (and of each channel, if the tensors are per-channel).
+    """
+    diff = np.abs(float_tensor - q_tensor)
+    diff **= p
+    error = diff.mean(axis=-1)
+    if norm:
+        error /= ((np.abs(float_tensor) ** p).mean(axis=-1) + norm_eps)
+    return error
+
+
+def get_threshold_selection_tensor_batched_error_function(quant_error_method: qc.QuantizationErrorMethod,
+                                                          p: int,
+                                                          norm: bool = False) -> Callable:
+    """
+    Returns a batched version of the error function compatible to the provided error method, to be used in the
+    vectorized threshold optimization search for tensor quantization.
+    The returned method gets a float tensor and a batch of quantized tensors, and returns the error of each
+    quantized tensor reduced over the last axis.
+
+    Args:
+        quant_error_method: the requested error function type.
+        p: p-norm to use for the Lp-norm distance.
+        norm: whether to normalize the error function result.
+
+    Returns: a Callable method that calculates the errors between a tensor and a batch of quantized tensors,
+    or None if the error method has no batched version.
+    """
+
+    quant_method_error_function_mapping = {
+        qc.QuantizationErrorMethod.MSE: lambda x, q_x: _batched_lp_error(x, q_x, p=2, norm=norm),
+        qc.QuantizationErrorMethod.MAE: lambda x, q_x: _batched_lp_error(x, q_x, p=1, norm=norm),
+        qc.QuantizationErrorMethod.LP: lambda x, q_x: _batched_lp_error(x, q_x, p=p, norm=norm),
+    }
+
+    return quant_method_error_function_mapping.get(quant_error_method)
+
+
 def get_threshold_selection_histogram_error_function(quantization_method: QuantizationMethod,
                                                      quant_error_method: qc.QuantizationErrorMethod,
                                                      p: int) -> Callable:
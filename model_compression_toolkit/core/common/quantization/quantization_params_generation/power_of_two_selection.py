@@ -20,7 +20,8 @@ from model_compression_toolkit.core.common.quantization.quantization_params_gene
     qparams_selection_tensor_search, qparams_selection_histogram_search
 from model_compression_toolkit.core.common.quantization.quantizers.quantizers_helpers import max_power_of_two, get_tensor_max
 from model_compression_toolkit.core.common.quantization.quantization_params_generation.error_functions import \
-    get_threshold_selection_tensor_error_function, get_threshold_selection_histogram_error_function
+    get_threshold_selection_tensor_error_function, get_threshold_selection_histogram_error_function, \
+    get_threshold_selection_tensor_batched_error_function
 from model_compression_toolkit.target_platform_capabilities.target_platform import QuantizationMethod
 
 
@@ -65,7 +66,10 @@ def power_of_two_selection_tensor(tensor_data: np.ndarray,
                                                     channel_axis=channel_axis,
                                                     n_iter=n_iter,
                                                     min_threshold=min_threshold,
-                                                    signed=signed)
+                                                    signed=signed,
+                                                    batched_error_function=
+                                                    get_threshold_selection_tensor_batched_error_function(
+                                                        quant_error_method, p, norm=False))
     return {THRESHOLD: threshold}
 
 
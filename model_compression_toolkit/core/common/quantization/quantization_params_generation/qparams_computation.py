@@ -12,11 +12,15 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 # ==============================================================================
-from typing import List
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from copy import deepcopy
+from typing import List, Dict, Tuple, Any
 
 from model_compression_toolkit.core.common.framework_implementation import FrameworkImplementation
 from model_compression_toolkit.core.common.framework_info import FrameworkInfo
 from model_compression_toolkit.core.common import Graph, BaseNode
+from model_compression_toolkit.core.common.quantization.node_quantization_config import NodeWeightsQuantizationConfig
 from model_compression_toolkit.core.common.quantization.quantization_params_generation.qparams_activations_computation \
     import get_activations_qparams
 from model_compression_toolkit.core.common.quantization.quantization_params_generation.qparams_weights_computation import \
@@ -27,7 +31,8 @@ def calculate_quantization_params(graph: Graph,
                                   fw_info: FrameworkInfo,
                                   nodes: List[BaseNode] = [],
                                   specific_nodes: bool = False,
-                                  fw_impl: FrameworkImplementation = None):
+                                  fw_impl: FrameworkImplementation = None,
+                                  n_workers: int = 1):
     """
     For a graph, go over its nodes, compute quantization params (for both weights and activations according
     to the given framework info), and create and attach a NodeQuantizationConfig to each node (containing the
@@ -35,6 +40,9 @@ def calculate_quantization_params(graph: Graph,
     By default, the function goes over all nodes in the graph. However, the specific_nodes flag enables
     to compute quantization paramss for specific nodes if the default behavior is unnecessary. For that,
     a list of nodes nodes should be passed as well.
+    Weights quantization params are computed once for every distinct (kernel, weights configuration) pair, so
+    candidates that differ only in their activation configuration share the computation. The distinct computations
+    can be distributed over a pool of processes.
 
     Args:
         fw_info: Information needed for quantization about the specific framework (e.g., kernel channels indices,
@@ -43,21 +51,24 @@ def calculate_quantization_params(graph: Graph,
         nodes: List of nodes to compute their thresholds instead of computing it for all nodes in the graph.
         specific_nodes: Flag to compute thresholds for only specific nodes.
         fw_impl: FrameworkImplementation with specific framework implementations.
+        n_workers: Number of processes to compute the weights quantization params with (1 computes them in the current process).
 
     """
 
     # Create a list of nodes to compute their thresholds
     nodes_list: List[BaseNode] = nodes if specific_nodes else graph.nodes()
 
+    weights_qparams = _compute_weights_qparams(nodes_list, fw_info, fw_impl, n_workers)
+
     for n in nodes_list:  # iterate only nodes that we should compute their thresholds
         for candidate_qc in n.candidates_quantization_cfg:
             if n.is_weights_quantization_enabled():
-                # If node's weights should be quantized, we compute its weights' quantization parameters
+                # If node's weights should be quantized, we set its weights' quantization parameters
                 output_channels_axis, _ = get_channels_axis(candidate_qc.weights_quantization_cfg, fw_info, n.type)
-                weights_params = get_weights_qparams(n.get_weights_by_keys(fw_impl.constants.KERNEL),
-                                                     candidate_qc.weights_quantization_cfg,
-                                                     output_channels_axis)
-                candidate_qc.weights_quantization_cfg.set_weights_quantization_param(weights_params)
+                weights_params = weights_qparams[_weights_qparams_key(n,
+                                                                      candidate_qc.weights_quantization_cfg,
+                                                                      output_channels_axis)]
+                candidate_qc.weights_quantization_cfg.set_weights_quantization_param(deepcopy(weights_params))
                 candidate_qc.weights_quantization_cfg.weights_channels_axis = output_channels_axis
             if n.is_activation_quantization_enabled():
                 # If node's activations should be quantized as well, we compute its activation quantization parameters
@@ -67,3 +78,69 @@ def calculate_quantization_params(graph: Graph,
                     out_stats_container=graph.get_out_stats_collector(n))
                 # Create a NodeQuantizationConfig containing all quantization params and attach it to the node
                 candidate_qc.activation_quantization_cfg.set_activation_quantization_param(activation_params)
+
+
+def _weights_qparams_key(node: BaseNode,
+                         weights_quant_config: NodeWeightsQuantizationConfig,
+                         output_channels_axis: int) -> Tuple:
+    """
+    Get a key that identifies the computation of a node's weights quantization params. Candidates
+    with the same key get the same weights quantization params.
+
+    Args:
+        node: Node to compute its weights quantization params.
+        weights_quant_config: Weights quantization configuration of the node's candidate.
+        output_channels_axis: Index of the kernel output channels dimension.
+
+    Returns:
+        A key of all the arguments that the weights quantization params depend on.
+    """
+    return (node,
+            weights_quant_config.weights_quantization_params_fn,
+            weights_quant_config.l_p_value,
+            weights_quant_config.weights_n_bits,
+            weights_quant_config.weights_per_channel_threshold,
+            output_channels_axis,
+            weights_quant_config.min_threshold,
+            weights_quant_config.weights_error_method)
+
+
+def _compute_weights_qparams(nodes_list: List[BaseNode],
+                             fw_info: FrameworkInfo,
+                             fw_impl: FrameworkImplementation,
+                             n_workers: int) -> Dict[Tuple, Dict[Any, Any]]:
+    """
+    Compute the weights quantization params of all distinct (kernel, weights configuration) pairs
+    of the nodes' candidates. The computations are ordered by the nodes and candidates order, and each
+    result is stored by its key, so the results do not depend on the number of workers.
+
+    Args:
+        nodes_list: Nodes to compute their weights quantization params.
+        fw_info: Information needed for quantization about the specific framework.
+        fw_impl: FrameworkImplementation with specific framework implementations.
+        n_workers: Number of processes to compute the weights quantization params with.
+
+    Returns:
+        A dictionary from a computation key to the computed weights quantization params.
+    """
+    jobs = {}
+    for n in nodes_list:
+        if n.is_weights_quantization_enabled():
+            for candidate_qc in n.candidates_quantization_cfg:
+                output_channels_axis, _ = get_channels_axis(candidate_qc.weights_quantization_cfg, fw_info, n.type)
+                key = _weights_qparams_key(n, candidate_qc.weights_quantization_cfg, output_channels_axis)
+                if key not in jobs:
+                    jobs[key] = (n.get_weights_by_keys(fw_impl.constants.KERNEL),
+                                 candidate_qc.weights_quantization_cfg,
+                                 output_channels_axis)
+
+    kernels, weights_quant_configs, output_channels_axes = zip(*jobs.values()) if len(jobs) > 0 else ([], [], [])
+    if n_workers > 1 and len(jobs) > 1:
+        # Use spawned processes since forking a process after the framework was initialized is not safe.
+        with ProcessPoolExecutor(max_workers=min(n_workers, len(jobs)),
+                                 mp_context=multiprocessing.get_context('spawn')) as executor:
+            results = list(executor.map(get_weights_qparams, kernels, weights_quant_configs, output_channels_axes))
+    else:
+        results = list(map(get_weights_qparams, kernels, weights_quant_configs, output_channels_axes))
+
+    return dict(zip(jobs.keys(), results))
@@ -28,6 +28,8 @@ from model_compression_toolkit.core.common.quantization.quantizers.quantizers_he
     reshape_tensor_for_per_channel_search, uniform_quantize_tensor, get_output_shape
 from model_compression_toolkit.core.common.quantization.quantizers.quantizers_helpers import max_power_of_two, \
     get_tensor_max
+from model_compression_toolkit.core.common.quantization.quantization_params_generation.batched_qparams_search import \
+    symmetric_batched_search, uniform_batched_search
 
 
 def qparams_selection_tensor_search(error_function: Callable,
@@ -37,7 +39,8 @@ def qparams_selection_tensor_search(error_function: Callable,
                                     channel_axis: int = 1,
                                     n_iter: int = 10,
                                     min_threshold=MIN_THRESHOLD,
-                                    signed: bool = True) -> Any:
+                                    signed: bool = True,
+                                    batched_error_function: Callable = None) -> Any:
     """
     Search for an optimal threshold to quantize a tensor.
     The search_methods starts with the constrained no-clipping threshold the tensor has, and continues with
@@ -54,6 +57,8 @@ def qparams_selection_tensor_search(error_function: Callable,
         n_iter: Number of searching iterations.
         min_threshold: Threshold to return if the computed threshold is smaller that min_threshold.
         signed: a flag whether the tensor is signed.
+        batched_error_function: Batched version of error_function. If passed, all thresholds candidates are
+        evaluated at once instead of one per iteration.
 
     Returns:
         Optimal constrained threshold to quantize the tensor.
@@ -71,6 +76,13 @@ def qparams_selection_tensor_search(error_function: Callable,
     if per_channel:
         tensor_data_r = reshape_tensor_for_per_channel_search(tensor_data, channel_axis)
 
+    if batched_error_function is not None:
+        thresholds = np.stack([(threshold / (2 ** i)).flatten() if per_channel else threshold / (2 ** i)
+                               for i in range(n_iter)])
+        i, _ = symmetric_batched_search(tensor_data_r if per_channel else tensor_data, thresholds, n_bits, signed,
+                                        batched_error_function, per_channel=per_channel)
+        return np.maximum(np.reshape(threshold.flatten() / np.power(2, i), output_shape), min_threshold)
+
     error_list = []  # init an empty error list
     # On each iteration a new constrained threshold which equal to half of the previous tested threshold
     # is used for quantizing the tensor and computing the error. The error is appended to an error list, which
@@ -157,7 +169,8 @@ def qparams_symmetric_iterative_minimization(x0: np.ndarray,
                                              dec_factor: Tuple = DEFAULT_DEC_FACTOR,
                                              dec_freq: int = SYMMETRIC_TENSOR_DEC_FREQ,
                                              tolerance: float = DEFAULT_TOL,
-                                             per_channel=False) -> Dict[str, np.ndarray]:
+                                             per_channel=False,
+                                             batched_loss_fn: Callable = None) -> Dict[str, np.ndarray]:
     """
     Search for an optimal threshold to for symmetric tensor quantization.
     The search starts with the no-clipping threshold the tensor has, and continues with
@@ -181,6 +194,7 @@ def qparams_symmetric_iterative_minimization(x0: np.ndarray,
         dec_freq: Frequency for decreasing the multiplication factors.
         tolerance: If the improvement between iterations is smaller than tolerance, then early stop.
         per_channel: Whether quantization is done per-channel or per-tensor.
+        batched_loss_fn: Batched version of loss_fn, for evaluating all thresholds candidates at once.
 
     Returns:
         Dictionary with optimized threshold for symmetric tensor quantization (best obtained during the search),
@@ -204,7 +218,8 @@ def qparams_symmetric_iterative_minimization(x0: np.ndarray,
         prev_best_loss = best['loss']
         new_range_bounds = curr_threshold * range_scale
 
-        curr_res = search_fixed_range_intervals(new_range_bounds, x, loss_fn, n_bits, signed, n_intervals, per_channel)
+        curr_res = search_fixed_range_intervals(new_range_bounds, x, loss_fn, n_bits, signed, n_intervals, per_channel,
+                                                batched_loss_fn=batched_loss_fn)
         curr_threshold = curr_res['param']
         curr_loss = curr_res['loss']
 
@@ -233,7 +248,8 @@ def iterative_uniform_dynamic_range_search(x0: np.ndarray,
                                            n_bits: int,
                                            n_iter: int = UNIFORM_TENSOR_N_ITER,
                                            tolerance: float = DEFAULT_TOL,
-                                           per_channel: bool = False) -> Dict[str, np.ndarray]:
+                                           per_channel: bool = False,
+                                           batched_loss_fn: Callable = None) -> Dict[str, np.ndarray]:
     """
     Search for an optimal quantization range for uniform tensor quantization.
     The search starts with the no-clipping range the tensor has, and continues with
@@ -249,6 +265,7 @@ def iterative_uniform_dynamic_range_search(x0: np.ndarray,
         n_iter: Number of searching iterations.
         tolerance: If the improvement between iterations is smaller than tolerance, then early stop.
         per_channel: Whether quantization is done per-channel or per-tensor.
+        batched_loss_fn: Batched version of loss_fn, for evaluating all range candidates at once.
 
     Returns:
         Dictionary with optimized quantization range for uniform tensor quantization (best obtained during the search),
@@ -275,7 +292,7 @@ def iterative_uniform_dynamic_range_search(x0: np.ndarray,
     for n in range(n_iter):
         prev_best_loss = best['loss']
         curr_res = search_dynamic_range(base_range=curr_range_bounds, scalers=scalers, x=x, loss_fn=loss_fn,
-                                        n_bits=n_bits, per_channel=per_channel)
+                                        n_bits=n_bits, per_channel=per_channel, batched_loss_fn=batched_loss_fn)
         curr_range_bounds = curr_res['param']
         curr_loss = curr_res['loss']
 
@@ -297,7 +314,8 @@ def search_fixed_range_intervals(range_bounds: np.ndarray,
                                  n_bits: int,
                                  signed: bool = True,
                                  n_intervals: int = 100,
-                                 per_channel: bool = False) -> Dict[str, np.ndarray]:
+                                 per_channel: bool = False,
+                                 batched_loss_fn: Callable = None) -> Dict[str, np.ndarray]:
     """
     Searches in a set of n_intervals thresholds, taken from evenly-space intervales from the constructed range.
 
@@ -309,10 +327,23 @@ def search_fixed_range_intervals(range_bounds: np.ndarray,
         signed: Whether quantization range is signed or not.
         n_intervals: Number of locations to examine each iteration from the given range.
         per_channel: Whether the search is done per-channel or per-tensor.
+        batched_loss_fn: Batched version of loss_fn. If passed, all thresholds candidates are evaluated at once.
 
     Returns: Dictionary with best obtained threshold and the threshold's matching loss.
 
     """
+    if batched_loss_fn is not None:
+        if per_channel:
+            intervals = np.linspace(start=range_bounds[:, 0], stop=range_bounds[:, 1], num=n_intervals, dtype=float)
+            best_idx, best_loss = symmetric_batched_search(x, intervals, n_bits, signed, batched_loss_fn,
+                                                           per_channel=True)
+            return {"param": intervals[best_idx, np.arange(intervals.shape[1])].reshape([-1, 1]),
+                    "loss": best_loss.reshape([-1, 1])}
+        intervals = np.linspace(start=range_bounds[0], stop=range_bounds[1], num=n_intervals, dtype=float)
+        best_idx, best_loss = symmetric_batched_search(x, intervals, n_bits, signed, batched_loss_fn,
+                                                       per_channel=False)
+        return {"param": intervals[best_idx], "loss": best_loss}
+
     if per_channel:
         # search per-channel
         intervals = np.linspace(start=range_bounds[:, 0], stop=range_bounds[:, 1], num=n_intervals, dtype=float)
@@ -341,7 +372,7 @@ def search_fixed_range_intervals(range_bounds: np.ndarray,
 
 
 def search_dynamic_range(base_range: np.ndarray, x: np.ndarray, scalers: np.ndarray, loss_fn: Callable, n_bits: int,
-                         per_channel: bool = False) -> Dict[str, np.ndarray]:
+                         per_channel: bool = False, batched_loss_fn: Callable = None) -> Dict[str, np.ndarray]:
     """
     Searches in a set of constructed quantization ranges.
 
@@ -352,10 +383,22 @@ def search_dynamic_range(base_range: np.ndarray, x: np.ndarray, scalers: np.ndar
         loss_fn: Function to compute the error between the original and quantized tensors.
         n_bits: Number of bits to quantize the
         per_channel: Whether the search is done per-channel or per-tensor.
+        batched_loss_fn: Batched version of loss_fn. If passed, all range candidates are evaluated at once.
 
     Returns: Dictionary with best obtained quantization range and the threshold's matching loss.
 
     """
+    if batched_loss_fn is not None:
+        if per_channel:
+            ranges = np.stack([np.multiply.outer(base_range[:, 0], scalers[:, 0]),
+                               np.multiply.outer(base_range[:, 1], scalers[:, 1])], axis=2)
+            best_idx, best_loss = uniform_batched_search(x, np.transpose(ranges, [1, 0, 2]), n_bits, batched_loss_fn,
+                                                         per_channel=True)
+            return {"param": ranges[np.arange(ranges.shape[0]), best_idx, :], "loss": best_loss.reshape([-1, 1])}
+        ranges = base_range * scalers
+        best_idx, best_loss = uniform_batched_search(x, ranges, n_bits, batched_loss_fn, per_channel=False)
+        return {"param": ranges[best_idx], "loss": best_loss}
+
     if per_channel:
         # search per-channel
         ranges = np.stack([np.multiply.outer(base_range[:, 0], scalers[:, 0]),
@@ -396,7 +439,8 @@ def qparams_symmetric_selection_tensor_search(error_function: Callable,
                                               channel_axis: int = 1,
                                               n_iter: int = SYMMETRIC_TENSOR_PER_CHANNEL_N_ITER,
                                               min_threshold=MIN_THRESHOLD,
-                                              signed: bool = True) -> Any:
+                                              signed: bool = True,
+                                              batched_error_function: Callable = None) -> Any:
     """
     Search for optimal threshold (per-channel or per-tensor) for symmetric quantization of a tensor,
     using the iterative optimizer method.
@@ -411,6 +455,7 @@ def qparams_symmetric_selection_tensor_search(error_function: Callable,
         n_iter: Number of searching iterations.
         min_threshold: Threshold to return if the computed threshold is smaller that min_threshold.
         signed: a flag whether the tensor is signed.
+        batched_error_function: Batched version of error_function, for evaluating all thresholds candidates at once.
 
     Returns:
         Ndarray with an optimized threshold (or set of thresholds shaped according to the channels_axis if per-channel).
@@ -432,7 +477,8 @@ def qparams_symmetric_selection_tensor_search(error_function: Callable,
                                                        n_intervals=SYMMETRIC_TENSOR_PER_CHANNEL_N_INTERVALS,
                                                        n_iter=SYMMETRIC_TENSOR_PER_CHANNEL_N_ITER,
                                                        dec_freq=SYMMETRIC_TENSOR_PER_CHANNEL_DEC_FREQ,
-                                                       per_channel=True)
+                                                       per_channel=True,
+                                                       batched_loss_fn=batched_error_function)
         return np.reshape(np.maximum(min_threshold, res['param']), output_shape)
     else:
         # quantize per-tensor
@@ -444,7 +490,8 @@ def qparams_symmetric_selection_tensor_search(error_function: Callable,
                                                        n_intervals=SYMMETRIC_TENSOR_N_INTERVALS,
                                                        n_iter=SYMMETRIC_TENSOR_N_ITER,
                                                        dec_freq=SYMMETRIC_TENSOR_DEC_FREQ,
-                                                       per_channel=False)
+                                                       per_channel=False,
+                                                       batched_loss_fn=batched_error_function)
 
         return max(min_threshold, res['param'])
 
@@ -456,7 +503,8 @@ def qparams_uniform_selection_tensor_search(error_function: Callable,
                                             n_bits: int,
                                             per_channel: bool = False,
                                             channel_axis: int = 1,
-                                            n_iter: int = UNIFORM_TENSOR_PER_CHANNEL_N_ITER) -> Any:
+                                            n_iter: int = UNIFORM_TENSOR_PER_CHANNEL_N_ITER,
+                                            batched_error_function: Callable = None) -> Any:
     """
     Search for optimal quantization range (per-channel or per-tensor) for uniform quantization of a tensor,
     using the iterative optimizer method and built-in scale factors
@@ -471,6 +519,7 @@ def qparams_uniform_selection_tensor_search(error_function: Callable,
         per_channel: Whether the tensor should be quantized per-channel or per-tensor.
         channel_axis: Index of output channels dimension.
         n_iter: Number of searching iterations.
+        batched_error_function: Batched version of error_function, for evaluating all range candidates at once.
 
     Returns:
         Ndarray with an optimized range (or set of thresholds shaped according to the channels_axis if per-channel).
@@ -495,7 +544,8 @@ def qparams_uniform_selection_tensor_search(error_function: Callable,
                                                          loss_fn=error_function,
                                                          n_bits=n_bits,
                                                          n_iter=UNIFORM_TENSOR_PER_CHANNEL_N_ITER,
-                                                         per_channel=True)
+                                                         per_channel=True,
+                                                         batched_loss_fn=batched_error_function)
             return np.reshape(res['param'][:, 0], output_shape), np.reshape(res['param'][:, 1], output_shape)
     else:
         # quantize per-tensor
@@ -506,7 +556,8 @@ def qparams_uniform_selection_tensor_search(error_function: Callable,
                                                      loss_fn=error_function,
                                                      n_bits=n_bits,
                                                      n_iter=UNIFORM_TENSOR_N_ITER,
-                                                     per_channel=False)
+                                                     per_channel=False,
+                                                     batched_loss_fn=batched_error_function)
         return res['param']
 
 
@@ -17,7 +17,8 @@ import numpy as np
 import model_compression_toolkit.core.common.quantization.quantization_config as qc
 from model_compression_toolkit.constants import MIN_THRESHOLD, THRESHOLD
 from model_compression_toolkit.core.common.quantization.quantization_params_generation.error_functions import \
-    get_threshold_selection_tensor_error_function, get_threshold_selection_histogram_error_function, _kl_error_histogram
+    get_threshold_selection_tensor_error_function, get_threshold_selection_histogram_error_function, \
+    get_threshold_selection_tensor_batched_error_function, _kl_error_histogram
 from model_compression_toolkit.core.common.quantization.quantization_params_generation.qparams_search import \
     qparams_symmetric_selection_tensor_search, \
     qparams_symmetric_selection_histogram_search, kl_qparams_symmetric_selection_histogram_search
@@ -66,7 +67,10 @@ def symmetric_selection_tensor(tensor_data: np.ndarray,
                                                               per_channel,
                                                               channel_axis,
                                                               min_threshold=min_threshold,
-                                                              signed=signed)
+                                                              signed=signed,
+                                                              batched_error_function=
+                                                              get_threshold_selection_tensor_batched_error_function(
+                                                                  quant_error_method, p, norm=False))
     return {THRESHOLD: threshold}
 
 
@@ -19,7 +19,8 @@ from model_compression_toolkit.constants import MIN_THRESHOLD, RANGE_MIN, RANGE_
 from model_compression_toolkit.core.common.quantization.quantization_params_generation.qparams_search import \
     qparams_uniform_selection_tensor_search, qparams_uniform_selection_histogram_search
 from model_compression_toolkit.core.common.quantization.quantization_params_generation.error_functions import \
-    get_threshold_selection_tensor_error_function, get_threshold_selection_histogram_error_function
+    get_threshold_selection_tensor_error_function, get_threshold_selection_histogram_error_function, \
+    get_threshold_selection_tensor_batched_error_function
 from model_compression_toolkit.core.common.quantization.quantizers.quantizers_helpers import get_tensor_max, \
     get_tensor_min
 from model_compression_toolkit.target_platform_capabilities.target_platform import QuantizationMethod
@@ -63,7 +64,10 @@ def uniform_selection_tensor(tensor_data: np.ndarray,
                                                      tensor_max,
                                                      n_bits,
                                                      per_channel,
-                                                     channel_axis)
+                                                     channel_axis,
+                                                     batched_error_function=
+                                                     get_threshold_selection_tensor_batched_error_function(
+                                                         quant_error_method, p, norm=False))
     return {RANGE_MIN: mm[0],
             RANGE_MAX: mm[1]}
 
@@ -0,0 +1,195 @@
+# Copyright 2023 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import os
+import tempfile
+import threading
+from typing import Any, Callable, Generator, List, Tuple
+
+import numpy as np
+
+from model_compression_toolkit.logger import Logger
+from model_compression_toolkit.core.common.quantization.quantization_config import QuantizationConfig
+
+# Offset alignment (in bytes) of the arrays in the store's buffer file.
+ARRAY_ALIGNMENT = 64
+
+
+class RepresentativeDatasetStore:
+    """
+    A store of a representative dataset's batches, that iterates the dataset's generator only once, and replays its
+    batches to every stage of the quantization pipeline that iterates the dataset (statistics collection,
+    mixed precision sensitivity evaluation, GPTQ training, second moment correction and the analyzer).
+    The store is a drop-in replacement of the dataset's generator function: calling it returns a generator of the
+    dataset's batches.
+
+    The first call starts a background thread that iterates the dataset and appends its batches to a temporary
+    buffer file, ahead of the stage that consumes them. When the dataset is exhausted, the buffer is memory-mapped,
+    and the batches are replayed as views into it, without copying them.
+    """
+
+    def __init__(self,
+                 representative_data_gen: Callable,
+                 store_dir: str = None):
+        """
+        Args:
+            representative_data_gen: The dataset's generator function, that yields batches (lists of arrays).
+            store_dir: Directory to create the buffer file in (None uses the default temporary directory).
+        """
+        self.representative_data_gen = representative_data_gen
+        self.store_dir = store_dir
+
+        # Each batch is indexed by a list of (offset, shape, dtype) of its arrays in the buffer file.
+        self.batches_index: List[List[Tuple[int, tuple, str]]] = []
+        self.buffer_file = None
+        self.buffer = None
+        self.producer = None
+        self.producer_error = None
+        self.done = False
+        self.condition = threading.Condition()
+        # Guards the buffer file's position, which is shared by the writes and the reads while the dataset is stored.
+        self.file_lock = threading.Lock()
+
+    def __call__(self) -> Generator[List[np.ndarray], None, None]:
+        """
+        Returns: A generator of the dataset's batches.
+        """
+        self._start()
+        return self._replay()
+
+    def __len__(self) -> int:
+        """
+        Returns: The number of batches in the dataset (waits for the dataset to be stored).
+        """
+        self.wait()
+        return len(self.batches_index)
+
+    def wait(self):
+        """
+        Wait until all the dataset's batches are stored.
+        """
+        self._start()
+        with self.condition:
+            self.condition.wait_for(lambda: self.done)
+        self._raise_producer_error()
+
+    def _start(self):
+        """
+        Start the background thread that stores the dataset's batches (if it hasn't started yet).
+        """
+        with self.condition:
+            if self.producer is None:
+                self.buffer_file = tempfile.TemporaryFile(prefix='mct_representative_dataset_', dir=self.store_dir)
+                self.producer = threading.Thread(target=self._produce, daemon=True)
+                self.producer.start()
+
+    def _produce(self):
+        """
+        Iterate the dataset and append its batches to the buffer file. When the dataset is exhausted, map the
+        buffer file to memory.
+        """
+        try:
+            offset = 0
+            for batch in self.representative_data_gen():
+                batch_index = []
+                with self.file_lock:
+                    for a in batch:
+                        a = np.ascontiguousarray(a)
+                        self.buffer_file.seek(0, os.SEEK_END)
+                        self.buffer_file.write(b'\0' * (offset - self.buffer_file.tell()))
+                        self.buffer_file.write(a.tobytes())
+                        batch_index.append((offset, a.shape, a.dtype.str))
+                        offset += -(-a.nbytes // ARRAY_ALIGNMENT) * ARRAY_ALIGNMENT
+                    self.buffer_file.flush()
+                with self.condition:
+                    self.batches_index.append(batch_index)
+                    self.condition.notify_all()
+
+            buffer = np.memmap(self.buffer_file, dtype=np.uint8, mode='r') if offset > 0 else b''
+            Logger.info(f'Stored {len(self.batches_index)} representative dataset batches ({offset} bytes)')
+        except Exception as e:
+            buffer = None
+            self.producer_error = e
+
+        with self.condition:
+            self.buffer = buffer
+            self.done = True
+            self.condition.notify_all()
+
+    def _replay(self) -> Generator[List[np.ndarray], None, None]:
+        """
+        Yield the dataset's batches, waiting for batches that aren't stored yet. Batches are read from the buffer
+        file while the dataset is stored, and are views into the memory-mapped buffer after it is stored.
+        """
+        i = 0
+        while True:
+            with self.condition:
+                self.condition.wait_for(lambda: self.done or i < len(self.batches_index))
+                if i >= len(self.batches_index):
+                    break
+                batch_index, buffer = self.batches_index[i], self.buffer
+
+            if buffer is not None:
+                batch = [np.ndarray(shape, dtype=np.dtype(dtype), buffer=buffer, offset=offset)
+                         for offset, shape, dtype in batch_index]
+            else:
+                batch = [self._read_array(offset, shape, dtype) for offset, shape, dtype in batch_index]
+            yield batch
+            i += 1
+
+        self._raise_producer_error()
+
+    def _read_array(self, offset: int, shape: tuple, dtype: str) -> np.ndarray:
+        """
+        Read an array from the buffer file (while the dataset is being stored).
+
+        Args:
+            offset: Offset of the array in the buffer file.
+            shape: Shape of the array.
+            dtype: Data type of the array.
+
+        Returns:
+            The array.
+        """
+        dtype = np.dtype(dtype)
+        with self.file_lock:
+            self.buffer_file.seek(offset)
+            data = self.buffer_file.read(int(np.prod(shape)) * dtype.itemsize)
+        return np.frombuffer(data, dtype=dtype).reshape(shape)
+
+    def _raise_producer_error(self):
+        """
+        Raise the error the dataset's generator raised while it was stored (if any).
+        """
+        if self.producer_error is not None:
+            raise self.producer_error
+
+
+def get_representative_dataset(representative_data_gen: Callable,
+                               qc: QuantizationConfig) -> Callable:
+    """
+    Get the representative dataset's generator function for the quantization pipeline's stages: a
+    RepresentativeDatasetStore of the dataset if store_representative_dataset is enabled, or the dataset's generator
+    function otherwise.
+
+    Args:
+        representative_data_gen: The dataset's generator function.
+        qc: Quantization configuration.
+
+    Returns:
+        A generator function of the dataset's batches.
+    """
+    if qc.store_representative_dataset and not isinstance(representative_data_gen, RepresentativeDatasetStore):
+        return RepresentativeDatasetStore(representative_data_gen, qc.representative_dataset_store_dir)
+    return representative_data_gen
@@ -12,8 +12,6 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 # ==============================================================================
-import copy
-
 from model_compression_toolkit.core import CoreConfig
 from model_compression_toolkit.core.common import Graph, BaseNode
 from model_compression_toolkit.core.common.framework_implementation import FrameworkImplementation
@@ -35,7 +33,7 @@ def apply_bias_correction_to_graph(graph_to_apply_bias_correction: Graph,
         Graph with bias correction apply to it's nodes.
     """
 
-    graph = copy.deepcopy(graph_to_apply_bias_correction)
+    graph = graph_to_apply_bias_correction.snapshot()
     for n in graph.nodes:
         if n.is_weights_quantization_enabled() and core_config.quantization_config.weights_bias_correction \
                 and not n.final_weights_quantization_cfg.weights_second_moment_correction:
@@ -53,7 +53,8 @@ def _collect_and_assign_act_threshold(graph: Graph,
 
     mi = ModelCollector(graph,
                         fw_impl,
-                        fw_info)
+                        fw_info,
+                        core_config.quantization_config)
 
     for _data in tqdm(representative_data_gen()):
         mi.infer(_data)
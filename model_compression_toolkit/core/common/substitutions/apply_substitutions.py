@@ -13,9 +13,60 @@
 # limitations under the License.
 # ==============================================================================
 
-from typing import List
+import heapq
+import itertools
+import time
+from typing import Any, Dict, List
 
 from model_compression_toolkit.core import common
+from model_compression_toolkit.core.common.matchers import function
+from model_compression_toolkit.logger import Logger
+
+
+class SubstitutionStats:
+    """
+    Counters of the matching and the substitution times of a substitution (accumulated over the runs of all the
+    substitutions of its type).
+    """
+
+    def __init__(self):
+        self.n_runs = 0  # Number of times the substitution was run on a graph
+        self.n_matches = 0  # Number of matches the substitution was applied on
+        self.match_time = 0.0  # Total time (in seconds) of searching for the substitution's matches
+        self.substitute_time = 0.0  # Total time (in seconds) of applying the substitution on its matches
+
+    def __repr__(self):
+        return f'runs: {self.n_runs}, matches: {self.n_matches}, ' \
+               f'match time: {self.match_time:.4f}s, substitute time: {self.substitute_time:.4f}s'
+
+
+# Counters of the substitutions that were applied, by the substitutions' class names.
+_substitutions_stats: Dict[str, SubstitutionStats] = {}
+
+
+def get_substitutions_stats() -> Dict[str, SubstitutionStats]:
+    """
+    Returns: The counters of the substitutions that were applied (since the counters were last reset), by the
+    substitutions' class names.
+    """
+    return _substitutions_stats
+
+
+def reset_substitutions_stats():
+    """
+    Reset the counters of the substitutions.
+    """
+    _substitutions_stats.clear()
+
+
+def _get_substitution_stats(substitution: common.BaseSubstitution) -> SubstitutionStats:
+    """
+    Args:
+        substitution: A substitution.
+
+    Returns: The counters of the substitution's type.
+    """
+    return _substitutions_stats.setdefault(type(substitution).__name__, SubstitutionStats())
 
 
 def substitute(graph: common.Graph,
@@ -31,7 +82,140 @@ def substitute(graph: common.Graph,
     """
 
     for substitution in substitutions_list:
+        stats = _get_substitution_stats(substitution)
+        stats.n_runs += 1
+
+        start = time.perf_counter()
         matched_nodes = graph.filter(substitution.matcher_instance)
+        stats.match_time += time.perf_counter() - start
+
+        start = time.perf_counter()
         for idn in matched_nodes:
             graph = substitution.substitute(graph, idn)
+        stats.substitute_time += time.perf_counter() - start
+        stats.n_matches += len(matched_nodes)
+
+        Logger.debug(f'Substitution {type(substitution).__name__}: {len(matched_nodes)} matches')
+    return graph
+
+
+def substitute_until_no_match(graph: common.Graph,
+                              substitution: common.BaseSubstitution) -> common.Graph:
+    """
+    Apply a substitution on a graph repeatedly, until no new match is found: in each step, the substitution is
+    applied on the first match (by the graph's nodes order) it was not applied on yet, so matches that are created by
+    the substitution are substituted as well.
+    The matches are kept in a worklist: after each step, only the matches that start in the neighbourhood of the
+    nodes that the step changed (nodes that were added or removed, or that had edges added or removed) are searched
+    again, instead of searching the whole graph.
+
+    Args:
+        graph: Graph to transform.
+        substitution: Substitution to apply on the graph (with a node matcher or a walk matcher).
+
+    Returns:
+        Transformed graph after applying the substitution.
+    """
+    stats = _get_substitution_stats(substitution)
+    stats.n_runs += 1
+
+    matcher = substitution.matcher_instance
+    # A match can't start more than max_match_depth edges before a changed node.
+    if function.is_walk_matcher(matcher):
+        max_match_depth = len(matcher.matcher_list) - 1
+    else:
+        max_match_depth = 1 if function.is_edge_matcher(matcher) else 0
+
+    # Nodes are ordered by their order in the graph, in which new nodes are added last.
+    nodes_order = {n: i for i, n in enumerate(graph.nodes)}
+    next_order = len(nodes_order)
+
+    matches = {}  # The matches that start in each node
+    # Entries of (start node order, match index in the start node's matches, push counter, match, start node)
+    matches_heap = []
+    push_counter = itertools.count()
+    applied_matches = set()
+
+    def _search_matches(start_nodes: List[Any] = None):
+        start = time.perf_counter()
+        for n, n_matches in _group_matches_by_start(graph.filter(matcher, start_nodes)):
+            matches[n] = n_matches
+            for i, m in enumerate(n_matches):
+                heapq.heappush(matches_heap,
+                               (nodes_order[n], i, next(push_counter), _get_match_key(m), n))
+        stats.match_time += time.perf_counter() - start
+
+    _search_matches()
+
+    while len(matches_heap) > 0:
+        _, match_index, _, match, start_node = heapq.heappop(matches_heap)
+        # Skip matches that were already applied, or that are no longer found after a previous step
+        start_node_matches = matches.get(start_node, [])
+        if match in applied_matches or match_index >= len(start_node_matches) or \
+                _get_match_key(start_node_matches[match_index]) != match:
+            continue
+
+        start = time.perf_counter()
+        graph.start_recording_changed_nodes()
+        new_graph = substitution.substitute(graph, start_node_matches[match_index])
+        changed_nodes = graph.stop_recording_changed_nodes()
+        stats.substitute_time += time.perf_counter() - start
+        stats.n_matches += 1
+        applied_matches.add(match)
+
+        if new_graph is not graph:  # pragma: no cover
+            # The changes of the substitution are unknown, so the whole graph is searched again.
+            graph = new_graph
+            changed_nodes = list(graph.nodes)
+
+        # Update the nodes order, and find the nodes that matches may start in (the changed nodes and their
+        # predecessors up to max_match_depth edges before them).
+        start_nodes = {}
+        for n in changed_nodes:
+            matches.pop(n, None)
+            if n not in graph.nodes:
+                nodes_order.pop(n, None)
+                continue
+            if n not in nodes_order:
+                nodes_order[n] = next_order
+                next_order += 1
+            start_nodes[n] = None
+        frontier = list(start_nodes)
+        for _ in range(max_match_depth):
+            frontier = [p for n in frontier for p in graph.predecessors(n) if p not in start_nodes]
+            start_nodes.update(dict.fromkeys(frontier))
+
+        for n in start_nodes:
+            matches.pop(n, None)
+        _search_matches(list(start_nodes))
+
+    Logger.debug(f'Substitution {type(substitution).__name__}: {len(applied_matches)} matches')
     return graph
+
+
+def _get_match_key(match: Any) -> tuple:
+    """
+    Args:
+        match: A match of a node matcher (a node), of an edge matcher (an edge tuple) or of a walk matcher (a list
+            of nodes).
+
+    Returns: A tuple of the match's nodes (and edge key), to compare matches by.
+    """
+    return tuple(match) if isinstance(match, (list, tuple)) else (match,)
+
+
+def _group_matches_by_start(matches: List[Any]) -> List[Any]:
+    """
+    Group a list of matches by the node each match starts in (the matched node, the edge's source node or the first
+    node of the walk), keeping the order of the matches.
+
+    Args:
+        matches: Matches of a node matcher (nodes), an edge matcher (edges) or a walk matcher (lists of nodes).
+
+    Returns:
+        A list of pairs of a start node and the list of matches that start in it.
+    """
+    groups = {}
+    for m in matches:
+        groups.setdefault(m[0] if isinstance(m, (list, tuple)) else m, []).append(m)
+    return list(groups.items())
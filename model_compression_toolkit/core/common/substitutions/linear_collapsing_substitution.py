@@ -14,6 +14,7 @@
 # ==============================================================================
 
 from model_compression_toolkit.core import common
+from model_compression_toolkit.core.common.substitutions.apply_substitutions import substitute_until_no_match
 
 
 def linear_collapsing_substitute(graph: common.Graph,
@@ -21,7 +22,7 @@ def linear_collapsing_substitute(graph: common.Graph,
     """
     Apply a list of linear collapsing substitutions on a graph.
     We run on the graph and find matches. For each valid match we do substitution.
-    After each substitution we find matches again on the transformed graph to look for new matches.
+    After each substitution we find matches again around the nodes the substitution changed, to look for new matches.
     This is because a node can participate in more than one match so after substitution
     the matches are not valid anymore, and we can find new matches.
     Args:
@@ -30,18 +31,4 @@ def linear_collapsing_substitute(graph: common.Graph,
     Returns:
         Transformed graph after applying all linear collapsing substitutions.
     """
-    matched_nodes = graph.filter(linear_collapsing_substitution.matcher_instance)
-    matched_nodes_list = []
-    match_indicator = True
-    while len(matched_nodes) > 0 and match_indicator:
-        match_indicator = False
-        for matched_node in matched_nodes:
-            if matched_node not in matched_nodes_list:
-                # Substitute
-                graph = linear_collapsing_substitution.substitute(graph, matched_node)
-                matched_nodes_list.append(matched_node)
-                match_indicator = True
-                break
-        # Find new matches on the transformed graph
-        matched_nodes = graph.filter(linear_collapsing_substitution.matcher_instance)
-    return graph
\ No newline at end of file
+    return substitute_until_no_match(graph, linear_collapsing_substitution)
@@ -30,6 +30,11 @@ class UserInformation:
         self.gptq_info_dict = dict()
         self.mixed_precision_cfg = None
         self.final_kpi = None
+        # Names of the model's nodes, in the order of the schedule its peak activation memory was computed by
+        # (if the mixed-precision search was constrained by a peak activation memory target KPI).
+        # Pytorch models run their nodes in this order. Keras functional models run their layers by their depth
+        # in the model, regardless of the order they were built in, so the Keras builder does not use it.
+        self.memory_schedule = None
 
     def set_input_scale(self, scale_value: float):
         """
@@ -30,7 +30,6 @@ from tensorboard.compat.proto.summary_pb2 import Summary
 from tensorboard.compat.proto.tensor_shape_pb2 import TensorShapeProto
 from tensorboard.summary.writer.event_file_writer import EventFileWriter
 from typing import List, Any, Dict
-from networkx import topological_sort
 from model_compression_toolkit.core import FrameworkInfo
 from model_compression_toolkit.core.common import Graph, BaseNode
 from model_compression_toolkit.core.common.collectors.statistics_collector import BaseStatsCollector
@@ -291,7 +290,7 @@ class TensorboardWriter(object):
 
         node_stats = []
         types_dict = dict()
-        node_sort = list(topological_sort(graph))
+        node_sort = graph.get_topo_sorted_nodes()
         for n in node_sort:  # For each node in the graph, we create NodeDefs and connect them to existing NodeDefs
             # ----------------------------
             # Main NodeDef: framework attributes
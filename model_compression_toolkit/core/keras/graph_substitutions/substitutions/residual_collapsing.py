@@ -50,8 +50,8 @@ def residual_collapsing_fn(first_node: BaseNode,
         The modified layer node's weights: kernel
     """
     if first_node.type == Conv2D:
-        # Get nodes attributes
-        kernel = first_node.get_weights_by_keys(kernel_str)
+        # Get nodes attributes (the kernel is copied, since weights may be shared with other graphs' nodes)
+        kernel = first_node.get_weights_by_keys(kernel_str).copy()
         (kH, kW, Cin, Cout) = kernel.shape
 
         # Collapsing residual by adding "1" to kernel diagonal
@@ -53,6 +53,7 @@ else:
 from model_compression_toolkit.core import QuantizationConfig, FrameworkInfo, CoreConfig, MixedPrecisionQuantizationConfigV2
 from model_compression_toolkit.core import common
 from model_compression_toolkit.core.common import Graph, BaseNode
+from model_compression_toolkit.core.common.collectors.reduced_statistics import ReducedStatistics
 from model_compression_toolkit.core.common.collectors.statistics_collector import BaseStatsCollector
 from model_compression_toolkit.core.common.framework_implementation import FrameworkImplementation
 from model_compression_toolkit.core.common.model_builder_mode import ModelBuilderMode
@@ -91,6 +92,7 @@ from model_compression_toolkit.core.common.collectors.statistics_collector_gener
     create_stats_collector_for_node
 import model_compression_toolkit.core.keras.constants as keras_constants
 from model_compression_toolkit.core.keras.tf_tensor_numpy import tf_tensor_to_numpy, to_tf_tensor
+from model_compression_toolkit.core.keras.tensor_statistics import tf_reduce_tensor_statistics
 from model_compression_toolkit.core.keras.back2framework import get_keras_model_builder
 
 
@@ -176,19 +178,68 @@ class KerasImplementation(FrameworkImplementation):
 
     def run_model_inference(self,
                             model: Any,
-                            input_list: List[Any]) -> Tuple[tf.Tensor]:
+                            input_list: List[Any],
+                            requires_grad: bool = False) -> Tuple[tf.Tensor]:
         """
         Run the model logic on the given the inputs.
+        In Keras, gradients are recorded only inside a GradientTape, so requires_grad doesn't change the inference.
 
         Args:
             model: Keras model.
             input_list: List of inputs for the model.
+            requires_grad: Whether the inference should record the autograd graph (for computing gradients).
 
         Returns:
             The Keras model's output.
         """
         return model(input_list)
 
+    def compile_inference_model(self,
+                                model: Model,
+                                jit_compile: bool = False) -> Callable:
+        """
+        Trace a Keras model into a tf.function, so it runs inference without the per-layer Python dispatch of eager
+        execution. The tf.function keeps a traced graph per input signature (the inputs' shapes and dtypes), so the
+        model is retraced only when the inputs' shapes change.
+        The model's configurable (mixed precision) quantizers are set to select their active candidate by their
+        index variables, so the traced graph follows the configuration of the model without retracing.
+
+        Args:
+            model: Keras model.
+            jit_compile: Whether to compile the traced graph with XLA.
+
+        Returns:
+            A tf.function that runs the model.
+        """
+        for layer in model.layers:
+            quantizers = []
+            if isinstance(layer, KerasQuantizationWrapper):
+                quantizers = list(layer.weights_quantizers.values())
+            elif isinstance(layer, KerasActivationQuantizationHolder):
+                quantizers = [layer.activation_holder_quantizer]
+            for quantizer in quantizers:
+                if isinstance(quantizer, (ConfigurableWeightsQuantizer, ConfigurableActivationQuantizer)):
+                    quantizer.select_by_index_variable = True
+        return tf.function(model, jit_compile=jit_compile)
+
+    def reduce_tensor_statistics(self,
+                                 tensor: tf.Tensor,
+                                 channel_axis: int,
+                                 n_bins: int) -> ReducedStatistics:
+        """
+        Compute the statistics that are needed for statistics collection (per-channel min/max/sum
+        and a histogram) from a TF tensor, inside the framework.
+
+        Args:
+            tensor: TF tensor.
+            channel_axis: Index of the channels axis to compute the per-channel statistics by.
+            n_bins: Number of bins in the histogram.
+
+        Returns:
+            ReducedStatistics of the tensor.
+        """
+        return tf_reduce_tensor_statistics(tensor, channel_axis, n_bins)
+
     def shift_negative_correction(self,
                                   graph: Graph,
                                   core_config: CoreConfig,
@@ -210,7 +261,8 @@ class KerasImplementation(FrameworkImplementation):
 
     def attach_sc_to_node(self,
                           node: BaseNode,
-                          fw_info: FrameworkInfo) -> BaseStatsCollector:
+                          fw_info: FrameworkInfo,
+                          qc: QuantizationConfig = None) -> BaseStatsCollector:
         """
         Return a statistics collector that should be attached to a node's output
         during statistics collection.
@@ -218,11 +270,12 @@ class KerasImplementation(FrameworkImplementation):
         Args:
             node: Node to return its collector.
             fw_info: Information relevant to a specific framework about what is out channel axis (for statistics per-channel)
+            qc: Quantization configuration that determines how the statistics should be collected.
 
         Returns:
             Statistics collector for the node.
         """
-        return create_stats_collector_for_node(node, fw_info)
+        return create_stats_collector_for_node(node, fw_info, qc)
 
     def get_substitutions_channel_equalization(self,
                                                quant_config: QuantizationConfig,
@@ -571,13 +624,54 @@ class KerasImplementation(FrameworkImplementation):
 
     def sensitivity_eval_inference(self,
                                    model: Model,
-                                   inputs: Any):
+                                   inputs: Any,
+                                   requires_grad: bool = False):
         """
         Calls for a Keras model inference for a specific framework during mixed precision sensitivity evaluation.
+        In Keras, gradients are recorded only inside a GradientTape, so requires_grad doesn't change the inference.
+
+        Args:
+            model: A Keras model to run inference for.
+            inputs: Input tensors to run inference on.
+            requires_grad: Whether the inference should record the autograd graph (for computing gradients).
+
+        Returns:
+            The output of the model inference on the given input.
+        """
+
+        return model(inputs)
+
+    def sensitivity_eval_inference_with_cache(self,
+                                              model: Model,
+                                              inputs: Any) -> Tuple[Any, Any]:
+        """
+        Calls for a Keras model inference during mixed precision sensitivity evaluation.
+        Keras models are not split into partial models, so no activations are cached.
+
+        Args:
+            model: A Keras model to run inference for.
+            inputs: Input tensors to run inference on.
+
+        Returns:
+            The output of the model inference on the given input, and an empty activations cache.
+        """
+
+        return model(inputs), None
+
+    def sensitivity_eval_inference_from_cache(self,
+                                              model: Model,
+                                              inputs: Any,
+                                              cache: Any,
+                                              changed_nodes_names: List[str]) -> Any:
+        """
+        Calls for a Keras model inference during mixed precision sensitivity evaluation.
+        Since no activations are cached for Keras models, the entire model is inferred.
 
         Args:
             model: A Keras model to run inference for.
             inputs: Input tensors to run inference on.
+            cache: Activations cache (not used for Keras models).
+            changed_nodes_names: Names of the nodes whose configuration changed (not used for Keras models).
 
         Returns:
             The output of the model inference on the given input.
@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 # ==============================================================================
+from functools import partial
 from typing import List, Dict, Any
 
 import numpy as np
@@ -68,6 +69,11 @@ class ConfigurableActivationQuantizer(BaseKerasInferableQuantizer):
 
         self.activation_quantizers = init_activation_quantizers(self.node_q_cfg)
         self.active_quantization_config_index = max_candidate_idx  # initialize with first config as default
+        # A copy of the active index, that a model compiled into a graph function (tf.function) reads at run time,
+        # so it selects the active quantizer without being retraced when it changes. The quantizer selects by the
+        # variable only once the model it's in is compiled (see KerasImplementation.compile_inference_model).
+        self.active_index_variable = tf.Variable(max_candidate_idx, trainable=False, dtype=tf.int32)
+        self.select_by_index_variable = False
 
     def set_active_activation_quantizer(self, index: int):
         """
@@ -81,13 +87,14 @@ class ConfigurableActivationQuantizer(BaseKerasInferableQuantizer):
         assert index < len(self.node_q_cfg), f'Quantizer has {len(self.node_q_cfg)} ' \
                                              f'possible nbits. Can not set index {index}'
         self.active_quantization_config_index = index
+        self.active_index_variable.assign(index)
 
     def __call__(self,
                  inputs: tf.Tensor) -> np.ndarray:
         """
         Method to return the quantized activation tensor. This method is called when the framework needs to
         quantize a float activation tensor, and is expected to return the quantized tensor, according to the active
-        activation quantizer.
+        activation quantizer. In a compiled model, the active quantizer is selected at run time by the index variable.
 
         Args:
             inputs: Input tensor to quantize.
@@ -95,6 +102,9 @@ class ConfigurableActivationQuantizer(BaseKerasInferableQuantizer):
         Returns:
             Quantized activation tensor.
         """
+        if self.select_by_index_variable:
+            return tf.switch_case(self.active_index_variable.read_value(),
+                                  [partial(q, inputs) for q in self.activation_quantizers])
         return self.activation_quantizers[self.active_quantization_config_index](inputs)
 
     def get_config(self) -> Dict[str, Any]:  # pragma: no cover
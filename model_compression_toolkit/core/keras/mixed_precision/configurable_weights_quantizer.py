@@ -83,6 +83,11 @@ class ConfigurableWeightsQuantizer(BaseKerasInferableQuantizer):
                                                                                        dtype=tf.float32))
 
         self.active_quantization_config_index = self.max_candidate_idx
+        # A copy of the active index, that a model compiled into a graph function (tf.function) reads at run time,
+        # so it selects the active candidate without being retraced when it changes. The quantizer selects by the
+        # variable only once the model it's in is compiled (see KerasImplementation.compile_inference_model).
+        self.active_index_variable = tf.Variable(self.max_candidate_idx, trainable=False, dtype=tf.int32)
+        self.select_by_index_variable = False
 
     def set_weights_bit_width_index(self,
                                     index: int):
@@ -99,6 +104,7 @@ class ConfigurableWeightsQuantizer(BaseKerasInferableQuantizer):
             Logger.error(f'Quantizer has {len(self.node_q_cfg)} '  # pragma: no cover
                          f'possible nbits. Can not set index {index}')
         self.active_quantization_config_index = index
+        self.active_index_variable.assign(index)
 
     def __call__(self,
                  inputs: tf.Tensor) -> tf.Tensor:
@@ -106,7 +112,8 @@ class ConfigurableWeightsQuantizer(BaseKerasInferableQuantizer):
         Method to return the quantized weight. This method is called when the framework needs to quantize a
         float weight, and is expected to return the quantized weight. Since we already quantized the weight in
         all possible bitwidths, we do not quantize it again, and simply return the quantized weight according
-        to the current active_quantization_config_index.
+        to the current active_quantization_config_index. In a compiled model, the quantized weight is selected
+        at run time by the index variable.
 
         Args:
             inputs: Input tensor (not relevant since the weights are already quantized).
@@ -117,6 +124,9 @@ class ConfigurableWeightsQuantizer(BaseKerasInferableQuantizer):
             index that is in active_quantization_config_index the quantizer holds).
         """
 
+        if self.select_by_index_variable:
+            return tf.switch_case(self.active_index_variable.read_value(),
+                                  [partial(tf.identity, w) for w in self.quantized_weights])
         return self.quantized_weights[self.active_quantization_config_index]
 
     def get_config(self) -> Dict[str, Any]:  # pragma: no cover
@@ -0,0 +1,56 @@
+# Copyright 2023 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import numpy as np
+import tensorflow as tf
+
+from model_compression_toolkit.core.common.collectors.reduced_statistics import ReducedStatistics, \
+    get_histogram_range
+
+
+def tf_reduce_tensor_statistics(tensor: tf.Tensor,
+                                channel_axis: int,
+                                n_bins: int) -> ReducedStatistics:
+    """
+    Compute the statistics a StatsCollector needs (per-channel min/max/sum and a histogram) from
+    a TF tensor on its device, so only the reduced statistics are copied to Numpy.
+
+    Args:
+        tensor: TF tensor to reduce.
+        channel_axis: Index of the channels axis to compute the per-channel statistics by.
+        n_bins: Number of bins in the histogram.
+
+    Returns:
+        ReducedStatistics of the tensor.
+    """
+    x = tf.convert_to_tensor(tensor)
+    if len(x.shape) == 0:
+        x = tf.reshape(x, [1])
+    axis = channel_axis % len(x.shape)
+    reduce_axes = [a for a in range(len(x.shape)) if a != axis]
+
+    min_per_channel = tf.reduce_min(x, axis=reduce_axes).numpy().astype(np.float64)
+    max_per_channel = tf.reduce_max(x, axis=reduce_axes).numpy().astype(np.float64)
+    sum_per_channel = tf.reduce_sum(tf.cast(x, tf.float64), axis=reduce_axes).numpy()
+
+    # Histogram range is computed on host to match numpy.histogram bins.
+    range_min, range_max = get_histogram_range(np.min(min_per_channel), np.max(max_per_channel))
+    hist_counts = tf.histogram_fixed_width(tf.cast(x, tf.float64), [range_min, range_max], nbins=n_bins)
+
+    return ReducedStatistics(min_per_channel=min_per_channel,
+                             max_per_channel=max_per_channel,
+                             sum_per_channel=sum_per_channel,
+                             count_per_channel=int(np.prod(x.shape)) // x.shape[axis],
+                             hist_counts=hist_counts.numpy().astype(np.float64),
+                             hist_bins=np.linspace(range_min, range_max, n_bins + 1))
@@ -35,18 +35,22 @@ class FloatPyTorchModel(PytorchModel):
     def __init__(self,
                  graph: common.Graph,
                  append2output=None,
-                 fw_info: FrameworkInfo = DEFAULT_PYTORCH_INFO):
+                 fw_info: FrameworkInfo = DEFAULT_PYTORCH_INFO,
+                 release_intermediate_tensors: bool = True):
         """
 
         Args:
             graph: Graph to build its corresponding Pytorch model.
             append2output: List of nodes or OutTensor objects.
             fw_info: Framework information (e.g., mapping from layers to their attributes to quantize).
+            release_intermediate_tensors: Whether to release the nodes' output tensors during inference, as soon as
+                no remaining node or model output needs them.
         """
 
         super().__init__(graph,
                          append2output,
-                         fw_info)
+                         fw_info,
+                         release_intermediate_tensors=release_intermediate_tensors)
 
     def _quantize_node_activations(self,
                                    node: BaseNode,
@@ -72,7 +76,8 @@ class FloatPyTorchModelBuilder(PyTorchModelBuilder):
                  graph: common.Graph,
                  append2output=None,
                  fw_info: FrameworkInfo = DEFAULT_PYTORCH_INFO,
-                 return_float_outputs: bool = False):
+                 return_float_outputs: bool = False,
+                 release_intermediate_tensors: bool = True):
         """
 
         Args:
@@ -80,12 +85,15 @@ class FloatPyTorchModelBuilder(PyTorchModelBuilder):
             append2output: Nodes to append to model's output.
             fw_info: Information about the specific framework of the model that is built.
             return_float_outputs: Whether the model returns float tensors or not.
+            release_intermediate_tensors: Whether the built model releases the nodes' output tensors during inference,
+                as soon as no remaining node or model output needs them.
         """
 
         super().__init__(graph,
                          append2output,
                          fw_info,
-                         return_float_outputs)
+                         return_float_outputs,
+                         release_intermediate_tensors=release_intermediate_tensors)
 
     def build_model(self) -> Tuple[PytorchModel, UserInformation]:
         """
@@ -95,4 +103,5 @@ class FloatPyTorchModelBuilder(PyTorchModelBuilder):
         """
         return FloatPyTorchModel(self.graph,
                                  self.append2output,
-                                 self.fw_info), self.graph.user_info
+                                 self.fw_info,
+                                 release_intermediate_tensors=self.release_intermediate_tensors), self.graph.user_info
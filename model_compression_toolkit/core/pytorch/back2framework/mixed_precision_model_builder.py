@@ -47,7 +47,8 @@ class MixedPrecisionPyTorchModelBuilder(PyTorchModelBuilder):
                  graph: common.Graph,
                  append2output=None,
                  fw_info: FrameworkInfo = DEFAULT_PYTORCH_INFO,
-                 return_float_outputs: bool = False):
+                 return_float_outputs: bool = False,
+                 release_intermediate_tensors: bool = True):
         """
 
         Args:
@@ -55,6 +56,8 @@ class MixedPrecisionPyTorchModelBuilder(PyTorchModelBuilder):
             append2output: Nodes to append to model's output.
             fw_info: Information about the specific framework of the model that is built.
             return_float_outputs: Whether the model returns float tensors or not.
+            release_intermediate_tensors: Whether the built model releases the nodes' output tensors during inference,
+                as soon as no remaining node or model output needs them.
         """
 
         self.graph = graph
@@ -64,7 +67,8 @@ class MixedPrecisionPyTorchModelBuilder(PyTorchModelBuilder):
                          fw_info,
                          return_float_outputs,
                          wrapper=self.mixed_precision_wrapper,
-                         get_activation_quantizer_holder_fn=self.mixed_precision_activation_holder)
+                         get_activation_quantizer_holder_fn=self.mixed_precision_activation_holder,
+                         release_intermediate_tensors=release_intermediate_tensors)
 
     def mixed_precision_wrapper(self,
                                 n: common.BaseNode,
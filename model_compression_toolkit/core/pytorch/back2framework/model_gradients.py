@@ -16,13 +16,13 @@ from typing import Any, Dict, List
 
 import torch
 import torch.autograd as autograd
-from networkx import topological_sort
 from tqdm import tqdm
 import numpy as np
 
 from model_compression_toolkit.core import common
 from model_compression_toolkit.core.common import BaseNode, Graph
-from model_compression_toolkit.constants import EPS, MIN_JACOBIANS_ITER, JACOBIANS_COMP_TOLERANCE
+from model_compression_toolkit.constants import EPS, MIN_JACOBIANS_ITER, JACOBIANS_COMP_TOLERANCE, \
+    JACOBIANS_PROBES_PER_BACKWARD, JACOBIANS_MEMORY_BUDGET
 from model_compression_toolkit.core.common.graph.edge import EDGE_SINK_INDEX
 from model_compression_toolkit.core.common.graph.functional_node import FunctionalNode
 from model_compression_toolkit.core.pytorch.back2framework.instance_builder import node_builder
@@ -127,7 +127,7 @@ class PytorchModelGradients(torch.nn.Module):
 
         super(PytorchModelGradients, self).__init__()
         self.graph_float = graph_float
-        self.node_sort = list(topological_sort(graph_float))
+        self.node_sort = graph_float.get_topo_sorted_nodes()
         self.interest_points = interest_points
         self.output_list = output_list
         self.interest_points_tensors = []
@@ -255,24 +255,7 @@ def pytorch_iterative_approx_jacobian_trace(graph_float: common.Graph,
     output_tensors = model_grads_net(model_input_tensors)
     device = output_tensors[0].device
 
-
-    # Concat outputs
-    # First, we need to unfold all outputs that are given as list, to extract the actual output tensors
-    unfold_outputs = []
-    for output in output_tensors:
-        if isinstance(output, List):
-            unfold_outputs += output
-        else:
-            unfold_outputs.append(output)
-
-    r_outputs = [torch.reshape(output, shape=[output.shape[0], -1]) for output in unfold_outputs]
-
-    concat_axis_dim = [o.shape[0] for o in r_outputs]
-    if not all(d == concat_axis_dim[0] for d in concat_axis_dim):
-        Logger.critical("Can't concat model's outputs for gradients calculation since the shape of the first axis "  # pragma: no cover
-                        "is not equal in all outputs.")
-
-    output = torch.concat(r_outputs, dim=1)
+    output = _concat_outputs(output_tensors)
 
     ipts_jac_trace_approx = []
     for ipt in tqdm(model_grads_net.interest_points_tensors):  # Per Interest point activation tensor
@@ -317,6 +300,212 @@ def pytorch_iterative_approx_jacobian_trace(graph_float: common.Graph,
         return ipts_jac_trace_approx
 
 
+def pytorch_batched_approx_jacobian_trace(graph_float: common.Graph,
+                                          model_input_tensors: Dict[BaseNode, torch.Tensor],
+                                          interest_points: List[BaseNode],
+                                          output_list: List[BaseNode],
+                                          all_outputs_indices: List[int],
+                                          alpha: float = 0.3,
+                                          n_iter: int = 50,
+                                          norm_weights: bool = True) -> np.ndarray:
+    """
+    Computes the approximation of pytorch_iterative_approx_jacobian_trace for each image of a batch of images, using a
+    single gradients model: the images are inferred together, and the products of the Jacobians with many random
+    vectors are computed (for all the images) in a single batched backward pass.
+
+    Args:
+        graph_float: Graph to build its corresponding Pytorch model.
+        model_input_tensors: A mapping between model input nodes to an input batch torch Tensor.
+        interest_points: List of nodes which we want to get their feature map as output, to calculate distance metric.
+        output_list: List of nodes that considered as model's output for the purpose of gradients computation.
+        all_outputs_indices: Indices of the model outputs and outputs replacements (if exists),
+            in a topological sorted interest points list.
+        alpha: A tuning parameter to allow calibration between the contribution of the output feature maps returned
+            weights and the other feature maps weights (since the gradient of the output layers does not provide a
+            compatible weight for the distance metric computation).
+        n_iter: The number of random iterations to calculate the approximated power of the Jacobian trace for each interest point.
+        norm_weights: Whether to normalize the returned weights (to get values between 0 and 1).
+
+    Returns: An array of the (possibly normalized) jacobian-based weights of each image (with the images on the first
+    axis, and the interest points on the second axis).
+    """
+
+    n_images = next(iter(model_input_tensors.values())).shape[0]
+    if len(interest_points) == 1:
+        # Only one compare point, nothing else to "weight"
+        return np.ones((n_images, 1))
+
+    # Set inputs to require_grad
+    for n, input_tensor in model_input_tensors.items():
+        input_tensor.requires_grad_()
+
+    model_grads_net = PytorchModelGradients(graph_float=graph_float,
+                                            interest_points=interest_points,
+                                            output_list=output_list)
+
+    # Batch normalization layers in training mode normalize the images by the statistics of the whole batch, so in
+    # this case each image is inferred alone.
+    jac_traces = None
+    if not any(isinstance(m, torch.nn.modules.batchnorm._BatchNorm) and m.training for m in model_grads_net.modules()):
+        jac_traces = _compute_jacobian_traces(model_grads_net, model_input_tensors, n_iter)
+    if jac_traces is None:
+        jac_traces = torch.cat([_compute_jacobian_traces(model_grads_net,
+                                                         {n: t[i:i + 1] for n, t in model_input_tensors.items()},
+                                                         n_iter)
+                                for i in range(n_images)])
+
+    jac_traces = torch_tensor_to_numpy(jac_traces)
+    if norm_weights:
+        return np.asarray([_normalize_weights(t, all_outputs_indices, alpha) for t in jac_traces])
+    else:
+        return jac_traces
+
+
+def _compute_jacobian_traces(model_grads_net: PytorchModelGradients,
+                             model_input_tensors: Dict[BaseNode, torch.Tensor],
+                             n_iter: int) -> Any:
+    """
+    Infer a batch of images with a gradients model, and compute the approximated power of the Jacobian trace of the
+    model's outputs with respect to each interest point, for each image.
+    The Jacobian products of all the interest points are computed together, in a single backward pass for a chunk of
+    random vectors.
+
+    Args:
+        model_grads_net: Gradients model to infer the images with.
+        model_input_tensors: A mapping between model input nodes to an input batch torch Tensor.
+        n_iter: The number of random iterations to calculate the approximated power of the Jacobian trace for each interest point.
+
+    Returns: A tensor of the approximations (with the images on the first axis, and the interest points on the
+    second axis), or None if an interest point's tensor does not hold the images on its first axis (so the images
+    can't be inferred together).
+    """
+
+    model_grads_net.interest_points_tensors = []
+    output = _concat_outputs(model_grads_net(model_input_tensors))
+    ipts = model_grads_net.interest_points_tensors
+    n_images = output.shape[0]
+
+    ipts_bytes = sum([ipt.numel() * ipt.element_size() for ipt in ipts])
+    n_probes = int(max(1, min(JACOBIANS_PROBES_PER_BACKWARD, JACOBIANS_MEMORY_BUDGET // max(ipts_bytes, 1))))
+
+    trace_jv = []  # Jacobian trace approximations per iteration, interest point and image
+    for j in tqdm(range(0, n_iter, n_probes)):  # Approximation iterations
+        # Getting random vectors with normal distribution, and computing the products of the jacobian with them
+        v = torch.randn((min(n_probes, n_iter - j),) + tuple(output.shape), device=output.device)
+        ipts_jac_v = _batched_vector_jacobian_product(output, ipts, v)
+
+        ipts_trace_jv = []
+        for jac_v in ipts_jac_v:
+            if jac_v is None:
+                # In case we have an output node, which is an interest point, but it is not differentiable,
+                # we still want to set some weight for it, so its jacobian traces are set to 0.
+                ipts_trace_jv.append(torch.zeros((v.shape[0], n_images), device=output.device))
+            elif jac_v.shape[1] != n_images:
+                return None
+            else:
+                ipts_trace_jv.append(torch.sum(torch.pow(torch.reshape(jac_v, [v.shape[0], n_images, -1]), 2.0),
+                                               dim=-1))
+        trace_jv.append(torch.stack(ipts_trace_jv, dim=1))
+
+        # If the change to the mean Jacobian approximation is insignificant for all the interest points and images
+        # we stop the calculation
+        if torch.all(_get_converged_mean(torch.cat(trace_jv))[1]):
+            break
+
+    mean_trace_jv, _ = _get_converged_mean(torch.cat(trace_jv))
+    # Get averaged jacobian trace approximation
+    return torch.transpose(2 * mean_trace_jv / output.shape[-1], 0, 1).detach()
+
+
+def _batched_vector_jacobian_product(output: torch.Tensor,
+                                     ipts: List[torch.Tensor],
+                                     v: torch.Tensor) -> List[Any]:
+    """
+    Compute the products of a batch of vectors with the Jacobians of an output with respect to interest points'
+    tensors (the gradients of the sums of the vectors times the output).
+
+    Args:
+        output: Output tensor.
+        ipts: Interest points' tensors to compute the gradients with respect to.
+        v: Vectors to multiply the Jacobians with (stacked on the first axis, each of the output's shape).
+
+    Returns: The products of each interest point (stacked on the first axis), or None for interest points the
+    output does not depend on.
+    """
+
+    try:
+        return list(autograd.grad(outputs=output,
+                                  inputs=ipts,
+                                  grad_outputs=v,
+                                  retain_graph=True,
+                                  allow_unused=True,
+                                  is_grads_batched=True))
+    except RuntimeError:  # pragma: no cover
+        # Some operations don't support batched gradients, so the products are computed one by one.
+        jac_v = [autograd.grad(outputs=output,
+                               inputs=ipts,
+                               grad_outputs=u,
+                               retain_graph=True,
+                               allow_unused=True) for u in v]
+        return [None if jac_v[0][k] is None else torch.stack([g[k] for g in jac_v]) for k in range(len(ipts))]
+
+
+def _get_converged_mean(trace_jv: torch.Tensor) -> Any:
+    """
+    Average the Jacobian trace approximations of each interest point and image, stopping at the first iteration in
+    which the change to the mean is insignificant (as in pytorch_iterative_approx_jacobian_trace).
+
+    Args:
+        trace_jv: Jacobian trace approximations (with the iterations on the first axis).
+
+    Returns: The averaged approximations (of the shape of an iteration's approximations), and whether each of
+    them converged.
+    """
+
+    n_iter, approximations_shape = trace_jv.shape[0], trace_jv.shape[1:]
+    trace_jv = torch.reshape(trace_jv, [n_iter, -1])
+    cum_means = torch.cumsum(trace_jv, dim=0) / torch.arange(1, n_iter + 1, device=trace_jv.device).unsqueeze(1)
+
+    stop = torch.zeros(trace_jv.shape, dtype=torch.bool, device=trace_jv.device)
+    if n_iter > MIN_JACOBIANS_ITER + 1:
+        delta = cum_means[MIN_JACOBIANS_ITER + 1:] - cum_means[MIN_JACOBIANS_ITER:-1]
+        stop[MIN_JACOBIANS_ITER + 1:] = \
+            torch.abs(delta) / (torch.abs(cum_means[MIN_JACOBIANS_ITER + 1:]) + 1e-6) < JACOBIANS_COMP_TOLERANCE
+
+    converged = torch.any(stop, dim=0)
+    stop_iter = torch.where(converged, torch.argmax(stop.int(), dim=0), n_iter - 1)
+    mean_trace_jv = cum_means[stop_iter, torch.arange(trace_jv.shape[1], device=trace_jv.device)]
+    return torch.reshape(mean_trace_jv, approximations_shape), torch.reshape(converged, approximations_shape)
+
+
+def _concat_outputs(output_tensors: List[Any]) -> torch.Tensor:
+    """
+    Concatenate the outputs of a gradients model to a single tensor of the flattened outputs.
+
+    Args:
+        output_tensors: The model's output tensors (or lists of tensors).
+
+    Returns: A tensor of the concatenated outputs, with the batch on its first axis.
+    """
+
+    # First, we need to unfold all outputs that are given as list, to extract the actual output tensors
+    unfold_outputs = []
+    for output in output_tensors:
+        if isinstance(output, List):
+            unfold_outputs += output
+        else:
+            unfold_outputs.append(output)
+
+    r_outputs = [torch.reshape(output, shape=[output.shape[0], -1]) for output in unfold_outputs]
+
+    concat_axis_dim = [o.shape[0] for o in r_outputs]
+    if not all(d == concat_axis_dim[0] for d in concat_axis_dim):
+        Logger.critical("Can't concat model's outputs for gradients calculation since the shape of the first axis "  # pragma: no cover
+                        "is not equal in all outputs.")
+
+    return torch.concat(r_outputs, dim=1)
+
+
 def _normalize_weights(jacobians_traces: np.ndarray,
                        all_outputs_indices: List[int],
                        alpha: float) -> List[float]:
@@ -17,12 +17,12 @@ from functools import partial
 from typing import Tuple, Any, Dict, List, Union, Callable
 
 import torch
-from networkx import topological_sort
 
 from model_compression_toolkit.core import FrameworkInfo
 from model_compression_toolkit.core import common
 from model_compression_toolkit.core.common import BaseNode, Graph
 from model_compression_toolkit.core.common.back2framework.base_model_builder import BaseModelBuilder
+from model_compression_toolkit.core.common.back2framework.tensors_liveness import get_release_schedule
 from model_compression_toolkit.core.common.graph.edge import EDGE_SINK_INDEX
 from model_compression_toolkit.core.common.graph.functional_node import FunctionalNode
 from model_compression_toolkit.core.common.user_info import UserInformation
@@ -34,67 +34,85 @@ from model_compression_toolkit.core.pytorch.constants import BUFFER
 from mct_quantizers.common.constants import ACTIVATION_HOLDER_QUANTIZER
 
 
-def _build_input_tensors_list(node: BaseNode,
-                              graph: Graph,
+class _ExecutionStep:
+    """
+    A step of a PytorchModel's execution plan: the inference of a single node, with everything that can be
+    resolved from the graph when the model is built.
+    """
+
+    def __init__(self,
+                 node: BaseNode,
+                 model_input_index: int,
+                 input_slots: List[int],
+                 use_activation_quantization: bool,
+                 activation_holder_name: str):
+        """
+        Args:
+            node: The node the step runs.
+            model_input_index: Index of the model's input the node gets, if the node is an input node (otherwise None).
+            input_slots: Indices (in the model's topological order) of the nodes whose outputs are the node's inputs,
+                sorted by the node's input index.
+            use_activation_quantization: Whether the node's outputs are quantized.
+            activation_holder_name: Name of the node's activation quantization holder module, if it has one.
+        """
+        self.node = node
+        self.model_input_index = model_input_index
+        self.input_slots = input_slots
+        is_functional = isinstance(node, FunctionalNode)
+        self.op_call_args = node.op_call_args if is_functional else []
+        self.op_call_kwargs = node.op_call_kwargs if is_functional else {}
+        self.inputs_as_list = is_functional and node.inputs_as_list
+        self.use_activation_quantization = use_activation_quantization
+        self.activation_holder_name = activation_holder_name
+
+
+def _build_input_tensors_list(step: _ExecutionStep,
                               inputs: Tuple[Any],
-                              node_to_output_tensors_dict: Dict[BaseNode, List]) -> List[List]:
+                              output_tensors: List[List]) -> List:
     """
-    Given a node, build a list of input tensors the node gets. The list is built
-    based on the node's incoming edges and previous nodes' output tensors.
+    Given an execution step, build a list of input tensors its node gets. The list is built
+    based on the node's input slots and previous nodes' output tensors.
 
     Args:
-        node: Node to build its input tensors list.
-        graph: Graph the node is in.
+        step: Execution step of the node to build its input tensors list.
         inputs: list of input tensors to model
-        node_to_output_tensors_dict: A dictionary from a node to its output tensors.
+        output_tensors: Output tensors of the nodes, by their index in the model's topological order.
 
     Returns:
         A list of the node's input tensors.
     """
-    if node.type == DummyPlaceHolder:
-        input_tensors = [inputs[graph.get_inputs().index(node)]]
-    else:
-        input_tensors = []
-        # Go over a sorted list of the node's incoming edges, and for each source node get its output tensors.
-        # Append them in a result list.
-        for ie in graph.incoming_edges(node, sort_by_attr=EDGE_SINK_INDEX):
-            _input_tensors = node_to_output_tensors_dict[ie.source_node]
-            input_tensors.append(_input_tensors)
-        input_tensors = [tensor for tensor_list in input_tensors for tensor in tensor_list]  # flat list of lists
-    return input_tensors
+    if step.model_input_index is not None:
+        return [inputs[step.model_input_index]]
+    # Flat list of the output tensors of the node's input nodes.
+    return [tensor for slot in step.input_slots for tensor in output_tensors[slot]]
 
 
-def _run_operation(n: BaseNode,
+def _run_operation(step: _ExecutionStep,
                    input_tensors: List,
                    op_func: Any,
-                   quantize_node_activation_fn,
-                   use_activation_quantization: bool) -> Tuple[Union[List, torch.Tensor], Union[List, torch.Tensor]]:
+                   quantize_node_activation_fn) -> Tuple[Union[List, torch.Tensor], Union[List, torch.Tensor]]:
     """
     Applying the layer (op_func) to the input tensors (input_tensors).
-    If quantized is set to True, and the layer's corresponding node (n) has quantization
-    attributes, an additional fake-quantization node is built and appended to the layer.
+    If the step's node quantizes its activations, the quantization function is applied
+    to the layer's output.
 
     Args:
-        n: The corresponding node of the layer it runs.
+        step: Execution step of the layer it runs.
         input_tensors: List of Pytorch tensors that are the layer's inputs.
         op_func: Module/functional to apply to the input tensors.
         quantize_node_activation_fn: quantization function
-        use_activation_quantization: Flag to indicate if we have an activation function.
     Returns:
         A tuple of Pytorch tensors. The Module/functional output tensors after applying the
         Module/functional to the input tensors.
     """
-
-    op_call_args = n.op_call_args if isinstance(n, FunctionalNode) else []
-    functional_kwargs = n.op_call_kwargs if isinstance(n, FunctionalNode) else {}
-    if isinstance(n, FunctionalNode) and n.inputs_as_list:
-        out_tensors_of_n_float = op_func(input_tensors, *op_call_args, **functional_kwargs)
+    if step.inputs_as_list:
+        out_tensors_of_n_float = op_func(input_tensors, *step.op_call_args, **step.op_call_kwargs)
     else:
-        out_tensors_of_n_float = op_func(*input_tensors + op_call_args, **functional_kwargs)
+        out_tensors_of_n_float = op_func(*input_tensors + step.op_call_args, **step.op_call_kwargs)
 
     # Add a fake quant node if the node has an activation threshold.
     out_tensors_of_n = out_tensors_of_n_float
-    if use_activation_quantization:
+    if step.use_activation_quantization:
         if isinstance(out_tensors_of_n_float, list):
             out_tensors_of_n_float = torch.cat(out_tensors_of_n_float, dim=0)
         out_tensors_of_n = quantize_node_activation_fn(out_tensors_of_n_float)
@@ -102,34 +120,19 @@ def _run_operation(n: BaseNode,
     return out_tensors_of_n, out_tensors_of_n_float
 
 
-def _find_by_node_name(node_to_output_tensors_dict: dict, node_name: str):
+def _generate_outputs(output_slots: List[int],
+                      output_tensors: List[List]) -> List:
     """
     Args:
-        node_to_output_tensors_dict: A dictionary from a node to its output tensors.
-        node_name: Node name
-    Returns:
-        Out tensors if found node with name equal to node_name, None if no exist
-    """
-    for node in node_to_output_tensors_dict.keys():
-        if node.name == node_name:
-            return node_to_output_tensors_dict.get(node)
-    return None
-
-
-def _generate_outputs(
-        out_nodes: List[BaseNode],
-        node_to_output_tensors_dict: dict):
-    """
-    Args:
-        out_nodes: List of output nodes.
-        node_to_output_tensors_dict: A dictionary from a node to its output tensors.
+        output_slots: Indices (in the model's topological order) of the output nodes.
+        output_tensors: Output tensors of the nodes, by their index in the model's topological order.
 
     Returns:
         List of output tensor/s for the model
     """
     output = []
-    for n in out_nodes:
-        out_tensors_of_n = _find_by_node_name(node_to_output_tensors_dict, n.name)
+    for slot in output_slots:
+        out_tensors_of_n = output_tensors[slot]
         if len(out_tensors_of_n) > 1:
             output.append(out_tensors_of_n)
         else:
@@ -147,7 +150,8 @@ class PytorchModel(torch.nn.Module):
                  append2output: List[Any] = None,
                  return_float_outputs: bool = False,
                  wrapper: Callable = None,
-                 get_activation_quantizer_holder_fn: Callable = None):
+                 get_activation_quantizer_holder_fn: Callable = None,
+                 release_intermediate_tensors: bool = True):
         """
         Construct a Pytorch model.
 
@@ -157,17 +161,21 @@ class PytorchModel(torch.nn.Module):
             return_float_outputs: Whether the model returns float tensors or not.
             wrapper: A function wrapper Pytorch Layers.
             get_activation_quantizer_holder_fn: Function to retrieve a quantization holder for a node.
+            release_intermediate_tensors: Whether to release the nodes' output tensors during inference, as soon as
+                no remaining node or model output needs them (otherwise, they are kept until the inference ends).
 
         """
         super(PytorchModel, self).__init__()
         self.graph = graph
-        self.node_sort = list(topological_sort(graph))
+        self.node_sort = graph.get_scheduled_nodes()
         self.node_to_activation_quantization_holder = {}
         self.append2output = append2output
         self.return_float_outputs = return_float_outputs
         self.wrapper = wrapper
         self.get_activation_quantizer_holder = get_activation_quantizer_holder_fn
+        self.release_intermediate_tensors = release_intermediate_tensors
         self._add_modules()
+        self._compile_execution_plan()
 
     # todo: Move to parent class BaseModelBuilder
     @property
@@ -243,6 +251,41 @@ class PytorchModel(torch.nn.Module):
                     self.node_to_activation_quantization_holder.update(
                         {node.name: node.name + '_' + ACTIVATION_HOLDER_QUANTIZER})
 
+    def _compile_execution_plan(self):
+        """
+        Resolve, once, everything the inference of the nodes needs from the graph (the nodes' input and output
+        slots, their operations' arguments, their activation quantization and the points after which their
+        outputs are no longer needed), so the forward pass only indexes into lists of tensors and does not query
+        the graph.
+        The modules themselves are fetched by name in every inference, since they may be replaced after the model
+        is built (for example, when the model is exported).
+        """
+        self.configurable_nodes_names = self.graph.get_configurable_sorted_nodes_names()
+        node_to_index = {node: i for i, node in enumerate(self.node_sort)}
+        model_inputs = self.graph.get_inputs()
+
+        self.execution_plan = []
+        for node in self.node_sort:
+            model_input_index = model_inputs.index(node) if node.type == DummyPlaceHolder else None
+            input_slots = [node_to_index[ie.source_node]
+                           for ie in self.graph.incoming_edges(node, sort_by_attr=EDGE_SINK_INDEX)]
+
+            activation_holder_name = self.node_to_activation_quantization_holder.get(node.name)
+            use_activation_quantization = node.is_activation_quantization_enabled()
+            if use_activation_quantization and activation_holder_name is None:
+                use_activation_quantization = self.wrapper is None
+
+            self.execution_plan.append(_ExecutionStep(node,
+                                                      model_input_index,
+                                                      input_slots,
+                                                      use_activation_quantization,
+                                                      activation_holder_name))
+
+        node_name_to_index = {node.name: i for i, node in enumerate(self.node_sort)}
+        out_nodes = self.append2output if self.append2output else [ot.node for ot in self.graph.get_outputs()]
+        self.output_slots = [node_name_to_index[n.name] for n in out_nodes]
+        self.release_schedule = get_release_schedule(self.graph, self.node_sort, [n.name for n in out_nodes])
+
     def forward(self,
                 *args: Any) -> Any:
         """
@@ -251,40 +294,127 @@ class PytorchModel(torch.nn.Module):
         Returns:
             torch Tensor/s which is/are the output of the model logic.
         """
-        node_to_output_tensors_dict = dict()
-        node_to_output_tensors_dict_float = dict()
-        configurable_nodes = self.graph.get_configurable_sorted_nodes_names()
-        for node in self.node_sort:
-            input_tensors = _build_input_tensors_list(node,
-                                                      self.graph,
-                                                      args,
-                                                      node_to_output_tensors_dict)
+        output_tensors, output_tensors_float = self._run_nodes(args, release=self.release_intermediate_tensors)
+        return self._get_outputs(output_tensors, output_tensors_float)
 
-            op_func = self._get_op_func(node, configurable_nodes)
-            use_activation_quantization, activation_quantization_fn = self._get_activation_quantization_fn(node)
+    def forward_with_cache(self,
+                           *args: Any) -> Tuple[Any, Tuple[Dict[str, List], Dict[str, List]]]:
+        """
+        Run the model logic and keep the output tensors of all nodes, so later inferences on the same
+        inputs can reuse them (see forward_from_cache).
+        The cache is keyed by the nodes' names, so it can be reused by other models that are built from
+        the same graph.
+
+        Args:
+            args: argument input tensors to model.
+
+        Returns:
+            The output of the model logic, and a cache of the output tensors (quantized and float) of all nodes.
+        """
+        output_tensors, output_tensors_float = self._run_nodes(args)
+        return self._get_outputs(output_tensors, output_tensors_float), \
+            ({n.name: t for n, t in zip(self.node_sort, output_tensors)},
+             {n.name: t for n, t in zip(self.node_sort, output_tensors_float)})
+
+    def forward_from_cache(self,
+                           cache: Tuple[Dict[str, List], Dict[str, List]],
+                           start_nodes_names: List[str],
+                           *args: Any) -> Any:
+        """
+        Run the model logic from the first (in the model's topological order) of the given nodes, using the
+        cached output tensors of all nodes before it. This gives the same outputs as running the entire model,
+        as long as only the given nodes changed since the cache was created (using forward_with_cache).
+
+        Args:
+            cache: Output tensors of all nodes, from a previous inference on the same inputs.
+            start_nodes_names: Names of the nodes that changed since the cache was created.
+            args: argument input tensors to model.
+
+        Returns:
+            torch Tensor/s which is/are the output of the model logic.
+        """
+        start_nodes_names = set(start_nodes_names)
+        start_index = min([i for i, n in enumerate(self.node_sort) if n.name in start_nodes_names],
+                          default=len(self.node_sort))
+        prefix_nodes = self.node_sort[:start_index]
+        output_tensors, output_tensors_float = self._run_nodes(args,
+                                                               [cache[0][n.name] for n in prefix_nodes],
+                                                               [cache[1][n.name] for n in prefix_nodes],
+                                                               release=self.release_intermediate_tensors)
+        return self._get_outputs(output_tensors, output_tensors_float)
+
+    def _run_nodes(self,
+                   args: Tuple[Any],
+                   output_tensors: List[List] = None,
+                   output_tensors_float: List[List] = None,
+                   release: bool = False) -> Tuple[List[List], List[List]]:
+        """
+        Run the model's execution plan (from the node that follows the given output tensors, in the model's
+        topological order), and collect the nodes' output tensors.
+        If release is True, the output tensors of each node are released (replaced by None) once no remaining
+        node or model output needs them, so they can be freed during the inference.
+
+        Args:
+            args: argument input tensors to model.
+            output_tensors: Output tensors of the first nodes in the model's topological order (if the inference
+                starts from the middle of the model).
+            output_tensors_float: Float output tensors of the first nodes in the model's topological order.
+            release: Whether to release the output tensors that are no longer needed.
+
+        Returns:
+            The output tensors and the float output tensors of all nodes, by their index in the model's
+            topological order (None for released tensors).
+        """
+        output_tensors = [] if output_tensors is None else output_tensors
+        output_tensors_float = [] if output_tensors_float is None else output_tensors_float
+        for i, step in enumerate(self.execution_plan[len(output_tensors):], len(output_tensors)):
+            input_tensors = _build_input_tensors_list(step, args, output_tensors)
+
+            op_func = self._get_op_func(step.node, self.configurable_nodes_names)
+            activation_quantization_fn = None
+            if step.use_activation_quantization:
+                if step.activation_holder_name is None:
+                    activation_quantization_fn = partial(self._quantize_node_activations, step.node)
+                else:
+                    activation_quantization_fn = getattr(self, step.activation_holder_name)
 
             # Run node operation and fetch outputs
-            out_tensors_of_n, out_tensors_of_n_float = _run_operation(node,
+            out_tensors_of_n, out_tensors_of_n_float = _run_operation(step,
                                                                       input_tensors,
                                                                       op_func=op_func,
-                                                                      quantize_node_activation_fn=activation_quantization_fn,
-                                                                      use_activation_quantization=use_activation_quantization)
+                                                                      quantize_node_activation_fn=activation_quantization_fn)
 
             if isinstance(out_tensors_of_n, list):
-                node_to_output_tensors_dict.update({node: out_tensors_of_n})
-                node_to_output_tensors_dict_float.update({node: out_tensors_of_n_float})
+                output_tensors.append(out_tensors_of_n)
+                output_tensors_float.append(out_tensors_of_n_float)
             else:
-                node_to_output_tensors_dict.update({node: [out_tensors_of_n]})
-                node_to_output_tensors_dict_float.update({node: [out_tensors_of_n_float]})
+                output_tensors.append([out_tensors_of_n])
+                output_tensors_float.append([out_tensors_of_n_float])
 
-        if self.append2output:
-            outputs = _generate_outputs(self.append2output,
-                                        node_to_output_tensors_dict_float if self.return_float_outputs else node_to_output_tensors_dict)
-        else:
-            outputs = _generate_outputs([ot.node for ot in self.graph.get_outputs()],
-                                        node_to_output_tensors_dict_float if self.return_float_outputs else node_to_output_tensors_dict)
-            if len(outputs) == 1:
-                outputs = outputs[0]
+            if release:
+                for slot in self.release_schedule[i]:
+                    output_tensors[slot] = None
+                    output_tensors_float[slot] = None
+
+        return output_tensors, output_tensors_float
+
+    def _get_outputs(self,
+                     output_tensors: List[List],
+                     output_tensors_float: List[List]) -> Any:
+        """
+        Gets the model's outputs from the nodes' output tensors.
+
+        Args:
+            output_tensors: Output tensors of the nodes, by their index in the model's topological order.
+            output_tensors_float: Float output tensors of the nodes, by their index in the model's topological order.
+
+        Returns:
+            torch Tensor/s which is/are the output of the model logic.
+        """
+        outputs = _generate_outputs(self.output_slots,
+                                    output_tensors_float if self.return_float_outputs else output_tensors)
+        if not self.append2output and len(outputs) == 1:
+            outputs = outputs[0]
         return outputs
 
     def _get_op_func(self,
@@ -302,28 +432,6 @@ class PytorchModel(torch.nn.Module):
         """
         return getattr(self, node.name)
 
-    def _get_activation_quantization_fn(self, node) -> Tuple[bool, bool, Callable]:
-        """
-        Get activation quantization parameters for this node.
-
-        Args:
-            node: Node from which to extract the activation quantization parameters.
-
-        Returns: Flag to indicate if we quantize activations, flag to indicate if we quantize activations
-        using a quantization holder and a quantization function to use for the node's activations.
-        """
-        activation_quantization_holder = self.node_to_activation_quantization_holder.get(node.name)
-        use_activation_quantization = node.is_activation_quantization_enabled()
-        if use_activation_quantization:
-            if activation_quantization_holder is None:
-                activation_quantization_fn = partial(self._quantize_node_activations, node)
-                use_activation_quantization = self.wrapper is None
-            else:
-                activation_quantization_fn = getattr(self, activation_quantization_holder)
-        else:
-            activation_quantization_fn = None
-        return use_activation_quantization, activation_quantization_fn
-
 
 class PyTorchModelBuilder(BaseModelBuilder):
     """
@@ -336,7 +444,8 @@ class PyTorchModelBuilder(BaseModelBuilder):
                  fw_info: FrameworkInfo = DEFAULT_PYTORCH_INFO,
                  return_float_outputs: bool = False,
                  wrapper: Callable = None,
-                 get_activation_quantizer_holder_fn: Callable = None):
+                 get_activation_quantizer_holder_fn: Callable = None,
+                 release_intermediate_tensors: bool = True):
         """
 
         Args:
@@ -346,6 +455,8 @@ class PyTorchModelBuilder(BaseModelBuilder):
             return_float_outputs: Whether the model returns float tensors or not.
             wrapper: A function wrapper Pytorch Layers.
             get_activation_quantizer_holder_fn: Function to retrieve a quantization holder for a node.
+            release_intermediate_tensors: Whether the built model releases the nodes' output tensors during inference,
+                as soon as no remaining node or model output needs them.
         """
 
         super().__init__(graph,
@@ -355,6 +466,7 @@ class PyTorchModelBuilder(BaseModelBuilder):
 
         self.wrapper = wrapper
         self.get_activation_quantizer_holder_fn = get_activation_quantizer_holder_fn
+        self.release_intermediate_tensors = release_intermediate_tensors
 
     def build_model(self) -> Tuple[PytorchModel, UserInformation]:
         """
@@ -366,4 +478,5 @@ class PyTorchModelBuilder(BaseModelBuilder):
                             self.append2output,
                             return_float_outputs=self.return_float_outputs,
                             wrapper=self.wrapper,
-                            get_activation_quantizer_holder_fn=self.get_activation_quantizer_holder_fn), self.graph.user_info
+                            get_activation_quantizer_holder_fn=self.get_activation_quantizer_holder_fn,
+                            release_intermediate_tensors=self.release_intermediate_tensors), self.graph.user_info
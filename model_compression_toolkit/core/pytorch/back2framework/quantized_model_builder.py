@@ -33,16 +33,20 @@ class QuantizedPyTorchModel(PytorchModel):
 
     def __init__(self,
                  graph: common.Graph,
-                 append2output=None):
+                 append2output=None,
+                 release_intermediate_tensors: bool = True):
         """
 
         Args:
             graph: Graph to build its corresponding Pytorch model.
             append2output: List of nodes or OutTensor objects.
+            release_intermediate_tensors: Whether to release the nodes' output tensors during inference, as soon as
+                no remaining node or model output needs them.
         """
 
         super().__init__(graph,
-                         append2output)
+                         append2output,
+                         release_intermediate_tensors=release_intermediate_tensors)
 
     def _quantize_node_activations(self,
                                    node: BaseNode,
@@ -71,7 +75,8 @@ class QuantizedPyTorchModelBuilder(PyTorchModelBuilder):
                  graph: common.Graph,
                  append2output=None,
                  fw_info: FrameworkInfo = DEFAULT_PYTORCH_INFO,
-                 return_float_outputs: bool = False):
+                 return_float_outputs: bool = False,
+                 release_intermediate_tensors: bool = True):
         """
 
         Args:
@@ -79,12 +84,15 @@ class QuantizedPyTorchModelBuilder(PyTorchModelBuilder):
             append2output: Nodes to append to model's output.
             fw_info: Information about the specific framework of the model that is built.
             return_float_outputs: Whether the model returns float tensors or not.
+            release_intermediate_tensors: Whether the built model releases the nodes' output tensors during inference,
+                as soon as no remaining node or model output needs them.
         """
 
         super().__init__(graph,
                          append2output,
                          fw_info,
-                         return_float_outputs)
+                         return_float_outputs,
+                         release_intermediate_tensors=release_intermediate_tensors)
 
     def build_model(self) -> Tuple[PytorchModel, UserInformation]:
         """
@@ -93,4 +101,6 @@ class QuantizedPyTorchModelBuilder(PyTorchModelBuilder):
 
         """
         return QuantizedPyTorchModel(self.graph,
-                                     self.append2output), self.graph.user_info
+                                     self.append2output,
+                                     release_intermediate_tensors=self.release_intermediate_tensors), \
+               self.graph.user_info
@@ -47,8 +47,8 @@ def residual_collapsing_fn(first_node: BaseNode,
         The modified layer node's weights: kernel
     """
     if first_node.type == Conv2d:
-        # Get nodes attributes
-        kernel = first_node.get_weights_by_keys(kernel_str)
+        # Get nodes attributes (the kernel is copied, since weights may be shared with other graphs' nodes)
+        kernel = first_node.get_weights_by_keys(kernel_str).copy()
         (Cout, Cin, kH, kW) = kernel.shape
 
         # Collapsing residual by adding "1" to kernel diagonal
@@ -28,6 +28,7 @@ import model_compression_toolkit.core.pytorch.constants as pytorch_constants
 from model_compression_toolkit.core import QuantizationConfig, FrameworkInfo, CoreConfig, MixedPrecisionQuantizationConfigV2
 from model_compression_toolkit.core import common
 from model_compression_toolkit.core.common import Graph, BaseNode
+from model_compression_toolkit.core.common.collectors.reduced_statistics import ReducedStatistics
 from model_compression_toolkit.core.common.collectors.statistics_collector import BaseStatsCollector
 from model_compression_toolkit.core.common.collectors.statistics_collector_generator import \
     create_stats_collector_for_node
@@ -40,7 +41,7 @@ from model_compression_toolkit.core.common.similarity_analyzer import compute_ms
 from model_compression_toolkit.core.common.user_info import UserInformation
 from model_compression_toolkit.core.pytorch.back2framework import get_pytorch_model_builder
 from model_compression_toolkit.core.pytorch.back2framework.model_gradients import \
-    pytorch_iterative_approx_jacobian_trace
+    pytorch_iterative_approx_jacobian_trace, pytorch_batched_approx_jacobian_trace
 from model_compression_toolkit.core.pytorch.default_framework_info import DEFAULT_PYTORCH_INFO
 from model_compression_toolkit.core.pytorch.graph_substitutions.substitutions.batchnorm_folding import \
     pytorch_batchnorm_folding, pytorch_batchnorm_forward_folding
@@ -78,10 +79,12 @@ from model_compression_toolkit.core.pytorch.mixed_precision.configurable_activat
 from model_compression_toolkit.core.pytorch.mixed_precision.configurable_weights_quantizer import \
     ConfigurableWeightsQuantizer
 from model_compression_toolkit.core.pytorch.pytorch_node_prior_info import create_node_prior_info
+from model_compression_toolkit.core.pytorch.tensor_statistics import torch_reduce_tensor_statistics
 from model_compression_toolkit.core.pytorch.reader.reader import model_reader
 from model_compression_toolkit.core.pytorch.statistics_correction.apply_second_moment_correction import \
     pytorch_apply_second_moment_correction
-from model_compression_toolkit.core.pytorch.utils import to_torch_tensor, torch_tensor_to_numpy, set_model
+from model_compression_toolkit.core.pytorch.utils import to_torch_tensor, torch_tensor_to_numpy, set_model, \
+    run_inference
 
 
 class PytorchImplementation(FrameworkImplementation):
@@ -140,7 +143,8 @@ class PytorchImplementation(FrameworkImplementation):
                       mode: ModelBuilderMode,
                       append2output: List[Any] = None,
                       fw_info: FrameworkInfo = DEFAULT_PYTORCH_INFO,
-                      return_float_outputs: bool = False) -> Tuple:
+                      return_float_outputs: bool = False,
+                      release_intermediate_tensors: bool = True) -> Tuple:
         """
         Build a Pytorch module from a graph.
         The mode determines how the module should be build. append2output is a list of Nodes
@@ -152,6 +156,8 @@ class PytorchImplementation(FrameworkImplementation):
             append2output: List of Nodes to set as the module's outputs.
             fw_info: FrameworkInfo object with information about the specific framework's module
             return_float_outputs (bool): whether to return outputs before or after quantization nodes (default)
+            release_intermediate_tensors (bool): whether the module releases the nodes' output tensors during
+                inference as soon as they are no longer needed (default), or keeps them until the inference ends.
 
         Returns:
             A tuple with the model and additional relevant supporting objects.
@@ -160,22 +166,44 @@ class PytorchImplementation(FrameworkImplementation):
         return pytorch_model_builder(graph=graph,
                                      append2output=append2output,
                                      fw_info=fw_info,
-                                     return_float_outputs=return_float_outputs).build_model()
+                                     return_float_outputs=return_float_outputs,
+                                     release_intermediate_tensors=release_intermediate_tensors).build_model()
 
     def run_model_inference(self,
                             model: Any,
-                            input_list: List[Any]) -> Tuple[torch.Tensor]:
+                            input_list: List[Any],
+                            requires_grad: bool = False) -> Tuple[torch.Tensor]:
         """
         Run the model logic on the given the inputs.
+        Unless requires_grad is set, the model runs in eval mode with autograd disabled.
 
         Args:
             model: Pytorch model.
             input_list: List of inputs for the model.
+            requires_grad: Whether the inference should record the autograd graph (for computing gradients).
 
         Returns:
             The Pytorch model's output.
         """
-        return model(*to_torch_tensor(input_list))
+        return run_inference(model, to_torch_tensor(input_list), requires_grad)
+
+    def reduce_tensor_statistics(self,
+                                 tensor: torch.Tensor,
+                                 channel_axis: int,
+                                 n_bins: int) -> ReducedStatistics:
+        """
+        Compute the statistics that are needed for statistics collection (per-channel min/max/sum
+        and a histogram) from a Pytorch tensor, inside the framework.
+
+        Args:
+            tensor: Pytorch tensor.
+            channel_axis: Index of the channels axis to compute the per-channel statistics by.
+            n_bins: Number of bins in the histogram.
+
+        Returns:
+            ReducedStatistics of the tensor.
+        """
+        return torch_reduce_tensor_statistics(tensor, channel_axis, n_bins)
 
     def shift_negative_correction(self,
                                   graph: Graph,
@@ -198,17 +226,19 @@ class PytorchImplementation(FrameworkImplementation):
 
     def attach_sc_to_node(self,
                           node: BaseNode,
-                          fw_info: FrameworkInfo) -> BaseStatsCollector:
+                          fw_info: FrameworkInfo,
+                          qc: QuantizationConfig = None) -> BaseStatsCollector:
         """
         Return a statistics collector that should be attached to a node's output
         during statistics collection.
         Args:
             node: Node to return its collector.
             fw_info: Information relevant to a specific framework about what is out channel axis (for statistics per-channel)
+            qc: Quantization configuration that determines how the statistics should be collected.
         Returns:
             Statistics collector for the node.
         """
-        return create_stats_collector_for_node(node, fw_info)
+        return create_stats_collector_for_node(node, fw_info, qc)
 
     def get_substitutions_channel_equalization(self,
                                                quant_config: QuantizationConfig,
@@ -454,6 +484,41 @@ class PytorchImplementation(FrameworkImplementation):
         return pytorch_iterative_approx_jacobian_trace(graph_float, model_input_tensors, interest_points, output_list,
                                                        all_outputs_indices, alpha, n_iter, norm_weights=norm_weights)
 
+    def model_grad_per_image(self,
+                             graph_float: common.Graph,
+                             model_input_tensors: Dict[BaseNode, torch.Tensor],
+                             interest_points: List[BaseNode],
+                             output_list: List[BaseNode],  # dummy - not used in pytorch
+                             all_outputs_indices: List[int],
+                             alpha: float = 0.3,
+                             n_iter: int = 50,
+                             norm_weights: bool = True) -> np.ndarray:
+        """
+        Calls a PyTorch specific model gradient calculation function, which computes the jacobian-based weights of
+        the model's outputs with respect to the feature maps of the set of given interest points, for each image of
+        a batch of images (as model_grad computes them for a single image). The images are inferred together, and the
+        jacobian products of many random vectors are computed in a single batched backward pass.
+
+        Args:
+            graph_float: Graph to build its corresponding Pytorch model.
+            model_input_tensors: A mapping between model input nodes to an input batch.
+            interest_points: List of nodes which we want to get their feature map as output, to calculate distance metric.
+            output_list: List of nodes that considered as model's output for the purpose of gradients computation.
+            all_outputs_indices: Indices of the model outputs and outputs replacements (if exists),
+                in a topological sorted interest points list.
+            alpha: A tuning parameter to allow calibration between the contribution of the output feature maps returned
+                weights and the other feature maps weights (since the gradient of the output layers does not provide a
+                compatible weight for the distance metric computation).
+            n_iter: The number of random iterations to calculate the approximated  jacobian-based weights for each interest point.
+            norm_weights: Whether to normalize the returned weights (to get values between 0 and 1).
+
+        Returns: An array of the (possibly normalized) jacobian-based weights of each image, with the images on the
+        first axis and the interest points on the second axis.
+        """
+
+        return pytorch_batched_approx_jacobian_trace(graph_float, model_input_tensors, interest_points, output_list,
+                                                     all_outputs_indices, alpha, n_iter, norm_weights=norm_weights)
+
     def is_node_compatible_for_metric_outputs(self,
                                               node: BaseNode) -> bool:
         """
@@ -520,17 +585,61 @@ class PytorchImplementation(FrameworkImplementation):
 
     def sensitivity_eval_inference(self,
                                    model: Module,
-                                   inputs: Any):
+                                   inputs: Any,
+                                   requires_grad: bool = False):
         """
         Calls for a Pytorch model inference for a specific framework during mixed precision sensitivity evaluation.
         In Pytorch, we need to unfold the list of inputs before passing it to the model.
+        Unless requires_grad is set, the model runs in eval mode with autograd disabled.
 
         Args:
             model: A Pytorch model to run inference for.
             inputs: Input tensors to run inference on.
+            requires_grad: Whether the inference should record the autograd graph (for computing gradients).
 
         Returns:
             The output of the model inference on the given input.
         """
 
-        return model(*inputs)
\ No newline at end of file
+        return run_inference(model, inputs, requires_grad)
+
+    def sensitivity_eval_inference_with_cache(self,
+                                              model: Module,
+                                              inputs: Any) -> Tuple[Any, Any]:
+        """
+        Calls for a Pytorch model inference during mixed precision sensitivity evaluation, and returns the
+        output tensors of all the model's nodes as a cache for sensitivity_eval_inference_from_cache.
+
+        Args:
+            model: A Pytorch model (built by a PyTorchModelBuilder) to run inference for.
+            inputs: Input tensors to run inference on.
+
+        Returns:
+            The output of the model inference on the given input, and the activations cache.
+        """
+        # The cached tensors are kept alive between inferences, so they must not hold the autograd graph.
+        model.eval()
+        with torch.inference_mode():
+            return model.forward_with_cache(*inputs)
+
+    def sensitivity_eval_inference_from_cache(self,
+                                              model: Module,
+                                              inputs: Any,
+                                              cache: Any,
+                                              changed_nodes_names: List[str]) -> Any:
+        """
+        Calls for a Pytorch model inference during mixed precision sensitivity evaluation, that runs the model
+        only from the first changed node, and takes the outputs of the nodes before it from the cache.
+
+        Args:
+            model: A Pytorch model (built by a PyTorchModelBuilder) to run inference for.
+            inputs: Input tensors to run inference on.
+            cache: Activations cache from sensitivity_eval_inference_with_cache on the same inputs.
+            changed_nodes_names: Names of the nodes whose configuration changed since the cache was created.
+
+        Returns:
+            The output of the model inference on the given input.
+        """
+        model.eval()
+        with torch.inference_mode():
+            return model.forward_from_cache(cache, changed_nodes_names, *inputs)
\ No newline at end of file
@@ -0,0 +1,60 @@
+# Copyright 2023 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import numpy as np
+import torch
+
+from model_compression_toolkit.core.common.collectors.reduced_statistics import ReducedStatistics, \
+    get_histogram_range
+
+
+def torch_reduce_tensor_statistics(tensor: torch.Tensor,
+                                   channel_axis: int,
+                                   n_bins: int) -> ReducedStatistics:
+    """
+    Compute the statistics a StatsCollector needs (per-channel min/max/sum and a histogram) from
+    a Pytorch tensor on its device, so only the reduced statistics are copied to Numpy.
+
+    Args:
+        tensor: Pytorch tensor to reduce.
+        channel_axis: Index of the channels axis to compute the per-channel statistics by.
+        n_bins: Number of bins in the histogram.
+
+    Returns:
+        ReducedStatistics of the tensor.
+    """
+    x = tensor.detach()
+    if x.dim() == 0:
+        x = x.reshape([1])
+    axis = channel_axis % x.dim()
+    reduce_dims = [d for d in range(x.dim()) if d != axis]
+
+    if len(reduce_dims) > 0:
+        min_per_channel = torch.amin(x, dim=reduce_dims)
+        max_per_channel = torch.amax(x, dim=reduce_dims)
+        sum_per_channel = torch.sum(x, dim=reduce_dims, dtype=torch.float64)
+    else:
+        min_per_channel, max_per_channel, sum_per_channel = x, x, x.double()
+
+    # Histogram range is computed on host to match numpy.histogram bins.
+    min_value, max_value = torch.stack([min_per_channel.min(), max_per_channel.max()]).double().cpu().numpy()
+    range_min, range_max = get_histogram_range(min_value, max_value)
+    hist_counts = torch.histc(x.float(), bins=n_bins, min=float(range_min), max=float(range_max))
+
+    return ReducedStatistics(min_per_channel=min_per_channel.double().cpu().numpy(),
+                             max_per_channel=max_per_channel.double().cpu().numpy(),
+                             sum_per_channel=sum_per_channel.cpu().numpy(),
+                             count_per_channel=x.numel() // x.shape[axis],
+                             hist_counts=hist_counts.double().cpu().numpy(),
+                             hist_bins=np.linspace(range_min, range_max, n_bins + 1))
@@ -14,7 +14,7 @@
 # ==============================================================================
 import torch
 import numpy as np
-from typing import Union
+from typing import Any, List, Union
 from model_compression_toolkit.core.pytorch.constants import CUDA, CPU
 
 
@@ -50,6 +50,28 @@ def set_model(model: torch.nn.Module, train_mode: bool = False):
         model.cpu()
 
 
+def run_inference(model: torch.nn.Module, inputs: List[Any], requires_grad: bool = False) -> Any:
+    """
+    Run a Pytorch model on inputs. Unless gradients of the outputs are required, the model runs in eval mode and
+    in inference mode, so autograd does not record a graph of the inference and the intermediate tensors are freed
+    as soon as they're used.
+
+    Args:
+        model: Pytorch model.
+        inputs: List of input tensors for the model.
+        requires_grad: Whether the inference should record the autograd graph (for computing gradients of the
+            outputs).
+
+    Returns:
+        The Pytorch model's output.
+    """
+    if requires_grad:
+        return model(*inputs)
+    model.eval()
+    with torch.inference_mode():
+        return model(*inputs)
+
+
 def to_torch_tensor(tensor):
     """
     Convert a Numpy array to a Torch tensor.
@@ -25,13 +25,15 @@ from model_compression_toolkit.core.graph_prep_runner import graph_preparation_r
 from model_compression_toolkit.logger import Logger
 from model_compression_toolkit.core.common.framework_implementation import FrameworkImplementation
 from model_compression_toolkit.core.common.graph.base_graph import Graph
+from model_compression_toolkit.core.common.graph.memory_graph.compute_graph_max_cut import get_graph_memory_schedule
 from model_compression_toolkit.core.common.mixed_precision.bit_width_setter import set_bit_widths
 from model_compression_toolkit.core.common.mixed_precision.kpi_tools.kpi import KPI, KPITarget
 from model_compression_toolkit.core.common.mixed_precision.kpi_tools.kpi_aggregation_methods import MpKpiAggregation
-from model_compression_toolkit.core.common.mixed_precision.kpi_tools.kpi_functions_mapping import kpi_functions_mapping
+from model_compression_toolkit.core.common.mixed_precision.kpi_tools.kpi_functions_mapping import get_kpi_functions
 from model_compression_toolkit.core.common.mixed_precision.kpi_tools.kpi_methods import MpKpiMetric
 from model_compression_toolkit.core.common.mixed_precision.mixed_precision_search_facade import search_bit_width
 from model_compression_toolkit.core.common.model_collector import ModelCollector
+from model_compression_toolkit.core.common.collectors.statistics_store import StatisticsStore
 from model_compression_toolkit.core.common.network_editors.edit_network import edit_network_graph
 from model_compression_toolkit.core.common.quantization.core_config import CoreConfig
 from model_compression_toolkit.core.common.quantization.quantization_analyzer import analyzer_graph
@@ -128,10 +130,16 @@ def core_runner(in_model: Any,
 
     _set_final_kpi(graph=tg,
                    final_bit_widths_config=bit_widths_config,
-                   kpi_functions_dict=kpi_functions_mapping,
+                   kpi_functions_dict=get_kpi_functions(target_kpi),
                    fw_info=fw_info,
                    fw_impl=fw_impl)
 
+    if target_kpi is not None and target_kpi.peak_activation_memory < np.inf:
+        # Keep the nodes schedule that the peak activation memory was computed for (the schedule that the
+        # mixed-precision search stored on the graph), so the quantized model is built to execute the nodes
+        # in this order.
+        tg.user_info.memory_schedule = [n.name for n in get_graph_memory_schedule(tg)[0]]
+
     if target_kpi is not None:
         # Retrieve lists of tuples (node, node's final weights/activation bitwidth)
         weights_conf_nodes_bitwidth = tg.get_final_weights_config()
@@ -240,12 +248,25 @@ def _prepare_model_for_quantization(transformed_graph: Graph,
     ######################################
     # Statistic collection
     ######################################
-    mi = ModelCollector(transformed_graph,
-                        fw_impl,
-                        fw_info)
-
-    for _data in tqdm(representative_data_gen()):
-        mi.infer(_data)
+    stats_store, stats_key = None, None
+    if core_config.quantization_config.statistics_cache_dir is not None:
+        stats_store = StatisticsStore(core_config.quantization_config.statistics_cache_dir)
+        stats_key = stats_store.get_key(transformed_graph,
+                                        representative_data_gen,
+                                        fw_impl,
+                                        core_config.quantization_config.framework_statistics_reduction)
+
+    if stats_store is None or not stats_store.load(transformed_graph, stats_key):
+        mi = ModelCollector(transformed_graph,
+                            fw_impl,
+                            fw_info,
+                            core_config.quantization_config)
+
+        for _data in tqdm(representative_data_gen()):
+            mi.infer(_data)
+
+        if stats_store is not None:
+            stats_store.save(transformed_graph, stats_key)
 
     ######################################
     # Edit network according to user
@@ -261,7 +282,8 @@ def _prepare_model_for_quantization(transformed_graph: Graph,
     ######################################
     calculate_quantization_params(transformed_graph,
                                   fw_info,
-                                  fw_impl=fw_impl)
+                                  fw_impl=fw_impl,
+                                  n_workers=core_config.quantization_config.qparams_computation_n_workers)
 
     if tb_w is not None:
         tb_w.add_graph(transformed_graph, 'thresholds_selection')
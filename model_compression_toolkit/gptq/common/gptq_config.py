@@ -16,7 +16,8 @@ from enum import Enum
 from typing import Callable, Any, Dict
 from model_compression_toolkit.core.common.defaultdict import DefaultDict
 from model_compression_toolkit.core import common
-from model_compression_toolkit.gptq.common.gptq_constants import QUANT_PARAM_LEARNING_STR, MAX_LSB_STR, REG_DEFAULT
+from model_compression_toolkit.gptq.common.gptq_constants import QUANT_PARAM_LEARNING_STR, MAX_LSB_STR, REG_DEFAULT, \
+    FLOAT_OUTPUTS_CACHE_MEMORY
 
 
 class RoundingType(Enum):
@@ -76,7 +77,10 @@ class GradientPTQConfig:
                  optimizer_bias: Any = None,
                  regularization_factor: float = REG_DEFAULT,
                  hessian_weights_config: GPTQHessianWeightsConfig = GPTQHessianWeightsConfig(),
-                 gptq_quantizer_params_override: Dict[str, Any] = None):
+                 gptq_quantizer_params_override: Dict[str, Any] = None,
+                 cache_float_outputs: bool = False,
+                 float_outputs_cache_memory: int = FLOAT_OUTPUTS_CACHE_MEMORY,
+                 log_interval: int = 1):
         """
         Initialize a GradientPTQConfig.
 
@@ -96,6 +100,9 @@ class GradientPTQConfig:
             regularization_factor (float): A floating point number that defines the regularization factor.
             hessian_weights_config (GPTQHessianWeightsConfig): A configuration that include all necessary arguments to run a computation of Hessian weights for the GPTQ loss.
             gptq_quantizer_params_override (dict): A dictionary of parameters to override in GPTQ quantizer instantiation. Defaults to None (no parameters).
+            cache_float_outputs (bool): Whether to infer the float model only in the first epoch, and reuse its outputs in the following epochs. Requires the representative dataset to yield the same batches in the same order in every epoch.
+            float_outputs_cache_memory (int): Maximal number of bytes of float outputs to cache in memory (the rest are spilled to a memory-mapped temporary file).
+            log_interval (int): Number of training steps between reading the loss values from the device (and calling log_function with the mean loss of these steps). With an interval larger than 1, the losses and gradients are kept on the device between logging steps, so the training steps don't wait for the device.
 
         """
         self.n_iter = n_iter
@@ -114,6 +121,9 @@ class GradientPTQConfig:
 
         self.gptq_quantizer_params_override = {} if gptq_quantizer_params_override is None \
             else gptq_quantizer_params_override
+        self.cache_float_outputs = cache_float_outputs
+        self.float_outputs_cache_memory = float_outputs_cache_memory
+        self.log_interval = log_interval
 
 
 class GradientPTQConfigV2(GradientPTQConfig):
@@ -132,7 +142,10 @@ class GradientPTQConfigV2(GradientPTQConfig):
                  optimizer_bias: Any = None,
                  regularization_factor: float = REG_DEFAULT,
                  hessian_weights_config: GPTQHessianWeightsConfig = GPTQHessianWeightsConfig(),
-                 gptq_quantizer_params_override: Dict[str, Any] = None):
+                 gptq_quantizer_params_override: Dict[str, Any] = None,
+                 cache_float_outputs: bool = False,
+                 float_outputs_cache_memory: int = FLOAT_OUTPUTS_CACHE_MEMORY,
+                 log_interval: int = 1):
         """
         Initialize a GradientPTQConfigV2.
 
@@ -152,6 +165,9 @@ class GradientPTQConfigV2(GradientPTQConfig):
             regularization_factor (float): A floating point number that defines the regularization factor.
             hessian_weights_config (GPTQHessianWeightsConfig): A configuration that include all necessary arguments to run a computation of Hessian weights for the GPTQ loss.
             gptq_quantizer_params_override (dict): A dictionary of parameters to override in GPTQ quantizer instantiation. Defaults to None (no parameters).
+            cache_float_outputs (bool): Whether to infer the float model only in the first epoch, and reuse its outputs in the following epochs. Requires the representative dataset to yield the same batches in the same order in every epoch.
+            float_outputs_cache_memory (int): Maximal number of bytes of float outputs to cache in memory (the rest are spilled to a memory-mapped temporary file).
+            log_interval (int): Number of training steps between reading the loss values from the device (and calling log_function with the mean loss of these steps). With an interval larger than 1, the losses and gradients are kept on the device between logging steps, so the training steps don't wait for the device.
 
         """
 
@@ -167,7 +183,10 @@ class GradientPTQConfigV2(GradientPTQConfig):
                          optimizer_bias=optimizer_bias,
                          regularization_factor=regularization_factor,
                          hessian_weights_config=hessian_weights_config,
-                         gptq_quantizer_params_override=gptq_quantizer_params_override)
+                         gptq_quantizer_params_override=gptq_quantizer_params_override,
+                         cache_float_outputs=cache_float_outputs,
+                         float_outputs_cache_memory=float_outputs_cache_memory,
+                         log_interval=log_interval)
         self.n_epochs = n_epochs
 
     @classmethod
@@ -22,4 +22,7 @@ SOFT_ROUNDING_ZETA = 1.1
 
 # GPTQ config constant
 QUANT_PARAM_LEARNING_STR = 'quantization_parameter_learning'
-MAX_LSB_STR = 'max_lsbs_change_map'
\ No newline at end of file
+MAX_LSB_STR = 'max_lsbs_change_map'
+# Default memory budget (in bytes) of the float model's outputs that are cached in memory, when the float outputs
+# are cached across GPTQ epochs (outputs beyond the budget are spilled to a memory-mapped file).
+FLOAT_OUTPUTS_CACHE_MEMORY = 2 ** 30
@@ -0,0 +1,107 @@
+# Copyright 2023 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import os
+import tempfile
+from typing import Any, Callable, Dict, List, Tuple
+
+import numpy as np
+
+
+class FloatOutputsCache:
+    """
+    A cache of the float (teacher) model's outputs for each batch of the representative dataset, so the float model
+    is inferred only in the first GPTQ epoch, and the following epochs reuse its outputs.
+    The outputs are kept in memory up to a memory budget, and the outputs of the rest of the batches are spilled to a
+    temporary file, which is memory-mapped when they're read.
+    """
+
+    def __init__(self,
+                 memory_budget: int,
+                 to_numpy: Callable,
+                 to_tensor: Callable):
+        """
+        Args:
+            memory_budget: Maximal number of bytes of outputs to keep in memory.
+            to_numpy: Function to convert a framework's tensor to a Numpy array.
+            to_tensor: Function to convert a Numpy array to a framework's tensor.
+        """
+        self.memory_budget = memory_budget
+        self.to_numpy = to_numpy
+        self.to_tensor = to_tensor
+
+        self.memory_bytes = 0
+        self.in_memory: Dict[int, Tuple[bool, List[np.ndarray]]] = {}
+        self.spilled: Dict[int, Tuple[bool, List[Tuple[int, tuple, str]]]] = {}
+        self.spill_file = None
+
+    def __contains__(self, batch_index: int) -> bool:
+        return batch_index in self.in_memory or batch_index in self.spilled
+
+    def put(self, batch_index: int, outputs: Any):
+        """
+        Cache the float model's outputs of a batch.
+
+        Args:
+            batch_index: Index of the batch in the representative dataset.
+            outputs: The float model's outputs of the batch (a tensor or a list of tensors).
+        """
+        is_list = isinstance(outputs, (list, tuple))
+        arrays = [np.ascontiguousarray(self.to_numpy(o)) for o in (outputs if is_list else [outputs])]
+        n_bytes = sum([a.nbytes for a in arrays])
+
+        if self.memory_bytes + n_bytes <= self.memory_budget:
+            self.in_memory[batch_index] = (is_list, arrays)
+            self.memory_bytes += n_bytes
+        else:
+            if self.spill_file is None:
+                self.spill_file = tempfile.TemporaryFile(prefix='gptq_float_outputs_')
+            self.spill_file.seek(0, os.SEEK_END)
+            arrays_index = []
+            for a in arrays:
+                arrays_index.append((self.spill_file.tell(), a.shape, a.dtype.str))
+                self.spill_file.write(a.tobytes())
+            self.spill_file.flush()
+            self.spilled[batch_index] = (is_list, arrays_index)
+
+    def get(self, batch_index: int) -> Any:
+        """
+        Get the cached float model's outputs of a batch.
+
+        Args:
+            batch_index: Index of the batch in the representative dataset.
+
+        Returns:
+            The float model's outputs of the batch (as they were cached), or None if they're not cached.
+        """
+        if batch_index in self.in_memory:
+            is_list, arrays = self.in_memory[batch_index]
+        elif batch_index in self.spilled:
+            is_list, arrays_index = self.spilled[batch_index]
+            arrays = [np.memmap(self.spill_file, dtype=np.dtype(dtype), mode='r', offset=offset, shape=shape)
+                      for offset, shape, dtype in arrays_index]
+        else:
+            return None
+
+        outputs = [self.to_tensor(a) for a in arrays]
+        return outputs if is_list else outputs[0]
+
+    def clear(self):
+        """
+        Remove all the cached outputs, and delete the spill file.
+        """
+        self.in_memory, self.spilled, self.memory_bytes = {}, {}, 0
+        if self.spill_file is not None:
+            self.spill_file.close()
+            self.spill_file = None
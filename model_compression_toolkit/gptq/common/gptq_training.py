@@ -12,7 +12,6 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 # ==============================================================================
-import copy
 from abc import ABC, abstractmethod
 import numpy as np
 from typing import Callable, List, Any
@@ -20,6 +19,7 @@ from model_compression_toolkit.gptq.common.gptq_config import GradientPTQConfig
 from model_compression_toolkit.core.common import Graph, BaseNode
 from model_compression_toolkit.core.common.framework_info import FrameworkInfo
 from model_compression_toolkit.gptq.common.gptq_constants import QUANT_PARAM_LEARNING_STR
+from model_compression_toolkit.gptq.common.gptq_float_outputs_cache import FloatOutputsCache
 from model_compression_toolkit.gptq.common.gptq_framework_implementation import GPTQFrameworkImplemantation
 from model_compression_toolkit.gptq.common.gptq_graph import get_compare_points
 from model_compression_toolkit.core.common.model_builder_mode import ModelBuilderMode
@@ -50,8 +50,8 @@ class GPTQTrainer(ABC):
             fw_impl: Framework implementation
             fw_info: Framework information
         """
-        self.graph_float = copy.deepcopy(graph_float)
-        self.graph_quant = copy.deepcopy(graph_quant)
+        self.graph_float = graph_float.snapshot()
+        self.graph_quant = graph_quant.snapshot()
         self.gptq_config = gptq_config
         self.fw_impl = fw_impl
         self.fw_info = fw_info
@@ -68,6 +68,33 @@ class GPTQTrainer(ABC):
 
         self.fxp_model, self.gptq_user_info = self.build_gptq_model()
 
+        # The float model's outputs of each batch are cached in the first epoch, if enabled.
+        self.float_outputs_cache = FloatOutputsCache(gptq_config.float_outputs_cache_memory,
+                                                     fw_impl.to_numpy,
+                                                     fw_impl.to_tensor) if gptq_config.cache_float_outputs else None
+
+    def get_float_outputs(self, batch_index: int, input_data: Any) -> Any:
+        """
+        Get the float model's outputs for a batch of the representative dataset: infer the float model, or take its
+        outputs from the float outputs cache (if enabled) after the batch was inferred in a previous epoch.
+
+        Args:
+            batch_index: Index of the batch in the representative dataset.
+            input_data: Input tensors of the batch.
+
+        Returns:
+            The float model's outputs.
+        """
+
+        if self.float_outputs_cache is None:
+            return self.float_model(input_data)
+
+        y_float = self.float_outputs_cache.get(batch_index)
+        if y_float is None:
+            y_float = self.float_model(input_data)
+            self.float_outputs_cache.put(batch_index, y_float)
+        return y_float
+
     def get_optimizer_with_param(self,
                                  flattened_trainable_weights: List[Any],
                                  flattened_bias_weights: List[Any],
@@ -120,7 +147,7 @@ class GPTQTrainer(ABC):
     def compute_hessian_based_weights(self,
                                       representative_data_gen: Callable) -> np.ndarray:
         """
-        Computes the Hessian-based weights using the framework's model_grad method per batch of images.
+        Computes the Hessian-based weights using the framework's model_grad_per_image method on a batch of images.
 
         Args:
             representative_data_gen: Dataset used for inference to compute the Hessian-based weights.
@@ -134,23 +161,20 @@ class GPTQTrainer(ABC):
 
             model_output_replacement = self._get_model_output_replacement()
 
-            points_apprx_jacobians_weights = []
-            for i in range(1, images.shape[0] + 1):
-                Logger.info(f"Computing Jacobian-based weights approximation for image sample {i} out of {images.shape[0]}...")
-                # Note that in GPTQ loss weights computation we assume that there aren't replacement output nodes,
-                # therefore, output_list is just the graph outputs, and we don't need the tuning factor for
-                # defining the output weights (since the output layer is not a compare point).
-                image_ip_gradients = self.fw_impl.model_grad(self.graph_float,
-                                                             {inode: self.fw_impl.to_tensor(images[i - 1:i]) for inode
-                                                              in
-                                                              self.graph_float.get_inputs()},
-                                                             self.compare_points,
-                                                             output_list=model_output_replacement,
-                                                             all_outputs_indices=[],
-                                                             alpha=0,
-                                                             norm_weights=self.gptq_config.hessian_weights_config.norm_weights,
-                                                             n_iter=self.gptq_config.hessian_weights_config.hessians_n_iter)
-                points_apprx_jacobians_weights.append(image_ip_gradients)
+            Logger.info(f"Computing Jacobian-based weights approximation for {images.shape[0]} image samples...")
+            # Note that in GPTQ loss weights computation we assume that there aren't replacement output nodes,
+            # therefore, output_list is just the graph outputs, and we don't need the tuning factor for
+            # defining the output weights (since the output layer is not a compare point).
+            points_apprx_jacobians_weights = \
+                self.fw_impl.model_grad_per_image(self.graph_float,
+                                                  {inode: self.fw_impl.to_tensor(images) for inode in
+                                                   self.graph_float.get_inputs()},
+                                                  self.compare_points,
+                                                  output_list=model_output_replacement,
+                                                  all_outputs_indices=[],
+                                                  alpha=0,
+                                                  norm_weights=self.gptq_config.hessian_weights_config.norm_weights,
+                                                  n_iter=self.gptq_config.hessian_weights_config.hessians_n_iter)
             if self.gptq_config.hessian_weights_config.log_norm:
                 mean_jacobian_weights = np.mean(points_apprx_jacobians_weights, axis=0)
                 mean_jacobian_weights = np.where(mean_jacobian_weights != 0, mean_jacobian_weights,
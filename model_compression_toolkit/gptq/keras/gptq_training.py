@@ -252,9 +252,12 @@ class KerasGPTQTrainer(GPTQTrainer):
                                      self.optimizer_with_param,
                                      self.gptq_config.n_epochs,
                                      True)
+        if self.float_outputs_cache is not None:
+            self.float_outputs_cache.clear()
 
     @tf.function
-    def nano_training_step(self, input_data, in_compute_gradients, in_optimizer_with_param, is_training):
+    def nano_training_step(self, input_data, in_compute_gradients, in_optimizer_with_param, is_training,
+                           y_float=None):
         """
         This function run part of the training step, wrapped by a tf.function for acceleration.
         Args:
@@ -262,14 +265,16 @@ class KerasGPTQTrainer(GPTQTrainer):
             in_compute_gradients: A callable function that compute the gradients.
             in_optimizer_with_param: A list of optimizer classes to update with the corresponding parameters.
             is_training: A boolean flag stating if the network is running in training mode.
+            y_float: The float model's outputs for the input data (if None, the float model is run in the step).
 
         Returns:
             loss value and gradients
 
         """
 
-        # run float model
-        y_float = self.float_model(input_data)
+        # run float model (unless its outputs were cached)
+        if y_float is None:
+            y_float = self.float_model(input_data)
         # rung quantized model and calculate loss & gradients
         loss_value_step, grads = in_compute_gradients(y_float, input_data, in_optimizer_with_param,
                                                       training=is_training)
@@ -293,21 +298,43 @@ class KerasGPTQTrainer(GPTQTrainer):
         Returns: None
 
         """
+        pending_losses, grads = [], []
         for _ in tqdm(range(n_epochs)):
-            for data in tqdm(data_function()):
+            for batch_index, data in enumerate(tqdm(data_function())):
                 input_data = [d * self.input_scale for d in data]
 
+                y_float = None if self.float_outputs_cache is None else self.get_float_outputs(batch_index, input_data)
                 loss_value_step, grads = self.nano_training_step(input_data, in_compute_gradients,
-                                                                 in_optimizer_with_param, is_training)
+                                                                 in_optimizer_with_param, is_training, y_float)
                 # Run one step of gradient descent by updating
                 # the value of the variables to minimize the loss.
                 for i, (o, p) in enumerate(in_optimizer_with_param):
                     o.apply_gradients(zip(grads[i], p))
-                if self.gptq_config.log_function is not None:
-                    self.gptq_config.log_function(loss_value_step, grads[0], in_optimizer_with_param[0][-1],
-                                                  self.compare_points)
-                self.loss_list.append(loss_value_step.numpy())
-                Logger.debug(f'last loss value: {self.loss_list[-1]}')
+                pending_losses.append(loss_value_step)
+                if len(pending_losses) >= self.gptq_config.log_interval:
+                    self._log_losses(pending_losses, grads, in_optimizer_with_param)
+                    pending_losses = []
+        if len(pending_losses) > 0:
+            self._log_losses(pending_losses, grads, in_optimizer_with_param)
+
+    def _log_losses(self,
+                    losses: List[tf.Tensor],
+                    grads: List[List[tf.Tensor]],
+                    in_optimizer_with_param: List[Tuple[tf.keras.optimizers.Optimizer, List[tf.Tensor]]]):
+        """
+        Read the losses of the last training steps from the device in a single copy, add them to the losses list,
+        and call the log function (if given) with their mean.
+        Args:
+            losses: Loss values of the training steps since the last logging.
+            grads: Gradients of the last training step.
+            in_optimizer_with_param: A list of optimizer classes to update with the corresponding parameters.
+        """
+        losses = tf.stack(losses)
+        self.loss_list.extend(list(losses.numpy()))
+        if self.gptq_config.log_function is not None:
+            self.gptq_config.log_function(tf.reduce_mean(losses), grads[0], in_optimizer_with_param[0][-1],
+                                          self.compare_points)
+        Logger.debug(f'last loss value: {self.loss_list[-1]}')
 
     def update_graph(self):
         """
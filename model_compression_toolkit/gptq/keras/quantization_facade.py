@@ -25,6 +25,7 @@ from model_compression_toolkit.core.common.framework_info import FrameworkInfo
 from model_compression_toolkit.core.common.mixed_precision.mixed_precision_quantization_config import MixedPrecisionQuantizationConfigV2
 from model_compression_toolkit.core import CoreConfig
 from model_compression_toolkit.core.runner import core_runner, _init_tensorboard_writer
+from model_compression_toolkit.core.common.representative_dataset_store import get_representative_dataset
 from model_compression_toolkit.gptq.runner import gptq_runner
 from model_compression_toolkit.core.exporter import export_model
 from model_compression_toolkit.core.analyzer import analyzer_model_quantization
@@ -202,6 +203,11 @@ if FOUND_TF:
             Logger.info("Using experimental mixed-precision quantization. "
                                "If you encounter an issue please file a bug.")
 
+        representative_data_gen = get_representative_dataset(representative_data_gen, core_config.quantization_config)
+        if gptq_representative_data_gen is not None:
+            gptq_representative_data_gen = get_representative_dataset(gptq_representative_data_gen,
+                                                                      core_config.quantization_config)
+
         tb_w = _init_tensorboard_writer(fw_info)
 
         fw_impl = GPTQKerasImplemantation()
@@ -14,6 +14,7 @@
 # ==============================================================================
 from typing import Callable
 
+from model_compression_toolkit.core.common.representative_dataset_store import RepresentativeDatasetStore
 from model_compression_toolkit.gptq import RoundingType, GradientPTQConfigV2, GradientPTQConfig
 from model_compression_toolkit.gptq.keras.quantizer.soft_rounding.soft_quantizer_reg import \
     SoftQuantizerRegularization
@@ -33,10 +34,13 @@ def get_regularization(gptq_config: GradientPTQConfig, representative_data_gen:
 
     """
     if gptq_config.rounding_type == RoundingType.SoftQuantizer:
-        # dry run on the representative dataset to count number of batches
-        num_batches = 0
-        for _ in representative_data_gen():
-            num_batches += 1
+        if isinstance(representative_data_gen, RepresentativeDatasetStore):
+            num_batches = len(representative_data_gen)
+        else:
+            # dry run on the representative dataset to count number of batches
+            num_batches = 0
+            for _ in representative_data_gen():
+                num_batches += 1
 
         n_epochs = GradientPTQConfigV2.from_v1(n_ptq_iter=num_batches, config_v1=gptq_config).n_epochs if \
             not type(gptq_config) == GradientPTQConfigV2 else gptq_config.n_epochs
@@ -180,13 +180,16 @@ class PytorchGPTQTrainer(GPTQTrainer):
         # Training loop
         # ----------------------------------------------
         self.micro_training_loop(representative_data_gen, self.gptq_config.n_epochs)
+        if self.float_outputs_cache is not None:
+            self.float_outputs_cache.clear()
 
     def compute_gradients(self,
                           y_float: List[torch.Tensor],
-                          input_tensors: List[torch.Tensor]) -> Tuple[torch.Tensor, List[np.ndarray]]:
+                          input_tensors: List[torch.Tensor]) -> Tuple[torch.Tensor, List[torch.Tensor]]:
         """
         Get outputs from both teacher and student networks. Compute the observed error,
         and use it to compute the gradients and applying them to the student weights.
+        The loss and gradients are returned as tensors on the device, so computing them doesn't wait for the device.
         Args:
             y_float: A list of reference tensor from the floating point network.
             input_tensors: A list of Input tensors to pass through the networks.
@@ -217,7 +220,7 @@ class PytorchGPTQTrainer(GPTQTrainer):
         grads = []
         for param in self.fxp_model.parameters():
             if param.requires_grad and param.grad is not None:
-                grads.append(torch_tensor_to_numpy(param.grad))
+                grads.append(param.grad)
 
         return loss_value, grads
 
@@ -226,26 +229,53 @@ class PytorchGPTQTrainer(GPTQTrainer):
                             n_epochs: int):
         """
         This function run a micro training loop on given set of parameters.
+        The steps' losses are kept on the device, and they're read (and logged) once every log_interval steps.
         Args:
             data_function: A callable function that give a batch of samples.
             n_epochs: Number of update iterations of representative dataset.
         """
+        pending_losses, grads = [], []
         for _ in tqdm(range(n_epochs)):
-            for data in tqdm(data_function()):
+            for batch_index, data in enumerate(tqdm(data_function())):
                 input_data = [d * self.input_scale for d in data]
                 input_tensor = to_torch_tensor(input_data)
-                y_float = self.float_model(input_tensor)  # running float model
+                y_float = self.get_float_outputs(batch_index, input_tensor)  # running float model
+                # The gradients are zeroed before each step (and not after it), so the gradients of the last step
+                # are still valid when they're logged.
+                for (optimizer, _) in self.optimizer_with_param:
+                    optimizer.zero_grad()
                 loss_value, grads = self.compute_gradients(y_float, input_tensor)
                 # Run one step of gradient descent by updating the value of the variables to minimize the loss.
                 for (optimizer, _) in self.optimizer_with_param:
                     optimizer.step()
-                    optimizer.zero_grad()
-                if self.gptq_config.log_function is not None:
-                    self.gptq_config.log_function(loss_value.item(),
-                                                  torch_tensor_to_numpy(grads),
-                                                  torch_tensor_to_numpy(self.optimizer_with_param[0][-1]))
-                self.loss_list.append(loss_value.item())
-                Logger.debug(f'last loss value: {self.loss_list[-1]}')
+                pending_losses.append(loss_value.detach())
+                if len(pending_losses) >= self.gptq_config.log_interval:
+                    self._log_losses(pending_losses, grads)
+                    pending_losses = []
+        if len(pending_losses) > 0:
+            self._log_losses(pending_losses, grads)
+        for (optimizer, _) in self.optimizer_with_param:
+            optimizer.zero_grad()
+
+    def _log_losses(self,
+                    losses: List[torch.Tensor],
+                    grads: List[torch.Tensor]):
+        """
+        Read the losses of the last training steps from the device in a single copy, add them to the losses list,
+        and call the log function (if given) with their mean.
+        Args:
+            losses: Loss values of the training steps since the last logging.
+            grads: Gradients of the last training step.
+        """
+        losses = torch_tensor_to_numpy(torch.stack(losses))
+        self.loss_list.extend(losses.tolist())
+        if self.gptq_config.log_function is not None:
+            # The gradients are copied, as the parameters' gradients are zeroed in-place in the next step (and the
+            # Numpy arrays of tensors on the CPU share their memory).
+            self.gptq_config.log_function(float(np.mean(losses)),
+                                          torch_tensor_to_numpy([g.clone() for g in grads]),
+                                          torch_tensor_to_numpy(self.optimizer_with_param[0][-1]))
+        Logger.debug(f'last loss value: {self.loss_list[-1]}')
 
     def update_graph(self) -> Graph:
         """
@@ -21,6 +21,7 @@ from model_compression_toolkit.gptq.common.gptq_config import GradientPTQConfigV
 from model_compression_toolkit.target_platform_capabilities.target_platform import TargetPlatformCapabilities
 from model_compression_toolkit.core.common.mixed_precision.kpi_tools.kpi import KPI
 from model_compression_toolkit.core.runner import core_runner, _init_tensorboard_writer
+from model_compression_toolkit.core.common.representative_dataset_store import get_representative_dataset
 from model_compression_toolkit.gptq.keras.quantization_facade import GPTQ_MOMENTUM
 from model_compression_toolkit.gptq.runner import gptq_runner
 from model_compression_toolkit.core.exporter import export_model
@@ -161,6 +162,11 @@ if FOUND_TORCH:
             Logger.info("Using experimental mixed-precision quantization. "
                                "If you encounter an issue please file a bug.")
 
+        representative_data_gen = get_representative_dataset(representative_data_gen, core_config.quantization_config)
+        if gptq_representative_data_gen is not None:
+            gptq_representative_data_gen = get_representative_dataset(gptq_representative_data_gen,
+                                                                      core_config.quantization_config)
+
         tb_w = _init_tensorboard_writer(DEFAULT_PYTORCH_INFO)
 
         fw_impl = GPTQPytorchImplemantation()
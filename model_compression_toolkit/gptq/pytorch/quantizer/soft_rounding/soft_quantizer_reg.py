@@ -12,14 +12,16 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 # ==============================================================================
-from typing import List
+from typing import Any, List, Tuple
 
 import torch
 import numpy as np
 from torch import nn
+from torch.autograd.function import once_differentiable
 
 from model_compression_toolkit.core.pytorch.default_framework_info import DEFAULT_PYTORCH_INFO
 from model_compression_toolkit.core.pytorch.utils import to_torch_tensor
+from model_compression_toolkit.gptq.common.gptq_constants import AUXVAR
 from model_compression_toolkit.gptq.common.gptq_graph import get_kernel_attribute_name_for_gptq
 from mct_quantizers import PytorchQuantizationWrapper
 
@@ -64,6 +66,76 @@ class LinearTempDecay:
                (self.end_b + (self.start_b - self.end_b) * torch.maximum(to_torch_tensor(np.array([0.0])),
                                                                          to_torch_tensor(np.array((1 - rel_t)))))
 
+    def get_schedule(self) -> torch.Tensor:
+        """
+        Computes the temperature of all the time steps of the annealing process at once.
+
+        Returns: A tensor with the scheduled temperature of each time step (0 to t_max), on the working device.
+        """
+
+        t = np.arange(self.t_max + 1)
+        rel_t = (t - self.start_decay) / (self.t_max - self.start_decay)
+        schedule = np.where(t < self.start_decay,
+                            self.start_b,
+                            self.end_b + (self.start_b - self.end_b) * np.maximum(0.0, 1 - rel_t))
+        return to_torch_tensor(schedule.astype(np.float32))
+
+
+class SoftRoundingRegularizationFunction(torch.autograd.Function):
+    """
+    The soft rounding regularization of a group of auxiliary variables, as a single autograd node.
+    The soft targets (as in the quantizers' get_soft_targets) and the regularization term of each variable are
+    computed in-place on a single temporary tensor, and the gradient is computed analytically in the backward pass,
+    so no intermediate tensors are kept between the forward and the backward passes.
+    """
+
+    @staticmethod
+    def forward(ctx: Any,
+                b: torch.Tensor,
+                stretch_params: List[Tuple[float, float]],
+                *aux_vars: torch.Tensor) -> torch.Tensor:
+        """
+        Args:
+            ctx: Autograd context.
+            b: Temperature of the regularization.
+            stretch_params: The stretch parameters (gamma, zeta) of the rectified sigmoid of each auxiliary variable.
+            *aux_vars: Soft rounding auxiliary variables.
+
+        Returns: Regularization value.
+        """
+
+        ctx.stretch_params = stretch_params
+        ctx.save_for_backward(b, *aux_vars)
+
+        reg = torch.zeros((), device=b.device)
+        for (gamma, zeta), aux_var in zip(stretch_params, aux_vars):
+            reg_term = torch.sigmoid(aux_var)
+            reg_term.mul_(zeta - gamma).add_(gamma).clip_(min=0, max=1)
+            reg_term.sub_(.5).abs_().mul_(2).pow_(b).neg_().add_(1)
+            reg += reg_term.sum()
+        return reg
+
+    @staticmethod
+    @once_differentiable
+    def backward(ctx: Any, grad_output: torch.Tensor) -> Tuple:
+        b, *aux_vars = ctx.saved_tensors
+        grads = []
+        for (gamma, zeta), aux_var, needs_grad in zip(ctx.stretch_params, aux_vars, ctx.needs_input_grad[2:]):
+            if not needs_grad:
+                grads.append(None)
+                continue
+            st = torch.sigmoid(aux_var)
+            # Gradient of the sigmoid
+            grad = torch.sub(1, st).mul_(st)
+            st.mul_(zeta - gamma).add_(gamma)
+            # Gradient of the clipping
+            grad.masked_fill_(torch.logical_or(st < 0, st > 1), 0)
+            st.clip_(min=0, max=1).sub_(.5)
+            # Gradient of the power of the absolute distance from 0.5
+            grad.mul_(torch.abs(st).mul_(2).pow_(b - 1)).mul_(st.sign_())
+            grads.append(grad.mul_(grad_output * b * (-2 * (zeta - gamma))))
+        return (None, None, *grads)
+
 
 class SoftQuantizerRegularization:
     """
@@ -80,34 +152,52 @@ class SoftQuantizerRegularization:
 
         # Initializing the temperature decay according to the number of expected gradient steps
         self.linear_decay = LinearTempDecay(total_gradient_steps)
+        self.temperature_schedule = self.linear_decay.get_schedule()
 
         self.count_iter = 0
 
-    def __call__(self, model: nn.Module, entropy_reg: float):
+        # The soft rounding auxiliary variables of the model and the stretch parameters (gamma, zeta) of their
+        # quantizers. They are collected once, on the first call with the model.
+        self.model = None
+        self.aux_vars = []
+        self.stretch_params = []
+
+    def _collect_aux_vars(self, model: nn.Module):
         """
-        Returns the soft quantizer regularization value for SoftRounding.
+        Collects the soft rounding auxiliary variables of all the wrapped layers in a model.
 
         Args:
             model: A model to be quantized with SoftRounding.
-            entropy_reg: Entropy value to scale the quantizer regularization.
-
-        Returns: Regularization value.
         """
 
-        soft_reg_aux: List[torch.Tensor] = []
-        b = self.linear_decay(self.count_iter)
+        self.model = model
+        self.aux_vars, self.stretch_params = [], []
         for layer in model.modules():
             if isinstance(layer, PytorchQuantizationWrapper):
                 kernel_attribute = get_kernel_attribute_name_for_gptq(layer_type=type(layer.layer),
                                                                       fw_info=DEFAULT_PYTORCH_INFO)
 
-                st = layer.weights_quantizers[kernel_attribute].get_soft_targets()
-                soft_reg_aux.append((1 - torch.pow(torch.abs(st - .5) * 2, b)).sum())
+                quantizer = layer.weights_quantizers[kernel_attribute]
+                self.aux_vars.append(quantizer.get_quantizer_variable(AUXVAR))
+                self.stretch_params.append((quantizer.gamma, quantizer.zeta))
+
+    def __call__(self, model: nn.Module, entropy_reg: float):
+        """
+        Returns the soft quantizer regularization value for SoftRounding.
+
+        Args:
+            model: A model to be quantized with SoftRounding.
+            entropy_reg: Entropy value to scale the quantizer regularization.
+
+        Returns: Regularization value.
+        """
+
+        if model is not self.model:
+            self._collect_aux_vars(model)
 
-        reg = 0
+        b = self.temperature_schedule[min(self.count_iter, len(self.temperature_schedule) - 1)]
 
-        for sq in soft_reg_aux:
-            reg += sq
+        reg = SoftRoundingRegularizationFunction.apply(b, self.stretch_params, *self.aux_vars)
 
         self.count_iter += 1
 
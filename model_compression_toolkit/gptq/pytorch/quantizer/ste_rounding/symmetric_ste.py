@@ -32,6 +32,7 @@ from mct_quantizers import mark_quantizer
 from model_compression_toolkit.trainable_infrastructure.common.base_trainable_quantizer import VariableGroup
 from model_compression_toolkit.trainable_infrastructure.common.quant_utils import \
     get_threshold_reshape_shape
+from model_compression_toolkit.trainable_infrastructure.pytorch.quantizer_utils import perturbation_ste_quantize
 
 
 def pertubation_symmetric_quantizer(input_tensor: torch.Tensor,
@@ -61,17 +62,11 @@ def pertubation_symmetric_quantizer(input_tensor: torch.Tensor,
         max_tensor = qutils.power_of_two_max(max_tensor)
     delta = qutils.calculate_delta(max_tensor, num_bits, signed)
     delta = to_torch_tensor(delta)
-    max_tensor_change = delta * max_lsbs_change
 
     min_int = -int(signed) * (2 ** (num_bits - int(signed)))
     max_int = (2 ** (num_bits - int(signed))) - 1
 
-    tensor_clipped = qutils.ste_clip(auxvar_tensor, min_val=-max_tensor_change, max_val=max_tensor_change) / delta
-    input_tensor_int = torch.round(input_tensor / delta).detach()
-
-    tensor_q = qutils.ste_round(qutils.ste_round(input_tensor_int + tensor_clipped))
-
-    return delta * qutils.ste_clip(tensor_q, max_val=max_int, min_val=min_int)
+    return perturbation_ste_quantize(input_tensor, auxvar_tensor, delta, max_lsbs_change, min_int, max_int)
 
 
 @mark_quantizer(quantization_target=QuantizationTarget.Weights,
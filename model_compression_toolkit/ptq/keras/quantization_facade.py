@@ -25,6 +25,7 @@ from model_compression_toolkit.core.common.mixed_precision.mixed_precision_quant
 from model_compression_toolkit.target_platform_capabilities.target_platform.targetplatform2framework import TargetPlatformCapabilities
 from model_compression_toolkit.core.exporter import export_model
 from model_compression_toolkit.core.runner import core_runner, _init_tensorboard_writer
+from model_compression_toolkit.core.common.representative_dataset_store import get_representative_dataset
 from model_compression_toolkit.ptq.runner import ptq_runner
 
 if FOUND_TF:
@@ -130,6 +131,8 @@ if FOUND_TF:
             Logger.info("Using experimental mixed-precision quantization. "
                                "If you encounter an issue please file a bug.")
 
+        representative_data_gen = get_representative_dataset(representative_data_gen, core_config.quantization_config)
+
         tb_w = _init_tensorboard_writer(fw_info)
 
         fw_impl = KerasImplementation()
@@ -15,6 +15,9 @@
 from typing import Tuple
 import torch
 
+from model_compression_toolkit.trainable_infrastructure.pytorch.quantizer_utils import symmetric_ste_quantize, \
+    uniform_ste_quantize
+
 
 def ste_round(x: torch.Tensor) -> torch.Tensor:
     """
@@ -93,15 +96,8 @@ def symmetric_quantizer(tensor_data: torch.Tensor,
     min_val = -int(sign) * n_pos
     max_val = n_pos - 1
 
-    # Apply rounding
-    input_tensor_int = ste_round(tensor_data / delta_tensor)
-
-    # Clip data in range
-    clipped_tensor = ste_clip(input_tensor_int, min_val=min_val, max_val=max_val)
-
     # Quantize the data between -threshold/threshold
-    q = delta_tensor * clipped_tensor
-    return q
+    return symmetric_ste_quantize(tensor_data, delta_tensor, min_val, max_val)
 
 
 def uniform_quantizer(tensor_data: torch.Tensor,
@@ -125,12 +121,5 @@ def uniform_quantizer(tensor_data: torch.Tensor,
     # Compute the step size of quantized values.
     delta_tensor = (b - a) / (2 ** n_bits - 1)
 
-    # Apply rounding
-    input_tensor_int = ste_round((tensor_data - a) / delta_tensor)
-
-    # Clip data in range
-    clipped_tensor = ste_clip(input_tensor_int, min_val=0, max_val=2 ** n_bits - 1)
-
     # Quantize the data between min/max of quantization range.
-    q = delta_tensor * clipped_tensor + a
-    return q
+    return uniform_ste_quantize(tensor_data, a, delta_tensor, 2 ** n_bits - 1)
@@ -27,7 +27,8 @@ from model_compression_toolkit.qat.pytorch.quantizer.base_pytorch_qat_quantizer
 from mct_quantizers.common.base_inferable_quantizer import mark_quantizer, QuantizationTarget
 
 from model_compression_toolkit.core.pytorch.utils import to_torch_tensor
-from model_compression_toolkit.qat.pytorch.quantizer.quantizer_utils import ste_round, ste_clip, symmetric_quantizer
+from model_compression_toolkit.qat.pytorch.quantizer.quantizer_utils import symmetric_quantizer
+from model_compression_toolkit.trainable_infrastructure.pytorch.quantizer_utils import symmetric_ste_quantize
 from mct_quantizers.pytorch.quantizers import \
     WeightsPOTInferableQuantizer, WeightsSymmetricInferableQuantizer, ActivationPOTInferableQuantizer, \
     ActivationSymmetricInferableQuantizer
@@ -103,10 +104,7 @@ class STEWeightQATQuantizer(BasePytorchQATTrainableQuantizer):
         Returns:
             quantized tensor
         """
-        w0 = ste_round(inputs / self.delta_tensor)
-        w1 = ste_clip(w0, min_val=self.min_int, max_val=self.max_int)
-        w_q = self.delta_tensor * w1
-        return w_q
+        return symmetric_ste_quantize(inputs, self.delta_tensor, self.min_int, self.max_int)
 
     def convert2inferable(self) -> Union[WeightsPOTInferableQuantizer, WeightsSymmetricInferableQuantizer]:
         """
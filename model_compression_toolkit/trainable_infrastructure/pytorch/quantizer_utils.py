@@ -0,0 +1,227 @@
+# Copyright 2023 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+from typing import Any, Tuple
+
+import torch
+
+# The fused quantization functions below implement the same straight-through estimators (STE) as quantizing a tensor
+# with the ste_round and ste_clip primitives: the gradient passes through both the rounding and the clipping, so the
+# gradient of the input is not masked, and the gradient of a quantization parameter (the step size) is the rounding
+# residual in integer units. Each function saves only this residual for the backward pass, and only when the
+# quantization parameter requires a gradient.
+
+
+def _reduce_grad(grad: torch.Tensor, shape: torch.Size) -> torch.Tensor:
+    """
+    Reduce the gradient of a broadcasted input to the input's shape.
+
+    Args:
+        grad: Gradient of the broadcasted input.
+        shape: Shape of the input.
+
+    Returns:
+        The gradient of the input.
+    """
+    return grad if grad.shape == shape else grad.sum_to_size(shape)
+
+
+class SymmetricSTEQuantizeFunction(torch.autograd.Function):
+    """
+    Quantize a tensor to a symmetric grid of a given step size, with a straight-through estimator of the rounding
+    and the clipping. This function serves both the symmetric and the power-of-two quantizers, as the power-of-two
+    constraint is applied to the threshold before the step size is computed.
+    """
+
+    @staticmethod
+    def forward(ctx: Any,
+                tensor_data: torch.Tensor,
+                delta: torch.Tensor,
+                min_int: int,
+                max_int: int) -> torch.Tensor:
+        """
+        Args:
+            ctx: Autograd context.
+            tensor_data: Tensor values to quantize.
+            delta: Step size of the quantization grid.
+            min_int: Minimal integer value of the quantization grid.
+            max_int: Maximal integer value of the quantization grid.
+
+        Returns:
+            Quantized data.
+        """
+        tensor_int = tensor_data / delta
+        clipped_tensor = torch.round(tensor_int).clip_(min_int, max_int)
+        ctx.input_shape, ctx.delta_shape = tensor_data.shape, delta.shape
+        if ctx.needs_input_grad[1]:
+            ctx.save_for_backward(torch.sub(clipped_tensor, tensor_int, out=tensor_int))
+        return clipped_tensor.mul_(delta)
+
+    @staticmethod
+    def backward(ctx: Any, grad_output: torch.Tensor) -> Tuple:
+        grad_input = _reduce_grad(grad_output, ctx.input_shape) if ctx.needs_input_grad[0] else None
+        grad_delta = None
+        if ctx.needs_input_grad[1]:
+            residual, = ctx.saved_tensors
+            grad_delta = _reduce_grad(grad_output * residual, ctx.delta_shape)
+        return grad_input, grad_delta, None, None
+
+
+class UniformSTEQuantizeFunction(torch.autograd.Function):
+    """
+    Quantize a tensor to a uniform grid of a given minimal value and step size, with a straight-through estimator of
+    the rounding and the clipping.
+    """
+
+    @staticmethod
+    def forward(ctx: Any,
+                tensor_data: torch.Tensor,
+                range_min: torch.Tensor,
+                delta: torch.Tensor,
+                max_int: int) -> torch.Tensor:
+        """
+        Args:
+            ctx: Autograd context.
+            tensor_data: Tensor values to quantize.
+            range_min: Minimal value of the quantization grid.
+            delta: Step size of the quantization grid.
+            max_int: Maximal integer value of the quantization grid.
+
+        Returns:
+            Quantized data.
+        """
+        tensor_int = (tensor_data - range_min).div_(delta)
+        clipped_tensor = torch.round(tensor_int).clip_(0, max_int)
+        ctx.input_shape, ctx.delta_shape = tensor_data.shape, delta.shape
+        if ctx.needs_input_grad[2]:
+            ctx.save_for_backward(torch.sub(clipped_tensor, tensor_int, out=tensor_int))
+        return clipped_tensor.mul_(delta).add_(range_min)
+
+    @staticmethod
+    def backward(ctx: Any, grad_output: torch.Tensor) -> Tuple:
+        # The grid's minimal value shifts both the input and the output, so the output does not depend on it
+        # through the straight-through estimator.
+        grad_input = _reduce_grad(grad_output, ctx.input_shape) if ctx.needs_input_grad[0] else None
+        grad_delta = None
+        if ctx.needs_input_grad[2]:
+            residual, = ctx.saved_tensors
+            grad_delta = _reduce_grad(grad_output * residual, ctx.delta_shape)
+        return grad_input, None, grad_delta, None
+
+
+class PerturbationSTEQuantizeFunction(torch.autograd.Function):
+    """
+    Quantize a tensor to a symmetric grid of a given step size after shifting its rounded values by an auxiliary
+    variable (limited to a maximal number of LSBs), with a straight-through estimator of the rounding and the
+    clipping. The input tensor itself is not trained.
+    """
+
+    @staticmethod
+    def forward(ctx: Any,
+                tensor_data: torch.Tensor,
+                auxvar: torch.Tensor,
+                delta: torch.Tensor,
+                max_lsbs_change: int,
+                min_int: int,
+                max_int: int) -> torch.Tensor:
+        """
+        Args:
+            ctx: Autograd context.
+            tensor_data: Tensor values to quantize.
+            auxvar: Shift of the tensor values, in the units of the tensor.
+            delta: Step size of the quantization grid.
+            max_lsbs_change: Maximal number of LSBs the auxiliary variable is allowed to shift the values.
+            min_int: Minimal integer value of the quantization grid.
+            max_int: Maximal integer value of the quantization grid.
+
+        Returns:
+            Quantized data.
+        """
+        max_tensor_change = delta * max_lsbs_change
+        auxvar_int = torch.clip(auxvar, min=-max_tensor_change, max=max_tensor_change).div_(delta)
+        clipped_tensor = (torch.round(tensor_data / delta) + auxvar_int).round_().clip_(min_int, max_int)
+        ctx.auxvar_shape, ctx.delta_shape = auxvar.shape, delta.shape
+        if ctx.needs_input_grad[2]:
+            ctx.save_for_backward(clipped_tensor - auxvar_int)
+        return clipped_tensor.mul_(delta)
+
+    @staticmethod
+    def backward(ctx: Any, grad_output: torch.Tensor) -> Tuple:
+        grad_auxvar = _reduce_grad(grad_output, ctx.auxvar_shape) if ctx.needs_input_grad[1] else None
+        grad_delta = None
+        if ctx.needs_input_grad[2]:
+            residual, = ctx.saved_tensors
+            grad_delta = _reduce_grad(grad_output * residual, ctx.delta_shape)
+        return None, grad_auxvar, grad_delta, None, None, None
+
+
+def symmetric_ste_quantize(tensor_data: torch.Tensor,
+                           delta: torch.Tensor,
+                           min_int: int,
+                           max_int: int) -> torch.Tensor:
+    """
+    Quantize a tensor to a symmetric (or power-of-two) grid with a fused straight-through estimator.
+
+    Args:
+        tensor_data: Tensor values to quantize.
+        delta: Step size of the quantization grid.
+        min_int: Minimal integer value of the quantization grid.
+        max_int: Maximal integer value of the quantization grid.
+
+    Returns:
+        Quantized data.
+    """
+    return SymmetricSTEQuantizeFunction.apply(tensor_data, delta, min_int, max_int)
+
+
+def uniform_ste_quantize(tensor_data: torch.Tensor,
+                         range_min: torch.Tensor,
+                         delta: torch.Tensor,
+                         max_int: int) -> torch.Tensor:
+    """
+    Quantize a tensor to a uniform grid with a fused straight-through estimator.
+
+    Args:
+        tensor_data: Tensor values to quantize.
+        range_min: Minimal value of the quantization grid.
+        delta: Step size of the quantization grid.
+        max_int: Maximal integer value of the quantization grid.
+
+    Returns:
+        Quantized data.
+    """
+    return UniformSTEQuantizeFunction.apply(tensor_data, range_min, delta, max_int)
+
+
+def perturbation_ste_quantize(tensor_data: torch.Tensor,
+                              auxvar: torch.Tensor,
+                              delta: torch.Tensor,
+                              max_lsbs_change: int,
+                              min_int: int,
+                              max_int: int) -> torch.Tensor:
+    """
+    Quantize a tensor shifted by an auxiliary variable to a symmetric grid with a fused straight-through estimator.
+
+    Args:
+        tensor_data: Tensor values to quantize.
+        auxvar: Shift of the tensor values, in the units of the tensor.
+        delta: Step size of the quantization grid.
+        max_lsbs_change: Maximal number of LSBs the auxiliary variable is allowed to shift the values.
+        min_int: Minimal integer value of the quantization grid.
+        max_int: Maximal integer value of the quantization grid.
+
+    Returns:
+        Quantized data.
+    """
+    return PerturbationSTEQuantizeFunction.apply(tensor_data, auxvar, delta, max_lsbs_change, min_int, max_int)
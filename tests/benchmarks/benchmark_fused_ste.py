@@ -0,0 +1,119 @@
+# Copyright 2023 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""
+Benchmark of the training step time and the peak activation memory of a ResNet18 with fake-quantized weights and
+activations, when the quantizers are composed of the ste_round and ste_clip primitives (the previous implementation)
+and when they use the fused straight-through estimator functions.
+The weights are quantized by a per-channel symmetric quantizer with a frozen threshold (as in the QAT weights
+quantizer) and each convolution's input is quantized by a uniform quantizer with a trainable range (as in the QAT
+activation quantizer).
+The peak memory is measured by tracking the storages of all the tensors the step creates, until they're freed.
+
+Run: python -m tests.benchmarks.benchmark_fused_ste
+"""
+import time
+
+import torch
+from torchvision.models import resnet18
+
+from model_compression_toolkit.qat.pytorch.quantizer.quantizer_utils import ste_round, ste_clip, \
+    fix_range_to_include_zero, uniform_quantizer
+from model_compression_toolkit.trainable_infrastructure.pytorch.quantizer_utils import symmetric_ste_quantize
+from tests.benchmarks.benchmark_intermediate_tensors_memory import PeakMemoryTracker
+
+INPUT_SHAPE = [8, 3, 160, 160]
+N_BITS = 8
+N_ITER = 5
+
+
+def previous_symmetric_quantizer(inputs, delta, min_int, max_int):
+    w0 = ste_round(inputs / delta)
+    w1 = ste_clip(w0, min_val=min_int, max_val=max_int)
+    return delta * w1
+
+
+def previous_uniform_quantizer(tensor_data, range_min, range_max, n_bits):
+    a, b = fix_range_to_include_zero(range_min, range_max, n_bits)
+    delta_tensor = (b - a) / (2 ** n_bits - 1)
+    input_tensor_int = ste_round((tensor_data - a) / delta_tensor)
+    clipped_tensor = ste_clip(input_tensor_int, min_val=0, max_val=2 ** n_bits - 1)
+    return delta_tensor * clipped_tensor + a
+
+
+class QuantizedConv2d(torch.nn.Module):
+    def __init__(self, conv, fused):
+        super(QuantizedConv2d, self).__init__()
+        self.conv = conv
+        self.fused = fused
+        threshold = conv.weight.detach().abs().amax(dim=(1, 2, 3), keepdim=True)
+        self.register_buffer('delta', threshold / 2 ** (N_BITS - 1))
+        self.range_min = torch.nn.Parameter(torch.tensor([-4.0]))
+        self.range_max = torch.nn.Parameter(torch.tensor([4.0]))
+
+    def forward(self, x):
+        if self.fused:
+            w = symmetric_ste_quantize(self.conv.weight, self.delta, -2 ** (N_BITS - 1), 2 ** (N_BITS - 1) - 1)
+            x = uniform_quantizer(x, self.range_min, self.range_max, N_BITS)
+        else:
+            w = previous_symmetric_quantizer(self.conv.weight, self.delta, -2 ** (N_BITS - 1), 2 ** (N_BITS - 1) - 1)
+            x = previous_uniform_quantizer(x, self.range_min, self.range_max, N_BITS)
+        return self.conv._conv_forward(x, w, self.conv.bias)
+
+
+def quantize_model(module, fused):
+    for name, child in module.named_children():
+        if isinstance(child, torch.nn.Conv2d):
+            setattr(module, name, QuantizedConv2d(child, fused))
+        else:
+            quantize_model(child, fused)
+    return module
+
+
+def _train_step(model, optimizer, x, y):
+    optimizer.zero_grad()
+    loss = torch.nn.functional.cross_entropy(model(x), y)
+    loss.backward()
+    optimizer.step()
+
+
+def main():
+    torch.manual_seed(0)
+    x = torch.randn(*INPUT_SHAPE)
+    y = torch.randint(0, 1000, [INPUT_SHAPE[0]])
+
+    for fused in [False, True]:
+        torch.manual_seed(0)
+        model = quantize_model(resnet18(), fused).train()
+        optimizer = torch.optim.SGD(model.parameters(), lr=1e-4)
+        _train_step(model, optimizer, x, y)
+
+        start = time.perf_counter()
+        for _ in range(N_ITER):
+            _train_step(model, optimizer, x, y)
+        step_time = (time.perf_counter() - start) / N_ITER
+
+        with PeakMemoryTracker() as tracker:
+            optimizer.zero_grad()
+            loss = torch.nn.functional.cross_entropy(model(x), y)
+            forward_peak_bytes = tracker.peak_bytes
+            loss.backward()
+
+        print(f'{"Fused" if fused else "Previous"} STE quantizers: {step_time * 1000:.1f}ms per training step, '
+              f'{forward_peak_bytes / 2 ** 20:.1f}MB peak memory after forward, '
+              f'{tracker.peak_bytes / 2 ** 20:.1f}MB peak memory in training step')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,125 @@
+# Copyright 2023 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""
+Benchmark of the GPTQ training step time of a convolutional model, with a device synchronization in every step
+(the previous training loop, that copies the gradients to Numpy and reads the loss value in every step) against
+keeping the losses and gradients on the device and reading them once every log_interval steps.
+On a GPU the per-step synchronization stalls the host until the step is done; on a CPU the difference is smaller,
+and comes from the gradients' copies.
+
+Run: python -m tests.benchmarks.benchmark_gptq_host_sync
+"""
+import time
+from typing import Callable, List
+from unittest.mock import patch
+
+import numpy as np
+import torch
+from tqdm import tqdm
+
+from model_compression_toolkit.core import CoreConfig, QuantizationConfig
+from model_compression_toolkit.core.pytorch.utils import to_torch_tensor, torch_tensor_to_numpy
+from model_compression_toolkit.gptq import get_pytorch_gptq_config, \
+    pytorch_gradient_post_training_quantization_experimental
+from model_compression_toolkit.gptq.pytorch.gptq_training import PytorchGPTQTrainer
+from model_compression_toolkit.target_platform_capabilities.tpc_models.imx500_tpc.latest import generate_pytorch_tpc
+from tests.common_tests.helpers.generate_test_tp_model import generate_test_tp_model
+
+N_LAYERS = 6
+CHANNELS = 32
+INPUT_SHAPE = [3, 32, 32]
+BATCH_SIZE = 8
+N_BATCHES = 10
+N_EPOCHS = 5
+LOG_INTERVALS = [10, 50]
+
+
+class ConvModel(torch.nn.Module):
+    def __init__(self):
+        super(ConvModel, self).__init__()
+        self.convs = torch.nn.ModuleList([torch.nn.Conv2d(INPUT_SHAPE[0] if i == 0 else CHANNELS, CHANNELS, 3,
+                                                          padding=1) for i in range(N_LAYERS)])
+
+    def forward(self, x):
+        for conv in self.convs:
+            x = torch.relu(conv(x))
+        return x
+
+
+class PerStepSyncGPTQTrainer(PytorchGPTQTrainer):
+    """
+    The previous training loop, that synchronizes with the device in every step.
+    """
+
+    def compute_gradients(self, y_float: List[torch.Tensor], input_tensors: List[torch.Tensor]):
+        loss_value, grads = super().compute_gradients(y_float, input_tensors)
+        return loss_value, [torch_tensor_to_numpy(g) for g in grads]
+
+    def micro_training_loop(self, data_function: Callable, n_epochs: int):
+        for _ in tqdm(range(n_epochs)):
+            for batch_index, data in enumerate(tqdm(data_function())):
+                input_data = [d * self.input_scale for d in data]
+                input_tensor = to_torch_tensor(input_data)
+                y_float = self.get_float_outputs(batch_index, input_tensor)
+                loss_value, grads = self.compute_gradients(y_float, input_tensor)
+                for (optimizer, _) in self.optimizer_with_param:
+                    optimizer.step()
+                    optimizer.zero_grad()
+                if self.gptq_config.log_function is not None:
+                    self.gptq_config.log_function(loss_value.item(),
+                                                  torch_tensor_to_numpy(grads),
+                                                  torch_tensor_to_numpy(self.optimizer_with_param[0][-1]))
+                self.loss_list.append(loss_value.item())
+
+
+def run_gptq(trainer_class, dataset, log_interval):
+    """
+    Run GPTQ with a trainer class, and return the time of its training loop.
+    """
+    torch.manual_seed(0)
+    gptq_config = get_pytorch_gptq_config(n_epochs=N_EPOCHS)
+    gptq_config.log_interval = log_interval
+    gptq_config.log_function = lambda loss, grads, params: None
+    core_config = CoreConfig(quantization_config=QuantizationConfig(weights_bias_correction=False))
+    tpc = generate_pytorch_tpc(name="gptq_host_sync_benchmark", tp_model=generate_test_tp_model({}))
+
+    loop_time = []
+    original_loop = trainer_class.micro_training_loop
+
+    def timed_loop(self, *args, **kwargs):
+        start = time.perf_counter()
+        original_loop(self, *args, **kwargs)
+        loop_time.append(time.perf_counter() - start)
+
+    with patch('model_compression_toolkit.gptq.pytorch.gptq_pytorch_implementation.PytorchGPTQTrainer',
+               trainer_class), patch.object(trainer_class, 'micro_training_loop', timed_loop):
+        pytorch_gradient_post_training_quantization_experimental(model=ConvModel(),
+                                                                 representative_data_gen=lambda: iter(dataset),
+                                                                 core_config=core_config,
+                                                                 gptq_config=gptq_config,
+                                                                 target_platform_capabilities=tpc)
+    return loop_time[0]
+
+
+if __name__ == '__main__':
+    dataset = [[np.random.randn(*[BATCH_SIZE] + INPUT_SHAPE).astype(np.float32)] for _ in range(N_BATCHES)]
+    n_steps = N_BATCHES * N_EPOCHS
+
+    per_step_time = run_gptq(PerStepSyncGPTQTrainer, dataset, log_interval=1)
+    print(f'{"mode":>24}{"step time [ms]":>16}')
+    print(f'{"sync every step":>24}{1e3 * per_step_time / n_steps:>16.2f}')
+    for log_interval in LOG_INTERVALS:
+        interval_time = run_gptq(PytorchGPTQTrainer, dataset, log_interval=log_interval)
+        print(f'{f"log_interval={log_interval}":>24}{1e3 * interval_time / n_steps:>16.2f}')
@@ -0,0 +1,56 @@
+# Copyright 2023 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""
+Benchmark of the peak memory (RSS) of copying a graph with large weights, by a deepcopy of the graph and by a
+copy-on-write snapshot of it, as the pipeline copies graphs before fusion, mixed precision search, bias correction
+and GPTQ.
+Each copy method runs in a separate process, since the peak RSS of a process can't be reset.
+
+Run: python -m tests.benchmarks.benchmark_graph_snapshot
+"""
+import copy
+import resource
+import subprocess
+import sys
+import time
+
+from tests.common_tests.function_tests.test_graph_snapshot import build_graph
+
+N_NODES = 50
+WEIGHTS_SHAPE = (1024, 1024)  # 8MB of float64 weights per node
+N_COPIES = 2
+
+
+def _peak_rss_mb() -> float:
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def _run(method: str):
+    graph = build_graph(N_NODES, WEIGHTS_SHAPE)
+    base_rss = _peak_rss_mb()
+    start = time.perf_counter()
+    copies = [copy.deepcopy(graph) if method == 'deepcopy' else graph.snapshot() for _ in range(N_COPIES)]
+    copy_time = time.perf_counter() - start
+    print(f'{method:>10}{base_rss:>16.0f}{_peak_rss_mb():>16.0f}{copy_time:>12.3f}')
+
+
+if __name__ == '__main__':
+    if len(sys.argv) > 1:
+        _run(sys.argv[1])
+    else:
+        print(f'{N_NODES} nodes, {N_NODES * 8}MB of weights, {N_COPIES} copies')
+        print(f'{"method":>10}{"graph RSS [MB]":>16}{"peak RSS [MB]":>16}{"time [s]":>12}')
+        for method in ['deepcopy', 'snapshot']:
+            subprocess.run([sys.executable, '-m', 'tests.benchmarks.benchmark_graph_snapshot', method], check=True)
@@ -0,0 +1,80 @@
+# Copyright 2023 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""
+Benchmark of the streaming histogram collector against the per-iteration histogram collector.
+For each number of calibration batches, both collectors are updated with the same activations, and the
+update time, the merge time, the collector's memory and the MSE/KL thresholds selected from the resulting
+histograms are reported.
+
+Run: python -m tests.benchmarks.benchmark_histogram_collector
+"""
+import pickle
+import time
+
+import numpy as np
+
+import model_compression_toolkit.core.common.quantization.quantization_config as qc
+from model_compression_toolkit.constants import THRESHOLD
+from model_compression_toolkit.core.common.collectors.histogram_collector import HistogramCollector, \
+    StreamingHistogramCollector
+from model_compression_toolkit.core.common.quantization.quantization_params_generation.power_of_two_selection import \
+    power_of_two_selection_histogram
+from model_compression_toolkit.core.common.quantization.quantization_params_generation.symmetric_selection import \
+    symmetric_selection_histogram
+
+N_BATCHES = [10, 100, 1000]
+BATCH_SHAPE = (8, 32, 32, 16)
+N_BITS = 8
+
+
+def _collect(collector, batches):
+    start = time.perf_counter()
+    for x in batches():
+        collector.update(x)
+    update_time = time.perf_counter() - start
+    collector_size = len(pickle.dumps(collector))
+    start = time.perf_counter()
+    bins, counts = collector.get_histogram()
+    merge_time = time.perf_counter() - start
+    return bins, counts, update_time, merge_time, collector_size
+
+
+def _thresholds(bins, counts):
+    thresholds = {}
+    for selection_fn in [power_of_two_selection_histogram, symmetric_selection_histogram]:
+        for m in [qc.QuantizationErrorMethod.MSE, qc.QuantizationErrorMethod.KL]:
+            t = selection_fn(bins, counts, p=2, n_bits=N_BITS, min_value=None, max_value=None, quant_error_method=m)
+            thresholds[f'{selection_fn.__name__.split("_selection")[0]}/{m.name}'] = round(float(t[THRESHOLD]), 4)
+    return thresholds
+
+
+def main():
+    for n_batches in N_BATCHES:
+        def batches():
+            rng = np.random.default_rng(0)
+            for i in range(n_batches):
+                # Activations with a slowly growing dynamic range.
+                yield rng.standard_normal(BATCH_SHAPE) * (1 + i / n_batches)
+
+        print(f'--- {n_batches} batches of shape {BATCH_SHAPE}')
+        for name, collector in [('per-iteration', HistogramCollector()), ('streaming', StreamingHistogramCollector())]:
+            bins, counts, update_time, merge_time, collector_size = _collect(collector, batches)
+            print(f'{name:>14}: update {update_time:.3f}s, merge {merge_time:.3f}s, '
+                  f'collector size {collector_size / 1024:.1f}KB, n_bins {len(counts)}')
+            print(f'{"":>14}  thresholds {_thresholds(bins, counts)}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,99 @@
+# Copyright 2023 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""
+Benchmark of the calibration inference throughput and peak memory of a PytorchModel, when the inference records
+the autograd graph (the previous run_model_inference) and when it runs in inference mode.
+The model is built with all of its nodes as outputs (as in statistics collection), and with only some of its
+nodes as outputs (as in the mixed precision sensitivity evaluation, where the outputs are the interest points).
+The peak memory is measured by tracking the storages of all the tensors the inference creates, until they're freed.
+
+Run: python -m tests.benchmarks.benchmark_inference_mode
+"""
+import time
+
+import numpy as np
+import torch
+
+from model_compression_toolkit.core.common.model_builder_mode import ModelBuilderMode
+from model_compression_toolkit.core.pytorch.default_framework_info import DEFAULT_PYTORCH_INFO
+from model_compression_toolkit.core.pytorch.pytorch_implementation import PytorchImplementation
+from model_compression_toolkit.core.pytorch.utils import to_torch_tensor
+from model_compression_toolkit.target_platform_capabilities.tpc_models.imx500_tpc.latest import generate_pytorch_tpc
+from tests.benchmarks.benchmark_intermediate_tensors_memory import PeakMemoryTracker
+from tests.common_tests.helpers.prep_graph_for_func_test import prepare_graph_with_quantization_parameters
+
+N_BLOCKS = 20
+CHANNELS = 32
+INPUT_SHAPE = [16, 3, 64, 64]
+N_ITER = 10
+
+
+class ResidualModel(torch.nn.Module):
+    def __init__(self):
+        super(ResidualModel, self).__init__()
+        self.stem = torch.nn.Conv2d(INPUT_SHAPE[1], CHANNELS, kernel_size=3, padding=1)
+        self.convs = torch.nn.ModuleList([torch.nn.Conv2d(CHANNELS, CHANNELS, kernel_size=3, padding=1)
+                                          for _ in range(N_BLOCKS)])
+        self.relu = torch.nn.ReLU()
+
+    def forward(self, x):
+        x = self.stem(x)
+        for conv in self.convs:
+            x = self.relu(conv(x)) + x
+        return x
+
+
+def representative_dataset():
+    yield [np.random.randn(*INPUT_SHAPE).astype(np.float32)]
+
+
+def legacy_run_model_inference(model, input_list):
+    """
+    The previous run_model_inference, that records the autograd graph of the inference.
+    """
+    return model(*to_torch_tensor(input_list))
+
+
+def benchmark(inference_fn, model, inputs):
+    """
+    Run the inference N_ITER times, and return its throughput (images per second) and the peak memory of an inference.
+    """
+    inference_fn(model, inputs)
+    start = time.perf_counter()
+    for _ in range(N_ITER):
+        inference_fn(model, inputs)
+    throughput = N_ITER * INPUT_SHAPE[0] / (time.perf_counter() - start)
+
+    with PeakMemoryTracker() as tracker:
+        outputs = inference_fn(model, inputs)
+    del outputs
+    return throughput, tracker.peak_bytes
+
+
+if __name__ == '__main__':
+    fw_impl = PytorchImplementation()
+    graph = prepare_graph_with_quantization_parameters(ResidualModel(), fw_impl, DEFAULT_PYTORCH_INFO,
+                                                       representative_dataset, generate_pytorch_tpc, INPUT_SHAPE)
+    nodes = graph.get_topo_sorted_nodes()
+    inputs = [np.random.randn(*INPUT_SHAPE).astype(np.float32)]
+
+    print(f'{"outputs":>16}{"inference":>16}{"images/s":>12}{"peak memory [MB]":>20}')
+    for outputs_name, append2output in [('all nodes', nodes), ('every 4th node', nodes[::4])]:
+        model, _ = fw_impl.model_builder(graph, mode=ModelBuilderMode.FLOAT, append2output=append2output,
+                                         fw_info=DEFAULT_PYTORCH_INFO)
+        for name, inference_fn in [('autograd', legacy_run_model_inference),
+                                   ('inference mode', fw_impl.run_model_inference)]:
+            throughput, peak_bytes = benchmark(inference_fn, model, inputs)
+            print(f'{outputs_name:>16}{name:>16}{throughput:>12.1f}{peak_bytes / 2 ** 20:>20.1f}')
@@ -0,0 +1,112 @@
+# Copyright 2023 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""
+Benchmark of the peak memory of the intermediate tensors of PytorchModel's inference, with and without releasing
+the tensors once no remaining node needs them.
+The memory is measured by tracking the storages of all the tensors the inference creates, until they are freed.
+
+Run: python -m tests.benchmarks.benchmark_intermediate_tensors_memory
+"""
+import weakref
+
+import numpy as np
+import torch
+from torch.utils._python_dispatch import TorchDispatchMode
+from torch.utils._pytree import tree_flatten
+
+from model_compression_toolkit.core.common.model_builder_mode import ModelBuilderMode
+from model_compression_toolkit.core.pytorch.default_framework_info import DEFAULT_PYTORCH_INFO
+from model_compression_toolkit.core.pytorch.pytorch_implementation import PytorchImplementation
+from model_compression_toolkit.target_platform_capabilities.tpc_models.imx500_tpc.latest import generate_pytorch_tpc
+from tests.common_tests.helpers.prep_graph_for_func_test import prepare_graph_with_quantization_parameters
+
+N_BLOCKS = 50
+CHANNELS = 16
+INPUT_SHAPE = [8, CHANNELS, 32, 32]
+
+
+class DeepModel(torch.nn.Module):
+    def __init__(self):
+        super(DeepModel, self).__init__()
+        self.convs = torch.nn.ModuleList([torch.nn.Conv2d(CHANNELS, CHANNELS, kernel_size=3, padding=1)
+                                          for _ in range(N_BLOCKS)])
+        self.relu = torch.nn.ReLU()
+
+    def forward(self, x):
+        for conv in self.convs:
+            x = self.relu(conv(x)) + x
+        return x
+
+
+def representative_dataset():
+    yield [np.random.randn(*INPUT_SHAPE).astype(np.float32)]
+
+
+class PeakMemoryTracker(TorchDispatchMode):
+    """
+    Track the bytes of the storages that are alive, of the tensors that are created under the mode.
+    """
+
+    def __init__(self):
+        super(PeakMemoryTracker, self).__init__()
+        self.storages_refs = {}
+        self.live_bytes = 0
+        self.peak_bytes = 0
+
+    def _release(self, key, nbytes):
+        self.storages_refs[key] -= 1
+        if self.storages_refs[key] == 0:
+            del self.storages_refs[key]
+            self.live_bytes -= nbytes
+
+    def __torch_dispatch__(self, func, types, args=(), kwargs=None):
+        outputs = func(*args, **(kwargs or {}))
+        for t in tree_flatten(outputs)[0]:
+            if isinstance(t, torch.Tensor):
+                storage = t.untyped_storage()
+                key = storage.data_ptr()
+                if key not in self.storages_refs:
+                    self.storages_refs[key] = 0
+                    self.live_bytes += storage.nbytes()
+                    self.peak_bytes = max(self.peak_bytes, self.live_bytes)
+                self.storages_refs[key] += 1
+                weakref.finalize(t, self._release, key, storage.nbytes())
+        return outputs
+
+
+def _peak_memory(model, x):
+    with torch.no_grad(), PeakMemoryTracker() as tracker:
+        model(x)
+    return tracker.peak_bytes
+
+
+def main():
+    fw_impl = PytorchImplementation()
+    model = DeepModel()
+    graph = prepare_graph_with_quantization_parameters(model, fw_impl, DEFAULT_PYTORCH_INFO, representative_dataset,
+                                                       generate_pytorch_tpc, INPUT_SHAPE)
+    x = torch.randn(*INPUT_SHAPE)
+    print(f'Pytorch model: {_peak_memory(model, x) / 2 ** 20:.1f}MB peak intermediate tensors memory')
+
+    for release_intermediate_tensors in [False, True]:
+        built_model = fw_impl.model_builder(graph, mode=ModelBuilderMode.FLOAT, fw_info=DEFAULT_PYTORCH_INFO,
+                                            release_intermediate_tensors=release_intermediate_tensors)[0]
+        x = x.to(next(built_model.parameters()).device)
+        print(f'FLOAT model (release_intermediate_tensors={release_intermediate_tensors}): '
+              f'{_peak_memory(built_model, x) / 2 ** 20:.1f}MB peak intermediate tensors memory')
+
+
+if __name__ == '__main__':
+    main()
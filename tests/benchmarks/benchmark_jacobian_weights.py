@@ -0,0 +1,81 @@
+# Copyright 2023 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""
+Benchmark of the Jacobian-based interest points weights computation of a convolutional model, for a batch of images.
+The per-image computation (a gradients model and a backward pass per random vector, for each image) is timed
+against the batched computation (a single gradients model, and a backward pass per chunk of random vectors for all
+the images), and the differences between their averaged weights are reported.
+
+Run: python -m tests.benchmarks.benchmark_jacobian_weights
+"""
+import time
+
+import numpy as np
+import torch
+
+from model_compression_toolkit.core.pytorch.default_framework_info import DEFAULT_PYTORCH_INFO
+from model_compression_toolkit.core.pytorch.pytorch_implementation import PytorchImplementation
+from model_compression_toolkit.core.pytorch.utils import to_torch_tensor
+from model_compression_toolkit.target_platform_capabilities.tpc_models.imx500_tpc.latest import generate_pytorch_tpc
+from tests.common_tests.helpers.prep_graph_for_func_test import prepare_graph_with_configs
+
+N_LAYERS = 8
+CHANNELS = 16
+INPUT_SHAPE = [3, 32, 32]
+N_IMAGES = [4, 16, 32]
+N_ITER = 50
+
+
+class ConvModel(torch.nn.Module):
+    def __init__(self):
+        super(ConvModel, self).__init__()
+        self.convs = torch.nn.ModuleList([torch.nn.Conv2d(INPUT_SHAPE[0] if i == 0 else CHANNELS, CHANNELS, 3,
+                                                          padding=1) for i in range(N_LAYERS)])
+
+    def forward(self, x):
+        for conv in self.convs:
+            x = torch.relu(conv(x))
+        return x
+
+
+def representative_dataset():
+    yield [np.random.randn(*[1] + INPUT_SHAPE).astype(np.float32)]
+
+
+if __name__ == '__main__':
+    torch.manual_seed(0)
+    fw_impl = PytorchImplementation()
+    graph = prepare_graph_with_configs(ConvModel(), fw_impl, DEFAULT_PYTORCH_INFO, representative_dataset,
+                                       generate_pytorch_tpc)
+    interest_points = graph.get_topo_sorted_nodes()
+    grad_args = dict(graph_float=graph, interest_points=interest_points, output_list=[interest_points[-1]],
+                     all_outputs_indices=[len(interest_points) - 1], alpha=0.3, n_iter=N_ITER)
+
+    print(f'{"images":>8}{"per image [s]":>16}{"batched [s]":>14}{"max weight diff":>18}')
+    for n_images in N_IMAGES:
+        images = to_torch_tensor(torch.randn([n_images] + INPUT_SHAPE))
+
+        start = time.perf_counter()
+        per_image = [fw_impl.model_grad(model_input_tensors={n: images[i:i + 1].clone() for n in graph.get_inputs()},
+                                        **grad_args) for i in range(n_images)]
+        per_image_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        batched = fw_impl.model_grad_per_image(model_input_tensors={n: images.clone() for n in graph.get_inputs()},
+                                               **grad_args)
+        batched_time = time.perf_counter() - start
+
+        diff = np.max(np.abs(np.mean(per_image, axis=0) - np.mean(batched, axis=0)))
+        print(f'{n_images:>8}{per_image_time:>16.3f}{batched_time:>14.3f}{diff:>18.4f}')
@@ -0,0 +1,104 @@
+# Copyright 2023 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""
+Benchmark of the per-batch inference time of the Keras statistics collection model (a MobileNetV2 that outputs all
+of its layers' tensors) and of the mixed precision sensitivity evaluation of a configuration, when the models are
+inferred eagerly, traced into a tf.function, and traced into a tf.function compiled with XLA.
+The first (tracing) inference of each model is excluded from the per-batch time, and reported separately.
+
+Run: python -m tests.benchmarks.benchmark_keras_compiled_inference
+"""
+import time
+
+import numpy as np
+from keras.applications.mobilenet_v2 import MobileNetV2
+
+from model_compression_toolkit.core import MixedPrecisionQuantizationConfigV2
+from model_compression_toolkit.core.common.model_builder_mode import ModelBuilderMode
+from model_compression_toolkit.core.keras.default_framework_info import DEFAULT_KERAS_INFO
+from model_compression_toolkit.core.keras.keras_implementation import KerasImplementation
+from model_compression_toolkit.target_platform_capabilities.tpc_models.imx500_tpc.latest import \
+    get_op_quantization_configs
+from tests.common_tests.helpers.prep_graph_for_func_test import prepare_graph_with_quantization_parameters
+from tests.keras_tests.tpc_keras import get_weights_only_mp_tpc_keras
+
+INPUT_SHAPE = (224, 224, 3)
+BATCH_SIZE = 8
+N_BATCHES = 10
+N_CONFIGS = 10
+MODES = [('eager', False, False), ('tf.function', True, False), ('tf.function+XLA', True, True)]
+
+
+def get_weights_mp_tpc(name, _tp):
+    base_config, _ = get_op_quantization_configs()
+    return get_weights_only_mp_tpc_keras(base_config, [(8, 8), (4, 8), (2, 8)], name)
+
+
+def representative_dataset():
+    yield [np.random.randn(*(BATCH_SIZE,) + INPUT_SHAPE).astype(np.float32)]
+
+
+def benchmark_collector(fw_impl, graph, compile_model, jit_compile):
+    model, _ = fw_impl.model_builder(graph, mode=ModelBuilderMode.FLOAT,
+                                     append2output=graph.get_topo_sorted_nodes(), fw_info=DEFAULT_KERAS_INFO)
+    if compile_model:
+        model = fw_impl.compile_inference_model(model, jit_compile)
+    batches = [[np.random.randn(*(BATCH_SIZE,) + INPUT_SHAPE).astype(np.float32)] for _ in range(N_BATCHES)]
+
+    start = time.perf_counter()
+    fw_impl.run_model_inference(model, batches[0])
+    first_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for inputs in batches:
+        [t.numpy() for t in fw_impl.run_model_inference(model, inputs)]
+    return first_time, (time.perf_counter() - start) / N_BATCHES
+
+
+def benchmark_sensitivity(fw_impl, graph, compile_model, jit_compile):
+    mp_config = MixedPrecisionQuantizationConfigV2(num_of_images=BATCH_SIZE, use_grad_based_weights=False,
+                                                   compile_inference_models=compile_model,
+                                                   jit_compile_inference=jit_compile)
+    se = fw_impl.get_sensitivity_evaluator(graph, mp_config, representative_dataset, DEFAULT_KERAS_INFO)
+    baseline_config = graph.get_max_candidates_config()
+    configs = []
+    for node_idx in np.random.choice(len(baseline_config), N_CONFIGS):
+        config = baseline_config.copy()
+        config[node_idx] = len(graph.get_configurable_sorted_nodes()[node_idx].candidates_quantization_cfg) - 1
+        configs.append((config, [node_idx]))
+
+    start = time.perf_counter()
+    se.compute_metric(*configs[0], baseline_config)
+    first_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for config, node_idx in configs:
+        se.compute_metric(config, node_idx, baseline_config)
+    return first_time, (time.perf_counter() - start) / N_CONFIGS
+
+
+if __name__ == '__main__':
+    np.random.seed(0)
+    fw_impl = KerasImplementation()
+    graph = prepare_graph_with_quantization_parameters(MobileNetV2(weights=None), fw_impl, DEFAULT_KERAS_INFO,
+                                                       representative_dataset, get_weights_mp_tpc,
+                                                       (1,) + INPUT_SHAPE, mixed_precision_enabled=True)
+
+    print(f'MobileNetV2, batch of {BATCH_SIZE} images')
+    print(f'{"model":>14}{"mode":>18}{"first call [s]":>16}{"per batch [ms]":>16}')
+    for name, benchmark in [('collector', benchmark_collector), ('sensitivity', benchmark_sensitivity)]:
+        for mode, compile_model, jit_compile in MODES:
+            first_time, batch_time = benchmark(fw_impl, graph, compile_model, jit_compile)
+            print(f'{name:>14}{mode:>18}{first_time:>16.2f}{1e3 * batch_time:>16.1f}')
@@ -0,0 +1,80 @@
+# Copyright 2023 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""
+Benchmark of the peak memory of the intermediate tensors of an inference of a Keras model that KerasModelBuilder
+builds. A Keras functional model releases each intermediate tensor once all the layers that consume it ran, so the
+builder needs no release mode. For comparison, the same model is built with all of its nodes appended to its
+outputs, which keeps all the intermediate tensors alive until the inference ends.
+The memory is measured by the peak memory of the TensorFlow CPU allocator during an eager inference.
+
+Run: python -m tests.benchmarks.benchmark_keras_intermediate_tensors_memory
+"""
+import numpy as np
+import tensorflow as tf
+from keras import layers
+
+from model_compression_toolkit.core.common.model_builder_mode import ModelBuilderMode
+from model_compression_toolkit.core.keras.default_framework_info import DEFAULT_KERAS_INFO
+from model_compression_toolkit.core.keras.keras_implementation import KerasImplementation
+from model_compression_toolkit.target_platform_capabilities.tpc_models.imx500_tpc.latest import generate_keras_tpc
+from tests.common_tests.helpers.prep_graph_for_func_test import prepare_graph_with_quantization_parameters
+
+N_BLOCKS = 50
+CHANNELS = 16
+INPUT_SHAPE = [8, 32, 32, CHANNELS]
+DEVICE = 'CPU:0'
+
+
+def deep_model():
+    inputs = layers.Input(shape=INPUT_SHAPE[1:])
+    x = inputs
+    for _ in range(N_BLOCKS):
+        x = layers.Add()([layers.ReLU()(layers.Conv2D(CHANNELS, 3, padding='same')(x)), x])
+    return tf.keras.Model(inputs=inputs, outputs=x)
+
+
+def representative_dataset():
+    yield [np.random.randn(*INPUT_SHAPE).astype(np.float32)]
+
+
+def _peak_memory(model, x):
+    model(x)  # Warm up, so allocations that are kept between inferences are not counted.
+    tf.config.experimental.reset_memory_stats(DEVICE)
+    current_bytes = tf.config.experimental.get_memory_info(DEVICE)['current']
+    outputs = model(x)
+    peak_bytes = tf.config.experimental.get_memory_info(DEVICE)['peak']
+    del outputs
+    return peak_bytes - current_bytes
+
+
+def main():
+    fw_impl = KerasImplementation()
+    model = deep_model()
+    graph = prepare_graph_with_quantization_parameters(model, fw_impl, DEFAULT_KERAS_INFO, representative_dataset,
+                                                       generate_keras_tpc, INPUT_SHAPE)
+    x = tf.convert_to_tensor(next(representative_dataset())[0])
+    print(f'Keras model: {_peak_memory(model, x) / 2 ** 20:.1f}MB peak intermediate tensors memory')
+
+    built_model = fw_impl.model_builder(graph, mode=ModelBuilderMode.FLOAT, fw_info=DEFAULT_KERAS_INFO)[0]
+    print(f'FLOAT model: {_peak_memory(built_model, x) / 2 ** 20:.1f}MB peak intermediate tensors memory')
+
+    keep_all_model = fw_impl.model_builder(graph, mode=ModelBuilderMode.FLOAT, fw_info=DEFAULT_KERAS_INFO,
+                                           append2output=graph.get_topo_sorted_nodes())[0]
+    print(f'FLOAT model with all nodes as outputs: '
+          f'{_peak_memory(keep_all_model, x) / 2 ** 20:.1f}MB peak intermediate tensors memory')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,86 @@
+# Copyright 2023 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""
+Benchmark of the mixed-precision ILP formulation as the number of configurable layers grows.
+For each number of layers, a synthetic search problem (weights memory and activation memory targets) is built
+with the sparse formulation and with the previous dense formulation (which multiplies the KPI matrix by a diagonal
+matrix of the indicators, and is skipped for large problems), and the build times and the solve time are reported.
+
+Run: python -m tests.benchmarks.benchmark_lp_formulation
+"""
+import time
+
+import numpy as np
+from pulp import PULP_CBC_CMD, LpProblem, LpStatusOptimal, lpSum
+
+from model_compression_toolkit.core.common.mixed_precision.kpi_tools.kpi import KPI
+from model_compression_toolkit.core.common.mixed_precision.search_methods.linear_programming import \
+    _init_problem_vars, _formalize_problem, SOLVER_TIME_LIMIT
+from tests.common_tests.function_tests.test_lp_search_formulation import SyntheticSearchManager
+
+N_LAYERS = [50, 100, 200, 400, 800, 1600]
+MAX_DENSE_LAYERS = 100
+
+
+def _formalize_dense_problem(indicators_mapping, metrics_mapping, objective_mapping, target_kpi, search_manager):
+    lp_problem = LpProblem()
+    lp_problem += lpSum([objective_mapping[layer] for layer in metrics_mapping.keys()])
+    for layer in metrics_mapping.keys():
+        lp_problem += lpSum([indicator * metrics_mapping[layer][nbits]
+                             for nbits, indicator in indicators_mapping[layer].items()]) == objective_mapping[layer]
+        lp_problem += lpSum([v for v in indicators_mapping[layer].values()]) == 1
+
+    indicators_matrix = np.diag(np.array([i for layer in metrics_mapping.keys()
+                                          for i in indicators_mapping[layer].values()]))
+    for target, kpi_value in target_kpi.get_kpi_dict().items():
+        if not np.isinf(kpi_value):
+            indicated_kpi_matrix = np.matmul(search_manager.compute_kpi_matrix(target), indicators_matrix)
+            kpi_sum_vector = np.array([np.sum(indicated_kpi_matrix[i], axis=0) + search_manager.min_kpi[target][i]
+                                       for i in range(indicated_kpi_matrix.shape[0])])
+            for v in search_manager.compute_kpi_functions[target][1](kpi_sum_vector):
+                lp_problem += v <= kpi_value
+    return lp_problem
+
+
+def _build(formalize_fn, search_manager, metrics_mapping, target_kpi):
+    start = time.perf_counter()
+    indicators_mapping, objective_mapping = _init_problem_vars(metrics_mapping)
+    lp_problem = formalize_fn(indicators_mapping, metrics_mapping, objective_mapping, target_kpi, search_manager)
+    return lp_problem, time.perf_counter() - start
+
+
+def main():
+    for n_layers in N_LAYERS:
+        search_manager = SyntheticSearchManager(n_layers)
+        metrics_mapping = {i: dict(enumerate(search_manager.metrics[i])) for i in range(n_layers)}
+        max_weights, max_activation = search_manager.kpi(search_manager.max_kpi_config)
+        target_kpi = KPI(weights_memory=0.6 * max_weights, activation_memory=0.8 * max_activation)
+
+        lp_problem, build_time = _build(_formalize_problem, search_manager, metrics_mapping, target_kpi)
+        dense_report = 'dense build skipped'
+        if n_layers <= MAX_DENSE_LAYERS:
+            _, dense_build_time = _build(_formalize_dense_problem, search_manager, metrics_mapping, target_kpi)
+            dense_report = f'dense build {dense_build_time:.3f}s (x{dense_build_time / build_time:.1f})'
+
+        start = time.perf_counter()
+        lp_problem.solve(solver=PULP_CBC_CMD(timeLimit=SOLVER_TIME_LIMIT, msg=False))
+        solve_time = time.perf_counter() - start
+
+        print(f'{n_layers:>5} layers: sparse build {build_time:.3f}s, {dense_report}, solve {solve_time:.3f}s, '
+              f'optimal {lp_problem.status == LpStatusOptimal}')
+
+
+if __name__ == '__main__':
+    main()
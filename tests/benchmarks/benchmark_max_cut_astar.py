@@ -0,0 +1,105 @@
+# Copyright 2023 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""
+Benchmark of the max cut AStar search on synthetic graphs of growing size (chains of blocks of parallel branches).
+For each graph, a single search with the initial estimate factor is timed with the heap based solver, and with the
+previous solver (which sorts the open list on every expansion and checks membership by scanning lists, and is skipped
+for large graphs), and the found max cut sizes are reported.
+
+Run: python -m tests.benchmarks.benchmark_max_cut_astar
+"""
+import time
+
+from model_compression_toolkit.core.common.graph.memory_graph.max_cut_astar import MaxCutAstar
+from model_compression_toolkit.core.common.graph.memory_graph.memory_graph import MemoryGraph
+from tests.common_tests.function_tests.test_max_cut_astar_search import build_synthetic_graph
+
+N_BLOCKS = [25, 50, 100, 200, 400, 800]
+MAX_LIST_SEARCH_BLOCKS = 200
+ITER_LIMIT = 10 ** 6
+
+
+class ListMaxCutAstar(MaxCutAstar):
+    """
+    MaxCutAstar with the previous solver, which keeps the open and closed sets in lists.
+    """
+
+    def solve(self, estimate_factor, iter_limit=500):
+        open_list = [self.src_cut]
+        closed_list = []
+        costs = {self.src_cut: self.src_cut.memory_size()}
+        routes = {self.src_cut: [self.src_cut]}
+
+        expansion_count = 0
+        while expansion_count < iter_limit and len(open_list) > 0:
+            next_cut = sorted(open_list,
+                              key=lambda c: (self.accumulate(costs[c], self.estimate(c, estimate_factor)),
+                                             len(routes[c])))[0]
+            cut_cost = costs[next_cut]
+            cut_route = routes[next_cut]
+
+            if next_cut == self.target_cut:
+                return self._remove_dummys_from_path(cut_route[0].op_order), cut_cost, \
+                       list(set([self._remove_dummys_from_cut(self.clean_memory_for_next_step(c)) for c in cut_route]))
+
+            if self.is_pivot(next_cut):
+                open_list = []
+                closed_list = []
+                routes = {}
+            else:
+                open_list.remove(next_cut)
+                del routes[next_cut]
+                closed_list.append(next_cut)
+
+            expanded_cuts = self.expand(next_cut)
+            expansion_count += 1
+
+            expanded_cuts = list(filter(lambda _c: _c not in closed_list, expanded_cuts))
+            for c in expanded_cuts:
+                cost = self.accumulate(cut_cost, c.memory_size())
+                if c not in open_list or self.ordering(cost, costs[c]):
+                    if c in open_list:
+                        open_list.remove(c)
+                    open_list.append(c)
+                    costs.update({c: cost})
+                    routes.update({c: [c] + cut_route})
+
+        return None, 0, None
+
+
+def _solve(solver_class, graph):
+    memory_graph = MemoryGraph(graph)
+    mc_astar = solver_class(memory_graph)
+    start = time.perf_counter()
+    _, max_cut_size, _ = mc_astar.solve(estimate_factor=mc_astar.get_init_estimate_factor(memory_graph),
+                                        iter_limit=ITER_LIMIT)
+    return max_cut_size, time.perf_counter() - start
+
+
+def main():
+    for n_blocks in N_BLOCKS:
+        graph = build_synthetic_graph(n_blocks)
+        max_cut_size, search_time = _solve(MaxCutAstar, graph)
+        list_report = 'list search skipped'
+        if n_blocks <= MAX_LIST_SEARCH_BLOCKS:
+            list_max_cut_size, list_search_time = _solve(ListMaxCutAstar, graph)
+            list_report = f'list search {list_search_time:.3f}s (x{list_search_time / search_time:.1f}), ' \
+                          f'max cut {list_max_cut_size}'
+
+        print(f'{len(graph.nodes):>5} nodes: heap search {search_time:.3f}s, max cut {max_cut_size}, {list_report}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,84 @@
+# Copyright 2023 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""
+Benchmark of the per-batch Python overhead of PytorchModel.forward on a deep model.
+A deep chain of small layers is read into a graph, and the float model and the mixed-precision model that are built
+from it are inferred on a small batch (so the time is dominated by the Python overhead), and compared to the
+original Pytorch model.
+
+Run: python -m tests.benchmarks.benchmark_pytorch_model_forward
+"""
+import time
+
+import numpy as np
+import torch
+
+from model_compression_toolkit.core.common.model_builder_mode import ModelBuilderMode
+from model_compression_toolkit.core.pytorch.default_framework_info import DEFAULT_PYTORCH_INFO
+from model_compression_toolkit.core.pytorch.pytorch_implementation import PytorchImplementation
+from model_compression_toolkit.target_platform_capabilities.tpc_models.imx500_tpc.latest import generate_pytorch_tpc
+from tests.common_tests.helpers.prep_graph_for_func_test import prepare_graph_with_quantization_parameters
+from tests.pytorch_tests.function_tests.test_sensitivity_prefix_cache import get_activation_mp_tpc
+
+N_BLOCKS = 100
+CHANNELS = 4
+INPUT_SHAPE = [1, CHANNELS, 8, 8]
+N_ITERS = 50
+
+
+class DeepModel(torch.nn.Module):
+    def __init__(self):
+        super(DeepModel, self).__init__()
+        self.convs = torch.nn.ModuleList([torch.nn.Conv2d(CHANNELS, CHANNELS, kernel_size=1)
+                                          for _ in range(N_BLOCKS)])
+        self.relu = torch.nn.ReLU()
+
+    def forward(self, x):
+        for conv in self.convs:
+            x = self.relu(conv(x)) + x
+        return x
+
+
+def representative_dataset():
+    yield [np.random.randn(*INPUT_SHAPE).astype(np.float32)]
+
+
+def _time_forward(model, x):
+    with torch.no_grad():
+        model(x)
+        start = time.perf_counter()
+        for _ in range(N_ITERS):
+            model(x)
+    return (time.perf_counter() - start) / N_ITERS
+
+
+def main():
+    fw_impl = PytorchImplementation()
+    model = DeepModel()
+    x = torch.randn(*INPUT_SHAPE)
+    print(f'Pytorch model ({3 * N_BLOCKS} layers): {1000 * _time_forward(model, x):.2f}ms per batch')
+
+    for mode, get_tpc, mixed_precision_enabled in [(ModelBuilderMode.FLOAT, generate_pytorch_tpc, False),
+                                                  (ModelBuilderMode.MIXEDPRECISION, get_activation_mp_tpc, True)]:
+        graph = prepare_graph_with_quantization_parameters(model, fw_impl, DEFAULT_PYTORCH_INFO,
+                                                           representative_dataset, get_tpc, INPUT_SHAPE,
+                                                           mixed_precision_enabled=mixed_precision_enabled)
+        built_model = fw_impl.model_builder(graph, mode=mode, fw_info=DEFAULT_PYTORCH_INFO)[0]
+        x = x.to(next(built_model.parameters()).device)
+        print(f'{mode.name} model ({len(graph.nodes)} nodes): {1000 * _time_forward(built_model, x):.2f}ms per batch')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,77 @@
+# Copyright 2023 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""
+Benchmark of the total run time of Pytorch GPTQ with a representative dataset that is slow to read (simulating
+images that are decoded from disk), when every stage of the pipeline iterates the dataset, and when the dataset is
+stored once in a RepresentativeDatasetStore and replayed.
+
+Run: python -m tests.benchmarks.benchmark_representative_dataset_store
+"""
+import time
+
+import numpy as np
+import torch
+
+from model_compression_toolkit.core import CoreConfig, QuantizationConfig
+from model_compression_toolkit.gptq import get_pytorch_gptq_config, \
+    pytorch_gradient_post_training_quantization_experimental
+from model_compression_toolkit.target_platform_capabilities.tpc_models.imx500_tpc.latest import generate_pytorch_tpc
+from tests.common_tests.helpers.generate_test_tp_model import generate_test_tp_model
+
+INPUT_SHAPE = [8, 3, 64, 64]
+N_BATCHES = 20
+N_EPOCHS = 5
+BATCH_READ_TIME = 0.05  # Seconds to "decode" a batch
+
+
+class ConvModel(torch.nn.Module):
+    def __init__(self):
+        super(ConvModel, self).__init__()
+        self.conv1 = torch.nn.Conv2d(3, 16, kernel_size=3, padding=1)
+        self.conv2 = torch.nn.Conv2d(16, 16, kernel_size=3, padding=1)
+
+    def forward(self, x):
+        return self.conv2(torch.relu(self.conv1(x)))
+
+
+class SlowDataset:
+    def __init__(self):
+        self.batches = [[np.random.randn(*INPUT_SHAPE).astype(np.float32)] for _ in range(N_BATCHES)]
+        self.n_iterations = 0
+
+    def __call__(self):
+        self.n_iterations += 1
+        for batch in self.batches:
+            time.sleep(BATCH_READ_TIME)
+            yield batch
+
+
+if __name__ == '__main__':
+    print(f'{"dataset":>12}{"dataset passes":>16}{"total time [s]":>16}')
+    for store_representative_dataset in [False, True]:
+        dataset = SlowDataset()
+        core_config = CoreConfig(quantization_config=QuantizationConfig(
+            weights_bias_correction=False, store_representative_dataset=store_representative_dataset))
+        start = time.perf_counter()
+        pytorch_gradient_post_training_quantization_experimental(
+            model=ConvModel(),
+            representative_data_gen=dataset,
+            core_config=core_config,
+            gptq_config=get_pytorch_gptq_config(n_epochs=N_EPOCHS),
+            target_platform_capabilities=generate_pytorch_tpc(name="dataset_store_benchmark",
+                                                              tp_model=generate_test_tp_model({})))
+        total_time = time.perf_counter() - start
+        name = 'stored' if store_representative_dataset else 'generator'
+        print(f'{name:>12}{dataset.n_iterations:>16}{total_time:>16.2f}')
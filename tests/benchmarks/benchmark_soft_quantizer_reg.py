@@ -0,0 +1,99 @@
+# Copyright 2023 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""
+Benchmark of the soft rounding regularization step (forward and backward) of a ResNet18 with soft rounding weights
+quantizers, when the regularization goes over the model's wrapped layers and computes each layer's term separately
+(the previous implementation) and when it is computed over all the layers' auxiliary variables by a single autograd
+function. The peak memory is measured by tracking the storages of all the tensors the regularization step creates,
+until they're freed.
+
+Run: python -m tests.benchmarks.benchmark_soft_quantizer_reg
+"""
+import time
+
+import torch
+from torchvision.models import resnet18
+
+from mct_quantizers import PytorchQuantizationWrapper
+from model_compression_toolkit.constants import THRESHOLD, MIN_THRESHOLD
+from model_compression_toolkit.core.pytorch.constants import KERNEL
+from model_compression_toolkit.core.pytorch.default_framework_info import DEFAULT_PYTORCH_INFO
+from model_compression_toolkit.gptq.common.gptq_graph import get_kernel_attribute_name_for_gptq
+from model_compression_toolkit.gptq.pytorch.quantizer.soft_rounding.soft_quantizer_reg import LinearTempDecay, \
+    SoftQuantizerRegularization
+from model_compression_toolkit.gptq.pytorch.quantizer.soft_rounding.symmetric_soft_quantizer import \
+    SymmetricSoftRoundingGPTQ
+from model_compression_toolkit.target_platform_capabilities.target_platform import QuantizationMethod
+from model_compression_toolkit.trainable_infrastructure import TrainableQuantizerWeightsConfig
+from tests.benchmarks.benchmark_intermediate_tensors_memory import PeakMemoryTracker
+
+N_STEPS = 50
+
+
+class PreviousSoftQuantizerRegularization:
+    def __init__(self, total_gradient_steps):
+        self.linear_decay = LinearTempDecay(total_gradient_steps)
+        self.count_iter = 0
+
+    def __call__(self, model, entropy_reg):
+        soft_reg_aux = []
+        b = self.linear_decay(self.count_iter)
+        for layer in model.modules():
+            if isinstance(layer, PytorchQuantizationWrapper):
+                kernel_attribute = get_kernel_attribute_name_for_gptq(layer_type=type(layer.layer),
+                                                                      fw_info=DEFAULT_PYTORCH_INFO)
+                st = layer.weights_quantizers[kernel_attribute].get_soft_targets()
+                soft_reg_aux.append((1 - torch.pow(torch.abs(st - .5) * 2, b)).sum())
+        reg = 0
+        for sq in soft_reg_aux:
+            reg += sq
+        self.count_iter += 1
+        return entropy_reg * reg
+
+
+def wrap_model(module):
+    for name, child in module.named_children():
+        if isinstance(child, torch.nn.Conv2d):
+            tqwc = TrainableQuantizerWeightsConfig(weights_quantization_method=QuantizationMethod.SYMMETRIC,
+                                                   weights_n_bits=8,
+                                                   weights_quantization_params={THRESHOLD: 2.0},
+                                                   enable_weights_quantization=True,
+                                                   weights_channels_axis=0,
+                                                   weights_per_channel_threshold=False,
+                                                   min_threshold=MIN_THRESHOLD)
+            setattr(module, name, PytorchQuantizationWrapper(child, {KERNEL: SymmetricSoftRoundingGPTQ(tqwc)}))
+        else:
+            wrap_model(child)
+    return module
+
+
+def main():
+    model = wrap_model(resnet18())
+    for name, reg_func in [('Previous', PreviousSoftQuantizerRegularization(N_STEPS)),
+                           ('Fused', SoftQuantizerRegularization(N_STEPS))]:
+        with PeakMemoryTracker() as tracker:
+            reg = reg_func(model, 0.01)
+            forward_bytes = tracker.live_bytes
+            reg.backward()
+
+        start = time.perf_counter()
+        for _ in range(N_STEPS - 1):
+            reg_func(model, 0.01).backward()
+        print(f'{name} regularization: {(time.perf_counter() - start) / (N_STEPS - 1) * 1000:.2f}ms per step, '
+              f'{forward_bytes / 2 ** 20:.1f}MB kept for backward, {tracker.peak_bytes / 2 ** 20:.1f}MB peak memory')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,44 @@
+# Copyright 2023 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""
+Benchmark of applying a substitution until no new match is found, on chain graphs of growing size.
+For each graph, the worklist engine (which searches only around the nodes each step changed) is timed against the
+previous loop (which filters the whole graph after each step), and the resulting graphs are compared.
+
+Run: python -m tests.benchmarks.benchmark_substitutions
+"""
+import time
+
+from model_compression_toolkit.core.common.substitutions.apply_substitutions import substitute_until_no_match
+from tests.common_tests.function_tests.test_substitutions_worklist import build_chain_graph, \
+    CollapseSubstitution, substitute_until_no_match_reference
+
+N_NODES = [100, 200, 400, 800, 1600]
+
+
+def _time(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+if __name__ == '__main__':
+    print(f'{"nodes":>8}{"full filter [s]":>18}{"worklist [s]":>16}{"same graph":>12}')
+    for n_nodes in N_NODES:
+        reference_graph, reference_time = _time(substitute_until_no_match_reference, build_chain_graph(n_nodes),
+                                                CollapseSubstitution())
+        graph, worklist_time = _time(substitute_until_no_match, build_chain_graph(n_nodes), CollapseSubstitution())
+        same = [n.name for n in graph.nodes] == [n.name for n in reference_graph.nodes]
+        print(f'{n_nodes:>8}{reference_time:>18.3f}{worklist_time:>16.3f}{str(same):>12}')
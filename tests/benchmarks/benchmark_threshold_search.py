@@ -0,0 +1,77 @@
+# Copyright 2023 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""
+Benchmark of the batched quantization parameters search against the per-candidate search.
+For each weights tensor shape, selection method, error method and granularity, both searches are run on the same
+tensor, and the run times, the speedup and whether the selected parameters are identical are reported.
+
+Run: python -m tests.benchmarks.benchmark_threshold_search
+"""
+import time
+from unittest.mock import patch
+
+import numpy as np
+
+import model_compression_toolkit.core.common.quantization.quantization_config as qc
+from model_compression_toolkit.core.common.quantization.quantization_params_generation import \
+    power_of_two_selection, symmetric_selection, uniform_selection
+
+# Weights shapes (kernel_h, kernel_w, in_channels, out_channels), the output channel is the last axis.
+SHAPES = [(3, 3, 32, 64), (3, 3, 128, 256), (1, 1, 512, 1024)]
+CHANNEL_AXIS = 3
+N_BITS = 8
+P = 3
+
+SELECTION_FUNCTIONS = [(power_of_two_selection, power_of_two_selection.power_of_two_selection_tensor),
+                       (symmetric_selection, symmetric_selection.symmetric_selection_tensor),
+                       (uniform_selection, uniform_selection.uniform_selection_tensor)]
+ERROR_METHODS = [qc.QuantizationErrorMethod.MSE, qc.QuantizationErrorMethod.MAE, qc.QuantizationErrorMethod.LP]
+
+
+def _run(selection_fn, x, per_channel, error_method):
+    start = time.perf_counter()
+    params = selection_fn(x, P, N_BITS, per_channel, CHANNEL_AXIS, quant_error_method=error_method)
+    return params, time.perf_counter() - start
+
+
+def main():
+    total_batched, total_loop, all_identical = 0, 0, True
+    for shape in SHAPES:
+        x = np.random.default_rng(0).standard_normal(shape).astype(np.float32)
+        print(f'--- weights of shape {shape}')
+        for module, selection_fn in SELECTION_FUNCTIONS:
+            for error_method in ERROR_METHODS:
+                for per_channel in [True, False]:
+                    batched_params, batched_time = _run(selection_fn, x, per_channel, error_method)
+                    # Without a batched error function the search falls back to evaluating one candidate at a time.
+                    with patch.object(module, 'get_threshold_selection_tensor_batched_error_function',
+                                      lambda *args, **kwargs: None):
+                        loop_params, loop_time = _run(selection_fn, x, per_channel, error_method)
+
+                    identical = all(np.array_equal(batched_params[k], loop_params[k]) for k in loop_params)
+                    all_identical &= identical
+                    total_batched += batched_time
+                    total_loop += loop_time
+                    print(f'{module.__name__.split(".")[-1]:>24} {error_method.name:>3} '
+                          f'{"per-channel" if per_channel else "per-tensor":>11}: '
+                          f'loop {loop_time:.3f}s, batched {batched_time:.3f}s, '
+                          f'speedup x{loop_time / batched_time:.1f}, identical {identical}')
+
+    print(f'Total: loop {total_loop:.2f}s, batched {total_batched:.2f}s, speedup x{total_loop / total_batched:.1f}, '
+          f'all identical {all_identical}')
+
+
+if __name__ == '__main__':
+    main()
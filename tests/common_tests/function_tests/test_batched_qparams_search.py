@@ -0,0 +1,102 @@
+# Copyright 2023 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import unittest
+import numpy as np
+
+import model_compression_toolkit.core.common.quantization.quantization_config as qc
+from model_compression_toolkit.core.common.quantization.quantization_params_generation.batched_qparams_search import \
+    symmetric_batched_search, uniform_batched_search
+from model_compression_toolkit.core.common.quantization.quantization_params_generation.error_functions import \
+    get_threshold_selection_tensor_error_function, get_threshold_selection_tensor_batched_error_function
+from model_compression_toolkit.core.common.quantization.quantization_params_generation.qparams_search import \
+    qparams_selection_tensor_search, qparams_symmetric_selection_tensor_search, \
+    qparams_uniform_selection_tensor_search
+from model_compression_toolkit.core.common.quantization.quantizers.quantizers_helpers import get_tensor_max, \
+    get_tensor_min, reshape_tensor_for_per_channel_search
+from model_compression_toolkit.target_platform_capabilities.target_platform import QuantizationMethod
+
+ERROR_METHODS = [qc.QuantizationErrorMethod.MSE, qc.QuantizationErrorMethod.MAE, qc.QuantizationErrorMethod.LP]
+
+
+class TestBatchedQparamsSearch(unittest.TestCase):
+
+    def _error_functions(self, quantization_method, error_method):
+        return get_threshold_selection_tensor_error_function(quantization_method, error_method, p=3), \
+            get_threshold_selection_tensor_batched_error_function(error_method, p=3)
+
+    def test_power_of_two_search(self):
+        for dtype in [np.float32, np.float64]:
+            x = (np.random.randn(3, 3, 8, 16) * 2).astype(dtype)
+            for error_method in ERROR_METHODS:
+                error_fn, batched_error_fn = self._error_functions(QuantizationMethod.POWER_OF_TWO, error_method)
+                for per_channel in [True, False]:
+                    expected = qparams_selection_tensor_search(error_fn, x, 8, per_channel, channel_axis=3)
+                    batched = qparams_selection_tensor_search(error_fn, x, 8, per_channel, channel_axis=3,
+                                                              batched_error_function=batched_error_fn)
+                    self.assertTrue(np.array_equal(expected, batched))
+
+    def test_symmetric_search(self):
+        for dtype in [np.float32, np.float64]:
+            x = (np.random.randn(3, 3, 8, 16) * 2).astype(dtype)
+            for error_method in ERROR_METHODS:
+                error_fn, batched_error_fn = self._error_functions(QuantizationMethod.SYMMETRIC, error_method)
+                for per_channel in [True, False]:
+                    tensor_max = get_tensor_max(x, per_channel, 3, 8)
+                    expected = qparams_symmetric_selection_tensor_search(error_fn, x, tensor_max, 8, per_channel, 3)
+                    batched = qparams_symmetric_selection_tensor_search(error_fn, x, tensor_max, 8, per_channel, 3,
+                                                                        batched_error_function=batched_error_fn)
+                    self.assertTrue(np.array_equal(expected, batched))
+
+    def test_uniform_search(self):
+        for dtype in [np.float32, np.float64]:
+            x = (np.random.randn(3, 3, 8, 16) * 2 + 0.5).astype(dtype)
+            for error_method in ERROR_METHODS:
+                error_fn, batched_error_fn = self._error_functions(QuantizationMethod.UNIFORM, error_method)
+                for per_channel in [True, False]:
+                    tensor_min = get_tensor_min(x, per_channel, 3)
+                    tensor_max = get_tensor_max(x, per_channel, 3, 8, is_uniform_quantization=True)
+                    expected = qparams_uniform_selection_tensor_search(error_fn, x, tensor_min, tensor_max, 8,
+                                                                       per_channel, 3)
+                    batched = qparams_uniform_selection_tensor_search(error_fn, x, tensor_min, tensor_max, 8,
+                                                                      per_channel, 3,
+                                                                      batched_error_function=batched_error_fn)
+                    self.assertTrue(np.array_equal(expected[0], batched[0]))
+                    self.assertTrue(np.array_equal(expected[1], batched[1]))
+
+    def test_memory_budget_chunks(self):
+        x = reshape_tensor_for_per_channel_search(np.random.randn(3, 3, 8, 16), 3)
+        batched_error_fn = get_threshold_selection_tensor_batched_error_function(qc.QuantizationErrorMethod.MSE, p=2)
+
+        thresholds = np.linspace(0.5, 4, 25)[:, np.newaxis] * np.ones([1, 16])
+        idx, loss = symmetric_batched_search(x, thresholds, 8, True, batched_error_fn, per_channel=True)
+        chunked_idx, chunked_loss = symmetric_batched_search(x, thresholds, 8, True, batched_error_fn,
+                                                             per_channel=True, memory_budget=1)
+        self.assertTrue(idx.shape == (16,))
+        self.assertTrue(np.array_equal(idx, chunked_idx))
+        self.assertTrue(np.array_equal(loss, chunked_loss))
+
+        ranges = np.stack([-thresholds, thresholds], axis=-1)
+        idx, loss = uniform_batched_search(x, ranges, 8, batched_error_fn, per_channel=True)
+        chunked_idx, chunked_loss = uniform_batched_search(x, ranges, 8, batched_error_fn, per_channel=True,
+                                                           memory_budget=1)
+        self.assertTrue(np.array_equal(idx, chunked_idx))
+        self.assertTrue(np.array_equal(loss, chunked_loss))
+
+    def test_no_batched_kl(self):
+        self.assertIsNone(get_threshold_selection_tensor_batched_error_function(qc.QuantizationErrorMethod.KL, p=2))
+
+
+if __name__ == '__main__':
+    unittest.main()
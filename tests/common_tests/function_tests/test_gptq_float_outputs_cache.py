@@ -0,0 +1,76 @@
+# Copyright 2023 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import unittest
+
+import numpy as np
+
+from model_compression_toolkit.gptq.common.gptq_float_outputs_cache import FloatOutputsCache
+
+
+def _identity(x):
+    return x
+
+
+class TestGPTQFloatOutputsCache(unittest.TestCase):
+
+    def _put_and_check(self, cache, batches):
+        for i, outputs in enumerate(batches):
+            self.assertFalse(i in cache)
+            self.assertIsNone(cache.get(i))
+            cache.put(i, outputs)
+
+        for i, outputs in enumerate(batches):
+            self.assertTrue(i in cache)
+            cached = cache.get(i)
+            if isinstance(outputs, list):
+                self.assertIsInstance(cached, list)
+                self.assertEqual(len(cached), len(outputs))
+                for c, o in zip(cached, outputs):
+                    self.assertEqual(c.dtype, o.dtype)
+                    self.assertTrue(np.array_equal(c, o))
+            else:
+                self.assertEqual(cached.dtype, outputs.dtype)
+                self.assertTrue(np.array_equal(cached, outputs))
+
+    def test_in_memory(self):
+        batches = [np.random.randn(2, 3, 4).astype(np.float32) for _ in range(4)]
+        cache = FloatOutputsCache(2 ** 20, _identity, _identity)
+        self._put_and_check(cache, batches)
+        self.assertEqual(len(cache.in_memory), 4)
+        self.assertIsNone(cache.spill_file)
+
+    def test_spill_to_file(self):
+        batches = [[np.random.randn(2, 5).astype(np.float32), np.random.randn(2, 3, 3)] for _ in range(5)]
+        batch_bytes = sum([o.nbytes for o in batches[0]])
+        cache = FloatOutputsCache(2 * batch_bytes, _identity, _identity)
+        self._put_and_check(cache, batches)
+        self.assertEqual(len(cache.in_memory), 2)
+        self.assertEqual(len(cache.spilled), 3)
+
+        cache.clear()
+        self.assertIsNone(cache.spill_file)
+        self.assertFalse(0 in cache)
+        self.assertIsNone(cache.get(4))
+
+    def test_no_memory_budget(self):
+        batches = [np.random.randn(3, 7) for _ in range(3)]
+        cache = FloatOutputsCache(0, _identity, _identity)
+        self._put_and_check(cache, batches)
+        self.assertEqual(len(cache.in_memory), 0)
+        self.assertEqual(len(cache.spilled), 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,106 @@
+# Copyright 2023 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import unittest
+
+import numpy as np
+
+from model_compression_toolkit.core.common import BaseNode, Graph
+from model_compression_toolkit.core.common.collectors.statistics_collector import StatsCollector
+from model_compression_toolkit.core.common.graph.base_graph import OutTensor
+from model_compression_toolkit.core.common.graph.edge import Edge
+
+
+class DummyLayer:
+    pass
+
+
+def build_graph(n_nodes, weights_shape=(16, 16)):
+    """
+    Build a chain graph of nodes with weights, and with statistics collectors attached to the nodes.
+    """
+    nodes = [BaseNode(f'node_{i}', {'attr': [i]}, tuple(), (1, 16),
+                      {'kernel': np.random.randn(*weights_shape), 'bias': np.random.randn(weights_shape[-1])},
+                      DummyLayer)
+             for i in range(n_nodes)]
+    edges = [Edge(nodes[i], nodes[i + 1], 0, 0) for i in range(n_nodes - 1)]
+    graph = Graph('graph', nodes, [nodes[0]], [OutTensor(nodes[-1], 0)], edges)
+    for n in nodes:
+        sc = StatsCollector(out_channel_axis=1)
+        sc.update_statistics(np.random.randn(4, 16))
+        graph.set_out_stats_collector_to_node(n, sc)
+    return graph
+
+
+class TestGraphSnapshot(unittest.TestCase):
+
+    def test_snapshot_shares_weights_and_collectors(self):
+        graph = build_graph(5)
+        snapshot = graph.snapshot()
+
+        self.assertEqual([n.name for n in snapshot.get_topo_sorted_nodes()],
+                         [n.name for n in graph.get_topo_sorted_nodes()])
+        for n, sn in zip(graph.get_topo_sorted_nodes(), snapshot.get_topo_sorted_nodes()):
+            self.assertIsNot(n, sn)
+            self.assertIsNot(n.framework_attr, sn.framework_attr)
+            self.assertIsNot(n.weights, sn.weights)
+            for k in n.weights:
+                self.assertIs(n.weights[k], sn.weights[k])
+            self.assertIs(graph.get_out_stats_collector(n), snapshot.get_out_stats_collector(sn))
+        for n, sn in zip(graph.get_topo_sorted_nodes()[1:], snapshot.get_topo_sorted_nodes()[1:]):
+            self.assertIs(graph.get_in_stats_collector(n), snapshot.get_in_stats_collector(sn))
+        self.assertIs(snapshot.input_nodes[0], snapshot.get_topo_sorted_nodes()[0])
+        self.assertIs(snapshot.get_outputs()[0].node, snapshot.get_topo_sorted_nodes()[-1])
+
+    def test_snapshot_copy_on_write(self):
+        graph = build_graph(5)
+        snapshot = graph.snapshot()
+        node, snapshot_node = graph.get_topo_sorted_nodes()[2], snapshot.get_topo_sorted_nodes()[2]
+        kernel = node.get_weights_by_keys('kernel')
+        kernel_copy = kernel.copy()
+
+        # Replacing a weight in the snapshot doesn't change the graph's weight
+        snapshot_node.set_weights_by_keys('kernel', kernel * 2)
+        self.assertIs(node.get_weights_by_keys('kernel'), kernel)
+        self.assertTrue(np.array_equal(kernel, kernel_copy))
+        self.assertTrue(np.array_equal(snapshot_node.get_weights_by_keys('kernel'), kernel_copy * 2))
+
+        # Changing the snapshot's attributes and structure doesn't change the graph
+        snapshot_node.framework_attr['attr'].append(100)
+        snapshot.remove_edge(snapshot_node, snapshot.get_next_nodes(snapshot_node)[0])
+        self.assertEqual(node.framework_attr['attr'], [2])
+        self.assertEqual(len(graph.get_next_nodes(node)), 1)
+        self.assertEqual(len(graph.edges), 4)
+
+    def test_multiple_outputs_stats_collectors(self):
+        # Each output of a node with multiple outputs gets its own copy of the passed statistics collector,
+        # as the passed collector may be used by another node (e.g., by batchnorm refusing).
+        nodes = [BaseNode('split', {}, tuple(), [(1, 16), (1, 16)], {}, DummyLayer),
+                 BaseNode('a', {}, tuple(), (1, 16), {}, DummyLayer),
+                 BaseNode('b', {}, tuple(), (1, 16), {}, DummyLayer)]
+        graph = Graph('graph', nodes, [nodes[0]], [OutTensor(nodes[1], 0), OutTensor(nodes[2], 0)],
+                      [Edge(nodes[0], nodes[1], 0, 0), Edge(nodes[0], nodes[2], 1, 0)])
+        sc = StatsCollector(out_channel_axis=1)
+        graph.set_out_stats_collector_to_node(nodes[0], sc)
+
+        out_stats_collectors = graph.get_out_stats_collector(nodes[0])
+        self.assertEqual(len(out_stats_collectors), 2)
+        self.assertIsNot(out_stats_collectors[0], out_stats_collectors[1])
+        for out_sc in out_stats_collectors:
+            self.assertIsNot(out_sc, sc)
+        self.assertEqual([graph.get_in_stats_collector(n) for n in nodes[1:]], out_stats_collectors)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,83 @@
+# Copyright 2023 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import unittest
+
+import networkx as nx
+
+from model_compression_toolkit.core.common import BaseNode
+from model_compression_toolkit.core.common.graph.base_graph import OutTensor
+from tests.common_tests.function_tests.test_max_cut_astar_search import build_synthetic_graph, SyntheticLayer
+
+
+def _new_node(name):
+    return BaseNode(name=name, framework_attr={}, input_shape=tuple(), output_shape=(1, 4), weights={},
+                    layer_class=SyntheticLayer)
+
+
+class TestGraphTopoSortCache(unittest.TestCase):
+
+    def _assert_topo_sort(self, graph):
+        expected = list(nx.topological_sort(graph))
+        self.assertEqual(graph.get_topo_sorted_nodes(), expected)
+        self.assertEqual(graph.get_nodes_topo_index(), {n: i for i, n in enumerate(expected)})
+
+    def test_topo_sort_cache(self):
+        graph = build_synthetic_graph(n_blocks=5)
+        self._assert_topo_sort(graph)
+
+        # The returned order is a copy of the cached order.
+        graph.get_topo_sorted_nodes().reverse()
+        self._assert_topo_sort(graph)
+
+        # Add a node after the graph's output
+        output_node = graph.get_outputs()[0].node
+        new_output_node = _new_node('new_output')
+        graph.add_node_with_in_edges(new_output_node, [output_node])
+        graph.set_outputs([OutTensor(new_output_node, 0)])
+        self._assert_topo_sort(graph)
+
+        # Replace a node in the middle of the graph
+        node = graph.get_topo_sorted_nodes()[5]
+        replacing_node = _new_node('replacing_node')
+        graph.add_node(replacing_node)
+        graph.reconnect_in_edges(node, replacing_node)
+        self._assert_topo_sort(graph)
+        graph.reconnect_out_edges(node, replacing_node)
+        self._assert_topo_sort(graph)
+        graph.remove_node(node)
+        self._assert_topo_sort(graph)
+        self.assertNotIn(node, graph.get_nodes_topo_index())
+
+        # Edges that change the order of independent nodes
+        input_node = graph.get_inputs()[0]
+        first, second = graph.get_topo_sorted_nodes()[1:3]
+        graph.add_edge(input_node, _new_node('branch'), source_index=0, sink_index=0)
+        self._assert_topo_sort(graph)
+        graph.remove_edges_from([(first, n) for n in graph.get_next_nodes(first)])
+        self._assert_topo_sort(graph)
+        graph.remove_nodes_from([first])
+        self._assert_topo_sort(graph)
+        self.assertNotIn(first, graph.get_topo_sorted_nodes())
+        self.assertIn(second, graph.get_topo_sorted_nodes())
+
+    def test_sort_nodes_in_list(self):
+        graph = build_synthetic_graph(n_blocks=5)
+        sorted_nodes = graph.get_topo_sorted_nodes()
+        nodes_list = sorted_nodes[::-3] + sorted_nodes[::-3] + [_new_node('not_in_graph')]
+        self.assertEqual(graph._sort_nodes_in_list(nodes_list), [n for n in sorted_nodes if n in nodes_list])
+
+
+if __name__ == '__main__':
+    unittest.main()
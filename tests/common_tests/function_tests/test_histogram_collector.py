@@ -16,7 +16,8 @@
 
 import unittest
 import numpy as np
-from model_compression_toolkit.core.common.collectors.histogram_collector import HistogramCollector, interpolate_histogram
+from model_compression_toolkit.core.common.collectors.histogram_collector import HistogramCollector, interpolate_histogram, \
+    StreamingHistogramCollector
 
 
 class TestHistogramCollector(unittest.TestCase):
@@ -54,6 +55,81 @@ class TestHistogramCollector(unittest.TestCase):
         interpolate_histogram(bins, b, c)
         self.assertTrue(True)  # Just check it works
 
+    def test_streaming_same(self):
+        hc = StreamingHistogramCollector()
+        x = np.random.rand(1, 2, 3, 4)
+        for i in range(100):
+            hc.update(x)
+
+        self.assertTrue(np.isclose(np.max(x), hc.max(), atol=(x.max() - x.min()) / 2048))
+        self.assertTrue(np.isclose(np.min(x), hc.min()))
+        self.assertTrue(np.sum(hc.get_histogram()[1]) == 100 * x.size)
+
+    def test_streaming_update_hist(self):
+        hc = StreamingHistogramCollector()
+        x = 0.1 * np.random.rand(1, 2, 3, 4) + 0.1
+        hc.update(x)
+        for i in range(1000):
+            x = np.random.rand(1, 2, 3, 4) - 0.5 * (i % 2)
+            hc.update(x)
+        bins, counts = hc.get_histogram()
+        self.assertTrue(len(bins) == 2049 and len(counts) == 2048)
+        self.assertTrue(hc.max() > 0.9)
+        self.assertTrue(hc.min() < -0.4)
+        self.assertTrue(np.sum(counts) == 1001 * x.size)
+
+    def test_streaming_same_value(self):
+        hc = StreamingHistogramCollector()
+        x = np.ones([100, 100])
+        hc.update(x)
+        self.assertTrue(hc.max() == 1.0)
+        self.assertTrue(hc.min() == 1.0)
+
+        hc = StreamingHistogramCollector()
+        hc.update(x)
+        hc.update(np.random.rand(10, 10) + 2)
+        bins, counts = hc.get_histogram()
+        self.assertTrue(np.sum(counts) == 10100)
+        self.assertTrue(hc.min() == 1.0)
+
+    def test_streaming_expand_beyond_max(self):
+        hc = StreamingHistogramCollector(n_bins=10)
+        hc.update(np.arange(11, dtype=np.float64))  # Histogram over [0, 10]
+        bins, _ = hc.get_histogram()
+        self.assertTrue(bins[-1] == 10.0)
+
+        # A value less than one bin width beyond the right edge expands the range, and is counted in its own bin.
+        hc.update(np.asarray([10.9]))
+        bins, counts = hc.get_histogram()
+        self.assertTrue(bins[-1] > 10.9)
+        value_bin = np.searchsorted(bins, 10.9, side='right') - 1
+        self.assertTrue(bins[value_bin] <= 10.9 < bins[value_bin + 1])
+        self.assertTrue(counts[value_bin] >= 1)
+        self.assertTrue(np.sum(counts[bins[:-1] >= 10.0]) == 1)
+        self.assertTrue(np.sum(counts) == 12)
+
+        # The same holds when updating with a histogram.
+        hc = StreamingHistogramCollector(n_bins=10)
+        hc.update(np.arange(11, dtype=np.float64))
+        hc.update_histogram(np.asarray([1]), np.asarray([10.2, 10.4]))
+        bins, counts = hc.get_histogram()
+        self.assertTrue(bins[-1] >= 10.4)
+        self.assertTrue(np.isclose(np.sum(counts[bins[:-1] >= 10.0]), 1))
+
+    def test_streaming_vs_merged_histogram(self):
+        hc = HistogramCollector()
+        shc = StreamingHistogramCollector()
+        for i in range(50):
+            x = np.random.randn(8, 16, 16) * (1 + i / 10)
+            hc.update(x)
+            shc.update(x)
+        bins, counts = hc.get_histogram()
+        s_bins, s_counts = shc.get_histogram()
+        # Compare the accumulated histograms at the streaming histogram's bins edges
+        cdf = np.interp(s_bins, bins, np.hstack([0, np.cumsum(counts)]))
+        s_cdf = np.hstack([0, np.cumsum(s_counts)])
+        self.assertTrue(np.max(np.abs(cdf - s_cdf)) / s_cdf[-1] < 1e-2)
+
 
 if __name__ == '__main__':
     unittest.main()
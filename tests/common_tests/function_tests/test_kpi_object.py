@@ -40,12 +40,14 @@ class TestKPIObject(unittest.TestCase):
         self.assertEqual(repr(default_kpi), f"Weights_memory: {np.inf}, "
                                             f"Activation_memory: {np.inf}, "
                                             f"Total_memory: {np.inf}, "
-                                            f"BOPS: {np.inf}")
+                                            f"BOPS: {np.inf}, "
+                                            f"Peak_activation_memory: {np.inf}")
 
         self.assertEqual(repr(custom_kpi), f"Weights_memory: {1}, "
                                            f"Activation_memory: {2}, "
                                            f"Total_memory: {3}, "
-                                           f"BOPS: {4}")
+                                           f"BOPS: {4}, "
+                                           f"Peak_activation_memory: {np.inf}")
 
     def test_kpi_hold_constraints(self):
         self.assertTrue(default_kpi.holds_constraints(custom_kpi))
@@ -0,0 +1,91 @@
+# Copyright 2023 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import itertools
+import unittest
+
+import numpy as np
+
+from model_compression_toolkit.core.common.mixed_precision.kpi_tools.kpi import KPI, KPITarget
+from model_compression_toolkit.core.common.mixed_precision.kpi_tools.kpi_aggregation_methods import MpKpiAggregation
+from model_compression_toolkit.core.common.mixed_precision.search_methods.linear_programming import \
+    mp_integer_programming_search
+
+BITWIDTHS = np.array([8, 4, 2])
+
+
+class SyntheticSearchManager:
+    """
+    A search manager of a chain of layers, each with a weights tensor and an activation tensor that are quantized
+    with the same bitwidth candidates. The weights KPI is the sum of the weights memory, and the activation KPI is
+    the maximal activation tensor memory.
+    """
+    def __init__(self, n_layers, seed=0):
+        rng = np.random.default_rng(seed)
+        self.n_layers = n_layers
+        self.weights_sizes = rng.integers(10, 1000, n_layers)
+        self.activation_sizes = rng.integers(10, 1000, n_layers)
+        self.metrics = np.sort(rng.random([n_layers, len(BITWIDTHS)]), axis=1)
+        self.metrics[:, 0] = 0
+
+        self.layer_to_bitwidth_mapping = {i: list(range(len(BITWIDTHS))) for i in range(n_layers)}
+        self.max_kpi_config = [0] * n_layers
+        self.min_kpi_config = [len(BITWIDTHS) - 1] * n_layers
+        self.compute_metric_fn = lambda config, idx=None, baseline=None: self._metric(config)
+        self.compute_metrics_fn = lambda configs, idx=None, baseline=None: np.array([self._metric(c) for c in configs])
+        self.min_kpi = {KPITarget.WEIGHTS: self.weights_sizes * BITWIDTHS[-1] / 8,
+                        KPITarget.ACTIVATION: self.activation_sizes * BITWIDTHS[-1] / 8}
+        self.compute_kpi_functions = {KPITarget.WEIGHTS: (None, MpKpiAggregation.SUM),
+                                      KPITarget.ACTIVATION: (None, MpKpiAggregation.MAX)}
+        self.non_conf_kpi_dict = None
+
+    def _metric(self, config):
+        return sum(self.metrics[i, c] for i, c in enumerate(config))
+
+    def compute_kpi_matrix(self, target):
+        sizes = self.weights_sizes if target == KPITarget.WEIGHTS else self.activation_sizes
+        kpi_matrix = np.zeros([self.n_layers, self.n_layers * len(BITWIDTHS)])
+        for i in range(self.n_layers):
+            for c, bitwidth in enumerate(BITWIDTHS):
+                kpi_matrix[i, i * len(BITWIDTHS) + c] = sizes[i] * (bitwidth - BITWIDTHS[-1]) / 8
+        return kpi_matrix
+
+    def kpi(self, config):
+        bitwidths = BITWIDTHS[list(config)]
+        return np.sum(self.weights_sizes * bitwidths / 8), np.max(self.activation_sizes * bitwidths / 8)
+
+
+class TestLpSearchFormulation(unittest.TestCase):
+
+    def test_optimal_solution(self):
+        search_manager = SyntheticSearchManager(n_layers=5)
+        max_weights, max_activation = search_manager.kpi(search_manager.max_kpi_config)
+        for weights_ratio, activation_ratio in [(0.5, 1), (0.7, 0.5), (1, 0.3), (0.3, 0.3)]:
+            target_kpi = KPI(weights_memory=max_weights * weights_ratio,
+                             activation_memory=max_activation * activation_ratio)
+            config = mp_integer_programming_search(search_manager, target_kpi)
+
+            weights, activation = search_manager.kpi(config)
+            self.assertTrue(weights <= target_kpi.weights_memory and activation <= target_kpi.activation_memory)
+
+            # Compare to the best configuration by an exhaustive search.
+            feasible_metrics = [search_manager._metric(c) for c in
+                                itertools.product(range(len(BITWIDTHS)), repeat=search_manager.n_layers)
+                                if np.all(np.array(search_manager.kpi(c)) <= [target_kpi.weights_memory,
+                                                                               target_kpi.activation_memory])]
+            self.assertTrue(np.isclose(search_manager._metric(config), min(feasible_metrics)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,110 @@
+# Copyright 2023 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import unittest
+
+import numpy as np
+
+from model_compression_toolkit.core.common import BaseNode, Graph
+from model_compression_toolkit.core.common.graph.base_graph import OutTensor
+from model_compression_toolkit.core.common.graph.edge import Edge
+from model_compression_toolkit.core.common.graph.memory_graph.compute_graph_max_cut import compute_graph_max_cut, \
+    compute_schedule_cuts
+from model_compression_toolkit.core.common.graph.memory_graph.max_cut_astar import MaxCutAstar
+from model_compression_toolkit.core.common.graph.memory_graph.memory_graph import MemoryGraph
+
+
+class SyntheticLayer:
+    pass
+
+
+def build_synthetic_graph(n_blocks, n_branches=3, branch_length=3, seed=0):
+    """
+    Build a graph of a chain of blocks, where each block splits its input to parallel branches of layers that are
+    merged at the block's output. The layers' output sizes are random.
+    """
+    rng = np.random.default_rng(seed)
+    nodes, edges = [], []
+
+    def _add_node(inputs):
+        node = BaseNode(name=f'node_{len(nodes)}',
+                        framework_attr={},
+                        input_shape=tuple(),
+                        output_shape=(1, int(rng.integers(1, 64)), 8, 8),
+                        weights={},
+                        layer_class=SyntheticLayer)
+        nodes.append(node)
+        edges.extend([Edge(n, node, 0, i) for i, n in enumerate(inputs)])
+        return node
+
+    input_node = x = _add_node([])
+    for _ in range(n_blocks):
+        branches_outputs = []
+        for _ in range(int(rng.integers(1, n_branches + 1))):
+            y = x
+            for _ in range(int(rng.integers(1, branch_length + 1))):
+                y = _add_node([y])
+            branches_outputs.append(y)
+        x = _add_node(branches_outputs)
+
+    return Graph('synthetic_graph', nodes, [input_node], [OutTensor(x, 0)], edges)
+
+
+class TestMaxCutAstarSearch(unittest.TestCase):
+
+    def _assert_valid_schedule(self, graph, schedule):
+        self.assertEqual(len(schedule), len(graph.nodes))
+        self.assertEqual(set(schedule), set(graph.nodes))
+        positions = {n: i for i, n in enumerate(schedule)}
+        for e in graph.edges:
+            self.assertLess(positions[e[0]], positions[e[1]])
+
+    def test_solve(self):
+        graph = build_synthetic_graph(n_blocks=20)
+        memory_graph = MemoryGraph(graph)
+        mc_astar = MaxCutAstar(memory_graph)
+
+        schedule, cost, cuts = mc_astar.solve(estimate_factor=mc_astar.get_init_estimate_factor(memory_graph),
+                                              iter_limit=10000)
+        self._assert_valid_schedule(graph, schedule)
+        self.assertGreaterEqual(cost, memory_graph.memory_lbound_single_op)
+        self.assertEqual(cost, compute_schedule_cuts(memory_graph, schedule)[0])
+        # The cuts are ordered by the schedule, and don't contain the tensors that are no longer needed.
+        self.assertEqual([c.op_order[-1] for c in cuts[1:len(schedule) + 1]], schedule)
+        self.assertLessEqual(max([c.memory_size() for c in cuts]), cost)
+
+        # The search is bounded by the iterations limit.
+        self.assertIsNone(mc_astar.solve(estimate_factor=mc_astar.get_init_estimate_factor(memory_graph),
+                                         iter_limit=10)[0])
+
+    def test_cut_key(self):
+        graph = build_synthetic_graph(n_blocks=3)
+        mc_astar = MaxCutAstar(MemoryGraph(graph))
+        expanded_cuts = mc_astar.expand(mc_astar.expand(mc_astar.src_cut)[0])
+        for c1 in expanded_cuts:
+            for c2 in expanded_cuts:
+                self.assertEqual(c1 == c2, mc_astar.get_cut_key(c1) == mc_astar.get_cut_key(c2))
+
+    def test_large_graph(self):
+        # The default iterations limit of the search grows with the graph.
+        graph = build_synthetic_graph(n_blocks=400)
+        self.assertGreater(len(graph.nodes), 1000)
+        memory_graph = MemoryGraph(graph)
+        schedule, cost, _ = compute_graph_max_cut(memory_graph)
+        self._assert_valid_schedule(graph, schedule)
+        self.assertEqual(cost, compute_schedule_cuts(memory_graph, schedule)[0])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,62 @@
+# Copyright 2023 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+
+
+import unittest
+import numpy as np
+
+from model_compression_toolkit.core.common.collectors.mean_collector import MeanCollector
+
+
+def transposed_mean(x, axis):
+    axis = axis % len(x.shape)
+    n = x.shape[axis]
+    transpose_index = [axis, *[i for i in range(len(x.shape)) if i != axis]]
+    return np.mean(np.reshape(np.transpose(x, transpose_index), [n, -1]), axis=-1)
+
+
+class TestMeanCollector(unittest.TestCase):
+
+    def test_exact_mean(self):
+        for axis in [1, -1]:
+            mc = MeanCollector(axis=axis, use_ema=False)
+            batches = [np.random.randn(4, 3, 5, 6).astype(np.float32) + i for i in range(20)]
+            for x in batches:
+                mc.update(x)
+            self.assertTrue(np.allclose(mc.state, transposed_mean(np.concatenate(batches), axis)))
+            self.assertTrue(mc.state.dtype == np.float64)
+
+    def test_ema_mean(self):
+        beta = 0.9
+        mc = MeanCollector(axis=1, beta=beta)
+        expected_state = 0
+        for i in range(1, 21):
+            x = np.random.randn(4, 3, 5, 6)
+            mc.update(x)
+            expected_state = beta * expected_state + (1 - beta) * transposed_mean(x, 1)
+            self.assertTrue(np.allclose(mc.state, expected_state / (1 - beta ** i)))
+
+    def test_exact_mean_scale_shift(self):
+        mc = MeanCollector(axis=-1, use_ema=False)
+        x = np.random.rand(2, 3, 4)
+        mc.update(x)
+        mean = mc.state.copy()
+        mc.scale(np.asarray([2.0]))
+        mc.shift(np.ones(4))
+        self.assertTrue(np.allclose(mc.state, 2 * mean + 1))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,113 @@
+# Copyright 2023 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import unittest
+
+import numpy as np
+
+from model_compression_toolkit.core import QuantizationConfig
+from model_compression_toolkit.core.common.representative_dataset_store import RepresentativeDatasetStore, \
+    get_representative_dataset
+
+
+class CountingDataset:
+    """
+    A representative dataset that counts the times it is iterated.
+    """
+
+    def __init__(self, n_batches, error_batch=None):
+        self.batches = [[np.random.randn(2, 3, 5).astype(np.float32), np.random.randint(0, 9, (2, 7))]
+                        for _ in range(n_batches)]
+        self.error_batch = error_batch
+        self.n_iterations = 0
+
+    def __call__(self):
+        self.n_iterations += 1
+        for i, batch in enumerate(self.batches):
+            if i == self.error_batch:
+                raise ValueError('Failed to read batch')
+            yield batch
+
+
+class TestRepresentativeDatasetStore(unittest.TestCase):
+
+    def _assert_batches_equal(self, expected, batches):
+        self.assertEqual(len(expected), len(batches))
+        for e, b in zip(expected, batches):
+            self.assertEqual(len(e), len(b))
+            for ea, ba in zip(e, b):
+                self.assertEqual(ea.dtype, ba.dtype)
+                self.assertTrue(np.array_equal(ea, ba))
+
+    def test_replay(self):
+        dataset = CountingDataset(6)
+        store = RepresentativeDatasetStore(dataset)
+
+        # The first pass reads the batches while the dataset is being stored.
+        self._assert_batches_equal(dataset.batches, list(store()))
+        self.assertEqual(len(store), 6)
+
+        # Later passes replay views into the memory-mapped buffer.
+        for _ in range(3):
+            batches = list(store())
+            self._assert_batches_equal(dataset.batches, batches)
+            self.assertTrue(all([isinstance(a.base, np.memmap) for b in batches for a in b]))
+        self.assertEqual(dataset.n_iterations, 1)
+
+    def test_partial_pass(self):
+        dataset = CountingDataset(5)
+        store = RepresentativeDatasetStore(dataset)
+
+        # A stage that reads only the first batch doesn't stop the dataset from being stored.
+        first_batch = next(store())
+        self._assert_batches_equal(dataset.batches[:1], [first_batch])
+        self.assertEqual(len(store), 5)
+        self._assert_batches_equal(dataset.batches, list(store()))
+        self.assertEqual(dataset.n_iterations, 1)
+
+    def test_concurrent_passes(self):
+        dataset = CountingDataset(4)
+        store = RepresentativeDatasetStore(dataset)
+        first, second = store(), store()
+        batches_first, batches_second = [], []
+        for b1, b2 in zip(first, second):
+            batches_first.append(b1)
+            batches_second.append(b2)
+        self._assert_batches_equal(dataset.batches, batches_first)
+        self._assert_batches_equal(dataset.batches, batches_second)
+        self.assertEqual(dataset.n_iterations, 1)
+
+    def test_empty_dataset(self):
+        store = RepresentativeDatasetStore(CountingDataset(0))
+        self.assertEqual(list(store()), [])
+        self.assertEqual(len(store), 0)
+
+    def test_dataset_error(self):
+        dataset = CountingDataset(4, error_batch=2)
+        store = RepresentativeDatasetStore(dataset)
+        with self.assertRaises(ValueError):
+            list(store())
+        with self.assertRaises(ValueError):
+            len(store)
+
+    def test_get_representative_dataset(self):
+        dataset = CountingDataset(2)
+        self.assertIs(get_representative_dataset(dataset, QuantizationConfig()), dataset)
+        store = get_representative_dataset(dataset, QuantizationConfig(store_representative_dataset=True))
+        self.assertIsInstance(store, RepresentativeDatasetStore)
+        self.assertIs(get_representative_dataset(store, QuantizationConfig(store_representative_dataset=True)), store)
+
+
+if __name__ == '__main__':
+    unittest.main()
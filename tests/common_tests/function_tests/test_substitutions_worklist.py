@@ -0,0 +1,190 @@
+# Copyright 2023 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import unittest
+
+import numpy as np
+
+from model_compression_toolkit.core import common
+from model_compression_toolkit.core.common import BaseNode, Graph
+from model_compression_toolkit.core.common.graph.base_graph import OutTensor
+from model_compression_toolkit.core.common.graph.edge import Edge
+from model_compression_toolkit.core.common.graph.graph_matchers import NodeOperationMatcher, WalkMatcher, EdgeMatcher
+from model_compression_toolkit.core.common.substitutions.apply_substitutions import substitute, \
+    substitute_until_no_match, get_substitutions_stats, reset_substitutions_stats
+
+
+class LayerA:
+    pass
+
+
+class LayerB:
+    pass
+
+
+class LayerC:
+    pass
+
+
+def build_chain_graph(n_nodes, seed=0):
+    """
+    Build a graph of a chain of nodes with random types, with a few skip connections.
+    """
+    rng = np.random.default_rng(seed)
+    types = [LayerA, LayerB, LayerC]
+    nodes = [BaseNode(f'node_{i}', {}, tuple(), (1, 4), {}, types[rng.integers(0, 3)] if i > 0 else LayerC)
+             for i in range(n_nodes)]
+    edges = [Edge(nodes[i], nodes[i + 1], 0, 0) for i in range(n_nodes - 1)]
+    edges += [Edge(nodes[i], nodes[i + 5], 0, 1) for i in range(0, n_nodes - 5, 17)]
+    return Graph('chain_graph', nodes, [nodes[0]], [OutTensor(nodes[-1], 0)], edges)
+
+
+class CollapseSubstitution(common.BaseSubstitution):
+    """
+    Collapse a pair of consecutive nodes of type LayerA into a single node of type LayerA.
+    """
+
+    def __init__(self):
+        super().__init__(matcher_instance=WalkMatcher([NodeOperationMatcher(LayerA), NodeOperationMatcher(LayerA)]))
+
+    def substitute(self, graph, matched_nodes):
+        first, second = matched_nodes
+        if len(graph.get_next_nodes(first)) > 1 or len(graph.get_prev_nodes(second)) > 1:
+            return graph
+        new_node = BaseNode(f'{first.name}+{second.name}', {}, tuple(), (1, 4), {}, LayerA)
+        graph.add_node(new_node)
+        graph.reconnect_in_edges(first, new_node)
+        graph.reconnect_out_edges(second, new_node)
+        graph.replace_output_node(second, new_node)
+        graph.remove_edge(first, second)
+        graph.remove_node(first)
+        graph.remove_node(second)
+        return graph
+
+
+class EdgeCollapseSubstitution(CollapseSubstitution):
+    """
+    Collapse a pair of consecutive nodes of type LayerA into a single node of type LayerA, matched by an edge matcher.
+    """
+
+    def __init__(self):
+        common.BaseSubstitution.__init__(self, matcher_instance=EdgeMatcher(NodeOperationMatcher(LayerA),
+                                                                            NodeOperationMatcher(LayerA)))
+
+    def substitute(self, graph, edge):
+        return super().substitute(graph, edge[:2])
+
+
+class ReplaceSubstitution(common.BaseSubstitution):
+    """
+    Replace a LayerB node by a LayerA node.
+    """
+
+    def __init__(self):
+        super().__init__(matcher_instance=NodeOperationMatcher(LayerB))
+
+    def substitute(self, graph, node):
+        new_node = BaseNode(f'{node.name}_a', {}, tuple(), (1, 4), {}, LayerA)
+        graph.add_node(new_node)
+        graph.reconnect_in_edges(node, new_node)
+        graph.reconnect_out_edges(node, new_node)
+        graph.replace_output_node(node, new_node)
+        graph.remove_node(node)
+        return graph
+
+
+def substitute_until_no_match_reference(graph, substitution):
+    # Search the whole graph again after each step
+    matched_nodes = graph.filter(substitution.matcher_instance)
+    matched_nodes_list = []
+    match_indicator = True
+    while len(matched_nodes) > 0 and match_indicator:
+        match_indicator = False
+        for matched_node in matched_nodes:
+            if matched_node not in matched_nodes_list:
+                graph = substitution.substitute(graph, matched_node)
+                matched_nodes_list.append(matched_node)
+                match_indicator = True
+                break
+        matched_nodes = graph.filter(substitution.matcher_instance)
+    return graph
+
+
+def _graph_structure(graph):
+    return [n.name for n in graph.nodes], sorted((u.name, v.name) for u, v in graph.edges())
+
+
+class TestSubstitutionsWorklist(unittest.TestCase):
+
+    def test_filter_by_node_types(self):
+        graph = build_chain_graph(50)
+        matchers = [NodeOperationMatcher(LayerA),
+                    NodeOperationMatcher(LayerA) | NodeOperationMatcher(LayerB),
+                    NodeOperationMatcher(LayerA) & NodeOperationMatcher(LayerB).logic_not(),
+                    NodeOperationMatcher(LayerA).logic_not()]
+        self.assertEqual(matchers[1].get_node_types(), {LayerA, LayerB})
+        self.assertEqual(matchers[2].get_node_types(), {LayerA})
+        self.assertIsNone(matchers[3].get_node_types())
+        for matcher in matchers:
+            self.assertEqual(graph.filter(matcher), [n for n in graph.nodes if matcher.apply(n)])
+
+        walk_matcher = WalkMatcher([NodeOperationMatcher(LayerA), NodeOperationMatcher(LayerB)])
+        matches = graph.filter(walk_matcher)
+        self.assertTrue(len(matches) > 0)
+        for m in matches:
+            self.assertEqual([n.type for n in m], [LayerA, LayerB])
+        start_nodes = list(graph.nodes)[10:20]
+        self.assertEqual(graph.filter(walk_matcher, start_nodes), [m for m in matches if m[0] in start_nodes])
+
+        edge_matcher = EdgeMatcher(NodeOperationMatcher(LayerA), NodeOperationMatcher(LayerB))
+        edges = graph.filter(edge_matcher)
+        self.assertEqual(edges, [e for e in graph.edges if edge_matcher.apply(e)])
+        self.assertEqual(graph.filter(edge_matcher, start_nodes), [e for e in edges if e[0] in start_nodes])
+
+    def test_substitute_until_no_match(self):
+        for seed in range(5):
+            graph, reference_graph = build_chain_graph(200, seed), build_chain_graph(200, seed)
+            for substitution in [CollapseSubstitution(), ReplaceSubstitution(), EdgeCollapseSubstitution()]:
+                graph = substitute_until_no_match(graph, substitution)
+                reference_graph = substitute_until_no_match_reference(reference_graph, substitution)
+                self.assertEqual(_graph_structure(graph), _graph_structure(reference_graph))
+            # The remaining pairs are the ones the substitution skips (a pair with a skip connection)
+            for first, second in graph.filter(CollapseSubstitution().matcher_instance):
+                self.assertTrue(len(graph.get_next_nodes(first)) > 1 or len(graph.get_prev_nodes(second)) > 1)
+
+    def test_substitutions_stats(self):
+        reset_substitutions_stats()
+        graph = substitute(build_chain_graph(50), [ReplaceSubstitution()])
+        graph = substitute_until_no_match(graph, CollapseSubstitution())
+        stats = get_substitutions_stats()
+        self.assertEqual(set(stats.keys()), {'ReplaceSubstitution', 'CollapseSubstitution'})
+        self.assertEqual(stats['ReplaceSubstitution'].n_runs, 1)
+        self.assertTrue(stats['ReplaceSubstitution'].n_matches > 0)
+        self.assertEqual(len(graph.filter(NodeOperationMatcher(LayerB))), 0)
+        self.assertTrue(stats['CollapseSubstitution'].match_time > 0)
+
+    def test_recording_changed_nodes(self):
+        graph = build_chain_graph(10)
+        nodes = list(graph.nodes)
+        graph.start_recording_changed_nodes()
+        graph.remove_edge(nodes[3], nodes[4])
+        new_node = BaseNode('new_node', {}, tuple(), (1, 4), {}, LayerA)
+        graph.add_edge(nodes[3], new_node, source_index=0, sink_index=0)
+        self.assertEqual(graph.stop_recording_changed_nodes(), [nodes[3], nodes[4], new_node])
+        graph.remove_edge(nodes[3], new_node)
+        self.assertIsNone(graph._changed_nodes)
+
+
+if __name__ == '__main__':
+    unittest.main()
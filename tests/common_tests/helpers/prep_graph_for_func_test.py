@@ -84,7 +84,8 @@ def prepare_graph_with_quantization_parameters(in_model,
 
     mi = ModelCollector(graph,
                         fw_impl=fw_impl,
-                        fw_info=fw_info)
+                        fw_info=fw_info,
+                        qc=qc)
 
     for i in range(10):
         mi.infer([np.random.randn(*input_shape)])
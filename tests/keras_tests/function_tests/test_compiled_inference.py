@@ -0,0 +1,132 @@
+# Copyright 2023 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import unittest
+
+import keras
+import numpy as np
+from keras import Input
+from keras.layers import Conv2D, ReLU, Add
+from mct_quantizers import KerasQuantizationWrapper, KerasActivationQuantizationHolder
+
+from model_compression_toolkit.core import MixedPrecisionQuantizationConfigV2
+from model_compression_toolkit.core.common.model_builder_mode import ModelBuilderMode
+from model_compression_toolkit.core.keras.default_framework_info import DEFAULT_KERAS_INFO
+from model_compression_toolkit.core.keras.keras_implementation import KerasImplementation
+from model_compression_toolkit.core.keras.mixed_precision.configurable_activation_quantizer import \
+    ConfigurableActivationQuantizer
+from model_compression_toolkit.core.keras.mixed_precision.configurable_weights_quantizer import \
+    ConfigurableWeightsQuantizer
+from model_compression_toolkit.target_platform_capabilities.tpc_models.imx500_tpc.latest import \
+    get_op_quantization_configs
+from tests.common_tests.helpers.prep_graph_for_func_test import prepare_graph_with_quantization_parameters
+from tests.keras_tests.tpc_keras import get_tpc_with_activation_mp_keras
+
+INPUT_SHAPE = (16, 16, 3)
+
+
+def residual_model():
+    inputs = Input(shape=INPUT_SHAPE)
+    x = ReLU()(Conv2D(4, 3, padding='same')(inputs))
+    y = ReLU()(Conv2D(4, 3, padding='same')(x))
+    outputs = Conv2D(6, 1)(Add()([x, y]))
+    return keras.Model(inputs=inputs, outputs=outputs)
+
+
+def get_activation_mp_tpc(name, _tp):
+    base_config, _ = get_op_quantization_configs()
+    return get_tpc_with_activation_mp_keras(base_config, [(8, 8), (8, 4), (4, 8), (4, 4)], name)
+
+
+def representative_dataset():
+    for _ in range(2):
+        yield [np.random.randn(*(2,) + INPUT_SHAPE).astype(np.float32)]
+
+
+class TestCompiledInference(unittest.TestCase):
+
+    def setUp(self):
+        self.fw_impl = KerasImplementation()
+        self.graph = prepare_graph_with_quantization_parameters(residual_model(), self.fw_impl, DEFAULT_KERAS_INFO,
+                                                                representative_dataset, get_activation_mp_tpc,
+                                                                (1,) + INPUT_SHAPE, mixed_precision_enabled=True)
+
+    def test_compiled_collector_model(self):
+        model, _ = self.fw_impl.model_builder(self.graph, mode=ModelBuilderMode.FLOAT,
+                                              append2output=self.graph.get_topo_sorted_nodes(),
+                                              fw_info=DEFAULT_KERAS_INFO)
+        inputs = [np.random.randn(*(2,) + INPUT_SHAPE).astype(np.float32)]
+        expected = self.fw_impl.run_model_inference(model, inputs)
+        for jit_compile in [False, True]:
+            compiled_model = self.fw_impl.compile_inference_model(model, jit_compile)
+            outputs = self.fw_impl.run_model_inference(compiled_model, inputs)
+            for e, o in zip(expected, outputs):
+                self.assertTrue(np.allclose(e.numpy(), o.numpy(), rtol=1e-5, atol=1e-5))
+            # The model is traced once for the inputs' shape.
+            self.fw_impl.run_model_inference(compiled_model, [np.random.randn(*(2,) + INPUT_SHAPE)
+                                                              .astype(np.float32)])
+            self.assertEqual(compiled_model.experimental_get_tracing_count(), 1)
+
+    def test_compiled_sensitivity_evaluation(self):
+        mp_config = MixedPrecisionQuantizationConfigV2(num_of_images=4, use_grad_based_weights=False)
+        se = self.fw_impl.get_sensitivity_evaluator(self.graph, mp_config, representative_dataset,
+                                                    DEFAULT_KERAS_INFO)
+
+        baseline_config = self.graph.get_max_candidates_config()
+        configs = []
+        for node_idx, n in enumerate(self.graph.get_configurable_sorted_nodes()):
+            for bitwidth_idx in range(len(n.candidates_quantization_cfg)):
+                config = baseline_config.copy()
+                config[node_idx] = bitwidth_idx
+                configs.append((config, node_idx))
+        expected = [se.compute_metric(config, [node_idx], baseline_config) for config, node_idx in configs]
+
+        mp_config.compile_inference_models = True
+        compiled_se = self.fw_impl.get_sensitivity_evaluator(self.graph, mp_config, representative_dataset,
+                                                             DEFAULT_KERAS_INFO)
+        # The images batches are drawn from the dataset, so both evaluators evaluate the same images.
+        compiled_se.images_batches = se.images_batches
+        compiled_se._init_baseline_tensors_list()
+        compiled = [compiled_se.compute_metric(config, [node_idx], baseline_config) for config, node_idx in configs]
+
+        # The MP model is traced once, and selects the configured candidates when it runs.
+        self.assertEqual(compiled_se.model_mp_inference.experimental_get_tracing_count(), 1)
+        self.assertTrue(len(np.unique(np.round(expected, 7))) > 1)
+        self.assertTrue(np.allclose(expected, compiled, rtol=1e-5, atol=1e-7))
+
+        # Only the compiled model's configurable quantizers select their candidate by the index variable, and the
+        # non-compiled model still gives the same metrics after the compiled one was configured.
+        self.assertFalse(any([q.select_by_index_variable for q in self._configurable_quantizers(se.model_mp)]))
+        self.assertTrue(all([q.select_by_index_variable
+                             for q in self._configurable_quantizers(compiled_se.model_mp)]))
+        self.assertTrue(np.allclose(expected,
+                                    [se.compute_metric(config, [node_idx], baseline_config)
+                                     for config, node_idx in configs], rtol=1e-6, atol=0))
+
+    @staticmethod
+    def _configurable_quantizers(model):
+        quantizers = []
+        for layer in model.layers:
+            if isinstance(layer, KerasQuantizationWrapper):
+                quantizers.extend(layer.weights_quantizers.values())
+            elif isinstance(layer, KerasActivationQuantizationHolder):
+                quantizers.append(layer.activation_holder_quantizer)
+        quantizers = [q for q in quantizers
+                      if isinstance(q, (ConfigurableWeightsQuantizer, ConfigurableActivationQuantizer))]
+        assert len(quantizers) > 0
+        return quantizers
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -454,4 +454,34 @@ class ModelGradientsSinglePointTest(ModelGradientsBasicModelTest):
                                               output_list=output_list,
                                               all_outputs_indices=[len(ipts) - 1])
 
-        self.unit_test.assertTrue(len(model_grads) == 1 and model_grads[0] == 1.0)
\ No newline at end of file
+        self.unit_test.assertTrue(len(model_grads) == 1 and model_grads[0] == 1.0)
+
+class ModelGradientsBatchedTest(ModelGradientsBasicModelTest):
+    def __init__(self, unit_test):
+        super().__init__(unit_test)
+        self.n_images = 4
+
+    def run_test(self, seed=0):
+        pytorch_impl = PytorchImplementation()
+        for model_float in [basic_model(), basic_derivative_model(), non_differentiable_node_model()]:
+            graph = prepare_graph_with_configs(model_float, PytorchImplementation(), DEFAULT_PYTORCH_INFO,
+                                               self.representative_data_gen, generate_pytorch_tpc)
+            images = to_torch_tensor(torch.randn(self.n_images, 3, 32, 32))
+
+            ipts = [n for n in graph.get_topo_sorted_nodes()]
+            output_list = [ipts[-1]]
+            grad_args = dict(graph_float=graph, interest_points=ipts, output_list=output_list,
+                             all_outputs_indices=[len(ipts) - 1], alpha=0.3)
+            expected = np.asarray([pytorch_impl.model_grad(model_input_tensors={inode: images[i:i + 1].clone()
+                                                                                for inode in graph.get_inputs()},
+                                                           **grad_args)
+                                   for i in range(self.n_images)])
+            model_grads = pytorch_impl.model_grad_per_image(model_input_tensors={inode: images.clone()
+                                                                                 for inode in graph.get_inputs()},
+                                                            **grad_args)
+
+            # The weights are approximated with different random vectors, so they are close but not equal
+            self.unit_test.assertTrue(model_grads.shape == (self.n_images, len(ipts)))
+            self.unit_test.assertTrue(np.allclose(np.sum(model_grads, axis=1), 1))
+            self.unit_test.assertTrue(np.allclose(model_grads, expected, atol=2e-2))
+
@@ -0,0 +1,109 @@
+# Copyright 2023 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import unittest
+
+import numpy as np
+import torch
+from torch.nn import Conv2d
+
+from model_compression_toolkit.core import QuantizationConfig
+from model_compression_toolkit.core.common.collectors.statistics_collector import StatsCollector
+from model_compression_toolkit.core.pytorch.default_framework_info import DEFAULT_PYTORCH_INFO
+from model_compression_toolkit.core.pytorch.pytorch_implementation import PytorchImplementation
+from model_compression_toolkit.core.pytorch.utils import torch_tensor_to_numpy
+from model_compression_toolkit.target_platform_capabilities.tpc_models.imx500_tpc.latest import generate_pytorch_tpc
+from tests.common_tests.helpers.prep_graph_for_func_test import prepare_graph_with_quantization_parameters
+
+INPUT_SHAPE = [3, 8, 8]
+
+
+class ReLUModel(torch.nn.Module):
+    def __init__(self):
+        super(ReLUModel, self).__init__()
+        self.conv1 = Conv2d(3, 4, kernel_size=3)
+        self.relu = torch.nn.ReLU()
+        self.conv2 = Conv2d(4, 5, kernel_size=1)
+
+    def forward(self, inp):
+        x = self.conv1(inp)
+        x = self.relu(x)
+        return self.conv2(x)
+
+
+def representative_dataset():
+    yield [np.random.randn(*[1] + INPUT_SHAPE).astype(np.float32)]
+
+
+class TestFrameworkStatisticsReduction(unittest.TestCase):
+
+    def _assert_same_statistics(self, sc, reduced_sc):
+        self.assertTrue(np.allclose(sc.get_mean(), reduced_sc.get_mean()))
+        self.assertTrue(np.allclose(sc.get_min_max_values(), reduced_sc.get_min_max_values()))
+        self.assertTrue(np.allclose(sc.mpcc.min_per_channel, reduced_sc.mpcc.min_per_channel))
+        bins, counts = sc.hc.get_histogram()
+        reduced_bins, reduced_counts = reduced_sc.hc.get_histogram()
+        self.assertTrue(np.allclose(bins, reduced_bins))
+        self.assertTrue(np.sum(counts) == np.sum(reduced_counts))
+        # Bins edges may differ in float32 and float64, and the streaming histogram interpolates reduced
+        # histograms, so values may only move to nearby bins.
+        self.assertTrue(np.max(np.abs(np.cumsum(counts) - np.cumsum(reduced_counts))) <= 1e-3 * np.sum(counts))
+
+    def test_reduced_statistics(self):
+        torch.manual_seed(0)
+        fw_impl = PytorchImplementation()
+        for streaming_histogram in [False, True]:
+            for axis in [1, -1]:
+                sc = StatsCollector(out_channel_axis=axis, streaming_histogram=streaming_histogram)
+                reduced_sc = StatsCollector(out_channel_axis=axis, streaming_histogram=streaming_histogram)
+                for i in range(5):
+                    x = torch.randn(4, 6, 5, 7) * (i + 1)
+                    sc.update_statistics(torch_tensor_to_numpy(x))
+                    reduced_sc.update_reduced_statistics(fw_impl.reduce_tensor_statistics(x,
+                                                                                          reduced_sc.out_channel_axis,
+                                                                                          reduced_sc.n_bins))
+                self._assert_same_statistics(sc, reduced_sc)
+
+    def test_reduced_statistics_constant_tensor(self):
+        sc = StatsCollector(out_channel_axis=1)
+        reduced_sc = StatsCollector(out_channel_axis=1)
+        x = torch.ones(2, 3, 4)
+        sc.update_statistics(torch_tensor_to_numpy(x))
+        reduced_sc.update_reduced_statistics(PytorchImplementation().reduce_tensor_statistics(x, 1, reduced_sc.n_bins))
+        self._assert_same_statistics(sc, reduced_sc)
+
+    def test_model_collector_with_reduction(self):
+        model = ReLUModel()
+        graphs = []
+        for qc in [QuantizationConfig(), QuantizationConfig(framework_statistics_reduction=True)]:
+            np.random.seed(0)
+            graphs.append(prepare_graph_with_quantization_parameters(model,
+                                                                     PytorchImplementation(),
+                                                                     DEFAULT_PYTORCH_INFO,
+                                                                     representative_dataset,
+                                                                     generate_pytorch_tpc,
+                                                                     [1] + INPUT_SHAPE,
+                                                                     qc=qc))
+
+        for n, reduced_n in zip(graphs[0].get_topo_sorted_nodes(), graphs[1].get_topo_sorted_nodes()):
+            sc = graphs[0].get_out_stats_collector(n)
+            if sc.require_collection():
+                self._assert_same_statistics(sc, graphs[1].get_out_stats_collector(reduced_n))
+            for c, reduced_c in zip(n.candidates_quantization_cfg, reduced_n.candidates_quantization_cfg):
+                self.assertTrue(c.activation_quantization_cfg.activation_quantization_params ==
+                                reduced_c.activation_quantization_cfg.activation_quantization_params)
+
+
+if __name__ == '__main__':
+    unittest.main()
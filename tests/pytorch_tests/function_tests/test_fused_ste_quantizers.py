@@ -0,0 +1,126 @@
+# Copyright 2023 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import unittest
+
+import torch
+
+from model_compression_toolkit.gptq.pytorch.quantizer.ste_rounding.symmetric_ste import \
+    pertubation_symmetric_quantizer
+from model_compression_toolkit.qat.pytorch.quantizer.quantizer_utils import ste_round, ste_clip, \
+    fix_range_to_include_zero, symmetric_quantizer, uniform_quantizer
+
+
+def reference_symmetric_quantizer(tensor_data, threshold, n_bits, sign):
+    n_pos = 2 ** (n_bits - int(sign))
+    delta_tensor = threshold / n_pos
+    input_tensor_int = ste_round(tensor_data / delta_tensor)
+    return delta_tensor * ste_clip(input_tensor_int, min_val=-int(sign) * n_pos, max_val=n_pos - 1)
+
+
+def reference_uniform_quantizer(tensor_data, range_min, range_max, n_bits):
+    a, b = fix_range_to_include_zero(range_min, range_max, n_bits)
+    delta_tensor = (b - a) / (2 ** n_bits - 1)
+    input_tensor_int = ste_round((tensor_data - a) / delta_tensor)
+    return delta_tensor * ste_clip(input_tensor_int, min_val=0, max_val=2 ** n_bits - 1) + a
+
+
+def reference_pertubation_quantizer(input_tensor, auxvar_tensor, max_tensor, num_bits, max_lsbs_change):
+    delta = max_tensor / (2 ** (num_bits - 1))
+    max_tensor_change = delta * max_lsbs_change
+    tensor_clipped = ste_clip(auxvar_tensor, min_val=-max_tensor_change, max_val=max_tensor_change) / delta
+    input_tensor_int = torch.round(input_tensor / delta).detach()
+    tensor_q = ste_round(ste_round(input_tensor_int + tensor_clipped))
+    return delta * ste_clip(tensor_q, max_val=2 ** (num_bits - 1) - 1, min_val=-2 ** (num_bits - 1))
+
+
+def count_saved_elements(quantizer, *args):
+    saved = []
+    with torch.autograd.graph.saved_tensors_hooks(lambda t: saved.append(t.numel()) or t, lambda t: t):
+        quantizer(*args)
+    return sum(saved)
+
+
+class TestFusedSTEQuantizers(unittest.TestCase):
+
+    def _compare(self, quantizer, reference_quantizer, args, kwargs):
+        """
+        Compare the outputs and the gradients of the tensor arguments of a quantizer and its reference.
+        """
+        fused_args = [a.detach().clone().requires_grad_(a.requires_grad) if isinstance(a, torch.Tensor) else a for a in args]
+        q = quantizer(*fused_args, **kwargs)
+        ref_q = reference_quantizer(*args, **kwargs)
+        self.assertTrue(torch.allclose(q, ref_q, atol=1e-6))
+
+        grad_output = torch.randn(q.shape)
+        (q * grad_output).sum().backward()
+        (ref_q * grad_output).sum().backward()
+        for a, ref_a in zip(fused_args, args):
+            if isinstance(a, torch.Tensor) and a.requires_grad:
+                self.assertTrue(torch.allclose(a.grad, ref_a.grad, rtol=1e-4, atol=1e-4))
+
+    def test_symmetric_quantizer(self):
+        for sign in [True, False]:
+            x = (3 * torch.randn(8, 4, 5, 5)).requires_grad_()
+            threshold = torch.tensor([2.0], requires_grad=True)
+            self._compare(symmetric_quantizer, reference_symmetric_quantizer, [x, threshold, 8], {'sign': sign})
+
+            # Per-channel threshold
+            x = (3 * torch.randn(8, 4, 5, 5)).requires_grad_()
+            threshold = (torch.rand(8, 1, 1, 1) + 0.5).requires_grad_()
+            self._compare(symmetric_quantizer, reference_symmetric_quantizer, [x, threshold, 4], {'sign': sign})
+
+    def test_uniform_quantizer(self):
+        x = (3 * torch.randn(16, 32)).requires_grad_()
+        range_min = torch.tensor([-1.3], requires_grad=True)
+        range_max = torch.tensor([2.2], requires_grad=True)
+        self._compare(uniform_quantizer, reference_uniform_quantizer, [x, range_min, range_max, 8], {})
+
+        # Per-channel ranges, including ranges that don't include zero.
+        x = (3 * torch.randn(4, 32)).requires_grad_()
+        range_min = torch.tensor([[-1.3], [0.5], [-3.0], [-0.2]], requires_grad=True)
+        range_max = torch.tensor([[2.2], [2.0], [-1.0], [0.1]], requires_grad=True)
+        self._compare(uniform_quantizer, reference_uniform_quantizer, [x, range_min, range_max, 3], {})
+
+    def test_pertubation_quantizer(self):
+        x = torch.randn(8, 4, 3, 3)
+        auxvar = (0.02 * torch.randn(8, 4, 3, 3)).requires_grad_()
+        max_tensor = (torch.rand(8, 1, 1, 1) + 2.0).requires_grad_()
+
+        def quantizer(input_tensor, auxvar_tensor, max_tensor, num_bits, max_lsbs_change):
+            return pertubation_symmetric_quantizer(input_tensor, auxvar_tensor, max_tensor, num_bits, signed=True,
+                                                   power_of_two=False, max_lsbs_change=max_lsbs_change)
+
+        self._compare(quantizer, reference_pertubation_quantizer, [x, auxvar, max_tensor, 4, 1], {})
+
+    def test_saved_tensors(self):
+        x = torch.randn(8, 4, 5, 5, requires_grad=True)
+
+        # A frozen threshold does not require saving anything for the backward pass.
+        threshold = torch.tensor([2.0])
+        self.assertEqual(count_saved_elements(symmetric_quantizer, x, threshold, 8, True), 0)
+
+        # A trainable threshold requires saving only the rounding residual.
+        threshold.requires_grad_()
+        self.assertEqual(count_saved_elements(symmetric_quantizer, x, threshold, 8, True), x.numel())
+        self.assertTrue(count_saved_elements(reference_symmetric_quantizer, x, threshold, 8, True) >= 2 * x.numel())
+
+        range_min = torch.tensor([-1.0], requires_grad=True)
+        range_max = torch.tensor([1.0], requires_grad=True)
+        n_saved = count_saved_elements(uniform_quantizer, x, range_min, range_max, 8)
+        self.assertTrue(x.numel() <= n_saved < x.numel() + 16)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,85 @@
+# Copyright 2023 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import unittest
+from unittest.mock import patch
+
+import numpy as np
+import torch
+from torch import nn
+
+from model_compression_toolkit.core import CoreConfig, QuantizationConfig
+from model_compression_toolkit.gptq import get_pytorch_gptq_config, \
+    pytorch_gradient_post_training_quantization_experimental
+from model_compression_toolkit.gptq.common.gptq_float_outputs_cache import FloatOutputsCache
+from model_compression_toolkit.target_platform_capabilities.tpc_models.imx500_tpc.latest import generate_pytorch_tpc
+from tests.common_tests.helpers.generate_test_tp_model import generate_test_tp_model
+
+N_BATCHES = 4
+N_EPOCHS = 3
+
+
+class TwoOutputsModel(nn.Module):
+    def __init__(self):
+        super(TwoOutputsModel, self).__init__()
+        self.conv1 = nn.Conv2d(3, 8, kernel_size=3)
+        self.relu = nn.ReLU()
+        self.conv2 = nn.Conv2d(8, 4, kernel_size=3)
+
+    def forward(self, inp):
+        x = self.relu(self.conv1(inp))
+        return x, self.conv2(x)
+
+
+class TestGPTQFloatOutputsCachePytorch(unittest.TestCase):
+
+    def _run_gptq(self, float_model, dataset, **cache_kwargs):
+        torch.manual_seed(0)
+        gptq_config = get_pytorch_gptq_config(n_epochs=N_EPOCHS)
+        for k, v in cache_kwargs.items():
+            setattr(gptq_config, k, v)
+        core_config = CoreConfig(quantization_config=QuantizationConfig(weights_bias_correction=False))
+        tpc = generate_pytorch_tpc(name="gptq_cache_test", tp_model=generate_test_tp_model({}))
+        quant_model, _ = pytorch_gradient_post_training_quantization_experimental(
+            model=float_model,
+            representative_data_gen=lambda: iter(dataset),
+            core_config=core_config,
+            gptq_config=gptq_config,
+            target_platform_capabilities=tpc)
+        return quant_model
+
+    def _outputs(self, model, x):
+        return [o.detach().cpu().numpy() for o in model(torch.from_numpy(x))]
+
+    def test_cached_float_outputs(self):
+        dataset = [[np.random.randn(2, 3, 12, 12).astype(np.float32)] for _ in range(N_BATCHES)]
+        float_model = TwoOutputsModel()
+        x = np.random.randn(2, 3, 12, 12).astype(np.float32)
+
+        expected = self._outputs(self._run_gptq(float_model, dataset), x)
+
+        # With no memory budget all the outputs are spilled to the file.
+        for memory_budget in [2 ** 30, 0]:
+            with patch.object(FloatOutputsCache, 'put', autospec=True, side_effect=FloatOutputsCache.put) as put_mock:
+                quant_model = self._run_gptq(float_model, dataset, cache_float_outputs=True,
+                                             float_outputs_cache_memory=memory_budget)
+                # The float model is inferred once per batch, and not once per batch in each epoch.
+                self.assertEqual(put_mock.call_count, N_BATCHES)
+
+            for e, c in zip(expected, self._outputs(quant_model, x)):
+                self.assertTrue(np.allclose(e, c, rtol=1e-5, atol=1e-6))
+
+
+if __name__ == '__main__':
+    unittest.main()
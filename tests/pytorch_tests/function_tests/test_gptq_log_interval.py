@@ -0,0 +1,100 @@
+# Copyright 2023 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import unittest
+from unittest.mock import patch
+
+import numpy as np
+import torch
+from torch import nn
+
+from model_compression_toolkit.core import CoreConfig, QuantizationConfig
+from model_compression_toolkit.gptq import get_pytorch_gptq_config, \
+    pytorch_gradient_post_training_quantization_experimental
+from model_compression_toolkit.target_platform_capabilities.tpc_models.imx500_tpc.latest import generate_pytorch_tpc
+from tests.common_tests.helpers.generate_test_tp_model import generate_test_tp_model
+
+N_BATCHES = 5
+N_EPOCHS = 2
+
+
+class ConvModel(nn.Module):
+    def __init__(self):
+        super(ConvModel, self).__init__()
+        self.conv1 = nn.Conv2d(3, 8, kernel_size=3)
+        self.relu = nn.ReLU()
+        self.conv2 = nn.Conv2d(8, 4, kernel_size=3)
+
+    def forward(self, inp):
+        return self.conv2(self.relu(self.conv1(inp)))
+
+
+class TestGPTQLogInterval(unittest.TestCase):
+
+    def _run_gptq(self, float_model, dataset, log_interval):
+        torch.manual_seed(0)
+        logged = []
+        gptq_config = get_pytorch_gptq_config(n_epochs=N_EPOCHS)
+        gptq_config.log_interval = log_interval
+        gptq_config.log_function = lambda loss, grads, params: logged.append((loss, grads, params))
+        core_config = CoreConfig(quantization_config=QuantizationConfig(weights_bias_correction=False))
+        tpc = generate_pytorch_tpc(name="gptq_log_interval_test", tp_model=generate_test_tp_model({}))
+        pytorch_gradient_post_training_quantization_experimental(model=float_model,
+                                                                 representative_data_gen=lambda: iter(dataset),
+                                                                 core_config=core_config,
+                                                                 gptq_config=gptq_config,
+                                                                 target_platform_capabilities=tpc)
+        return logged
+
+    def test_log_interval(self):
+        dataset = [[np.random.randn(2, 3, 12, 12).astype(np.float32)] for _ in range(N_BATCHES)]
+        float_model = ConvModel()
+        n_steps = N_BATCHES * N_EPOCHS
+
+        per_step = self._run_gptq(float_model, dataset, log_interval=1)
+        self.assertEqual(len(per_step), n_steps)
+        step_losses = np.array([loss for loss, _, _ in per_step])
+        for _, grads, params in per_step:
+            self.assertTrue(all([isinstance(g, np.ndarray) for g in grads]))
+            self.assertTrue(all([isinstance(p, np.ndarray) for p in params]))
+
+        # The losses are logged once every 3 steps (and once for the remaining step), with the mean of their steps.
+        log_interval = 3
+        intervals = self._run_gptq(float_model, dataset, log_interval=log_interval)
+        self.assertEqual(len(intervals), int(np.ceil(n_steps / log_interval)))
+        expected = [np.mean(step_losses[i:i + log_interval]) for i in range(0, n_steps, log_interval)]
+        self.assertTrue(np.allclose([loss for loss, _, _ in intervals], expected, rtol=1e-5))
+
+    def test_logged_gradients(self):
+        dataset = [[np.random.randn(2, 3, 12, 12).astype(np.float32)] for _ in range(N_BATCHES)]
+        float_model = ConvModel()
+        zero_grad = torch.optim.Optimizer.zero_grad
+
+        def zero_grad_in_place(optimizer, set_to_none=False):
+            # The gradients are zeroed in-place (the default before torch 2.0).
+            zero_grad(optimizer, set_to_none=False)
+
+        # The logged gradients are those of the interval's last step (including the remaining steps' interval),
+        # so they're not zeroed by the following steps.
+        with patch.object(torch.optim.Optimizer, 'zero_grad', zero_grad_in_place):
+            for log_interval in [1, 3]:
+                logged = self._run_gptq(float_model, dataset, log_interval=log_interval)
+                self.assertTrue(len(logged) > 0)
+                for _, grads, _ in logged:
+                    self.assertTrue(len(grads) > 0)
+                    self.assertTrue(np.linalg.norm(np.concatenate([g.flatten() for g in grads])) > 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,85 @@
+# Copyright 2023 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import unittest
+
+import numpy as np
+import torch
+
+from model_compression_toolkit.core.common.model_builder_mode import ModelBuilderMode
+from model_compression_toolkit.core.pytorch.default_framework_info import DEFAULT_PYTORCH_INFO
+from model_compression_toolkit.core.pytorch.pytorch_implementation import PytorchImplementation
+from model_compression_toolkit.core.pytorch.utils import to_torch_tensor
+from model_compression_toolkit.target_platform_capabilities.tpc_models.imx500_tpc.latest import generate_pytorch_tpc
+from tests.common_tests.helpers.prep_graph_for_func_test import prepare_graph_with_quantization_parameters
+
+INPUT_SHAPE = [2, 3, 16, 16]
+
+
+class DropoutModel(torch.nn.Module):
+    def __init__(self):
+        super(DropoutModel, self).__init__()
+        self.conv1 = torch.nn.Conv2d(3, 8, kernel_size=3, padding=1)
+        self.dropout = torch.nn.Dropout(0.5)
+        self.conv2 = torch.nn.Conv2d(8, 4, kernel_size=3)
+
+    def forward(self, x):
+        return self.conv2(self.dropout(torch.relu(self.conv1(x))))
+
+
+def representative_dataset():
+    yield [np.random.randn(*INPUT_SHAPE).astype(np.float32)]
+
+
+class TestInferenceMode(unittest.TestCase):
+
+    def setUp(self):
+        self.fw_impl = PytorchImplementation()
+        graph = prepare_graph_with_quantization_parameters(DropoutModel(), self.fw_impl, DEFAULT_PYTORCH_INFO,
+                                                           representative_dataset, generate_pytorch_tpc, INPUT_SHAPE)
+        self.model, _ = self.fw_impl.model_builder(graph, mode=ModelBuilderMode.FLOAT,
+                                                   append2output=graph.get_topo_sorted_nodes(),
+                                                   fw_info=DEFAULT_PYTORCH_INFO)
+        self.inputs = [np.random.randn(*INPUT_SHAPE).astype(np.float32)]
+
+    def test_run_model_inference(self):
+        self.model.train()
+        outputs = self.fw_impl.run_model_inference(self.model, self.inputs)
+        self.assertFalse(self.model.training)
+        # The first output is the input placeholder's output, which is the input tensor itself.
+        for o in outputs[1:]:
+            self.assertTrue(o.is_inference())
+            self.assertIsNone(o.grad_fn)
+
+        # The model runs in eval mode, so the inference is deterministic.
+        for o1, o2 in zip(outputs, self.fw_impl.run_model_inference(self.model, self.inputs)):
+            self.assertTrue(torch.equal(o1, o2))
+
+        # Gradient-based callers get outputs that are attached to the autograd graph.
+        outputs_with_grad = self.fw_impl.run_model_inference(self.model, self.inputs, requires_grad=True)
+        self.assertIsNotNone(outputs_with_grad[-1].grad_fn)
+        outputs_with_grad[-1].sum().backward()
+        self.assertIsNotNone(next(self.model.parameters()).grad)
+        for o1, o2 in zip(outputs, outputs_with_grad):
+            self.assertTrue(torch.allclose(o1, o2.detach()))
+
+    def test_sensitivity_eval_inference(self):
+        inputs = to_torch_tensor(self.inputs)
+        outputs = self.fw_impl.sensitivity_eval_inference(self.model, inputs)
+        self.assertTrue(all([o.is_inference() for o in outputs[1:]]))
+        self.assertIsNotNone(self.fw_impl.sensitivity_eval_inference(self.model, inputs, requires_grad=True)[-1].grad_fn)
+
+
+if __name__ == '__main__':
+    unittest.main()
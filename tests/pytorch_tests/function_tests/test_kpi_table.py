@@ -0,0 +1,95 @@
+# Copyright 2023 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import unittest
+from unittest.mock import Mock
+
+import numpy as np
+
+from model_compression_toolkit.core.common.mixed_precision.kpi_tools.kpi import KPI, KPITarget
+from model_compression_toolkit.core.common.mixed_precision.kpi_tools.kpi_functions_mapping import \
+    kpi_functions_mapping
+from model_compression_toolkit.core.common.mixed_precision.mixed_precision_search_manager import \
+    MixedPrecisionSearchManager
+from model_compression_toolkit.core.pytorch.default_framework_info import DEFAULT_PYTORCH_INFO
+from model_compression_toolkit.core.pytorch.pytorch_implementation import PytorchImplementation
+from model_compression_toolkit.target_platform_capabilities.tpc_models.imx500_tpc.latest import generate_pytorch_tpc, \
+    get_op_quantization_configs
+from tests.common_tests.helpers.generate_test_tp_model import generate_tp_model_with_activation_mp
+from tests.common_tests.helpers.prep_graph_for_func_test import prepare_graph_with_quantization_parameters
+from tests.pytorch_tests.function_tests.test_sensitivity_prefix_cache import ResidualModel, representative_dataset, \
+    INPUT_SHAPE
+
+TARGETS = [KPITarget.WEIGHTS, KPITarget.ACTIVATION, KPITarget.TOTAL]
+
+
+def get_weights_activation_mp_tpc(name, _tp):
+    base_config, _ = get_op_quantization_configs()
+    return generate_pytorch_tpc(name, generate_tp_model_with_activation_mp(base_config,
+                                                                           [(8, 8), (8, 4), (4, 8), (4, 4),
+                                                                            (2, 8), (2, 4)]))
+
+
+class TestKPITable(unittest.TestCase):
+
+    def _get_search_managers(self):
+        fw_impl = PytorchImplementation()
+        graph = prepare_graph_with_quantization_parameters(ResidualModel(),
+                                                           fw_impl,
+                                                           DEFAULT_PYTORCH_INFO,
+                                                           representative_dataset,
+                                                           get_weights_activation_mp_tpc,
+                                                           [1] + INPUT_SHAPE,
+                                                           mixed_precision_enabled=True)
+        target_kpi = KPI(weights_memory=1, activation_memory=1, total_memory=1)
+        kpi_functions = {target: kpi_functions_mapping[target] for target in TARGETS}
+        search_manager = MixedPrecisionSearchManager(graph, DEFAULT_PYTORCH_INFO, fw_impl, Mock(), kpi_functions,
+                                                     target_kpi)
+        # A search manager that computes the KPIs by the KPI methods
+        reference_search_manager = MixedPrecisionSearchManager(graph, DEFAULT_PYTORCH_INFO, fw_impl, Mock(),
+                                                               kpi_functions, target_kpi)
+        reference_search_manager.kpi_tables = {}
+        reference_search_manager.min_kpi = reference_search_manager.compute_min_kpis()
+        return search_manager, reference_search_manager
+
+    def test_kpi_table(self):
+        search_manager, reference_search_manager = self._get_search_managers()
+        self.assertEqual(set(search_manager.kpi_tables.keys()), set(TARGETS))
+
+        for target in TARGETS:
+            self.assertTrue(np.array_equal(search_manager.min_kpi[target], reference_search_manager.min_kpi[target]))
+            self.assertTrue(np.array_equal(search_manager.compute_kpi_matrix(target),
+                                           reference_search_manager.compute_kpi_matrix(target)))
+
+        rng = np.random.default_rng(0)
+        n_candidates = [len(n.candidates_quantization_cfg) for n in
+                        search_manager.graph.get_configurable_sorted_nodes()]
+        base_config = list(rng.integers(0, n_candidates))
+        for _ in range(10):
+            config = list(rng.integers(0, n_candidates))
+            expected = reference_search_manager.compute_kpi_for_config(config).get_kpi_dict()
+            self.assertEqual(search_manager.compute_kpi_for_config(config).get_kpi_dict(), expected)
+            self.assertEqual(search_manager.compute_kpi_for_config(config, base_config=base_config).get_kpi_dict(),
+                             expected)
+
+            # A configuration that differs from the base configuration in a single node.
+            node_idx = rng.integers(0, len(n_candidates))
+            config = search_manager.replace_config_in_index(base_config, node_idx,
+                                                            rng.integers(0, n_candidates[node_idx]))
+            self.assertEqual(search_manager.compute_kpi_for_config(config, base_config=base_config).get_kpi_dict(),
+                             reference_search_manager.compute_kpi_for_config(config).get_kpi_dict())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,133 @@
+# Copyright 2023 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import unittest
+from unittest.mock import patch
+
+import numpy as np
+
+from model_compression_toolkit.constants import BITS_TO_BYTES
+from model_compression_toolkit.core import MixedPrecisionQuantizationConfigV2
+from model_compression_toolkit.core.common.graph.memory_graph import compute_graph_max_cut
+from model_compression_toolkit.core.common.graph.memory_graph.compute_graph_max_cut import \
+    get_graph_memory_schedule
+from model_compression_toolkit.core.common.mixed_precision.kpi_tools.kpi import KPI, KPITarget
+from model_compression_toolkit.core.common.mixed_precision.kpi_tools.kpi_functions_mapping import \
+    get_kpi_functions
+from model_compression_toolkit.core.common.mixed_precision.kpi_tools.kpi_methods import MpKpiMetric
+from model_compression_toolkit.core.common.mixed_precision.mixed_precision_search_facade import search_bit_width
+from model_compression_toolkit.core.common.model_builder_mode import ModelBuilderMode
+from model_compression_toolkit.core.pytorch.default_framework_info import DEFAULT_PYTORCH_INFO
+from model_compression_toolkit.core.pytorch.pytorch_implementation import PytorchImplementation
+from tests.common_tests.helpers.prep_graph_for_func_test import prepare_graph_with_quantization_parameters
+from tests.pytorch_tests.function_tests.test_sensitivity_prefix_cache import ResidualModel, get_activation_mp_tpc, \
+    representative_dataset, INPUT_SHAPE
+
+
+class TestPeakActivationKPI(unittest.TestCase):
+
+    def setUp(self):
+        self.fw_impl = PytorchImplementation()
+        self.graph = prepare_graph_with_quantization_parameters(ResidualModel(),
+                                                                self.fw_impl,
+                                                                DEFAULT_PYTORCH_INFO,
+                                                                representative_dataset,
+                                                                get_activation_mp_tpc,
+                                                                [1] + INPUT_SHAPE,
+                                                                mixed_precision_enabled=True)
+
+    def _peak_activation(self, config):
+        return max(MpKpiMetric.PEAK_ACTIVATION_MEMORY(config, self.graph, DEFAULT_PYTORCH_INFO, self.fw_impl))
+
+    def test_memory_schedule(self):
+        schedule, max_cut_size, cuts = get_graph_memory_schedule(self.graph)
+        self.assertEqual(set(schedule), set(self.graph.nodes))
+        positions = {n: i for i, n in enumerate(schedule)}
+        for e in self.graph.edges:
+            self.assertLess(positions[e[0]], positions[e[1]])
+        self.assertEqual(len(cuts), len(schedule))
+        self.assertEqual(max([c.memory_size() for c in cuts]), max_cut_size)
+        # The schedule is stored on the graph, until the graph's structure changes.
+        self.assertIs(self.graph.get_memory_schedule()[0], schedule)
+        self.assertIs(get_graph_memory_schedule(self.graph)[0], schedule)
+        snapshot = self.graph.snapshot()
+        self.assertEqual([n.name for n in snapshot.get_memory_schedule()[0]], [n.name for n in schedule])
+        self.assertEqual(set(snapshot.get_memory_schedule()[0]), set(snapshot.nodes))
+        last_node = schedule[-1]
+        in_edges = self.graph.incoming_edges(last_node)
+        self.graph.remove_edge(in_edges[0].source_node, last_node)
+        self.assertIsNone(self.graph.get_memory_schedule())
+        self.graph.add_edge(in_edges[0].source_node, last_node, **in_edges[0].get_attributes())
+        self.assertEqual(get_graph_memory_schedule(self.graph)[0], schedule)
+        self.assertIsNot(get_graph_memory_schedule(self.graph)[0], schedule)
+
+    def test_peak_activation_metric(self):
+        _, _, cuts = get_graph_memory_schedule(self.graph)
+        config = self.graph.get_min_candidates_config()
+        conf_nodes = self.graph.get_configurable_sorted_nodes()
+        nodes_cfg = {n.name: n.candidates_quantization_cfg[0].activation_quantization_cfg for n in self.graph.nodes}
+        nodes_cfg.update({n.name: n.candidates_quantization_cfg[c].activation_quantization_cfg
+                          for n, c in zip(conf_nodes, config)})
+
+        expected = [sum([t.total_size * nodes_cfg[t.node_name].activation_n_bits / BITS_TO_BYTES
+                         for t in c.mem_elements.elements
+                         if nodes_cfg[t.node_name].enable_activation_quantization])
+                    for c in cuts]
+        kpi_vector = MpKpiMetric.PEAK_ACTIVATION_MEMORY(config, self.graph, DEFAULT_PYTORCH_INFO, self.fw_impl)
+        self.assertTrue(np.allclose(kpi_vector, expected))
+        self.assertLess(self._peak_activation(config),
+                        self._peak_activation(self.graph.get_max_candidates_config()))
+
+        # Non-configurable nodes are included in the configurable nodes' KPI vector.
+        self.assertEqual(len(MpKpiMetric.PEAK_ACTIVATION_MEMORY([], self.graph, DEFAULT_PYTORCH_INFO,
+                                                                self.fw_impl)), 0)
+
+    def test_peak_activation_target(self):
+        self.assertNotIn(KPITarget.PEAK_ACTIVATION, get_kpi_functions(KPI(activation_memory=1)))
+        self.assertIn(KPITarget.PEAK_ACTIVATION, get_kpi_functions(KPI(peak_activation_memory=1)))
+
+        min_peak = self._peak_activation(self.graph.get_min_candidates_config())
+        max_peak = self._peak_activation(self.graph.get_max_candidates_config())
+        target_kpi = KPI(peak_activation_memory=(min_peak + max_peak) / 2)
+        self.graph.set_memory_schedule(None)
+        with patch.object(compute_graph_max_cut, 'compute_graph_max_cut',
+                          wraps=compute_graph_max_cut.compute_graph_max_cut) as max_cut_search:
+            config = search_bit_width(self.graph,
+                                      DEFAULT_PYTORCH_INFO,
+                                      self.fw_impl,
+                                      target_kpi,
+                                      MixedPrecisionQuantizationConfigV2(num_of_images=2,
+                                                                         use_grad_based_weights=False),
+                                      representative_dataset)
+            # The search stores the schedule on the searched graph, so it is not computed again after the search.
+            self.assertIsNotNone(self.graph.get_memory_schedule())
+            get_graph_memory_schedule(self.graph)
+        self.assertEqual(max_cut_search.call_count, 1)
+        self.assertLessEqual(self._peak_activation(config), target_kpi.peak_activation_memory)
+        self.assertTrue(target_kpi.holds_constraints(KPI(peak_activation_memory=self._peak_activation(config))))
+
+    def test_scheduled_nodes(self):
+        schedule = get_graph_memory_schedule(self.graph)[0]
+        self.graph.user_info.memory_schedule = [n.name for n in reversed(schedule)]
+        # An invalid schedule is ignored
+        self.assertEqual(self.graph.get_scheduled_nodes(), self.graph.get_topo_sorted_nodes())
+
+        self.graph.user_info.memory_schedule = [n.name for n in schedule]
+        self.assertEqual(self.graph.get_scheduled_nodes(), schedule)
+        model = self.fw_impl.model_builder(self.graph, mode=ModelBuilderMode.FLOAT, fw_info=DEFAULT_PYTORCH_INFO)[0]
+        self.assertEqual(model.node_sort, schedule)
+
+
+if __name__ == '__main__':
+    unittest.main()
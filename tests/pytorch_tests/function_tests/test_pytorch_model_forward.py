@@ -0,0 +1,151 @@
+# Copyright 2023 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import unittest
+
+import numpy as np
+import torch
+
+from model_compression_toolkit.core.common.mixed_precision.bit_width_setter import set_bit_widths
+from model_compression_toolkit.core.common.model_builder_mode import ModelBuilderMode
+from model_compression_toolkit.core.pytorch.default_framework_info import DEFAULT_PYTORCH_INFO
+from model_compression_toolkit.core.pytorch.pytorch_implementation import PytorchImplementation
+from model_compression_toolkit.core.pytorch.utils import to_torch_tensor
+from model_compression_toolkit.target_platform_capabilities.tpc_models.imx500_tpc.latest import generate_pytorch_tpc
+from tests.common_tests.helpers.prep_graph_for_func_test import prepare_graph_with_quantization_parameters
+
+INPUT_SHAPE = [3, 8, 8]
+
+
+class MultiOutputModel(torch.nn.Module):
+    def __init__(self):
+        super(MultiOutputModel, self).__init__()
+        self.conv1 = torch.nn.Conv2d(3, 4, kernel_size=3, padding=1)
+        self.conv2 = torch.nn.Conv2d(3, 4, kernel_size=1)
+        self.conv3 = torch.nn.Conv2d(8, 6, kernel_size=1)
+        self.relu = torch.nn.ReLU()
+
+    def forward(self, x):
+        a = self.relu(self.conv1(x))
+        b = self.conv2(x)
+        c = self.conv3(torch.cat([a, b], dim=1))
+        return c, a + b
+
+
+def representative_dataset():
+    yield [np.random.randn(*[2] + INPUT_SHAPE).astype(np.float32)]
+
+
+class TestPytorchModelForward(unittest.TestCase):
+
+    def setUp(self):
+        self.fw_impl = PytorchImplementation()
+        self.model = MultiOutputModel()
+        graph = prepare_graph_with_quantization_parameters(self.model,
+                                                           self.fw_impl,
+                                                           DEFAULT_PYTORCH_INFO,
+                                                           representative_dataset,
+                                                           generate_pytorch_tpc,
+                                                           [1] + INPUT_SHAPE)
+        self.graph = set_bit_widths(mixed_precision_enable=False, graph=graph)
+        self.inputs = to_torch_tensor(next(representative_dataset()))
+
+    def _build(self, mode, append2output=None, **kwargs):
+        return self.fw_impl.model_builder(self.graph, mode=mode, append2output=append2output,
+                                          fw_info=DEFAULT_PYTORCH_INFO, **kwargs)[0]
+
+    def _assert_outputs_equal(self, outputs, expected_outputs):
+        self.assertEqual(len(outputs), len(expected_outputs))
+        for o, e in zip(outputs, expected_outputs):
+            self.assertTrue(torch.equal(o, e))
+
+    def test_float_model_forward(self):
+        float_model = self._build(ModelBuilderMode.FLOAT)
+        with torch.no_grad():
+            expected_outputs = self.model.to(self.inputs[0].device)(*self.inputs)
+            outputs = float_model(*self.inputs)
+        self.assertEqual(len(outputs), len(expected_outputs))
+        for o, e in zip(outputs, expected_outputs):
+            self.assertTrue(torch.allclose(o, e, atol=1e-5))
+
+    def test_quantized_model_forward_with_cache(self):
+        quantized_model = self._build(ModelBuilderMode.QUANTIZED)
+        with torch.no_grad():
+            outputs = quantized_model(*self.inputs)
+            cached_outputs, cache = quantized_model.forward_with_cache(*self.inputs)
+            self._assert_outputs_equal(cached_outputs, outputs)
+            self.assertEqual(set(cache[0].keys()), {n.name for n in quantized_model.node_sort})
+
+            # Running from any node with the cache of the previous nodes gives the same outputs.
+            for n in quantized_model.node_sort:
+                self._assert_outputs_equal(quantized_model.forward_from_cache(cache, [n.name], *self.inputs),
+                                           outputs)
+
+    def test_append2output(self):
+        out_nodes = [n for n in self.graph.get_topo_sorted_nodes() if n.type == torch.nn.Conv2d]
+        model = self._build(ModelBuilderMode.FLOAT, append2output=out_nodes)
+        with torch.no_grad():
+            outputs = model(*self.inputs)
+            _, cache = model.forward_with_cache(*self.inputs)
+        self._assert_outputs_equal(outputs, [cache[0][n.name][0] for n in out_nodes])
+
+    def test_release_intermediate_tensors(self):
+        float_model = self._build(ModelBuilderMode.FLOAT)
+        self.assertTrue(float_model.release_intermediate_tensors)
+        with torch.no_grad():
+            output_tensors, _ = float_model._run_nodes(self.inputs, release=True)
+            outputs = float_model(*self.inputs)
+
+        # Only the output tensors of the model's outputs are kept to the end of the inference.
+        self.assertEqual([i for i, t in enumerate(output_tensors) if t is not None],
+                         sorted(float_model.output_slots))
+
+        # Each intermediate tensor is released after its last consumer.
+        released_after = {slot: i for i, slots in enumerate(float_model.release_schedule) for slot in slots}
+        for i, n in enumerate(float_model.node_sort):
+            if i not in float_model.output_slots:
+                consumers = [float_model.node_sort.index(oe.sink_node) for oe in self.graph.out_edges(n)]
+                self.assertEqual(released_after[i], max(consumers, default=i))
+
+    def test_keep_intermediate_tensors(self):
+        # The flag is passed through the model builders of all modes, and only changes which tensors are kept.
+        for mode in [ModelBuilderMode.FLOAT, ModelBuilderMode.QUANTIZED, ModelBuilderMode.MIXEDPRECISION]:
+            released_model = self._build(mode)
+            kept_model = self._build(mode, release_intermediate_tensors=False)
+            self.assertTrue(released_model.release_intermediate_tensors)
+            self.assertFalse(kept_model.release_intermediate_tensors)
+            with torch.no_grad():
+                kept_model.load_state_dict(released_model.state_dict())
+                outputs = released_model(*self.inputs)
+                expected_outputs = kept_model(*self.inputs)
+                output_tensors, _ = kept_model._run_nodes(self.inputs,
+                                                          release=kept_model.release_intermediate_tensors)
+            self._assert_outputs_equal(outputs, expected_outputs)
+            self.assertTrue(all(t is not None for t in output_tensors))
+
+    def test_replaced_module(self):
+        # Modules that are replaced after the model is built (for example, by the exporter) are used in inference.
+        float_model = self._build(ModelBuilderMode.FLOAT)
+        conv3_name = [n.name for n in float_model.node_sort if n.type == torch.nn.Conv2d][-1]
+        replacement = torch.nn.Conv2d(8, 6, kernel_size=1).to(self.inputs[0].device)
+        torch.nn.init.zeros_(replacement.weight)
+        torch.nn.init.ones_(replacement.bias)
+        setattr(float_model, conv3_name, replacement)
+        with torch.no_grad():
+            outputs = float_model(*self.inputs)
+        self.assertTrue(torch.equal(outputs[0], torch.ones_like(outputs[0])))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,101 @@
+# Copyright 2023 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import copy
+import unittest
+from unittest.mock import patch
+
+import numpy as np
+import torch
+from torch.nn import Conv2d
+
+from model_compression_toolkit.core.common.quantization.quantization_params_generation import qparams_computation
+from model_compression_toolkit.core.common.quantization.quantization_params_generation.qparams_computation import \
+    calculate_quantization_params
+from model_compression_toolkit.core.pytorch.default_framework_info import DEFAULT_PYTORCH_INFO
+from model_compression_toolkit.core.pytorch.pytorch_implementation import PytorchImplementation
+from model_compression_toolkit.target_platform_capabilities.tpc_models.imx500_tpc.latest import generate_pytorch_tpc, \
+    get_op_quantization_configs
+from tests.common_tests.helpers.generate_test_tp_model import generate_tp_model_with_activation_mp
+from tests.common_tests.helpers.prep_graph_for_func_test import prepare_graph_with_quantization_parameters
+
+INPUT_SHAPE = [3, 8, 8]
+
+
+class ConvModel(torch.nn.Module):
+    def __init__(self):
+        super(ConvModel, self).__init__()
+        self.conv1 = Conv2d(3, 4, kernel_size=3)
+        self.relu = torch.nn.ReLU()
+        self.conv2 = Conv2d(4, 5, kernel_size=1)
+
+    def forward(self, inp):
+        x = self.conv1(inp)
+        x = self.relu(x)
+        return self.conv2(x)
+
+
+def get_activation_mp_tpc(name, _tp):
+    base_config, _ = get_op_quantization_configs()
+    return generate_pytorch_tpc(name, generate_tp_model_with_activation_mp(base_config,
+                                                                           [(8, 8), (8, 4), (4, 8), (4, 4)]))
+
+
+def representative_dataset():
+    yield [np.random.randn(*[1] + INPUT_SHAPE).astype(np.float32)]
+
+
+class TestQuantizationParamsComputation(unittest.TestCase):
+
+    def setUp(self):
+        self.fw_impl = PytorchImplementation()
+        self.graph = prepare_graph_with_quantization_parameters(ConvModel(),
+                                                                self.fw_impl,
+                                                                DEFAULT_PYTORCH_INFO,
+                                                                representative_dataset,
+                                                                get_activation_mp_tpc,
+                                                                [1] + INPUT_SHAPE,
+                                                                mixed_precision_enabled=True)
+
+    def _weights_params(self, graph):
+        return [[c.weights_quantization_cfg.weights_quantization_params for c in n.candidates_quantization_cfg]
+                for n in graph.get_topo_sorted_nodes() if n.is_weights_quantization_enabled()]
+
+    def test_weights_qparams_deduplication(self):
+        n_candidates = sum([len(n.candidates_quantization_cfg) for n in self.graph.nodes
+                            if n.is_weights_quantization_enabled()])
+        n_weights_bits = sum([len(set([c.weights_quantization_cfg.weights_n_bits for c in n.candidates_quantization_cfg]))
+                              for n in self.graph.nodes if n.is_weights_quantization_enabled()])
+        self.assertTrue(n_weights_bits < n_candidates)
+
+        with patch.object(qparams_computation, 'get_weights_qparams',
+                          wraps=qparams_computation.get_weights_qparams) as get_weights_qparams_mock:
+            calculate_quantization_params(self.graph, DEFAULT_PYTORCH_INFO, fw_impl=self.fw_impl)
+        # Weights params are computed once per weights bit-width of each node.
+        self.assertTrue(get_weights_qparams_mock.call_count == n_weights_bits)
+
+    def test_parallel_weights_qparams(self):
+        parallel_graph = copy.deepcopy(self.graph)
+        calculate_quantization_params(self.graph, DEFAULT_PYTORCH_INFO, fw_impl=self.fw_impl)
+        calculate_quantization_params(parallel_graph, DEFAULT_PYTORCH_INFO, fw_impl=self.fw_impl, n_workers=2)
+        for node_params, parallel_node_params in zip(self._weights_params(self.graph),
+                                                     self._weights_params(parallel_graph)):
+            for params, parallel_params in zip(node_params, parallel_node_params):
+                self.assertTrue(params.keys() == parallel_params.keys())
+                for k in params.keys():
+                    self.assertTrue(np.array_equal(params[k], parallel_params[k]))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,73 @@
+# Copyright 2023 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import unittest
+
+import numpy as np
+import torch
+from torch import nn
+
+from model_compression_toolkit.core import CoreConfig, QuantizationConfig
+from model_compression_toolkit.gptq import get_pytorch_gptq_config, \
+    pytorch_gradient_post_training_quantization_experimental
+from model_compression_toolkit.target_platform_capabilities.tpc_models.imx500_tpc.latest import generate_pytorch_tpc
+from tests.common_tests.function_tests.test_representative_dataset_store import CountingDataset
+from tests.common_tests.helpers.generate_test_tp_model import generate_test_tp_model
+
+
+class ConvModel(nn.Module):
+    def __init__(self):
+        super(ConvModel, self).__init__()
+        self.conv1 = nn.Conv2d(3, 8, kernel_size=3)
+        self.relu = nn.ReLU()
+        self.conv2 = nn.Conv2d(8, 4, kernel_size=3)
+
+    def forward(self, inp):
+        return self.conv2(self.relu(self.conv1(inp)))
+
+
+class TestRepresentativeDatasetStorePytorch(unittest.TestCase):
+
+    def _run_gptq(self, float_model, dataset, store_representative_dataset):
+        torch.manual_seed(0)
+        core_config = CoreConfig(quantization_config=QuantizationConfig(
+            weights_bias_correction=False, store_representative_dataset=store_representative_dataset))
+        tpc = generate_pytorch_tpc(name="dataset_store_test", tp_model=generate_test_tp_model({}))
+        quant_model, _ = pytorch_gradient_post_training_quantization_experimental(
+            model=float_model,
+            representative_data_gen=dataset,
+            core_config=core_config,
+            gptq_config=get_pytorch_gptq_config(n_epochs=2),
+            target_platform_capabilities=tpc)
+        return quant_model
+
+    def test_gptq_with_dataset_store(self):
+        dataset = CountingDataset(4)
+        dataset.batches = [[np.random.randn(2, 3, 12, 12).astype(np.float32)] for _ in range(4)]
+        float_model = ConvModel()
+        x = torch.from_numpy(np.random.randn(2, 3, 12, 12).astype(np.float32))
+
+        expected = self._run_gptq(float_model, dataset, store_representative_dataset=False)(x)
+        self.assertTrue(dataset.n_iterations > 1)
+
+        dataset.n_iterations = 0
+        stored = self._run_gptq(float_model, dataset, store_representative_dataset=True)(x)
+        # All the pipeline's stages replay the stored batches, so the dataset is iterated once.
+        self.assertEqual(dataset.n_iterations, 1)
+        self.assertTrue(np.allclose(expected.detach().cpu().numpy(), stored.detach().cpu().numpy(),
+                                    rtol=1e-5, atol=1e-6))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,127 @@
+# Copyright 2023 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import unittest
+from unittest.mock import patch
+
+import numpy as np
+
+from model_compression_toolkit.core import MixedPrecisionQuantizationConfigV2
+from model_compression_toolkit.core.common.mixed_precision import sensitivity_evaluation
+from model_compression_toolkit.core.common.mixed_precision.kpi_tools.kpi import KPI
+from model_compression_toolkit.core.common.mixed_precision.kpi_tools.kpi_functions_mapping import \
+    get_kpi_functions
+from model_compression_toolkit.core.common.mixed_precision.mixed_precision_search_manager import \
+    MixedPrecisionSearchManager
+from model_compression_toolkit.core.pytorch.default_framework_info import DEFAULT_PYTORCH_INFO
+from model_compression_toolkit.core.pytorch.pytorch_implementation import PytorchImplementation
+from tests.common_tests.helpers.prep_graph_for_func_test import prepare_graph_with_quantization_parameters
+from tests.pytorch_tests.function_tests.test_sensitivity_prefix_cache import ResidualModel, get_activation_mp_tpc, \
+    representative_dataset, INPUT_SHAPE
+
+
+class TestSensitivityBatchedEvaluation(unittest.TestCase):
+
+    def _get_evaluator(self, mp_config):
+        fw_impl = PytorchImplementation()
+        graph = prepare_graph_with_quantization_parameters(ResidualModel(),
+                                                           fw_impl,
+                                                           DEFAULT_PYTORCH_INFO,
+                                                           representative_dataset,
+                                                           get_activation_mp_tpc,
+                                                           [1] + INPUT_SHAPE,
+                                                           mixed_precision_enabled=True)
+        return graph, fw_impl.get_sensitivity_evaluator(graph, mp_config, representative_dataset,
+                                                        DEFAULT_PYTORCH_INFO)
+
+    def test_batched_evaluation(self):
+        mp_config = MixedPrecisionQuantizationConfigV2(num_of_images=4, use_grad_based_weights=False)
+        graph, se = self._get_evaluator(mp_config)
+
+        baseline_config = graph.get_max_candidates_config()
+        configs, nodes_idx = [], []
+        for node_idx, n in enumerate(graph.get_configurable_sorted_nodes()):
+            for bitwidth_idx in range(len(n.candidates_quantization_cfg)):
+                config = baseline_config.copy()
+                config[node_idx] = bitwidth_idx
+                configs.append(config)
+                nodes_idx.append([node_idx])
+
+        expected = [se.compute_metric(config, idx, baseline_config) for config, idx in zip(configs, nodes_idx)]
+        self.assertTrue(np.allclose(expected, se.compute_metrics(configs, nodes_idx, baseline_config),
+                                    rtol=1e-6, atol=0))
+        self.assertIsNone(se.replicas)
+
+        for cache_prefix_activations in [False, True]:
+            mp_config.cache_prefix_activations = cache_prefix_activations
+            for n_workers in [2, 3]:
+                mp_config.sensitivity_eval_n_workers = n_workers
+                metrics = se.compute_metrics(configs, nodes_idx, baseline_config)
+                self.assertEqual(metrics.shape, (len(configs),))
+                self.assertTrue(np.allclose(expected, metrics, rtol=1e-6, atol=0))
+                # The replicas are kept between calls, and each of them has its own MP model.
+                self.assertEqual(len(se.replicas), 3 if cache_prefix_activations else n_workers)
+                self.assertEqual(len({id(r.model_mp) for r in se.replicas}), len(se.replicas))
+                if cache_prefix_activations:
+                    self.assertTrue(all(r.prefix_cache is se.prefix_cache for r in se.replicas[:n_workers]))
+
+        # The progress bar counts all the evaluated configurations, in both the serial and the parallel evaluation.
+        tqdm = sensitivity_evaluation.tqdm
+        for n_workers in [1, 3]:
+            mp_config.sensitivity_eval_n_workers = n_workers
+            progress_bars = []
+
+            def _tqdm(*args, **kwargs):
+                progress_bars.append(tqdm(*args, **kwargs))
+                return progress_bars[-1]
+
+            with patch.object(sensitivity_evaluation, 'tqdm', _tqdm):
+                se.compute_metrics(configs, nodes_idx, baseline_config)
+            self.assertEqual(len(progress_bars), 1)
+            self.assertEqual(progress_bars[0].total, len(configs))
+            self.assertEqual(progress_bars[0].n, len(configs))
+
+        # Evaluating full configurations (without a baseline to restore).
+        full_configs = [graph.get_min_candidates_config(), baseline_config]
+        expected = [se.compute_metric(config) for config in full_configs]
+        self.assertTrue(np.allclose(expected, se.compute_metrics(full_configs), rtol=1e-6, atol=0))
+
+    def test_search_manager_sensitivity_metric(self):
+        mp_config = MixedPrecisionQuantizationConfigV2(num_of_images=4, use_grad_based_weights=False,
+                                                       sensitivity_eval_n_workers=2)
+        graph, se = self._get_evaluator(mp_config)
+        target_kpi = KPI(activation_memory=np.inf)
+        search_manager = MixedPrecisionSearchManager(graph, DEFAULT_PYTORCH_INFO, PytorchImplementation(), se,
+                                                     get_kpi_functions(target_kpi), target_kpi)
+        self.assertEqual(search_manager.compute_metrics_fn, se.get_sensitivity_metric())
+        baseline_config = graph.get_max_candidates_config()
+        config = graph.get_min_candidates_config()
+        self.assertTrue(np.isclose(search_manager.compute_metric_fn(config),
+                                   se.compute_metric(config), rtol=1e-6))
+        self.assertTrue(np.isclose(search_manager.compute_metric_fn(config, [0], baseline_config),
+                                   se.compute_metric(config, [0], baseline_config), rtol=1e-6))
+
+        # A search manager that overrides the sensitivity metric accessor uses its metric for all configurations.
+        class _SearchManager(MixedPrecisionSearchManager):
+            def get_sensitivity_metric(self):
+                return lambda configs, nodes_idx=None, baseline=None: np.arange(len(configs)) + 10.0
+
+        search_manager = _SearchManager(graph, DEFAULT_PYTORCH_INFO, PytorchImplementation(), se,
+                                        get_kpi_functions(target_kpi), target_kpi)
+        self.assertTrue(np.array_equal(search_manager.compute_metrics_fn([config, config]), [10.0, 11.0]))
+        self.assertEqual(search_manager.compute_metric_fn(config), 10.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,101 @@
+# Copyright 2023 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import unittest
+from unittest.mock import patch
+
+import numpy as np
+import torch
+from torch.nn import Conv2d
+
+from model_compression_toolkit.core import MixedPrecisionQuantizationConfigV2
+from model_compression_toolkit.core.pytorch.default_framework_info import DEFAULT_PYTORCH_INFO
+from model_compression_toolkit.core.pytorch.pytorch_implementation import PytorchImplementation
+from model_compression_toolkit.target_platform_capabilities.tpc_models.imx500_tpc.latest import generate_pytorch_tpc, \
+    get_op_quantization_configs
+from tests.common_tests.helpers.generate_test_tp_model import generate_tp_model_with_activation_mp
+from tests.common_tests.helpers.prep_graph_for_func_test import prepare_graph_with_quantization_parameters
+
+INPUT_SHAPE = [3, 16, 16]
+
+
+class ResidualModel(torch.nn.Module):
+    def __init__(self):
+        super(ResidualModel, self).__init__()
+        self.conv1 = Conv2d(3, 4, kernel_size=3, padding=1)
+        self.conv2 = Conv2d(4, 4, kernel_size=3, padding=1)
+        self.conv3 = Conv2d(4, 6, kernel_size=1)
+        self.relu = torch.nn.ReLU()
+
+    def forward(self, inp):
+        x = self.relu(self.conv1(inp))
+        y = self.relu(self.conv2(x))
+        return self.conv3(x + y)
+
+
+def get_activation_mp_tpc(name, _tp):
+    base_config, _ = get_op_quantization_configs()
+    return generate_pytorch_tpc(name, generate_tp_model_with_activation_mp(base_config,
+                                                                           [(8, 8), (8, 4), (4, 8), (4, 4)]))
+
+
+def representative_dataset():
+    for _ in range(2):
+        yield [np.random.randn(*[2] + INPUT_SHAPE).astype(np.float32)]
+
+
+class TestSensitivityPrefixCache(unittest.TestCase):
+
+    def test_prefix_cache_metric(self):
+        fw_impl = PytorchImplementation()
+        graph = prepare_graph_with_quantization_parameters(ResidualModel(),
+                                                           fw_impl,
+                                                           DEFAULT_PYTORCH_INFO,
+                                                           representative_dataset,
+                                                           get_activation_mp_tpc,
+                                                           [1] + INPUT_SHAPE,
+                                                           mixed_precision_enabled=True)
+        mp_config = MixedPrecisionQuantizationConfigV2(num_of_images=4, use_grad_based_weights=False)
+        se = fw_impl.get_sensitivity_evaluator(graph, mp_config, representative_dataset, DEFAULT_PYTORCH_INFO)
+
+        baseline_config = graph.get_max_candidates_config()
+        configs = []
+        for node_idx, n in enumerate(graph.get_configurable_sorted_nodes()):
+            for bitwidth_idx in range(len(n.candidates_quantization_cfg)):
+                config = baseline_config.copy()
+                config[node_idx] = bitwidth_idx
+                configs.append((config, node_idx))
+        self.assertTrue(len(configs) > 4)
+
+        expected = [se.compute_metric(config, [node_idx], baseline_config) for config, node_idx in configs]
+
+        mp_config.cache_prefix_activations = True
+        with patch.object(fw_impl, 'sensitivity_eval_inference_with_cache',
+                          wraps=fw_impl.sensitivity_eval_inference_with_cache) as with_cache_mock:
+            cached = [se.compute_metric(config, [node_idx], baseline_config) for config, node_idx in configs]
+            # The activations are cached once for each images batch.
+            self.assertEqual(with_cache_mock.call_count, len(se.images_batches))
+
+        self.assertTrue(np.allclose(expected, cached, rtol=1e-6, atol=0))
+        self.assertEqual(se.prefix_cache_configuration, baseline_config)
+
+        # Evaluating a configuration without restoring the baseline invalidates the cache.
+        se.compute_metric(graph.get_min_candidates_config())
+        self.assertIsNone(se.prefix_cache)
+        config, node_idx = configs[-1]
+        self.assertTrue(np.isclose(se.compute_metric(config, [node_idx], baseline_config), cached[-1], rtol=1e-6))
+
+
+if __name__ == '__main__':
+    unittest.main()
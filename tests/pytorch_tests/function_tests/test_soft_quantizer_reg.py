@@ -0,0 +1,102 @@
+# Copyright 2023 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import unittest
+
+import numpy as np
+import torch
+from torch import nn
+
+from model_compression_toolkit.constants import THRESHOLD, MIN_THRESHOLD
+from model_compression_toolkit.target_platform_capabilities.target_platform import QuantizationMethod
+from mct_quantizers import PytorchQuantizationWrapper
+from model_compression_toolkit.core.pytorch.constants import KERNEL
+from model_compression_toolkit.core.pytorch.utils import to_torch_tensor
+from model_compression_toolkit.gptq.common.gptq_constants import AUXVAR
+from model_compression_toolkit.gptq.pytorch.quantizer.soft_rounding.soft_quantizer_reg import LinearTempDecay, \
+    SoftQuantizerRegularization
+from model_compression_toolkit.gptq.pytorch.quantizer.soft_rounding.symmetric_soft_quantizer import \
+    SymmetricSoftRoundingGPTQ
+from model_compression_toolkit.trainable_infrastructure import TrainableQuantizerWeightsConfig
+
+N_STEPS = 10
+
+
+class SoftRoundingModel(nn.Module):
+    def __init__(self):
+        super(SoftRoundingModel, self).__init__()
+        self.conv1 = self._wrap(nn.Conv2d(3, 8, kernel_size=3))
+        self.relu = nn.ReLU()
+        self.conv2 = self._wrap(nn.Conv2d(8, 4, kernel_size=1))
+
+    @staticmethod
+    def _wrap(conv):
+        tqwc = TrainableQuantizerWeightsConfig(weights_quantization_method=QuantizationMethod.SYMMETRIC,
+                                               weights_n_bits=8,
+                                               weights_quantization_params={THRESHOLD: 2.0},
+                                               enable_weights_quantization=True,
+                                               weights_channels_axis=0,
+                                               weights_per_channel_threshold=False,
+                                               min_threshold=MIN_THRESHOLD)
+        wrapper = PytorchQuantizationWrapper(conv, {KERNEL: SymmetricSoftRoundingGPTQ(quantization_config=tqwc)})
+        with torch.no_grad():
+            wrapper.get_parameter(f'{KERNEL}_{AUXVAR}').normal_()
+        return wrapper
+
+    def forward(self, inp):
+        return self.conv2(self.relu(self.conv1(inp)))
+
+
+def reference_regularization(model, entropy_reg, b):
+    reg = 0
+    for layer in model.modules():
+        if isinstance(layer, PytorchQuantizationWrapper):
+            st = layer.weights_quantizers[KERNEL].get_soft_targets()
+            reg += (1 - torch.pow(torch.abs(st - .5) * 2, b)).sum()
+    return entropy_reg * reg
+
+
+class TestSoftQuantizerRegularization(unittest.TestCase):
+
+    def test_temperature_schedule(self):
+        linear_decay = LinearTempDecay(N_STEPS)
+        schedule = linear_decay.get_schedule()
+        self.assertEqual(len(schedule), N_STEPS + 1)
+        expected = [float(linear_decay(t)) for t in range(N_STEPS + 1)]
+        self.assertTrue(np.allclose(schedule.cpu().numpy(), expected))
+
+    def test_regularization(self):
+        model = SoftRoundingModel().to(to_torch_tensor(torch.zeros(1)).device)
+        aux_vars = [p for n, p in model.named_parameters() if n.endswith(AUXVAR)]
+        self.assertEqual(len(aux_vars), 2)
+
+        reg_func = SoftQuantizerRegularization(total_gradient_steps=N_STEPS)
+        linear_decay = LinearTempDecay(N_STEPS)
+        # The regularization keeps using the final temperature after the expected number of steps.
+        for t in range(N_STEPS + 2):
+            reg = reg_func(model, 0.01)
+            expected_reg = reference_regularization(model, 0.01, linear_decay(min(t, N_STEPS)))
+            self.assertTrue(torch.allclose(reg, expected_reg.reshape(reg.shape), rtol=1e-5))
+
+            grads = torch.autograd.grad(reg, aux_vars)
+            expected_grads = torch.autograd.grad(expected_reg.sum(), aux_vars)
+            for g, expected_g in zip(grads, expected_grads):
+                self.assertTrue(torch.allclose(g, expected_g, rtol=1e-5, atol=1e-8))
+
+        self.assertEqual(reg_func.count_iter, N_STEPS + 2)
+        self.assertEqual(len(reg_func.aux_vars), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,89 @@
+# Copyright 2023 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+import numpy as np
+import torch
+from torch.nn import Conv2d
+
+import model_compression_toolkit as mct
+from model_compression_toolkit.core import CoreConfig, QuantizationConfig, QuantizationErrorMethod
+from model_compression_toolkit.core.common.model_collector import ModelCollector
+
+INPUT_SHAPE = [3, 8, 8]
+
+
+class ResidualModel(torch.nn.Module):
+    def __init__(self):
+        super(ResidualModel, self).__init__()
+        self.conv1 = Conv2d(3, 4, kernel_size=3, padding=1)
+        self.conv2 = Conv2d(4, 4, kernel_size=1)
+        self.relu = torch.nn.ReLU()
+
+    def forward(self, inp):
+        x = self.relu(self.conv1(inp))
+        return self.conv2(x) + x
+
+
+def get_representative_dataset(seed):
+    def representative_dataset():
+        rng = np.random.default_rng(seed)
+        for _ in range(3):
+            yield [rng.standard_normal([2] + INPUT_SHAPE).astype(np.float32)]
+    return representative_dataset
+
+
+class TestStatisticsStore(unittest.TestCase):
+
+    def _quantize(self, model, representative_dataset, **qc_kwargs):
+        core_config = CoreConfig(quantization_config=QuantizationConfig(**qc_kwargs))
+        with patch.object(ModelCollector, 'infer', autospec=True, side_effect=ModelCollector.infer) as infer_mock:
+            q_model, _ = mct.ptq.pytorch_post_training_quantization_experimental(model,
+                                                                                 representative_dataset,
+                                                                                 core_config=core_config)
+        x = torch.from_numpy(np.random.default_rng(1).standard_normal([1] + INPUT_SHAPE).astype(np.float32))
+        return q_model(x).detach().cpu().numpy(), infer_mock.call_count
+
+    def test_statistics_store(self):
+        model = ResidualModel()
+        with tempfile.TemporaryDirectory() as cache_dir:
+            for streaming_histogram in [False, True]:
+                for error_method in [QuantizationErrorMethod.MSE, QuantizationErrorMethod.NOCLIPPING]:
+                    expected, n_infer = self._quantize(model, get_representative_dataset(0),
+                                                       activation_error_method=error_method,
+                                                       streaming_histogram=streaming_histogram)
+                    self.assertEqual(n_infer, 3)
+
+                    cached, n_infer = self._quantize(model, get_representative_dataset(0),
+                                                     activation_error_method=error_method,
+                                                     streaming_histogram=streaming_histogram,
+                                                     statistics_cache_dir=cache_dir)
+                    self.assertTrue(np.array_equal(expected, cached))
+                    # The statistics are collected once per collectors configuration, and loaded afterwards.
+                    self.assertEqual(n_infer, 3 if error_method == QuantizationErrorMethod.MSE else 0)
+
+            self.assertEqual(len([f for f in os.listdir(cache_dir) if f.endswith('.json')]), 2)
+
+            # A different representative dataset does not use the saved statistics.
+            _, n_infer = self._quantize(model, get_representative_dataset(2), statistics_cache_dir=cache_dir)
+            self.assertEqual(n_infer, 3)
+            self.assertEqual(len([f for f in os.listdir(cache_dir) if f.endswith('.json')]), 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -26,6 +26,15 @@ from tests.common_tests.function_tests.test_folder_image_loader import TestFolde
 from model_compression_toolkit.constants import FOUND_ONNX
 from tests.common_tests.function_tests.test_histogram_collector import TestHistogramCollector
 from tests.common_tests.function_tests.test_kpi_object import TestKPIObject
+from tests.common_tests.function_tests.test_mean_collector import TestMeanCollector
+from tests.common_tests.function_tests.test_batched_qparams_search import TestBatchedQparamsSearch
+from tests.common_tests.function_tests.test_lp_search_formulation import TestLpSearchFormulation
+from tests.common_tests.function_tests.test_max_cut_astar_search import TestMaxCutAstarSearch
+from tests.common_tests.function_tests.test_graph_topo_sort_cache import TestGraphTopoSortCache
+from tests.common_tests.function_tests.test_substitutions_worklist import TestSubstitutionsWorklist
+from tests.common_tests.function_tests.test_graph_snapshot import TestGraphSnapshot
+from tests.common_tests.function_tests.test_gptq_float_outputs_cache import TestGPTQFloatOutputsCache
+from tests.common_tests.function_tests.test_representative_dataset_store import TestRepresentativeDatasetStore
 from tests.common_tests.function_tests.test_threshold_selection import TestThresholdSelection
 from tests.common_tests.test_doc_examples import TestCommonDocsExamples
 from tests.common_tests.test_tp_model import TargetPlatformModelingTest, OpsetTest, QCOptionsTest, FusingTest
@@ -67,6 +76,7 @@ if found_tf:
     from tests.keras_tests.function_tests.test_sensitivity_eval_output_replacement import \
         TestSensitivityEvalWithOutputReplacementNodes
     from tests.keras_tests.function_tests.test_set_layer_to_bitwidth import TestKerasSetLayerToBitwidth
+    from tests.keras_tests.function_tests.test_compiled_inference import TestCompiledInference
     from tests.keras_tests.function_tests.test_export_keras_fully_quantized_model import TestKerasFakeQuantExporter
     from tests.keras_tests.function_tests.test_kpi_data import TestKPIData
     from tests.keras_tests.exporter_tests.test_runner import ExporterTestsRunner
@@ -85,6 +95,22 @@ if found_pytorch:
     # from tests.pytorch_tests.model_tests.test_models_runner import ModelTest
     from tests.pytorch_tests.function_tests.test_function_runner import FunctionTestRunner
     from tests.pytorch_tests.function_tests.test_pytorch_tp_model import TestPytorchTPModel
+    from tests.pytorch_tests.function_tests.test_framework_statistics_reduction import \
+        TestFrameworkStatisticsReduction
+    from tests.pytorch_tests.function_tests.test_qparams_computation import TestQuantizationParamsComputation
+    from tests.pytorch_tests.function_tests.test_sensitivity_prefix_cache import TestSensitivityPrefixCache
+    from tests.pytorch_tests.function_tests.test_sensitivity_batched_evaluation import TestSensitivityBatchedEvaluation
+    from tests.pytorch_tests.function_tests.test_statistics_store import TestStatisticsStore
+    from tests.pytorch_tests.function_tests.test_kpi_table import TestKPITable
+    from tests.pytorch_tests.function_tests.test_pytorch_model_forward import TestPytorchModelForward
+    from tests.pytorch_tests.function_tests.test_peak_activation_kpi import TestPeakActivationKPI
+    from tests.pytorch_tests.function_tests.test_gptq_float_outputs_cache import TestGPTQFloatOutputsCachePytorch
+    from tests.pytorch_tests.function_tests.test_gptq_log_interval import TestGPTQLogInterval
+    from tests.pytorch_tests.function_tests.test_inference_mode import TestInferenceMode
+    from tests.pytorch_tests.function_tests.test_representative_dataset_store import \
+        TestRepresentativeDatasetStorePytorch
+    from tests.pytorch_tests.function_tests.test_fused_ste_quantizers import TestFusedSTEQuantizers
+    from tests.pytorch_tests.function_tests.test_soft_quantizer_reg import TestSoftQuantizerRegularization
     from tests.trainable_infrastructure_tests.pytorch.test_pytorch_trainable_infra_runner import \
         PytorchTrainableInfrastructureTestRunner
     from tests.pytorch_tests.function_tests.test_gptq_soft_quantizer import TestGPTQSoftQuantizer as pytorch_gptq_soft_quantier_test
@@ -107,6 +133,15 @@ if __name__ == '__main__':
     suiteList.append(unittest.TestLoader().loadTestsFromTestCase(FusingTest))
     suiteList.append(unittest.TestLoader().loadTestsFromTestCase(TestCommonDocsExamples))
     suiteList.append(unittest.TestLoader().loadTestsFromTestCase(TestKPIObject))
+    suiteList.append(unittest.TestLoader().loadTestsFromTestCase(TestMeanCollector))
+    suiteList.append(unittest.TestLoader().loadTestsFromTestCase(TestBatchedQparamsSearch))
+    suiteList.append(unittest.TestLoader().loadTestsFromTestCase(TestLpSearchFormulation))
+    suiteList.append(unittest.TestLoader().loadTestsFromTestCase(TestMaxCutAstarSearch))
+    suiteList.append(unittest.TestLoader().loadTestsFromTestCase(TestGraphTopoSortCache))
+    suiteList.append(unittest.TestLoader().loadTestsFromTestCase(TestSubstitutionsWorklist))
+    suiteList.append(unittest.TestLoader().loadTestsFromTestCase(TestGraphSnapshot))
+    suiteList.append(unittest.TestLoader().loadTestsFromTestCase(TestGPTQFloatOutputsCache))
+    suiteList.append(unittest.TestLoader().loadTestsFromTestCase(TestRepresentativeDatasetStore))
 
     # Add TF tests only if tensorflow is installed
     if found_tf:
@@ -132,6 +167,7 @@ if __name__ == '__main__':
         suiteList.append(unittest.TestLoader().loadTestsFromTestCase(TestModelGradients))
         suiteList.append(unittest.TestLoader().loadTestsFromTestCase(TestGraphMaxCut))
         suiteList.append(unittest.TestLoader().loadTestsFromTestCase(TestKerasSetLayerToBitwidth))
+        suiteList.append(unittest.TestLoader().loadTestsFromTestCase(TestCompiledInference))
         suiteList.append(unittest.TestLoader().loadTestsFromTestCase(TestSensitivityEvalWithOutputReplacementNodes))
         suiteList.append(unittest.TestLoader().loadTestsFromTestCase(TestKerasFakeQuantExporter))
         suiteList.append(unittest.TestLoader().loadTestsFromTestCase(TestKPIData))
@@ -157,6 +193,20 @@ if __name__ == '__main__':
         # suiteList.append(unittest.TestLoader().loadTestsFromName('test_resnet18', ModelTest))
         # suiteList.append(unittest.TestLoader().loadTestsFromName('test_shufflenet_v2_x1_0', ModelTest))
         suiteList.append(unittest.TestLoader().loadTestsFromTestCase(TestPytorchTPModel))
+        suiteList.append(unittest.TestLoader().loadTestsFromTestCase(TestFrameworkStatisticsReduction))
+        suiteList.append(unittest.TestLoader().loadTestsFromTestCase(TestQuantizationParamsComputation))
+        suiteList.append(unittest.TestLoader().loadTestsFromTestCase(TestSensitivityPrefixCache))
+        suiteList.append(unittest.TestLoader().loadTestsFromTestCase(TestSensitivityBatchedEvaluation))
+        suiteList.append(unittest.TestLoader().loadTestsFromTestCase(TestStatisticsStore))
+        suiteList.append(unittest.TestLoader().loadTestsFromTestCase(TestKPITable))
+        suiteList.append(unittest.TestLoader().loadTestsFromTestCase(TestPytorchModelForward))
+        suiteList.append(unittest.TestLoader().loadTestsFromTestCase(TestPeakActivationKPI))
+        suiteList.append(unittest.TestLoader().loadTestsFromTestCase(TestGPTQFloatOutputsCachePytorch))
+        suiteList.append(unittest.TestLoader().loadTestsFromTestCase(TestGPTQLogInterval))
+        suiteList.append(unittest.TestLoader().loadTestsFromTestCase(TestInferenceMode))
+        suiteList.append(unittest.TestLoader().loadTestsFromTestCase(TestRepresentativeDatasetStorePytorch))
+        suiteList.append(unittest.TestLoader().loadTestsFromTestCase(TestFusedSTEQuantizers))
+        suiteList.append(unittest.TestLoader().loadTestsFromTestCase(TestSoftQuantizerRegularization))
         suiteList.append(unittest.TestLoader().loadTestsFromTestCase(pytorch_gptq_soft_quantier_test))
         suiteList.append(unittest.TestLoader().loadTestsFromTestCase(PytorchTrainableInfrastructureTestRunner))
         suiteList.append(unittest.TestLoader().loadTestsFromTestCase(PytorchExporterTestsRunner))